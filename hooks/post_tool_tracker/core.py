@@ -436,7 +436,7 @@ else:
             # Log the entry
             debug_log("  [GRANULAR] Step 3.1.4: About to call log_tool_entry()")
             try:
-                log_tool_entry(entry, TRACKER_LOG)
+                log_tool_entry(entry, TRACKER_LOG, _get_session_id_from_progress(SESSION_STATE_FILE))
                 debug_log("  [GRANULAR] Step 3.1.4: ? log_tool_entry() completed")
             except Exception as e:
                 debug_log(
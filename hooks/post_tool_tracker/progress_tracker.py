@@ -13,6 +13,7 @@ Handles:
 """
 
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -130,16 +131,41 @@ def save_session_progress(state, session_state_file):
         pass
 
 
-def log_tool_entry(entry, tracker_log):
+def _load_tracker_log_helpers():
+    """Import scripts/helpers/tool_tracker_log.py (None when unavailable)."""
+    try:
+        scripts_dir = str(Path(__file__).resolve().parent.parent.parent / "scripts")
+        if scripts_dir not in sys.path:
+            sys.path.append(scripts_dir)
+        from helpers import tool_tracker_log
+
+        return tool_tracker_log
+    except Exception:
+        return None
+
+
+def log_tool_entry(entry, tracker_log, session_id=None):
     """Append a tool usage entry as a JSONL line to TRACKER_LOG.
 
+    With a session_id the entry goes to the per-session segment
+    (logs/sessions/<id>/tool-tracker.jsonl) and TaskCreate/TaskUpdate lines
+    are recorded in its offset index, so issue closing can seek straight
+    to a task's activity.  Without one (or if the helpers cannot be
+    imported) the global log is used.
+
     Creates parent directories automatically.  Errors are silently swallowed.
 
     Args:
         entry (dict): Tool tracking record to serialise and append.
         tracker_log: Path-like pointing to tool-tracker.jsonl.
+        session_id (str): Optional current session ID.
     """
     try:
+        if session_id:
+            helpers = _load_tracker_log_helpers()
+            if helpers is not None:
+                helpers.append_entry(helpers.segment_path(tracker_log, session_id), entry)
+                return
         tl = Path(tracker_log)
         tl.parent.mkdir(parents=True, exist_ok=True)
         with open(tl, "a", encoding="utf-8") as f:
@@ -7,6 +7,7 @@ import os
 import sys
 import time
 from datetime import datetime
+from pathlib import Path
 
 from .helpers import (
     _HOOK_START,
@@ -23,9 +24,9 @@ from .helpers import (
     read_hook_stdin,
 )
 from .post_impl import _create_pr_from_pipeline_data, _run_post_implementation_steps
+from .tasks import StopContext, StopTaskRunner, default_tasks
 from .voice import (
     _get_session_issues_file,
-    get_current_session_id,
     get_session_start_default,
     get_session_summary_for_voice,
     get_task_complete_default,
@@ -38,9 +39,13 @@ def main():
     """Stop hook entry point - run session maintenance then trigger voice notifications.
 
     Executed by Claude Code after every AI response (Stop event).  The function:
-      1. Loads and runs auto-commit-enforcer.py with up to 3 retries.
-      2. Runs auto-save-session.py, archive-old-sessions.py, and
-         failure-detector.py for end-of-response session maintenance.
+      1. Runs the session maintenance jobs (auto-commit-enforcer,
+         auto-save-session, archive/prune, failure-detector, ...) through
+         StopTaskRunner: required jobs concurrently, each architecture
+         script in its own subprocess under a timeout, deferrable ones in
+         a detached background worker.
+      2. Takes one git snapshot (branch, commits ahead, clean tree) that
+         the PR checks and post-implementation steps share.
       3. Resolves PID-isolated voice flag files in priority order:
            a. .session-start-voice-{PID}  -> new session greeting
            b. .task-complete-voice-{PID}  -> task completion notification
@@ -52,203 +57,24 @@ def main():
     Always exits 0.  Errors in any phase are caught and logged to
     stop-notifier.log without disrupting subsequent phases.
     """
-    # INTEGRATION: Load git commit policies from scripts/architecture/
-    # Retry up to 3 times per policy script. Warn on failure (Stop hook
-    # should not hard-break; it runs AFTER the response is sent).
-    try:
-        import subprocess
-        from pathlib import Path
-
-        _scripts_dir = Path(__file__).resolve().parent.parent.parent / "scripts"
-        git_commit_script = (
-            _scripts_dir / "architecture" / "03-execution-system" / "09-git-commit" / "git-auto-commit-policy.py"
-        )
-        if git_commit_script.exists():
-            _commit_ok = False
-            for _attempt in range(1, 4):
-                try:
-                    _r = subprocess.run(
-                        [sys.executable, str(git_commit_script), "--enforce"], timeout=60, capture_output=True
-                    )
-                    if _r.returncode == 0:
-                        _commit_ok = True
-                        break
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] auto-commit-enforcer failed, retrying...")
-                except Exception:
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] auto-commit-enforcer error, retrying...")
-            if not _commit_ok:
-                log_s("[POLICY-WARN] auto-commit-enforcer failed after 3 retries")
-    except Exception:
-        pass
-
     read_hook_stdin()
 
     # =========================================================================
-    # SESSION END MAINTENANCE (non-blocking, before voice)
-    # Architecture scripts: auto-save-session, archive-old-sessions, failure-detector
+    # SESSION END MAINTENANCE (before voice)
+    # Jobs (auto-commit policy, auto-save-session, archive-old-sessions,
+    # session-pruner, failure-detector, preference-auto-tracker,
+    # plan-session-archiver) are declared in tasks.default_tasks().  Required
+    # ones run concurrently under STOP_HOOK_BUDGET_S; deferrable
+    # ones go to a detached worker.  The git snapshot taken after the
+    # auto-commit job is reused by every branch check below.
     # =========================================================================
-    # 1. Auto-save session state before cleanup (3 retries)
-    # Architecture: 01-sync-system/session-management/auto-save-session.py
-    try:
-        save_script = _scripts_dir / "architecture" / "01-sync-system" / "session-management" / "auto-save-session.py"
-        if save_script.exists():
-            project_name = Path.cwd().name
-            _save_ok = False
-            for _attempt in range(1, 4):
-                try:
-                    _r = subprocess.run(
-                        [sys.executable, str(save_script), "--project", project_name], timeout=10, capture_output=True
-                    )
-                    if _r.returncode == 0:
-                        _save_ok = True
-                        break
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] auto-save-session failed, retrying...")
-                except Exception:
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] auto-save-session error, retrying...")
-            if _save_ok:
-                log_s("[SESSION-SAVE] Auto-saved session for: " + project_name)
-            else:
-                log_s("[POLICY-WARN] auto-save-session failed after 3 retries")
-    except Exception as e:
-        log_s("[SESSION-SAVE] Skipped: " + str(e))
-
-    # 2. Archive old sessions - keep last 10, archive >30 days (3 retries)
-    # Architecture: 01-sync-system/session-management/archive-old-sessions.py
-    try:
-        archive_script = (
-            _scripts_dir / "architecture" / "01-sync-system" / "session-management" / "archive-old-sessions.py"
-        )
-        if archive_script.exists():
-            _arch_ok = False
-            for _attempt in range(1, 4):
-                try:
-                    _r = subprocess.run([sys.executable, str(archive_script)], timeout=10, capture_output=True)
-                    if _r.returncode == 0:
-                        _arch_ok = True
-                        break
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] archive-old-sessions failed, retrying...")
-                except Exception:
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] archive-old-sessions error, retrying...")
-            if _arch_ok:
-                log_s("[SESSION-ARCHIVE] Old sessions archived")
-            else:
-                log_s("[POLICY-WARN] archive-old-sessions failed after 3 retries")
-    except Exception as e:
-        log_s("[SESSION-ARCHIVE] Skipped: " + str(e))
-
-    # 2b. Session log pruning - prune old sessions (30-day max, keep 10)
-    # Architecture: 01-sync-system/session-pruner.py
+    ctx = StopContext()
+    task_results = {}
     try:
-        pruner_script = _scripts_dir / "architecture" / "01-sync-system" / "session-pruner.py"
-        if pruner_script.exists():
-            _prune_ok = False
-            for _attempt in range(1, 4):
-                try:
-                    _r = subprocess.run(
-                        [sys.executable, str(pruner_script), "--max-age", "30", "--keep-min", "10"],
-                        timeout=15,
-                        capture_output=True,
-                    )
-                    if _r.returncode == 0:
-                        _prune_ok = True
-                        break
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] session-pruner failed, retrying...")
-                except Exception:
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] session-pruner error, retrying...")
-            if _prune_ok:
-                log_s("[SESSION-PRUNE] Old session logs pruned")
-            else:
-                log_s("[POLICY-WARN] session-pruner failed after 3 retries")
+        task_results = StopTaskRunner(default_tasks()).run(ctx)
     except Exception as e:
-        log_s("[SESSION-PRUNE] Skipped: " + str(e))
-
-    # 3. Failure detection analysis - learn from errors (3 retries)
-    # Architecture: 03-execution-system/failure-prevention/common-failures-prevention.py --analyze
-    try:
-        failure_script = (
-            _scripts_dir
-            / "architecture"
-            / "03-execution-system"
-            / "failure-prevention"
-            / "common-failures-prevention.py"
-        )
-        if failure_script.exists():
-            _fail_ok = False
-            for _attempt in range(1, 4):
-                try:
-                    _r = subprocess.run(
-                        [sys.executable, str(failure_script), "--analyze"], timeout=10, capture_output=True
-                    )
-                    if _r.returncode == 0:
-                        _fail_ok = True
-                        break
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] failure-detector failed, retrying...")
-                except Exception:
-                    if _attempt < 3:
-                        log_s("[RETRY " + str(_attempt) + "/3] failure-detector error, retrying...")
-            if _fail_ok:
-                log_s("[FAILURE-DETECT] Failure patterns analyzed")
-            else:
-                log_s("[POLICY-WARN] failure-detector failed after 3 retries")
-    except Exception as e:
-        log_s("[FAILURE-DETECT] Skipped: " + str(e))
-
-    # 4. Preference auto-detection - learn user preferences from session
-    # Architecture: 01-sync-system/user-preferences/preference-auto-tracker.py
-    try:
-        pref_script = (
-            _scripts_dir / "architecture" / "01-sync-system" / "user-preferences" / "preference-auto-tracker.py"
-        )
-        if pref_script.exists():
-            _r = subprocess.run([sys.executable, str(pref_script)], timeout=10, capture_output=True)
-            if _r.returncode == 0:
-                log_s("[PREFERENCES] Auto-detected from session")
-            else:
-                log_s("[PREFERENCES] Detection skipped (no new patterns)")
-    except Exception:
-        pass
-
-    # 4. Archive plan file to session folder (if plan mode was used this session)
-    # Policy: 03-execution-system/02-plan-mode/auto-plan-mode-suggestion-policy.md (v2.0)
-    # Script: 03-execution-system/02-plan-mode/plan-session-archiver.py
-    try:
-        plan_archiver_script = (
-            _scripts_dir / "architecture" / "03-execution-system" / "02-plan-mode" / "plan-session-archiver.py"
-        )
-        if plan_archiver_script.exists():
-            _plan_session_id = get_current_session_id()
-            if _plan_session_id:
-                _plan_ok = False
-                for _attempt in range(1, 4):
-                    try:
-                        _r = subprocess.run(
-                            [sys.executable, str(plan_archiver_script), "--archive", _plan_session_id],
-                            timeout=10,
-                            capture_output=True,
-                        )
-                        if _r.returncode == 0:
-                            _plan_ok = True
-                            break
-                        if _attempt < 3:
-                            log_s("[RETRY " + str(_attempt) + "/3] plan-session-archiver failed, retrying...")
-                    except Exception:
-                        if _attempt < 3:
-                            log_s("[RETRY " + str(_attempt) + "/3] plan-session-archiver error, retrying...")
-                if _plan_ok:
-                    log_s("[PLAN-ARCHIVE] Plan checked/archived for session: " + _plan_session_id)
-                else:
-                    log_s("[POLICY-WARN] plan-session-archiver failed after 3 retries")
-    except Exception as e:
-        log_s("[PLAN-ARCHIVE] Skipped: " + str(e))
+        log_s("[STOP-TASKS] Runner error: " + str(e))
+    git = ctx.git
 
     spoke_something = False
 
@@ -308,6 +134,7 @@ def main():
 
             pr_merged = github_pr_workflow.run_pr_workflow()
             pr_triggered = True
+            git.invalidate()
         except Exception as e:
             log_s(f"[PR-WORKFLOW] Error: {e}")
 
@@ -336,10 +163,7 @@ def main():
     if not pr_triggered and (FLAG_DIR / ".pr-workflow-retry").exists():
         try:
             # Check if still on a feature branch - if on main, clean up stale flag
-            _retry_branch = subprocess.run(
-                ["git", "branch", "--show-current"], capture_output=True, text=True, timeout=5
-            )
-            _retry_current = _retry_branch.stdout.strip() if _retry_branch.returncode == 0 else ""
+            _retry_current = git.branch
             if _retry_current in ("main", "master", ""):
                 # On main/master - PR was already merged or branch deleted, clean up flag
                 (FLAG_DIR / ".pr-workflow-retry").unlink(missing_ok=True)
@@ -351,6 +175,7 @@ def main():
                 import github_pr_workflow
 
                 pr_merged = github_pr_workflow.run_pr_workflow()
+                git.invalidate()
                 if pr_merged:
                     (FLAG_DIR / ".pr-workflow-retry").unlink(missing_ok=True)
                     log_s("[PR-WORKFLOW] Retry succeeded - PR merged")
@@ -364,10 +189,7 @@ def main():
     # Also ensures version bump + PR workflow runs even for manual PR creation
     if not pr_triggered:
         try:
-            branch_result = subprocess.run(
-                ["git", "branch", "--show-current"], capture_output=True, text=True, timeout=5
-            )
-            current_branch = branch_result.stdout.strip() if branch_result.returncode == 0 else ""
+            current_branch = git.branch
 
             if current_branch and current_branch not in ("main", "master"):
                 # On a feature branch - check if work is done
@@ -409,20 +231,11 @@ def main():
                 # This prevents shipping mid-work when Claude is still coding
                 if not should_trigger:
                     try:
-                        ahead_result = subprocess.run(
-                            ["git", "rev-list", "--count", f"main..{current_branch}"],
-                            capture_output=True,
-                            text=True,
-                            timeout=5,
-                        )
-                        commits_ahead = int(ahead_result.stdout.strip()) if ahead_result.returncode == 0 else 0
+                        commits_ahead = git.commits_ahead
 
                         if commits_ahead > 0:
                             # Also check: working tree must be clean (no uncommitted changes)
-                            status_result = subprocess.run(
-                                ["git", "status", "--porcelain"], capture_output=True, text=True, timeout=5
-                            )
-                            working_tree_clean = not status_result.stdout.strip()
+                            working_tree_clean = git.is_clean
 
                             if working_tree_clean:
                                 # Debounce: write "ready" timestamp, only ship if 60s old
@@ -471,6 +284,7 @@ def main():
                     import github_pr_workflow
 
                     github_pr_workflow.run_pr_workflow()
+                    git.invalidate()
         except Exception as e:
             log_s(f"[PR-WORKFLOW] Branch detection error: {e}")
 
@@ -478,14 +292,20 @@ def main():
         log_s("[OK] Stop hook fired | No voice flags found (normal, most stops are silent)")
 
     # Post-implementation steps 11-14 (close issue, update docs, generate summary)
-    _run_post_implementation_steps()
+    _run_post_implementation_steps(git)
 
     # Auto-create PR from pipeline data (non-blocking)
-    _create_pr_from_pipeline_data()
+    _create_pr_from_pipeline_data(git)
 
     try:
         _dur_stop = int((datetime.now() - _HOOK_START).total_seconds() * 1000)
-        emit_hook_execution("stop-notifier.py", _dur_stop, session_id="", exit_code=0, extra={"spoke": spoke_something})
+        emit_hook_execution(
+            "stop-notifier.py",
+            _dur_stop,
+            session_id="",
+            exit_code=0,
+            extra={"spoke": spoke_something, "tasks": {n: r["status"] for n, r in task_results.items()}},
+        )
     except Exception:
         pass
 
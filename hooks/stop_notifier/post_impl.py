@@ -42,29 +42,39 @@ def _find_latest_session_dir():
         return None
 
 
-def _create_pr_from_pipeline_data():
+def _create_pr_from_pipeline_data(git=None):
     """Auto-create PR using pipeline Step 7 prompt data and Step 0 classification.
 
     Reads session folder for pipeline outputs and creates a GitHub PR
     if commits are detected ahead of main on the current feature branch.
     Wrapped in try/except so it never crashes the stop hook.
+
+    Args:
+        git: Optional tasks.GitSnapshot; when given its cached branch and
+             commit count are used instead of spawning git again.
     """
 
     try:
         # 1. Check if we are on a feature branch with commits ahead of main
-        branch_result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True, text=True, timeout=10
-        )
-        current_branch = branch_result.stdout.strip()
+        if git is not None:
+            current_branch = git.branch
+        else:
+            branch_result = subprocess.run(
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True, text=True, timeout=10
+            )
+            current_branch = branch_result.stdout.strip()
 
         if current_branch in ("main", "master", "HEAD", ""):
             return  # Not on a feature branch
 
         # Check commits ahead
-        ahead_result = subprocess.run(
-            ["git", "rev-list", "--count", "main..HEAD"], capture_output=True, text=True, timeout=10
-        )
-        commits_ahead = int(ahead_result.stdout.strip() or "0")
+        if git is not None:
+            commits_ahead = git.commits_ahead
+        else:
+            ahead_result = subprocess.run(
+                ["git", "rev-list", "--count", "main..HEAD"], capture_output=True, text=True, timeout=10
+            )
+            commits_ahead = int(ahead_result.stdout.strip() or "0")
 
         if commits_ahead == 0:
             return  # No new commits
@@ -195,28 +205,37 @@ def _create_pr_from_pipeline_data():
 # =============================================================================
 
 
-def _run_post_implementation_steps():
+def _run_post_implementation_steps(git=None):
     """Run Steps 11-14 automatically after Claude finishes implementation.
 
     In hook mode, Steps 0-9 run in the pipeline before Claude works.
     Steps 10+ are Claude's implementation. When Claude stops and we
     detect commits on a feature branch, we run the remaining steps.
+
+    Args:
+        git: Optional tasks.GitSnapshot shared with the Stop hook.
     """
 
     try:
         # Check if on feature branch with commits
-        branch_result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True, text=True, timeout=10
-        )
-        current_branch = branch_result.stdout.strip()
+        if git is not None:
+            current_branch = git.branch
+        else:
+            branch_result = subprocess.run(
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True, text=True, timeout=10
+            )
+            current_branch = branch_result.stdout.strip()
 
         if current_branch in ("main", "master", "HEAD", ""):
             return
 
-        ahead_result = subprocess.run(
-            ["git", "rev-list", "--count", "main..HEAD"], capture_output=True, text=True, timeout=10
-        )
-        commits_ahead = int(ahead_result.stdout.strip() or "0")
+        if git is not None:
+            commits_ahead = git.commits_ahead
+        else:
+            ahead_result = subprocess.run(
+                ["git", "rev-list", "--count", "main..HEAD"], capture_output=True, text=True, timeout=10
+            )
+            commits_ahead = int(ahead_result.stdout.strip() or "0")
 
         if commits_ahead == 0:
             return
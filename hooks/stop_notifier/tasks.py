@@ -0,0 +1,472 @@
+"""stop_notifier/tasks.py - Concurrent task runner for the Stop hook.
+
+The Stop hook used to run its end-of-session jobs one after another, each in
+a fresh interpreter with up to three retries, so its wall time was the sum
+of every launch.  Each job is now a StopTask: a callable with declared
+dependencies.  StopTaskRunner starts every task whose dependencies have
+finished on its own daemon thread, all under one time budget, so the hook
+waits roughly as long as its slowest required chain.  Deferrable tasks are
+handed to one detached worker (python -m stop_notifier.tasks) and do not
+delay the hook at all.
+
+Architecture scripts run as subprocesses, each under its own timeout, so
+concurrent tasks never share sys.argv or stdout and a timed-out script is
+killed rather than left running.  Tasks marked must_finish (the auto-commit
+job: it mutates git) are not abandoned at the budget: the runner keeps
+waiting for them until retries x timeout (plus a short kill grace) after
+they started, then reports them as timed out like any other task.
+
+Git state the hook needs (branch, commits ahead, clean tree) comes from one
+GitSnapshot, read once after the auto-commit job.
+
+Windows-safe: ASCII only.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from .helpers import log_s
+
+ARCH_DIR = Path(__file__).resolve().parent.parent.parent / "scripts" / "architecture"
+_HOOKS_DIR = Path(__file__).resolve().parent.parent
+
+# Seconds the hook waits for required tasks; the rest is reported as timeout.
+# Above the auto-commit script's single 60s attempt, so it normally fits.
+STOP_HOOK_BUDGET_S = float(os.environ.get("STOP_HOOK_BUDGET_S", "90"))
+# Extra seconds a must_finish task gets past retries x timeout, for the
+# timed-out script to be killed and reaped.
+MUST_FINISH_GRACE_S = 5.0
+# Budget of the detached worker that runs deferred tasks.
+DEFERRED_BUDGET_S = float(os.environ.get("STOP_HOOK_DEFERRED_BUDGET_S", "120"))
+
+
+# =============================================================================
+# SHARED GIT SNAPSHOT
+# =============================================================================
+
+
+class GitSnapshot:
+    """Branch, commits ahead of *base* and clean-tree state, each read once.
+
+    Values are computed on first access and shared by every task and by the
+    PR checks in core.main().  Call invalidate() after anything that moves
+    HEAD (the PR workflow may merge and switch branches).
+    """
+
+    def __init__(self, cwd=None, base="main"):
+        self.cwd = cwd
+        self.base = base
+        self.git_calls = 0
+        self._values = {}
+        self._lock = threading.RLock()
+
+    def _git(self, *args):
+        self.git_calls += 1
+        try:
+            result = subprocess.run(["git", *args], cwd=self.cwd, capture_output=True, text=True, timeout=5)
+        except Exception:
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def _get(self, key, compute):
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = compute()
+            return self._values[key]
+
+    @property
+    def branch(self):
+        """Current branch name, or "" when detached / not a repo."""
+        return self._get("branch", lambda: self._git("branch", "--show-current") or "")
+
+    @property
+    def commits_ahead(self):
+        """Commits on HEAD that are not on the base branch."""
+
+        def _count():
+            if not self.branch:
+                return 0
+            out = self._git("rev-list", "--count", "%s..HEAD" % self.base)
+            try:
+                return int(out) if out else 0
+            except ValueError:
+                return 0
+
+        return self._get("ahead", _count)
+
+    @property
+    def is_clean(self):
+        """True when git status --porcelain reports nothing."""
+        return self._get("clean", lambda: not (self._git("status", "--porcelain") or ""))
+
+    def prefetch(self):
+        """Read every value now (run as a task, in parallel with the others)."""
+        self.commits_ahead  # noqa: B018 - reads branch too
+        self.is_clean  # noqa: B018
+        return True
+
+    def invalidate(self):
+        with self._lock:
+            self._values.clear()
+
+
+# =============================================================================
+# TASKS
+# =============================================================================
+
+
+class StopContext:
+    """Per-invocation inputs shared by all tasks."""
+
+    def __init__(self, project_name=None, session_id=None, git=None):
+        self.project_name = project_name or Path.cwd().name
+        self._session_id = session_id
+        self.git = git or GitSnapshot()
+
+    @property
+    def session_id(self):
+        if self._session_id is None:
+            from .voice import get_current_session_id
+
+            self._session_id = get_current_session_id() or ""
+        return self._session_id
+
+
+class StopTask:
+    """One end-of-session job.
+
+    Args:
+        name: Unique task name (also used in log lines and on the worker CLI).
+        func: Callable(ctx) -> bool, True on success.  Exceptions count as
+              a failed attempt.
+        deps: Names of tasks that must finish (in any state) first.  A
+              dependency that is not scheduled in this run is ignored.
+        retries: Attempts before giving up.
+        deferrable: May run in the detached worker instead of the hook.
+        must_finish: Not abandoned when the runner's budget runs out (tasks
+                  that mutate git); waited for up to retries x timeout
+                  instead.  Requires *timeout*.
+        timeout: Seconds one attempt may take (enforced by *func*, e.g.
+                  run_script); None when unbounded.
+        when: Optional callable(ctx) -> bool; False skips the task.
+        ok_msg / fail_msg: Log lines, formatted with project and session_id.
+                  fail_msg defaults to the POLICY-WARN line; "" logs nothing.
+        label: Name used in log lines (defaults to *name*).
+    """
+
+    def __init__(
+        self,
+        name,
+        func,
+        deps=(),
+        retries=3,
+        deferrable=False,
+        must_finish=False,
+        timeout=None,
+        when=None,
+        ok_msg="",
+        fail_msg=None,
+        label=None,
+    ):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.retries = max(1, retries)
+        self.deferrable = deferrable
+        if must_finish and timeout is None:
+            raise ValueError("must_finish stop task %s needs a timeout" % name)
+        self.must_finish = must_finish
+        self.timeout = timeout
+        self.when = when
+        self.ok_msg = ok_msg
+        if fail_msg is None:
+            fail_msg = "[POLICY-WARN] %s failed after %d retries" % (label or name, self.retries)
+        self.fail_msg = fail_msg
+        self.label = label or name
+
+    def execute(self, ctx):
+        """Run with retries; returns a result dict (never raises)."""
+        started = time.monotonic()
+        result = {"status": "failed", "attempts": 0, "error": ""}
+        try:
+            if self.when is not None and not self.when(ctx):
+                result["status"] = "skipped"
+                return result
+        except Exception as e:
+            result["status"], result["error"] = "skipped", str(e)
+            return result
+
+        for attempt in range(1, self.retries + 1):
+            result["attempts"] = attempt
+            try:
+                if self.func(ctx):
+                    result["status"] = "ok"
+                    break
+                outcome = "failed"
+            except Exception as e:
+                result["error"] = str(e)
+                outcome = "error"
+            if attempt < self.retries:
+                log_s("[RETRY %d/%d] %s %s, retrying..." % (attempt, self.retries, self.label, outcome))
+
+        msg = self.ok_msg if result["status"] == "ok" else self.fail_msg
+        if msg:
+            session_id = ctx.session_id if "{session_id}" in msg else ""
+            log_s(msg.format(project=ctx.project_name, session_id=session_id))
+        result["duration_s"] = round(time.monotonic() - started, 3)
+        return result
+
+
+# =============================================================================
+# SCRIPT JOBS
+# =============================================================================
+
+
+def run_script(path, args=(), timeout=10):
+    """Run an architecture script in a subprocess; True when it exits 0.
+
+    Output is captured and discarded.  A script still running after
+    *timeout* seconds is killed and subprocess.TimeoutExpired propagates
+    (StopTask counts it as a failed attempt).
+    """
+    result = subprocess.run([sys.executable, str(path)] + list(args), timeout=timeout, capture_output=True)
+    return result.returncode == 0
+
+
+def script_task(name, relpath, args=(), timeout=10, **kwargs):
+    """StopTask running scripts/architecture/<relpath>; skipped when absent.
+
+    *args* is a list, or a callable(ctx) returning one.
+    """
+    path = ARCH_DIR / relpath
+    when = kwargs.pop("when", None)
+
+    def _when(ctx):
+        return path.exists() and (when is None or when(ctx))
+
+    def _run(ctx):
+        return run_script(path, args(ctx) if callable(args) else args, timeout=timeout)
+
+    return StopTask(name, _run, when=_when, timeout=timeout, **kwargs)
+
+
+def default_tasks():
+    """The Stop hook's end-of-session jobs and their ordering constraints."""
+    return [
+        # Commit first: every git read below must see its result.
+        script_task(
+            "auto-commit",
+            "03-execution-system/09-git-commit/git-auto-commit-policy.py",
+            ["--enforce"],
+            timeout=60,
+            retries=1,  # 3 x 60s would outlast STOP_HOOK_BUDGET_S
+            must_finish=True,
+            label="auto-commit-enforcer",
+        ),
+        StopTask("git-snapshot", lambda ctx: ctx.git.prefetch(), deps=("auto-commit",), retries=1, fail_msg=""),
+        script_task(
+            "auto-save-session",
+            "01-sync-system/session-management/auto-save-session.py",
+            lambda ctx: ["--project", ctx.project_name],
+            ok_msg="[SESSION-SAVE] Auto-saved session for: {project}",
+        ),
+        # Archive / prune only after the current session has been saved.
+        script_task(
+            "archive-old-sessions",
+            "01-sync-system/session-management/archive-old-sessions.py",
+            deps=("auto-save-session",),
+            deferrable=True,
+            ok_msg="[SESSION-ARCHIVE] Old sessions archived",
+        ),
+        script_task(
+            "session-pruner",
+            "01-sync-system/session-pruner.py",
+            ["--max-age", "30", "--keep-min", "10"],
+            timeout=15,
+            deps=("auto-save-session",),
+            deferrable=True,
+            ok_msg="[SESSION-PRUNE] Old session logs pruned",
+        ),
+        script_task(
+            "failure-detector",
+            "03-execution-system/failure-prevention/common-failures-prevention.py",
+            ["--analyze"],
+            deferrable=True,
+            ok_msg="[FAILURE-DETECT] Failure patterns analyzed",
+        ),
+        script_task(
+            "preference-auto-tracker",
+            "01-sync-system/user-preferences/preference-auto-tracker.py",
+            retries=1,
+            deferrable=True,
+            ok_msg="[PREFERENCES] Auto-detected from session",
+            fail_msg="[PREFERENCES] Detection skipped (no new patterns)",
+        ),
+        script_task(
+            "plan-session-archiver",
+            "03-execution-system/02-plan-mode/plan-session-archiver.py",
+            lambda ctx: ["--archive", ctx.session_id],
+            when=lambda ctx: bool(ctx.session_id),
+            deferrable=True,
+            ok_msg="[PLAN-ARCHIVE] Plan checked/archived for session: {session_id}",
+        ),
+    ]
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+
+class StopTaskRunner:
+    """Run StopTasks concurrently in dependency order under a time budget."""
+
+    def __init__(self, tasks, budget_s=None):
+        self.tasks = {}
+        for task in tasks:
+            if task.name in self.tasks:
+                raise ValueError("duplicate stop task: %s" % task.name)
+            self.tasks[task.name] = task
+        self.budget_s = STOP_HOOK_BUDGET_S if budget_s is None else budget_s
+        self._check_acyclic()
+
+    def _check_acyclic(self):
+        state = {}
+
+        def visit(name, chain):
+            if state.get(name) == 1:
+                raise ValueError("stop task dependency cycle: %s" % " -> ".join(chain + [name]))
+            if state.get(name) == 2 or name not in self.tasks:
+                return
+            state[name] = 1
+            for dep in self.tasks[name].deps:
+                visit(dep, chain + [name])
+            state[name] = 2
+
+        for name in self.tasks:
+            visit(name, [])
+
+    def run(self, ctx, defer=True, spawn=None):
+        """Run all tasks; returns {name: result dict}.
+
+        With defer=True, deferrable tasks are passed to *spawn* (default
+        spawn_deferred_worker) after the required ones finish and are
+        reported as "deferred".
+        """
+        deferred = [n for n, t in self.tasks.items() if defer and t.deferrable]
+        pending = {n: t for n, t in self.tasks.items() if n not in deferred}
+        results = {}
+        running = set()
+        started = {}
+        cond = threading.Condition()
+        deadline = time.monotonic() + self.budget_s
+
+        def _worker(task):
+            outcome = task.execute(ctx)
+            with cond:
+                results[task.name] = outcome
+                running.discard(task.name)
+                cond.notify_all()
+
+        with cond:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    for name, task in list(pending.items()):
+                        if any(dep in pending or dep in running for dep in task.deps):
+                            continue
+                        del pending[name]
+                        running.add(name)
+                        started[name] = time.monotonic()
+                        threading.Thread(target=_worker, args=(task,), name="stop-task-" + name, daemon=True).start()
+                if not pending and not running:
+                    break
+                # Out of budget: start nothing new, but give a task that is
+                # mid-way through changing git state its own bounded time
+                hard_deadline = max(
+                    [
+                        started[n] + self.tasks[n].retries * self.tasks[n].timeout + MUST_FINISH_GRACE_S
+                        for n in running
+                        if self.tasks[n].must_finish
+                    ],
+                    default=0,
+                )
+                hard_remaining = hard_deadline - time.monotonic()
+                if remaining > 0:
+                    cond.wait(remaining)
+                elif hard_remaining > 0:
+                    cond.wait(hard_remaining)
+                else:
+                    abandoned = sorted(running | set(pending))
+                    for name in abandoned:
+                        results[name] = {"status": "timeout", "attempts": 0, "error": "stop hook budget exhausted"}
+                    log_s("[STOP-TASKS] Budget %.0fs exhausted; abandoned: %s" % (self.budget_s, abandoned))
+                    break
+            results = dict(results)
+
+        if deferred:
+            pid = (spawn or spawn_deferred_worker)(deferred, ctx)
+            for name in deferred:
+                results[name] = {"status": "deferred", "attempts": 0, "error": "", "worker_pid": pid}
+        return results
+
+
+def spawn_deferred_worker(names, ctx):
+    """Start a detached `python -m stop_notifier.tasks` for *names*; returns its PID."""
+    cmd = [
+        sys.executable,
+        "-m",
+        "stop_notifier.tasks",
+        "--run",
+        ",".join(names),
+        "--project",
+        ctx.project_name,
+        "--session-id",
+        ctx.session_id,
+    ]
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(_HOOKS_DIR), env.get("PYTHONPATH")) if p)
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NO_WINDOW
+    else:
+        kwargs["start_new_session"] = True
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+    except Exception as e:
+        log_s("[STOP-TASKS] Could not start deferred worker: %s" % e)
+        return None
+    log_s("[STOP-TASKS] Deferred to worker %d: %s" % (proc.pid, ", ".join(names)))
+    return proc.pid
+
+
+def _worker_main(argv=None):
+    parser = argparse.ArgumentParser(description="Run deferred Stop-hook tasks.")
+    parser.add_argument("--run", required=True, help="comma-separated task names")
+    parser.add_argument("--project", default=None)
+    parser.add_argument("--session-id", default=None)
+    opts = parser.parse_args(argv)
+
+    wanted = set(opts.run.split(","))
+    tasks = [t for t in default_tasks() if t.name in wanted]
+    ctx = StopContext(project_name=opts.project, session_id=opts.session_id or None)
+    results = StopTaskRunner(tasks, budget_s=DEFERRED_BUDGET_S).run(ctx, defer=False)
+    log_s("[STOP-TASKS] Deferred worker done: %s" % {n: r["status"] for n, r in sorted(results.items())})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_worker_main())
@@ -16,19 +16,35 @@ All existing policy scripts continue to work unchanged via PolicyNodeAdapter.
 
 __version__ = "1.19.1"
 
-from .backup_manager import BackupManager, create_backup_manager
-from .checkpoint_manager import CheckpointManager, create_checkpoint_manager
-from .error_logger import ErrorLogger, create_logger
-from .flow_state import FlowState
-from .hooks_decorator import with_hooks
-from .metrics_collector import MetricsCollector, create_metrics_collector
-from .orchestrator import create_flow_graph
-from .policy_node_adapter import PolicyNodeAdapter
-from .recovery_handler import RecoveryHandler, resume_from_checkpoint
+# Public names -> defining submodule.  Nothing below is imported until first
+# attribute access (PEP 562), so ``import langgraph_engine.core.config_loader``
+# or ``3-level-flow.py --help`` does not pull in the orchestrator, loguru and
+# the GitHub stack.  Run ``python -m langgraph_engine.core.import_profiler``
+# to see what a given entry point actually imports.
+_LAZY_ATTRS = {
+    "BackupManager": "backup_manager",
+    "create_backup_manager": "backup_manager",
+    "CheckpointManager": "checkpoint_manager",
+    "create_checkpoint_manager": "checkpoint_manager",
+    "ErrorLogger": "error_logger",
+    "create_logger": "error_logger",
+    "FlowState": "flow_state",
+    "with_hooks": "hooks_decorator",
+    "MetricsCollector": "metrics_collector",
+    "create_metrics_collector": "metrics_collector",
+    "create_flow_graph": "orchestrator",
+    "release_flow_graph": "orchestrator",
+    "warm_flow_graphs": "orchestrator",
+    "PolicyNodeAdapter": "policy_node_adapter",
+    "RecoveryHandler": "recovery_handler",
+    "resume_from_checkpoint": "recovery_handler",
+}
 
 __all__ = [
     "FlowState",
     "create_flow_graph",
+    "release_flow_graph",
+    "warm_flow_graphs",
     "PolicyNodeAdapter",
     "with_hooks",
     "CheckpointManager",
@@ -55,10 +71,19 @@ _LAZY_SUBMODULES = frozenset({"github_mcp", "github_operation_router", "runtime_
 
 
 def __getattr__(name: str):  # noqa: ANN201
-    if name in _LAZY_SUBMODULES:
-        import importlib
+    import importlib
 
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f"langgraph_engine.{_LAZY_ATTRS[name]}")
+        value = getattr(module, name)
+        globals()[name] = value  # cache so next getattr is a normal dict lookup
+        return value
+    if name in _LAZY_SUBMODULES:
         module = importlib.import_module(f"langgraph_engine.{name}")
-        globals()[name] = module  # cache so next getattr is a normal dict lookup
+        globals()[name] = module
         return module
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():  # noqa: ANN201
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _LAZY_SUBMODULES)
@@ -6,34 +6,102 @@ Provides safe backup/restore functionality with:
 - Automatic rollback on failure
 - Diff generation
 - Transaction-like semantics
+
+Storage layout (per session, under <backup_base_dir>/sessions/<id>/backup):
+
+    blobs/<sha256[:2]>/<sha256>[.gz]   content-addressed file contents
+    backup_log.jsonl                   append-only metadata log
+    diffs/                             generated unified diffs
+
+Backups are deduplicated by SHA-256: backing up content that is already
+stored writes nothing but one log line.  The (mtime_ns, size) of every file
+backed up is remembered, so re-backing-up an unchanged file does not even
+read it.  New blobs are cloned with a copy-on-write reflink where the
+filesystem supports it (Linux FICLONE), otherwise copied, or gzip-compressed
+when compress=True.  A new blob is named by the hash of the bytes actually
+stored, so a file rewritten while it is being backed up can never end up
+under another content's name.  Source files are never hardlinked: callers
+edit them in place, which would silently rewrite the backup.
+
+Sessions written by older versions (full copies + backup_metadata.json)
+are still read; new entries go to the log.
 """
 
 import difflib
+import gzip
+import hashlib
 import json
+import os
+import shutil
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+_HASH_CHUNK = 1024 * 1024
+
+# Files modified less than this long ago are rehashed instead of trusted by
+# (mtime, size) - the "racy clean" rule git uses for its index.
+_RACY_WINDOW_NS = 2 * 10**9
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)); used for copy-on-write clones.
+_FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone *src* to *dst* copy-on-write.  Returns False when unsupported."""
+    try:
+        import fcntl
+    except ImportError:
+        return False  # Windows
+    try:
+        with open(src, "rb") as fin, open(dst, "wb") as fout:
+            fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+        return True
+    except OSError:
+        try:
+            dst.unlink()
+        except OSError:
+            pass
+        return False
+
 
 class BackupManager:
     """Manages file backups and rollback operations."""
 
-    def __init__(self, session_id: str, backup_base_dir: str = "~/.claude/logs"):
+    def __init__(self, session_id: str, backup_base_dir: str = "~/.claude/logs", compress: bool = False):
         """
         Initialize backup manager for a session.
 
         Args:
             session_id: Unique session identifier
             backup_base_dir: Base directory for backups
+            compress: Store new blobs gzip-compressed (disables reflinks)
         """
         self.session_id = session_id
+        self.compress = compress
         self.backup_dir = Path(backup_base_dir).expanduser() / "sessions" / session_id / "backup"
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
         self.diff_dir = self.backup_dir / "diffs"
         self.diff_dir.mkdir(parents=True, exist_ok=True)
 
-        self.metadata_file = self.backup_dir / "backup_metadata.json"
+        self.blob_dir = self.backup_dir / "blobs"
+        self.metadata_file = self.backup_dir / "backup_metadata.json"  # legacy snapshot (read-only)
+        self.log_file = self.backup_dir / "backup_log.jsonl"
+
+        self._lock = threading.Lock()
+        # original_path -> [mtime_ns, size, sha256] of the last content hashed
+        self._stat_cache: Dict[str, list] = {}
+        self.stats = {
+            "backups": 0,
+            "dedup_hits": 0,
+            "stat_hits": 0,
+            "bytes_hashed": 0,
+            "bytes_written": 0,
+            "reflinks": 0,
+        }
         self.metadata = self._load_metadata()
 
     def backup_file(self, file_path: str, step: str, description: str = "") -> bool:
@@ -55,28 +123,36 @@ class BackupManager:
             return False
 
         try:
-            # Generate backup filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_name = file_path.name.replace(".", f"_{timestamp}.")
-            backup_file = self.backup_dir / f"{step}_{safe_name}"
-
-            # Create backup
-            backup_file.write_bytes(file_path.read_bytes())
-
-            # Track in metadata
-            entry = {
-                "timestamp": datetime.now().isoformat(),
-                "original_path": str(file_path),
-                "backup_path": str(backup_file),
-                "step": step,
-                "description": description,
-                "file_size": file_path.stat().st_size,
-            }
-
-            self.metadata["backups"].append(entry)
-            self._save_metadata()
-
-            print(f"[OK] Backup created: {file_path} -> {backup_file}")
+            st = file_path.stat()
+            digest = self._file_digest(file_path, st)
+            blob, created, stored, size = self._store_blob(file_path, digest, st.st_size)
+
+            with self._lock:
+                if stored != digest:
+                    # Rewritten between the hash and the copy: the manifest
+                    # describes what was stored, and the stat is not trusted
+                    self._stat_cache.pop(str(file_path), None)
+                    digest = stored
+                entry = {
+                    "id": len(self.metadata["backups"]),
+                    "timestamp": datetime.now().isoformat(),
+                    "original_path": str(file_path),
+                    "backup_path": str(blob),
+                    "step": step,
+                    "description": description,
+                    "file_size": size,
+                    "sha256": digest,
+                    "compressed": blob.suffix == ".gz",
+                }
+                cached = self._stat_cache.get(str(file_path))
+                if cached and cached[2] == digest:
+                    entry["mtime_ns"] = cached[0]  # Lets a later session skip the read
+                self.metadata["backups"].append(entry)
+                self.stats["backups"] += 1
+                self._append_log(dict(entry, op="backup"))
+
+            state = "stored" if created else "deduplicated"
+            print(f"[OK] Backup created: {file_path} -> {blob.name[:12]} ({state})")
             return True
 
         except Exception as e:
@@ -97,30 +173,33 @@ class BackupManager:
         file_path = Path(file_path)
 
         try:
-            # Find backup for this file and step
-            backup_entries = [
-                b for b in self.metadata["backups"] if b["original_path"] == str(file_path) and b["step"] == step
-            ]
+            latest_backup = self._latest_backup(file_path, step)
 
-            if not backup_entries:
+            if latest_backup is None:
                 print(f"[WARN]  No backup found for {file_path} in step {step}")
                 return False
 
-            # Use most recent backup
-            latest_backup = max(backup_entries, key=lambda x: x["timestamp"])
             backup_file = Path(latest_backup["backup_path"])
 
             if not backup_file.exists():
                 print(f"[FAIL] Backup file not found: {backup_file}")
                 return False
 
-            # Restore file
-            file_path.write_bytes(backup_file.read_bytes())
+            # Restore file in place (keeps inode and permissions), streaming
+            with self._open_blob(latest_backup) as src, open(file_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, _HASH_CHUNK)
 
             # Update metadata
-            latest_backup["restored"] = True
-            latest_backup["restore_timestamp"] = datetime.now().isoformat()
-            self._save_metadata()
+            with self._lock:
+                latest_backup["restored"] = True
+                latest_backup["restore_timestamp"] = datetime.now().isoformat()
+                self._append_log(
+                    {
+                        "op": "restore",
+                        "id": latest_backup.get("id"),
+                        "restore_timestamp": latest_backup["restore_timestamp"],
+                    }
+                )
 
             print(f"[OK] Restored: {file_path} from {backup_file}")
             return True
@@ -145,38 +224,27 @@ class BackupManager:
 
         try:
             # Find backup for comparison
-            backup_entries = [
-                b for b in self.metadata["backups"] if b["original_path"] == str(file_path) and b["step"] == step
-            ]
+            latest_backup = self._latest_backup(file_path, step)
 
-            if not backup_entries:
+            if latest_backup is None:
                 print(f"[WARN]  No backup found for diff: {file_path}")
                 return None
 
-            latest_backup = max(backup_entries, key=lambda x: x["timestamp"])
-            backup_file = Path(latest_backup["backup_path"])
-
-            # Read both versions
-            try:
-                original_lines = backup_file.read_text(encoding="utf-8").splitlines(keepends=True)
-            except Exception:
-                original_lines = backup_file.read_bytes().decode("utf-8", errors="replace").splitlines(keepends=True)
-
-            try:
-                current_lines = file_path.read_text(encoding="utf-8").splitlines(keepends=True)
-            except Exception:
-                current_lines = file_path.read_bytes().decode("utf-8", errors="replace").splitlines(keepends=True)
-
-            # Generate unified diff
-            diff_lines = difflib.unified_diff(
-                original_lines,
-                current_lines,
-                fromfile=f"{file_path} (original)",
-                tofile=f"{file_path} (current)",
-                lineterm="",
-            )
-
-            diff_content = "\n".join(diff_lines)
+            if self._matches_backup(file_path, latest_backup):
+                diff_content = ""  # Unchanged: skip reading both versions
+            else:
+                original_lines = self._decode(self._read_blob(latest_backup)).splitlines(keepends=True)
+                current_lines = self._decode(file_path.read_bytes()).splitlines(keepends=True)
+
+                # Generate unified diff
+                diff_lines = difflib.unified_diff(
+                    original_lines,
+                    current_lines,
+                    fromfile=f"{file_path} (original)",
+                    tofile=f"{file_path} (current)",
+                    lineterm="",
+                )
+                diff_content = "\n".join(diff_lines)
 
             # Save diff file
             diff_label = label or file_path.stem
@@ -237,6 +305,8 @@ class BackupManager:
         """
         Get detailed comparison between original and current file.
 
+        Content identity is decided by SHA-256; the backup is not reread.
+
         Args:
             file_path: Path to file
             step: Step name
@@ -248,25 +318,32 @@ class BackupManager:
 
         try:
             # Find backup
-            backup_entries = [
-                b for b in self.metadata["backups"] if b["original_path"] == str(file_path) and b["step"] == step
-            ]
+            latest_backup = self._latest_backup(file_path, step)
 
-            if not backup_entries:
+            if latest_backup is None:
                 return {"error": "No backup found", "file": str(file_path)}
 
-            latest_backup = max(backup_entries, key=lambda x: x["timestamp"])
             backup_file = Path(latest_backup["backup_path"])
 
-            original_content = backup_file.read_bytes()
-            current_content = file_path.read_bytes()
+            if latest_backup.get("sha256"):
+                st = file_path.stat()
+                original_size = latest_backup["file_size"]
+                current_size = st.st_size
+                identical = original_size == current_size and (
+                    self._file_digest(file_path, st) == latest_backup["sha256"]
+                )
+            else:  # Legacy full-copy entry
+                original_content = backup_file.read_bytes()
+                current_content = file_path.read_bytes()
+                original_size, current_size = len(original_content), len(current_content)
+                identical = original_content == current_content
 
             return {
                 "file": str(file_path),
-                "original_size": len(original_content),
-                "current_size": len(current_content),
-                "size_changed": len(original_content) != len(current_content),
-                "content_identical": original_content == current_content,
+                "original_size": original_size,
+                "current_size": current_size,
+                "size_changed": original_size != current_size,
+                "content_identical": identical,
                 "backup_path": str(backup_file),
             }
 
@@ -292,22 +369,173 @@ class BackupManager:
 
     # ========== Private methods ==========
 
+    def _latest_backup(self, file_path: Path, step: str) -> Optional[Dict]:
+        """Most recent backup entry of *file_path* for *step* (log order)."""
+        for entry in reversed(self.metadata["backups"]):
+            if entry["original_path"] == str(file_path) and entry["step"] == step:
+                return entry
+        return None
+
+    def _file_digest(self, file_path: Path, st: os.stat_result) -> str:
+        """SHA-256 of *file_path*, skipping the read when its stat is unchanged."""
+        key = str(file_path)
+        cached = self._stat_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            self.stats["stat_hits"] += 1
+            return cached[2]
+
+        h = hashlib.sha256()
+        with open(file_path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+                h.update(chunk)
+        self.stats["bytes_hashed"] += st.st_size
+        digest = h.hexdigest()
+        # Filesystem timestamps are coarse: a same-size rewrite within the
+        # same tick keeps its mtime.  Only trust stats that have settled.
+        if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+            self._stat_cache[key] = [st.st_mtime_ns, st.st_size, digest]
+        else:
+            self._stat_cache.pop(key, None)
+        return digest
+
+    def _blob_path(self, digest: str, compressed: bool) -> Path:
+        return self.blob_dir / digest[:2] / (digest + (".gz" if compressed else ""))
+
+    def _existing_blob(self, digest: str) -> Optional[Path]:
+        for compressed in (False, True):
+            existing = self._blob_path(digest, compressed)
+            if existing.exists():
+                return existing
+        return None
+
+    def _store_blob(self, file_path: Path, digest: str, size: int):
+        """Store *file_path* unless blob *digest* is present.
+
+        *digest* (from _file_digest) only decides whether the content is
+        already stored.  A new blob is hashed from the bytes written - while
+        streaming them, or by reading back the reflinked clone - and named
+        by that hash.
+
+        Returns:
+            (blob path, created, sha256 of the stored content, its size)
+        """
+        existing = self._existing_blob(digest)
+        if existing is not None:
+            self.stats["dedup_hits"] += 1
+            return existing, False, digest, size
+
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.blob_dir / f"incoming.{os.getpid()}.{threading.get_ident()}.tmp"
+        h = hashlib.sha256()
+        size = 0
+        try:
+            if self.compress:
+                with open(file_path, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+                    for chunk in iter(lambda: src.read(_HASH_CHUNK), b""):
+                        h.update(chunk)
+                        dst.write(chunk)
+                        size += len(chunk)
+            else:
+                if _reflink(file_path, tmp):
+                    self.stats["reflinks"] += 1
+                    src_path, dst = tmp, None  # Hash the clone: it is what is stored
+                else:
+                    src_path, dst = file_path, open(tmp, "wb")
+                try:
+                    with open(src_path, "rb") as src:
+                        for chunk in iter(lambda: src.read(_HASH_CHUNK), b""):
+                            h.update(chunk)
+                            if dst is not None:
+                                dst.write(chunk)
+                            size += len(chunk)
+                finally:
+                    if dst is not None:
+                        dst.close()
+            self.stats["bytes_hashed"] += size
+            stored = h.hexdigest()
+
+            existing = self._existing_blob(stored) if stored != digest else None
+            if existing is not None:
+                self.stats["dedup_hits"] += 1
+                return existing, False, stored, size
+            blob = self._blob_path(stored, self.compress)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            self.stats["bytes_written"] += tmp.stat().st_size
+            os.replace(tmp, blob)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        return blob, True, stored, size
+
+    def _open_blob(self, entry: Dict):
+        path = Path(entry["backup_path"])
+        return gzip.open(path, "rb") if entry.get("compressed") else open(path, "rb")
+
+    def _read_blob(self, entry: Dict) -> bytes:
+        with self._open_blob(entry) as fh:
+            return fh.read()
+
+    def _matches_backup(self, file_path: Path, entry: Dict) -> bool:
+        """True when *file_path* still has the backed-up content (by hash)."""
+        if not entry.get("sha256") or not file_path.exists():
+            return False
+        st = file_path.stat()
+        return st.st_size == entry["file_size"] and self._file_digest(file_path, st) == entry["sha256"]
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            return data.decode("utf-8", errors="replace")
+
     def _load_metadata(self) -> Dict:
-        """Load or initialize metadata."""
+        """Load the legacy snapshot (if any) and replay the append-only log."""
+        metadata = {"session_id": self.session_id, "created": datetime.now().isoformat(), "backups": []}
         if self.metadata_file.exists():
             try:
-                return json.loads(self.metadata_file.read_text())
+                metadata = json.loads(self.metadata_file.read_text())
             except Exception:
                 pass
 
-        return {"session_id": self.session_id, "created": datetime.now().isoformat(), "backups": []}
-
-    def _save_metadata(self) -> None:
-        """Save metadata to file."""
+        backups = metadata["backups"]
+        for i, entry in enumerate(backups):
+            entry.setdefault("id", i)
+        by_id = {entry["id"]: entry for entry in backups}
+        if self.log_file.exists():
+            try:
+                with open(self.log_file, encoding="utf-8") as fh:
+                    for line in fh:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue  # Torn final line after a crash
+                        op = record.pop("op", None)
+                        if op == "backup":
+                            record["id"] = len(backups)
+                            backups.append(record)
+                            by_id[record["id"]] = record
+                            if record.get("sha256") and record.get("mtime_ns") is not None:
+                                self._stat_cache[record["original_path"]] = [
+                                    record["mtime_ns"],
+                                    record["file_size"],
+                                    record["sha256"],
+                                ]
+                        elif op == "restore" and record.get("id") in by_id:
+                            target = by_id[record["id"]]
+                            target["restored"] = True
+                            target["restore_timestamp"] = record.get("restore_timestamp")
+            except Exception as e:
+                print(f"[WARN]  Could not read backup log {self.log_file}: {e}")
+        return metadata
+
+    def _append_log(self, record: Dict) -> None:
+        """Append one record to the metadata log (caller holds the lock)."""
         try:
-            self.metadata_file.write_text(json.dumps(self.metadata, indent=2))
+            with open(self.log_file, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(record, separators=(",", ":")) + "\n")
         except Exception as e:
-            print(f"[FAIL] Failed to save backup metadata: {e}")
+            print(f"[FAIL] Failed to append backup metadata: {e}")
 
 
 # ============================================================================
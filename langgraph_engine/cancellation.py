@@ -0,0 +1,531 @@
+"""
+Cancellation - Cooperative cancellation tokens and a bounded timeout executor.
+
+patterns.with_timeout and timeout_wrapper.StepTimeout used to start a fresh
+daemon thread per call and abandon it on timeout, so a slow step kept
+running (and spawning processes) after the pipeline had moved on.  This
+module replaces that with:
+
+  CancellationToken  - set when a step's deadline passes.  Visible to the
+                       step and to the LLM / subprocess layers through
+                       current_token(); cancelling it kills every subprocess
+                       started through run_subprocess() under that token.
+  run_subprocess()   - drop-in for subprocess.run() that registers the child
+                       with the current token (its own process group on
+                       POSIX, so grandchildren die too).  Without an active
+                       token it is exactly subprocess.run().
+  TimeoutExecutor    - runs callables on a bounded, reusable worker pool
+                       with a per-call token.  A call's deadline starts
+                       when a worker picks it up, so time spent queued
+                       behind other calls never counts against it.  Work
+                       still running after cancellation is counted as
+                       leaked in ``stats``.
+
+Nested timeouts (a timed call made from a pool worker) and calls made
+while every worker is occupied by leaked work run inline on the caller's
+thread with a timer-driven token, so the pool can neither deadlock nor
+grow.  Inline calls have no hard deadline: the caller's thread cannot be
+abandoned, so the timer only cancels the token (killing run_subprocess()
+children) and pure-Python work that never checks the token runs to
+completion before the timeout is reported.
+
+Environment:
+  STEP_TIMEOUT_MAX_WORKERS  size of the shared worker pool (default: 8)
+
+ASCII-only (cp1252-safe for Windows).
+"""
+
+import contextlib
+import contextvars
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from .exceptions import StepCancelledError
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+_DEFAULT_MAX_WORKERS = int(os.getenv("STEP_TIMEOUT_MAX_WORKERS", "8"))
+
+# After cancelling, wait this long for the step to notice before counting
+# it as leaked.
+_CANCEL_GRACE_SECONDS = 0.2
+
+# How often a caller whose call is still queued re-checks whether the pool
+# has been saturated by leaked work (and the call should run inline).
+_QUEUE_POLL_SECONDS = 0.5
+
+# SIGTERM -> SIGKILL escalation delay for cancelled subprocesses.
+_KILL_GRACE_SECONDS = 1.0
+
+_current_token: contextvars.ContextVar = contextvars.ContextVar("langgraph_cancel_token", default=None)
+
+
+# ---------------------------------------------------------------------------
+# Token
+# ---------------------------------------------------------------------------
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared by a step and the work it starts.
+
+    Args:
+        label:  Name used in log messages and StepCancelledError.
+        parent: Optional parent token; cancelling it cancels this one.
+    """
+
+    def __init__(self, label: str = "", parent: Optional["CancellationToken"] = None):
+        self.label = label
+        self.reason: Optional[str] = None
+        self.killed_processes = 0
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._processes: set = set()
+        self._callbacks: List[Callable[["CancellationToken"], None]] = []
+        if parent is not None:
+            parent.add_callback(lambda p: self.cancel(p.reason or "parent cancelled"))
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """Cancel the token, kill tracked subprocesses and run callbacks.
+
+        Returns:
+            True on the first call, False when already cancelled.
+        """
+        with self._lock:
+            if self._event.is_set():
+                return False
+            self.reason = reason
+            self._event.set()
+            processes = list(self._processes)
+            callbacks = list(self._callbacks)
+        for proc in processes:
+            if _kill_process(proc):
+                self.killed_processes += 1
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as exc:
+                logger.debug("[cancellation] callback failed: {}", exc)
+        return True
+
+    def raise_if_cancelled(self) -> None:
+        """Raise StepCancelledError when the token has been cancelled."""
+        if self._event.is_set():
+            raise StepCancelledError(self.reason or "cancelled", step=self.label or None)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or *timeout* elapses. Returns cancelled()."""
+        return self._event.wait(timeout)
+
+    def add_callback(self, callback: Callable[["CancellationToken"], None]) -> None:
+        """Run *callback(token)* on cancellation (immediately if already cancelled)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def track_process(self, proc: subprocess.Popen) -> None:
+        """Kill *proc* when the token is cancelled (immediately if it already is)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._processes.add(proc)
+                return
+        if _kill_process(proc):
+            self.killed_processes += 1
+
+    def untrack_process(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._processes.discard(proc)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """Return the token of the step running on this thread, if any."""
+    return _current_token.get()
+
+
+def raise_if_cancelled() -> None:
+    """Raise StepCancelledError when the current step has been cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+@contextlib.contextmanager
+def use_token(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    """Make *token* the current token for the duration of the block."""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+# ---------------------------------------------------------------------------
+# Subprocesses
+# ---------------------------------------------------------------------------
+
+
+def _kill_process(proc: subprocess.Popen) -> bool:
+    """Terminate *proc* (and its process group on POSIX), escalating to kill.
+
+    Returns:
+        True when the process was still running.
+    """
+    if proc.poll() is not None:
+        return False
+    group = os.name == "posix" and getattr(proc, "_cancel_group", False)
+    try:
+        if group:
+            os.killpg(proc.pid, signal.SIGTERM)
+        else:
+            proc.terminate()
+        try:
+            proc.wait(timeout=_KILL_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            if group:
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+            proc.wait(timeout=_KILL_GRACE_SECONDS)
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        logger.debug("[cancellation] could not kill pid {}: {}", proc.pid, exc)
+    return True
+
+
+def run_subprocess(
+    cmd,
+    *,
+    input: Any = None,
+    timeout: Optional[float] = None,
+    check: bool = False,
+    capture_output: bool = False,
+    token: Optional[CancellationToken] = None,
+    **popen_kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """subprocess.run() that is killed when the current step is cancelled.
+
+    Args:
+        cmd:            Command, as for subprocess.run().
+        input, timeout, check, capture_output: As for subprocess.run().
+        token:          Explicit token; defaults to current_token().
+        **popen_kwargs: Passed to subprocess.Popen (text, cwd, env, ...).
+
+    Returns:
+        subprocess.CompletedProcess.
+
+    Raises:
+        StepCancelledError: the token was cancelled before or during the run.
+        subprocess.TimeoutExpired / CalledProcessError: as subprocess.run().
+    """
+    token = token if token is not None else _current_token.get()
+    if token is None:
+        return subprocess.run(
+            cmd, input=input, timeout=timeout, check=check, capture_output=capture_output, **popen_kwargs
+        )
+
+    token.raise_if_cancelled()
+    if capture_output:
+        popen_kwargs["stdout"] = subprocess.PIPE
+        popen_kwargs["stderr"] = subprocess.PIPE
+    if input is not None:
+        popen_kwargs["stdin"] = subprocess.PIPE
+    if os.name == "posix":
+        popen_kwargs.setdefault("start_new_session", True)
+
+    proc = subprocess.Popen(cmd, **popen_kwargs)
+    proc._cancel_group = bool(popen_kwargs.get("start_new_session"))  # type: ignore[attr-defined]
+    token.track_process(proc)
+    try:
+        try:
+            stdout, stderr = proc.communicate(input, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_process(proc)
+            stdout, stderr = proc.communicate()
+            raise subprocess.TimeoutExpired(cmd, timeout, output=stdout, stderr=stderr)
+    finally:
+        token.untrack_process(proc)
+
+    token.raise_if_cancelled()
+    if check and proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+
+class _WorkerPool:
+    """Bounded pool of reusable daemon worker threads, started on demand.
+
+    Unlike ThreadPoolExecutor the workers are daemon threads, so a leaked
+    step that never returns cannot block interpreter exit.
+    """
+
+    def __init__(self, max_workers: int, name: str):
+        self.max_workers = max_workers
+        self._name = name
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        self._pending = 0
+
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._pending += 1
+            if self._pending > self._idle and len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work, name="%s_%d" % (self._name, len(self._threads)), daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+        self._queue.put((future, fn, args))
+        return future
+
+    @property
+    def thread_count(self) -> int:
+        with self._lock:
+            return len(self._threads)
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                self._idle += 1
+            item = self._queue.get()
+            with self._lock:
+                self._idle -= 1
+                if item is not None:
+                    self._pending -= 1
+            if item is None:
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as exc:  # noqa: BLE001 - delivered through the future
+                future.set_exception(exc)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            count = len(self._threads)
+        for _ in range(count):
+            self._queue.put(None)
+
+
+class TimedOutcome:
+    """Result of TimeoutExecutor.run()."""
+
+    __slots__ = ("value", "error", "timed_out", "elapsed", "token")
+
+    def __init__(self, value=None, error=None, timed_out=False, elapsed=0.0, token=None):
+        self.value = value
+        self.error: Optional[BaseException] = error
+        self.timed_out: bool = timed_out
+        self.elapsed: float = elapsed
+        self.token: Optional[CancellationToken] = token
+
+    @property
+    def completed(self) -> bool:
+        return not self.timed_out and self.error is None
+
+
+class TimeoutExecutor:
+    """Run callables with a deadline on a bounded, reusable worker pool.
+
+    Args:
+        max_workers: Pool size (default: STEP_TIMEOUT_MAX_WORKERS).
+        name:        Worker thread name prefix.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, name: str = "step-timeout"):
+        self.max_workers = max(1, max_workers or _DEFAULT_MAX_WORKERS)
+        self._pool = _WorkerPool(self.max_workers, name)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "inline": 0,
+            "not_started": 0,
+            "leaked": 0,
+            "leaked_active": 0,
+            "leaked_recovered": 0,
+            "processes_killed": 0,
+        }
+
+    def _bump(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return a copy of the counters (for metrics export)."""
+        with self._lock:
+            return dict(self.stats)
+
+    def run(
+        self,
+        fn: Callable,
+        args: Tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        label: str = "",
+    ) -> TimedOutcome:
+        """Run fn(*args, **kwargs), giving up (and cancelling) after *timeout*.
+
+        The timeout is measured from when a worker starts the call.  A call
+        still queued when every worker holds leaked work is withdrawn from
+        the pool and run inline instead (see _run_inline()).
+
+        Returns:
+            TimedOutcome with value, error (exception raised by fn) or
+            timed_out set.  Never raises for fn's exceptions.
+        """
+        kwargs = kwargs or {}
+        token = CancellationToken(label, parent=_current_token.get())
+        start = time.monotonic()
+        self._bump("submitted")
+
+        if getattr(self._local, "worker", False) or self._saturated(label):
+            return self._run_inline(fn, args, kwargs, timeout, token, start)
+
+        ctx = contextvars.copy_context()
+        started: List[float] = []  # filled by the worker when the call begins
+        future = self._pool.submit(ctx.run, self._invoke, token, fn, args, kwargs, started)
+        while True:
+            if started:
+                wait_s = None if timeout is None else max(0.0, started[0] + timeout - time.monotonic())
+            else:
+                wait_s = _QUEUE_POLL_SECONDS
+            try:
+                value = future.result(timeout=wait_s)
+            except FutureTimeout:
+                if not started:
+                    if self._saturated(label) and future.cancel():
+                        self._bump("not_started")
+                        return self._run_inline(fn, args, kwargs, timeout, token, start)
+                    continue
+                if timeout is None or time.monotonic() < started[0] + timeout:
+                    continue
+                self._on_timeout(future, token, timeout, label)
+                return TimedOutcome(timed_out=True, elapsed=time.monotonic() - start, token=token)
+            except BaseException as exc:  # noqa: BLE001 - reported to the caller
+                self._bump("failed")
+                return TimedOutcome(error=exc, elapsed=time.monotonic() - start, token=token)
+            self._bump("completed")
+            return TimedOutcome(value=value, elapsed=time.monotonic() - start, token=token)
+
+    def _saturated(self, label: str) -> bool:
+        """True (and logged) when every worker is held by leaked work."""
+        with self._lock:
+            saturated = self.stats["leaked_active"] >= self.max_workers
+        if saturated:
+            logger.warning(
+                "[cancellation] all {} timeout workers hold leaked work; running '{}' inline",
+                self.max_workers,
+                label,
+            )
+        return saturated
+
+    def _invoke(self, token, fn, args, kwargs, started):
+        started.append(time.monotonic())
+        self._local.worker = True
+        _current_token.set(token)
+        return fn(*args, **kwargs)
+
+    def _run_inline(self, fn, args, kwargs, timeout, token, start) -> TimedOutcome:
+        """Run on the caller's thread with a cooperative deadline only.
+
+        A timer cancels the token at *timeout*; the call itself cannot be
+        interrupted, so it is reported as timed out only once it returns.
+        """
+        self._bump("inline")
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, token.cancel, args=("timeout after %ss" % timeout,))
+            timer.daemon = True
+            timer.start()
+        try:
+            with use_token(token):
+                value = fn(*args, **kwargs)
+        except BaseException as exc:  # noqa: BLE001
+            if token.cancelled:
+                self._bump("timed_out")
+                self._bump("processes_killed", token.killed_processes)
+                return TimedOutcome(timed_out=True, elapsed=time.monotonic() - start, token=token)
+            self._bump("failed")
+            return TimedOutcome(error=exc, elapsed=time.monotonic() - start, token=token)
+        finally:
+            if timer is not None:
+                timer.cancel()
+        if token.cancelled:
+            self._bump("timed_out")
+            self._bump("processes_killed", token.killed_processes)
+            return TimedOutcome(timed_out=True, elapsed=time.monotonic() - start, token=token)
+        self._bump("completed")
+        return TimedOutcome(value=value, elapsed=time.monotonic() - start, token=token)
+
+    def _on_timeout(self, future, token, timeout, label) -> None:
+        token.cancel("timeout after %ss" % timeout)
+        self._bump("timed_out")
+        try:
+            future.result(timeout=_CANCEL_GRACE_SECONDS)
+        except FutureTimeout:
+            self._bump("leaked")
+            self._bump("leaked_active")
+            future.add_done_callback(self._on_leaked_done)
+            logger.warning(
+                "[cancellation] '{}' ignored cancellation and is still running (leaked={})",
+                label,
+                self.stats["leaked_active"],
+            )
+        except BaseException:  # noqa: BLE001 - stopped by cancellation, as intended
+            pass
+        self._bump("processes_killed", token.killed_processes)
+
+    def _on_leaked_done(self, _future) -> None:
+        with self._lock:
+            self.stats["leaked_active"] -= 1
+            self.stats["leaked_recovered"] += 1
+
+    @property
+    def thread_count(self) -> int:
+        """Number of worker threads started so far (never above max_workers)."""
+        return self._pool.thread_count
+
+    def shutdown(self) -> None:
+        """Ask every worker to exit once it is idle."""
+        self._pool.shutdown()
+
+
+_executor: Optional[TimeoutExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_timeout_executor() -> TimeoutExecutor:
+    """Return the process-wide TimeoutExecutor (created on demand)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = TimeoutExecutor()
+        return _executor
@@ -69,11 +69,10 @@ def _create_sqlite_saver(db_path: str):
     if not _SQLITE_SAVER_AVAILABLE or _SqliteSaverClass is None:
         raise ImportError("langgraph-checkpoint-sqlite not installed")
 
-    # Try from_conn_string first (newer API), then direct constructor
-    if hasattr(_SqliteSaverClass, "from_conn_string"):
-        return _SqliteSaverClass.from_conn_string(db_path)
-    else:
-        return _SqliteSaverClass(db_path)
+    # Every version takes a connection.  from_conn_string() is a context
+    # manager in langgraph-checkpoint-sqlite 1.x+, not a saver.  The saver
+    # owns its own connection; LangGraph may call it from worker threads.
+    return _SqliteSaverClass(sqlite3.connect(db_path, check_same_thread=False))
 
 
 class CheckpointerManager:
@@ -11,22 +11,40 @@ Scoring matrix:
   4-7  : 5-100 files AND 500-5000 LOC  (typical project)
   8-10 : > 100 files OR > 5000 LOC  (large / enterprise project)
 
+Per-file metrics (mtime, size, content hash, LOC) are kept in a
+ComplexityIndex that is refreshed incrementally: a pruned walk (shared
+EXCLUDED_DIRS) stats every Python file and only files whose (mtime_ns, size)
+changed are re-read; a file whose content hash is unchanged keeps its LOC.
+Project totals are maintained as aggregates and the index is persisted, so a
+warm run only pays for the directory walk.
+
+Cache location: ~/.claude/logs/cache/complexity_index/<md5(project_root)>.json
+
 Usage:
     from complexity_calculator import calculate_complexity, should_plan
     score = calculate_complexity("/path/to/project")
     plan_needed = should_plan(score, task_type="refactoring")
 """
 
+import hashlib
 import json
+import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 try:
     from .error_logger import ErrorLogger
 except ImportError:
     ErrorLogger = None  # type: ignore
 
+try:
+    from .core.file_walker import iter_project_files
+except ImportError:
+    from langgraph_engine.core.file_walker import iter_project_files  # type: ignore[no-redef]
+
 
 # ============================================================================
 # SCORING CONSTANTS
@@ -49,6 +67,15 @@ DEP_NONE = 0
 DEP_FEW = 10
 DEP_MANY = 30
 
+# Persisted per-file metrics index
+_INDEX_FORMAT_VERSION = 2
+
+# A cached (mtime_ns, size) is only trusted when the file was last modified
+# this long before it was read; edits landing within the filesystem's
+# timestamp granularity are re-read ("racy clean" handling, as in git).
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+_DEFAULT_CACHE_BASE = os.environ.get("CACHE_BASE_DIR", "~/.claude/logs/cache")
+
 # Task type planning thresholds
 PLAN_THRESHOLD_DEFAULT = 6  # complexity >= 6 requires planning
 PLAN_THRESHOLD_BUG_FIX = 4  # bug fix requires planning if complexity >= 4
@@ -90,43 +117,23 @@ def calculate_complexity(project_path: str, session_id: Optional[str] = None) ->
         return 3  # Safe default
 
     try:
-        # --- Count Python source files (exclude __pycache__, .venv, node_modules) ---
-        def _is_excluded(p: Path) -> bool:
-            excluded_dirs = {"__pycache__", ".venv", "venv", "node_modules", ".git", ".tox", "dist", "build"}
-            return any(part in excluded_dirs for part in p.parts)
-
-        py_files = [f for f in path.rglob("*.py") if not _is_excluded(f)]
-
-        # --- Count lines of code ---
-        total_loc = 0
-        for py_file in py_files:
-            try:
-                lines = py_file.read_text(encoding="utf-8", errors="ignore").splitlines()
-                # Count non-empty, non-comment lines
-                code_lines = [ln for ln in lines if ln.strip() and not ln.strip().startswith("#")]
-                total_loc += len(code_lines)
-            except Exception:
-                pass
+        # --- Python file count and LOC from the incremental index ---
+        index = get_complexity_index(path)
+        index.refresh()
+        py_file_count, total_loc = index.totals()
 
         # --- Count dependencies ---
         dep_count = _count_dependencies(path)
 
         # --- Compute raw score from each dimension ---
-        file_score = _file_score(len(py_files))
-        loc_score = _loc_score(total_loc)
-        dep_score = _dep_score(dep_count)
-
-        # Weighted average: files=40%, LOC=45%, deps=15%
-        raw_score = (file_score * 0.40) + (loc_score * 0.45) + (dep_score * 0.15)
-        score = int(round(raw_score))
-        score = max(1, min(10, score))  # Clamp 1-10
+        score = _weighted_score(py_file_count, total_loc, dep_count)
 
         if logger:
             logger.log_validation_result(
                 "Level 1",
                 "Complexity calculation",
                 True,
-                details=("py_files={}, loc={}, deps={}, score={}".format(len(py_files), total_loc, dep_count, score)),
+                details=("py_files={}, loc={}, deps={}, score={}".format(py_file_count, total_loc, dep_count, score)),
             )
 
         return score
@@ -148,6 +155,12 @@ def calculate_complexity(project_path: str, session_id: Optional[str] = None) ->
 # ============================================================================
 
 
+def _weighted_score(py_file_count: int, total_loc: int, dep_count: int) -> int:
+    """Combine the three dimensions: files=40%, LOC=45%, deps=15%, clamped 1-10."""
+    raw_score = (_file_score(py_file_count) * 0.40) + (_loc_score(total_loc) * 0.45) + (_dep_score(dep_count) * 0.15)
+    return max(1, min(10, int(round(raw_score))))
+
+
 def _file_score(py_file_count: int) -> int:
     """Map file count to 1-10 score."""
     if py_file_count < FILE_TINY:
@@ -228,6 +241,170 @@ def _count_dependencies(project_root: Path) -> int:
     return dep_count
 
 
+# ============================================================================
+# INCREMENTAL FILE METRICS
+# ============================================================================
+
+
+def _count_loc(data: bytes) -> int:
+    """Count non-empty, non-comment lines in Python source bytes."""
+    count = 0
+    for ln in data.decode("utf-8", errors="ignore").splitlines():
+        stripped = ln.strip()
+        if stripped and not stripped.startswith("#"):
+            count += 1
+    return count
+
+
+class ComplexityIndex:
+    """Incrementally maintained per-file metrics for one project root.
+
+    Each entry is keyed by root-relative path and stores the file's mtime_ns,
+    size, content hash, LOC and when it was read.  An entry whose mtime falls
+    within _RACY_WINDOW_NS of that read is re-read even when the stat matches.  The project totals (file count, LOC) are
+    kept as running aggregates, so scoring never re-reads unchanged files.
+
+    Args:
+        project_root: Directory to index.
+        cache_dir:    Directory for the persisted index file.  Defaults to
+                      <CACHE_BASE_DIR>/complexity_index.
+        persist:      Save/load the index to/from disk.
+    """
+
+    def __init__(self, project_root, cache_dir: Optional[str] = None, persist: bool = True):
+        self.root = Path(project_root).resolve()
+        self.persist = persist
+        base = Path(cache_dir or Path(_DEFAULT_CACHE_BASE) / "complexity_index").expanduser()
+        root_key = hashlib.md5(str(self.root).encode("utf-8")).hexdigest()
+        self._index_path = base / "{}.json".format(root_key)
+
+        # rel_path -> {"m": mtime_ns, "s": size, "h": sha1, "loc": int, "t": read_at_ns}
+        self._files: Dict[str, dict] = {}
+        self._total_loc = 0
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.stats = {"walks": 0, "reused": 0, "rehashed": 0, "rescored": 0, "removed": 0}
+        if self.persist:
+            self._load()
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the working tree.
+
+        Returns:
+            Number of files added, changed or removed by this refresh.
+        """
+        with self._lock:
+            self.stats["walks"] += 1
+            changed = 0
+            seen = set()
+            for path in iter_project_files(self.root, {".py"}):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                rel = path.relative_to(self.root).as_posix()
+                seen.add(rel)
+                entry = self._files.get(rel)
+                if (
+                    entry is not None
+                    and entry["m"] == st.st_mtime_ns
+                    and entry["s"] == st.st_size
+                    and entry["t"] - st.st_mtime_ns >= _RACY_WINDOW_NS
+                ):
+                    self.stats["reused"] += 1
+                    continue
+                if self._update_file(rel, path, st.st_mtime_ns, st.st_size):
+                    changed += 1
+
+            for rel in [r for r in self._files if r not in seen]:
+                self._total_loc -= self._files.pop(rel)["loc"]
+                self.stats["removed"] += 1
+                self._dirty = True
+                changed += 1
+
+            if self._dirty and self.persist:
+                self._save()
+            return changed
+
+    def _update_file(self, rel: str, path: Path, mtime_ns: int, size: int) -> bool:
+        """Re-read one file. Returns True when its content actually changed."""
+        read_at = time.time_ns()
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return False
+        digest = hashlib.sha1(data).hexdigest()
+        entry = self._files.get(rel)
+        self._dirty = True
+        if entry is not None and entry["h"] == digest:
+            # Touched but identical: keep the LOC, remember the new stat.
+            entry["m"], entry["s"], entry["t"] = mtime_ns, size, read_at
+            self.stats["rehashed"] += 1
+            return False
+        loc = _count_loc(data)
+        if entry is not None:
+            self._total_loc -= entry["loc"]
+        self._files[rel] = {"m": mtime_ns, "s": size, "h": digest, "loc": loc, "t": read_at}
+        self._total_loc += loc
+        self.stats["rescored"] += 1
+        return True
+
+    def totals(self):
+        """Return (py_file_count, total_loc) from the current aggregates."""
+        with self._lock:
+            return len(self._files), self._total_loc
+
+    def file_metrics(self, rel_path: str) -> Optional[dict]:
+        """Return the cached metrics for one root-relative path, or None."""
+        with self._lock:
+            entry = self._files.get(rel_path)
+            return dict(entry) if entry is not None else None
+
+    def _load(self) -> None:
+        try:
+            if not self._index_path.exists():
+                return
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            if data.get("version") != _INDEX_FORMAT_VERSION or data.get("root") != str(self.root):
+                return
+            self._files = data["files"]
+            self._total_loc = sum(entry["loc"] for entry in self._files.values())
+        except Exception:
+            self._files, self._total_loc = {}, 0
+
+    def _save(self) -> None:
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"version": _INDEX_FORMAT_VERSION, "root": str(self.root), "files": self._files}
+            tmp = self._index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(str(tmp), str(self._index_path))
+            self._dirty = False
+        except Exception:
+            pass  # Cache only: the in-memory index stays valid
+
+
+_indexes: Dict[str, ComplexityIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_complexity_index(project_root) -> ComplexityIndex:
+    """Return the process-wide ComplexityIndex for *project_root* (created on demand)."""
+    key = str(Path(project_root).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = ComplexityIndex(key)
+            _indexes[key] = index
+        return index
+
+
+def clear_complexity_indexes() -> None:
+    """Drop all in-memory indexes (persisted files are kept). Useful in tests."""
+    with _indexes_lock:
+        _indexes.clear()
+
+
 # ============================================================================
 # PLANNING DECISION
 # ============================================================================
@@ -277,28 +454,18 @@ def complexity_report(project_path: str) -> dict:
     if not path.exists():
         return {"error": "Path not found", "score": 3}
 
-    def _is_excluded(p: Path) -> bool:
-        excluded_dirs = {"__pycache__", ".venv", "venv", "node_modules", ".git", ".tox", "dist", "build"}
-        return any(part in excluded_dirs for part in p.parts)
-
-    py_files = [f for f in path.rglob("*.py") if not _is_excluded(f)]
-    total_loc = 0
-    for pf in py_files:
-        try:
-            lines = pf.read_text(encoding="utf-8", errors="ignore").splitlines()
-            total_loc += sum(1 for ln in lines if ln.strip() and not ln.strip().startswith("#"))
-        except Exception:
-            pass
-
+    index = get_complexity_index(path)
+    index.refresh()
+    py_file_count, total_loc = index.totals()
     dep_count = _count_dependencies(path)
-    score = calculate_complexity(project_path)
+    score = _weighted_score(py_file_count, total_loc, dep_count)
 
     return {
         "project_path": str(path),
-        "py_file_count": len(py_files),
+        "py_file_count": py_file_count,
         "lines_of_code": total_loc,
         "dependency_count": dep_count,
-        "file_score": _file_score(len(py_files)),
+        "file_score": _file_score(py_file_count),
         "loc_score": _loc_score(total_loc),
         "dep_score": _dep_score(dep_count),
         "complexity_score": score,
@@ -28,6 +28,14 @@ integration_hook
     create_integration_hook - factory method that generates the 9 formerly
     duplicated apply_integration_stepN functions from a single template.
 
+file_walker
+    iter_project_files - os.walk-based file enumeration that prunes the shared
+    EXCLUDED_DIRS set (.git, node_modules, virtualenvs) before descending.
+
+source_repository
+    get_source_repository - process-wide memo of file text, line offsets and
+    parsed ASTs so each file version is read and parsed once per run.
+
 infrastructure
     get_infra - returns (and caches) per-session infrastructure objects
     (CheckpointManager, MetricsCollector, ErrorLogger, BackupManager).
@@ -40,12 +48,28 @@ infrastructure
     to compute the total pipeline duration when Step 14 completes.
 """
 
-from .error_handler import NodeResult, node_error_handler, safe_execute
-from .infrastructure import _pipeline_start_times, clear_infra_cache, get_infra
-from .integration_hook import create_integration_hook
-from .lazy_loader import LazyLoader
-from .logger_factory import get_logger
-from .step_decorator import StepExecutionContext, create_step_node
+import importlib
+
+# Public names -> sub-module, resolved on first access (PEP 562) so that
+# importing one light helper such as core.config_loader does not load the
+# whole package (file_walker alone pulls in every language parser).
+_LAZY_ATTRS = {
+    "NodeResult": "error_handler",
+    "node_error_handler": "error_handler",
+    "safe_execute": "error_handler",
+    "is_excluded_dir": "file_walker",
+    "iter_project_files": "file_walker",
+    "_pipeline_start_times": "infrastructure",
+    "clear_infra_cache": "infrastructure",
+    "get_infra": "infrastructure",
+    "create_integration_hook": "integration_hook",
+    "LazyLoader": "lazy_loader",
+    "get_logger": "logger_factory",
+    "SourceRepository": "source_repository",
+    "get_source_repository": "source_repository",
+    "StepExecutionContext": "step_decorator",
+    "create_step_node": "step_decorator",
+}
 
 __all__ = [
     # lazy_loader
@@ -56,6 +80,12 @@ __all__ = [
     "node_error_handler",
     "safe_execute",
     "NodeResult",
+    # file_walker
+    "iter_project_files",
+    "is_excluded_dir",
+    # source_repository
+    "SourceRepository",
+    "get_source_repository",
     # integration_hook
     "create_integration_hook",
     # infrastructure
@@ -66,3 +96,15 @@ __all__ = [
     "create_step_node",
     "StepExecutionContext",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module("." + _LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
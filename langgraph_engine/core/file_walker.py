@@ -0,0 +1,64 @@
+"""Pruned project file walker shared by indexers and scanners.
+
+Several pipeline modules used ``Path.rglob`` to enumerate project files and
+then filtered excluded directories out of the results afterwards.  That walks
+into ``.git``, ``node_modules`` and virtualenvs before discarding them, which
+dominates wall time on large repositories.
+
+iter_project_files() uses ``os.walk`` and prunes excluded directories in place
+so they are never descended into.  The exclusion set defaults to
+``parsers.config.EXCLUDED_DIRS`` so every caller honours the same rules.
+
+ASCII-only (cp1252-safe for Windows).
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from ..parsers.config import EXCLUDED_DIRS
+
+
+def is_excluded_dir(name: str, excluded_dirs: Optional[Iterable[str]] = None) -> bool:
+    """Return True when a directory called *name* must not be descended into.
+
+    Args:
+        name:          Bare directory name (not a path).
+        excluded_dirs: Override for the shared EXCLUDED_DIRS set.
+
+    Returns:
+        True for excluded names and for ``*.egg-info`` metadata directories.
+    """
+    excluded = EXCLUDED_DIRS if excluded_dirs is None else excluded_dirs
+    return name in excluded or name.endswith(".egg-info")
+
+
+def iter_project_files(
+    root,
+    extensions: Optional[Iterable[str]] = None,
+    excluded_dirs: Optional[Iterable[str]] = None,
+) -> Iterator[Path]:
+    """Yield files under *root*, never descending into excluded directories.
+
+    Args:
+        root:          Project root (str or Path).
+        extensions:    Optional set of lowercase suffixes (e.g. {".py"}).
+                       When None every file is yielded.
+        excluded_dirs: Override for the shared EXCLUDED_DIRS set.
+
+    Yields:
+        Absolute-or-root-relative Path objects in a deterministic order
+        (directories and files sorted by name).
+    """
+    root_path = Path(root)
+    if not root_path.is_dir():
+        return
+    exts = frozenset(e.lower() for e in extensions) if extensions is not None else None
+    excluded = frozenset(EXCLUDED_DIRS if excluded_dirs is None else excluded_dirs)
+
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        dirnames[:] = sorted(d for d in dirnames if not is_excluded_dir(d, excluded))
+        for fname in sorted(filenames):
+            if exts is not None and os.path.splitext(fname)[1].lower() not in exts:
+                continue
+            yield Path(dirpath) / fname
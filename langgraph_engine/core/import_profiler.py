@@ -0,0 +1,183 @@
+"""Import-time profiler for the pipeline entry points.
+
+Cold start is dominated by imports: the full engine (orchestrator, loguru,
+every step module, the GitHub stack) costs a few hundred milliseconds, while
+``3-level-flow.py --help`` or a slash-command hook run needs almost none of
+it.  This module runs a target in a *fresh* interpreter with CPython's
+``-X importtime`` switch and attributes the startup cost to each module and
+package, so a regression ("who started importing the orchestrator?") shows
+up as a named line instead of a slower hook.
+
+Usage:
+
+    python -m langgraph_engine.core.import_profiler
+    python -m langgraph_engine.core.import_profiler -m langgraph_engine.orchestrator
+    python -m langgraph_engine.core.import_profiler --script scripts/3-level-flow.py -- --help
+
+The same data is available programmatically via profile_imports(), which
+tests/test_import_budget.py uses to enforce the cold-start budget.
+
+ASCII-only (cp1252-safe for Windows).
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# Repository root (the directory that contains langgraph_engine/).
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# One "import time:" line.  depth is the nesting level (0 = imported by the
+# target itself), self_us excludes nested imports, cumulative_us includes them.
+ImportRecord = namedtuple("ImportRecord", ["module", "self_us", "cumulative_us", "depth"])
+
+
+def parse_importtime(text: str) -> List[ImportRecord]:
+    """Parse ``-X importtime`` stderr output into ImportRecords.
+
+    Lines that are not import-time records (program output, warnings, the
+    column header) are ignored.
+    """
+    records = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0])
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # Column header
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped) - 1) // 2
+        records.append(ImportRecord(stripped, self_us, cumulative_us, depth))
+    return records
+
+
+class ImportProfile:
+    """Import-time records of one interpreter run."""
+
+    def __init__(self, records: List[ImportRecord], wall_s: float, returncode: int, output: str = ""):
+        self.records = records
+        self.wall_s = wall_s
+        self.returncode = returncode
+        self.output = output
+
+    @property
+    def modules(self) -> frozenset:
+        """Names of every module imported during the run."""
+        return frozenset(r.module for r in self.records)
+
+    @property
+    def total_us(self) -> int:
+        """Total time spent importing, in microseconds."""
+        return sum(r.self_us for r in self.records)
+
+    def cost_us(self, prefix: str) -> int:
+        """Self time of *prefix* and all of its submodules, in microseconds."""
+        dotted = prefix + "."
+        return sum(r.self_us for r in self.records if r.module == prefix or r.module.startswith(dotted))
+
+    def top(self, n: int = 20) -> List[ImportRecord]:
+        """The *n* modules with the largest self time."""
+        return sorted(self.records, key=lambda r: r.self_us, reverse=True)[:n]
+
+    def by_package(self, depth: int = 2) -> Dict[str, int]:
+        """Self time rolled up to the first *depth* components of each name."""
+        totals: Dict[str, int] = {}
+        for r in self.records:
+            key = ".".join(r.module.split(".")[:depth])
+            totals[key] = totals.get(key, 0) + r.self_us
+        return dict(sorted(totals.items(), key=lambda kv: kv[1], reverse=True))
+
+    def report(self, top: int = 20) -> str:
+        """Human-readable summary: totals, heaviest packages, heaviest modules."""
+        lines = [
+            "Import profile: %d modules, %.1f ms importing, %.1f ms wall"
+            % (len(self.records), self.total_us / 1000.0, self.wall_s * 1000.0),
+            "",
+            "Top packages (self ms):",
+        ]
+        for name, us in list(self.by_package().items())[:top]:
+            lines.append("  %8.2f  %s" % (us / 1000.0, name))
+        lines += ["", "Top modules (self ms / cumulative ms):"]
+        for r in self.top(top):
+            lines.append("  %8.2f  %8.2f  %s" % (r.self_us / 1000.0, r.cumulative_us / 1000.0, r.module))
+        return "\n".join(lines)
+
+
+def profile_imports(
+    module: Optional[str] = None,
+    script: Optional[str] = None,
+    args: Sequence[str] = (),
+    env: Optional[Dict[str, str]] = None,
+    timeout: float = 120,
+) -> ImportProfile:
+    """Run *module* (imported) or *script* (executed) in a fresh interpreter.
+
+    Args:
+        module: Dotted module name to import, e.g. 'langgraph_engine'.
+                Defaults to 'langgraph_engine' when neither target is given.
+        script: Path to a script to run instead (e.g. scripts/3-level-flow.py).
+        args:   Extra command-line arguments for *script*.
+        env:    Extra environment variables for the child process.
+        timeout: Seconds before the child is killed.
+
+    Returns:
+        ImportProfile of the run.  The child's own stdout is discarded.
+    """
+    child_env = dict(os.environ)
+    child_env.pop("PYTHONPROFILEIMPORTTIME", None)
+    # The hook recursion guard would make 3-level-flow.py exit before parsing.
+    child_env.pop("CLAUDE_WORKFLOW_RUNNING", None)
+    child_env["PYTHONPATH"] = os.pathsep.join(p for p in (str(_REPO_ROOT), child_env.get("PYTHONPATH")) if p)
+    child_env["PYTHONDONTWRITEBYTECODE"] = child_env.get("PYTHONDONTWRITEBYTECODE", "")
+    child_env.update(env or {})
+
+    cmd = [sys.executable, "-X", "importtime"]
+    if script:
+        cmd += [str(script)] + list(args)
+    else:
+        cmd += ["-c", "import %s" % (module or "langgraph_engine")]
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=child_env,
+        cwd=str(_REPO_ROOT),
+        timeout=timeout,
+        encoding="utf-8",
+        errors="replace",
+    )
+    wall_s = time.perf_counter() - started
+    other = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+    return ImportProfile(parse_importtime(proc.stderr), wall_s, proc.returncode, other)
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Attribute interpreter start-up cost per imported module.")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("-m", "--module", help="module to import (default: langgraph_engine)")
+    target.add_argument("--script", help="script to run, e.g. scripts/3-level-flow.py")
+    parser.add_argument("--top", type=int, default=20, help="rows per section (default: 20)")
+    parser.add_argument("args", nargs="*", help="arguments for --script (put them after --)")
+    opts = parser.parse_args(list(argv) if argv is not None else None)
+
+    profile = profile_imports(module=opts.module, script=opts.script, args=opts.args)
+    print(profile.report(opts.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -33,6 +33,9 @@ class LazyLoader:
 
     _cache: dict = {}
 
+    # Placeholder for a module global that resolve() has not filled in yet
+    UNLOADED: Any = object()
+
     @classmethod
     def load(cls, module_path: str, class_name: str, *args: Any, **kwargs: Any) -> Optional[Any]:
         """Lazy-load a class from a dotted module path and optionally instantiate it.
@@ -70,6 +73,29 @@ class LazyLoader:
             cls._cache[cache_key] = None
             return None
 
+    @classmethod
+    def resolve(cls, namespace: dict, name: str, module_path: str, class_name: Optional[str] = None) -> Optional[Any]:
+        """Return the module global *name*, loading it on first use.
+
+        For modules that declare ``Name = LazyLoader.UNLOADED`` and read it
+        through this method: the global is replaced with the load() result
+        the first time, so later reads (and mock.patch of the module
+        attribute) see an ordinary module global.
+
+        Args:
+            namespace:   The calling module's globals().
+            name:        Global to resolve.
+            module_path: Dotted module path to load it from.
+            class_name:  Attribute in that module (defaults to *name*).
+
+        Returns:
+            The resolved object, or None if it is unavailable.
+        """
+        value = namespace.get(name, cls.UNLOADED)
+        if value is cls.UNLOADED:
+            value = namespace[name] = cls.load(module_path, class_name or name)
+        return value
+
     @classmethod
     def load_function(cls, module_path: str, func_name: str) -> Any:
         """Lazy-load a function from a module path.
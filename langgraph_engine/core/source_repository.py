@@ -0,0 +1,254 @@
+"""Shared parsed-source service: one read and one ast.parse per file version.
+
+Before this module existed the same Python file was read and parsed
+independently by the call graph parser, the coverage analyzer, the
+lightweight scanner, the test generator and the UML AST analyzer, so a
+full-mode pipeline parsed most files four or five times.
+
+SourceRepository memoises, per file:
+
+- decoded text (UTF-8, errors="replace")
+- line start offsets (for offset <-> line conversions)
+- the parsed ``ast.Module`` (or the SyntaxError/ValueError it raised)
+
+Entries are validated by (path, mtime_ns, size); when the stat changes the
+file is re-read and its content hash compared, so a touched-but-identical
+file keeps its AST.  ASTs are stored by content hash, which means
+``parse_source()`` callers that already hold the text (language parsers)
+share the same tree as path-based callers.
+
+Memory is bounded by a byte budget (SOURCE_REPO_MAX_BYTES, default 256 MB)
+with least-recently-used eviction.  AST size is estimated from the source
+length.
+
+Cached ASTs are shared between consumers and must be treated as read-only.
+
+ASCII-only (cp1252-safe for Windows).
+"""
+
+import ast
+import copy
+import hashlib
+import os
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Default byte budget for all cached text + ASTs.
+_DEFAULT_MAX_BYTES = int(os.environ.get("SOURCE_REPO_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Rough in-memory size of an ast.Module per byte of source text (CPython).
+_AST_BYTES_PER_SOURCE_BYTE = 12
+
+# A (mtime_ns, size) match is only trusted when the file was modified this
+# long before it was read; otherwise the content is re-hashed.
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+
+
+class _Blob:
+    """Cached content for one content hash."""
+
+    __slots__ = ("text", "offsets", "tree", "error", "parsed", "nbytes")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.offsets: Optional[List[int]] = None
+        self.tree: Optional[ast.Module] = None
+        self.error: Optional[BaseException] = None
+        self.parsed = False
+        self.nbytes = len(text)
+
+
+class SourceRepository:
+    """Process-wide memo of file text, line offsets and parsed ASTs.
+
+    Args:
+        max_bytes: Approximate memory budget; least recently used content is
+                   evicted once the budget is exceeded.
+    """
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._blobs: "OrderedDict[str, _Blob]" = OrderedDict()  # digest -> blob (LRU order)
+        self._paths: Dict[str, Tuple[int, int, int, str]] = {}  # path -> (mtime_ns, size, read_at_ns, digest)
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {"reads": 0, "parses": 0, "hits": 0, "evictions": 0}
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _touch(self, digest: str) -> Optional[_Blob]:
+        blob = self._blobs.get(digest)
+        if blob is not None:
+            self._blobs.move_to_end(digest)
+        return blob
+
+    def _charge(self, blob: _Blob, nbytes: int) -> None:
+        blob.nbytes += nbytes
+        self._bytes += nbytes
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and len(self._blobs) > 1:
+            _, old = self._blobs.popitem(last=False)
+            self._bytes -= old.nbytes
+            self._stats["evictions"] += 1
+
+    def _blob_for_text(self, text: str, digest: Optional[str] = None) -> Tuple[str, _Blob]:
+        digest = digest or _digest(text)
+        with self._lock:
+            blob = self._touch(digest)
+            if blob is None:
+                blob = _Blob(text)
+                self._blobs[digest] = blob
+                self._bytes += blob.nbytes
+                self._evict()
+            return digest, blob
+
+    def _blob_for_path(self, path) -> _Blob:
+        """Return the blob for the current content of *path* (raises OSError)."""
+        key = str(path)
+        st = os.stat(key)
+        with self._lock:
+            entry = self._paths.get(key)
+            if (
+                entry is not None
+                and entry[0] == st.st_mtime_ns
+                and entry[1] == st.st_size
+                and entry[2] - st.st_mtime_ns >= _RACY_WINDOW_NS
+            ):
+                blob = self._touch(entry[3])
+                if blob is not None:
+                    self._stats["hits"] += 1
+                    return blob
+
+        with open(key, "rb") as fh:
+            data = fh.read()
+        text = data.decode("utf-8", errors="replace")
+        digest, blob = self._blob_for_text(text)
+        with self._lock:
+            self._stats["reads"] += 1
+            self._paths[key] = (st.st_mtime_ns, st.st_size, time.time_ns(), digest)
+        return blob
+
+    def _parse(self, blob: _Blob, filename: str) -> ast.Module:
+        if not blob.parsed:
+            try:
+                tree = ast.parse(blob.text, filename=filename)
+            except (SyntaxError, ValueError) as exc:
+                with self._lock:
+                    blob.error, blob.parsed = exc, True
+                    self._stats["parses"] += 1
+            else:
+                with self._lock:
+                    if not blob.parsed:
+                        blob.tree, blob.parsed = tree, True
+                        self._stats["parses"] += 1
+                        self._charge(blob, len(blob.text) * _AST_BYTES_PER_SOURCE_BYTE)
+        if blob.error is not None:
+            # Each caller gets its own exception object; raising the cached
+            # one would grow a single shared traceback across threads.
+            raise copy.copy(blob.error) from blob.error
+        return blob.tree
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_text(self, path) -> str:
+        """Return the decoded text of *path*.
+
+        Raises:
+            OSError: when the file cannot be stat'ed or read.
+        """
+        return self._blob_for_path(path).text
+
+    def get_lines(self, path) -> List[str]:
+        """Return ``get_text(path).splitlines()``."""
+        return self.get_text(path).splitlines()
+
+    def get_line_offsets(self, path) -> List[int]:
+        """Return the character offset at which each line of *path* starts."""
+        blob = self._blob_for_path(path)
+        if blob.offsets is None:
+            offsets = [0]
+            find = blob.text.find
+            pos = find("\n")
+            while pos != -1:
+                offsets.append(pos + 1)
+                pos = find("\n", pos + 1)
+            with self._lock:
+                if blob.offsets is None:
+                    blob.offsets = offsets
+                    self._charge(blob, 8 * len(offsets))
+        return blob.offsets
+
+    def line_of_offset(self, path, offset: int) -> int:
+        """Return the 1-based line number containing character *offset*."""
+        return bisect_right(self.get_line_offsets(path), offset)
+
+    def get_ast(self, path, filename: Optional[str] = None) -> ast.Module:
+        """Return the parsed module for *path* (shared; do not mutate).
+
+        Raises:
+            OSError:     when the file cannot be read.
+            SyntaxError: when the source does not parse (cached as well).
+            ValueError:  for source containing null bytes.
+        """
+        return self._parse(self._blob_for_path(path), filename or str(path))
+
+    def get_text_and_ast(self, path, filename: Optional[str] = None) -> Tuple[str, ast.Module]:
+        """Return ``(text, tree)`` for *path* with a single stat/read."""
+        blob = self._blob_for_path(path)
+        return blob.text, self._parse(blob, filename or str(path))
+
+    def parse_source(self, source: str, filename: str = "<unknown>") -> ast.Module:
+        """Parse *source*, reusing any tree already built for identical text."""
+        _, blob = self._blob_for_text(source)
+        return self._parse(blob, filename)
+
+    def invalidate(self, path=None) -> None:
+        """Forget *path* (or everything when None)."""
+        with self._lock:
+            if path is None:
+                self._blobs.clear()
+                self._paths.clear()
+                self._bytes = 0
+            else:
+                self._paths.pop(str(path), None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters: reads, parses, hits, evictions, entries, bytes."""
+        with self._lock:
+            result: Dict[str, Any] = dict(self._stats)
+            result.update({"entries": len(self._blobs), "bytes": self._bytes, "max_bytes": self.max_bytes})
+            return result
+
+
+_repository: Optional[SourceRepository] = None
+_repository_lock = threading.Lock()
+
+
+def get_source_repository() -> SourceRepository:
+    """Return the process-wide SourceRepository (created on first use)."""
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = SourceRepository()
+    return _repository
+
+
+def reset_source_repository() -> None:
+    """Discard the process-wide repository (useful in tests)."""
+    global _repository
+    with _repository_lock:
+        _repository = None
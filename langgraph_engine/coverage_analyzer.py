@@ -5,6 +5,11 @@ to find untested methods and prioritize test generation by risk.
 Uses AST scanning of test files (not pytest --cov) so no test execution is
 required. Works entirely from source and test file inspection.
 
+Per-test-file reference sets are cached by content hash and merged into a
+set-based TestReferenceIndex (see coverage_index.py); the FQN-segment
+fallback runs one Aho-Corasick scan per method instead of looping over
+every reference name.
+
 Usage:
     from coverage_analyzer import find_untested_methods, generate_coverage_report
 
@@ -13,8 +18,19 @@ Python 3.8+ compatible. ASCII-only (cp1252-safe). No external dependencies.
 
 import ast
 import re
+import threading
 from pathlib import Path
 
+try:
+    from .coverage_index import ReferenceCache, TestReferenceIndex
+except ImportError:
+    from coverage_index import ReferenceCache, TestReferenceIndex
+
+try:
+    from .core.source_repository import get_source_repository
+except ImportError:
+    get_source_repository = None
+
 # ---------------------------------------------------------------------------
 # Lazy import helpers - avoid import-time side effects
 # ---------------------------------------------------------------------------
@@ -144,17 +160,11 @@ def find_test_references(test_dir):
     }
 
     try:
-        test_files = _collect_test_files(test_dir)
-        result["test_files"] = [str(f) for f in test_files]
-
-        for tf in test_files:
-            tf_str = str(tf)
-            refs = _extract_references_from_file(tf)
-            for name in refs:
-                if name not in result["references"]:
-                    result["references"][name] = []
-                if tf_str not in result["references"][name]:
-                    result["references"][name].append(tf_str)
+        index = TestReferenceIndex()
+        for tf in _collect_test_files(test_dir):
+            index.add(tf, _extract_references_from_file(tf))
+        result["test_files"] = index.test_files
+        result["references"] = index.as_dict()
 
     except Exception:
         pass
@@ -165,12 +175,22 @@ def find_test_references(test_dir):
 def _extract_references_from_file(test_file):
     """Extract referenced names from a single test file.
 
-    Returns a set of simple names (class names, method names) referenced.
+    Served from the content-hash ReferenceCache; the file is only parsed when
+    its bytes have not been seen before.
+
+    Returns a frozenset of simple names (class names, method names) referenced.
     """
+    return _REFERENCE_CACHE.get(test_file)
+
+
+def _parse_references(test_file, source):
+    """Parse *source* of *test_file* and return the set of referenced names."""
     names = set()
     try:
-        source = Path(test_file).read_text(encoding="utf-8", errors="ignore")
-        tree = ast.parse(source, filename=str(test_file))
+        if get_source_repository is not None:
+            tree = get_source_repository().parse_source(source, str(test_file))
+        else:
+            tree = ast.parse(source, filename=str(test_file))
     except Exception:
         return names
 
@@ -217,6 +237,9 @@ def _extract_references_from_file(test_file):
     return names
 
 
+_REFERENCE_CACHE = ReferenceCache(_parse_references)
+
+
 def _looks_like_identifier(s):
     """Return True if s could be a Python identifier (class or method name)."""
     if not s or len(s) < 2 or len(s) > 80:
@@ -234,24 +257,60 @@ def _looks_like_identifier(s):
 # ---------------------------------------------------------------------------
 
 
+# Last merged index per project root, reused while no test file changed.
+# {root str: (content fingerprint, TestReferenceIndex)}
+_INDEX_CACHE = {}
+_INDEX_CACHE_LOCK = threading.Lock()
+
+
+def _discover_test_files(project_root):
+    """Return the de-duplicated test files found in all test dirs of project_root."""
+    test_files = []
+    seen = set()
+    for td in _find_test_dirs(project_root):
+        for tf in _collect_test_files(td):
+            key = str(tf)
+            if key not in seen:
+                seen.add(key)
+                test_files.append(tf)
+    return test_files
+
+
+def _build_reference_index(project_root, test_files=None):
+    """Return the merged TestReferenceIndex for all test dirs of project_root.
+
+    The index (and its Aho-Corasick matcher) is reused across calls as long
+    as the content fingerprint of the discovered test files is unchanged.
+
+    Args:
+        project_root: Path to project root directory.
+        test_files:   Optional pre-discovered test files (skips the walk).
+    """
+    if test_files is None:
+        test_files = _discover_test_files(project_root)
+
+    fingerprint = _REFERENCE_CACHE.fingerprint(test_files)
+    root_key = str(Path(project_root).resolve())
+    with _INDEX_CACHE_LOCK:
+        cached = _INDEX_CACHE.get(root_key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+    index = TestReferenceIndex()
+    for tf in test_files:
+        index.add(tf, _extract_references_from_file(tf))
+
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[root_key] = (fingerprint, index)
+    return index
+
+
 def _collect_all_references(project_root):
     """Collect all test references across all test directories.
 
     Returns dict {name: [test_file_paths]}
     """
-    test_dirs = _find_test_dirs(project_root)
-    merged = {}
-
-    for td in test_dirs:
-        refs = find_test_references(td)
-        for name, files in refs["references"].items():
-            if name not in merged:
-                merged[name] = []
-            for f in files:
-                if f not in merged[name]:
-                    merged[name].append(f)
-
-    return merged
+    return _build_reference_index(project_root).as_dict()
 
 
 def _is_method_tested(method_node, all_references):
@@ -264,7 +323,8 @@ def _is_method_tested(method_node, all_references):
 
     Args:
         method_node: dict from CallGraph.methods (has 'name', 'id', 'file', etc.)
-        all_references: dict {name: [test_files]}
+        all_references: TestReferenceIndex (check 3 uses its Aho-Corasick
+                        matcher) or a plain dict {name: [test_files]}.
 
     Returns:
         bool
@@ -291,6 +351,8 @@ def _is_method_tested(method_node, all_references):
     # FQN segment match (e.g. "test_calculate_tax" -> "calculate_tax" in FQN)
     if fqn:
         fqn_lower = fqn.lower()
+        if isinstance(all_references, TestReferenceIndex):
+            return all_references.matcher.contains_any(fqn_lower)
         for ref_name in all_references:
             if ref_name.lower() in fqn_lower:
                 return True
@@ -298,7 +360,7 @@ def _is_method_tested(method_node, all_references):
     return False
 
 
-def find_untested_methods(project_root, call_graph=None):
+def find_untested_methods(project_root, call_graph=None, reference_index=None):
     """Cross-reference CallGraph methods with existing test files.
 
     Strategy:
@@ -311,6 +373,8 @@ def find_untested_methods(project_root, call_graph=None):
         project_root: Path to project root directory.
         call_graph:   Optional pre-built CallGraph instance. If None, one is
                       built automatically.
+        reference_index: Optional pre-built TestReferenceIndex (see
+                      _build_reference_index); built when None.
 
     Returns:
         {
@@ -358,7 +422,7 @@ def find_untested_methods(project_root, call_graph=None):
             callers_count[callee] = callers_count.get(callee, 0) + 1
 
         # Gather all test references
-        all_references = _collect_all_references(root)
+        all_references = reference_index if reference_index is not None else _build_reference_index(root)
 
         tested = []
         untested = []
@@ -457,6 +521,7 @@ def suggest_test_scope(
     modified_files=None,
     call_graph=None,
     max_tests=20,
+    reference_index=None,
 ):
     """Smart test scope suggestion combining coverage gaps + modified files.
 
@@ -469,6 +534,8 @@ def suggest_test_scope(
         modified_files: Optional list of recently changed file paths.
         call_graph:     Optional pre-built CallGraph instance.
         max_tests:      Maximum number of methods to suggest.
+        reference_index: Optional pre-built TestReferenceIndex shared with
+                        other callers (e.g. the quality gate).
 
     Returns:
         {
@@ -499,7 +566,9 @@ def suggest_test_scope(
             return empty
 
         # Full coverage analysis
-        coverage = find_untested_methods(root, call_graph=call_graph)
+        if reference_index is None:
+            reference_index = _build_reference_index(root)
+        coverage = find_untested_methods(root, call_graph=call_graph, reference_index=reference_index)
         coverage_before = coverage["coverage_pct"]
         all_untested = coverage["untested"]
         total_methods = coverage["total_methods"]
@@ -515,7 +584,7 @@ def suggest_test_scope(
                     modified_rel.add(str(mf).replace("\\", "/"))
 
         # Collect all references to find test files covering modified code
-        all_references = _collect_all_references(root)
+        all_references = reference_index.references
         existing_tests_to_run = _find_tests_for_modified_files(root, modified_rel, all_references)
 
         # Build adjacency: caller FQN -> [callee FQNs]
@@ -0,0 +1,258 @@
+"""
+Coverage Index - Cached test-reference mapping for coverage_analyzer.
+
+coverage_analyzer decides whether a method is "tested" by looking its name,
+class and FQN up against the set of names referenced by test files.  Done
+naively that means re-parsing every test file per call, merging references
+with list membership checks, and an O(methods x references) substring loop
+for the FQN-segment fallback.  This module provides the pieces that make the
+mapping cheap:
+
+- ReferenceCache      per-test-file reference sets keyed by content hash, so a
+                      test file is parsed once until its bytes change.
+- TestReferenceIndex  set-based merged index {name: {test_files}} plus a lazily
+                      built Aho-Corasick automaton over lowercase names.
+- AhoCorasick         multi-pattern substring matcher; answers "does any
+                      reference name occur in this FQN?" in O(len(fqn)).
+
+Usage:
+    from coverage_index import AhoCorasick, ReferenceCache, TestReferenceIndex
+
+Python 3.8+ compatible. ASCII-only (cp1252-safe). No external dependencies.
+"""
+
+import hashlib
+import threading
+from collections import deque
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Aho-Corasick automaton
+# ---------------------------------------------------------------------------
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher (Aho-Corasick, dict-based trie).
+
+    Build cost is O(total pattern length); a scan is O(len(text)) plus the
+    number of reported matches.  Empty patterns are ignored.
+
+    Args:
+        patterns: Iterable of strings to search for (matched case-sensitively;
+                  lowercase both sides for case-insensitive matching).
+    """
+
+    def __init__(self, patterns):
+        self._goto = [{}]  # state -> {char: next_state}
+        self._fail = [0]
+        self._out = [None]  # state -> pattern ending exactly here (or None)
+        self._dict_link = [0]  # state -> nearest proper suffix state with output
+        self.pattern_count = 0
+
+        for pattern in patterns:
+            if pattern:
+                self._insert(pattern)
+        self._build_links()
+
+    def _insert(self, pattern):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(None)
+                self._dict_link.append(0)
+            state = nxt
+        if self._out[state] is None:
+            self._out[state] = pattern
+            self.pattern_count += 1
+
+    def _build_links(self):
+        queue = deque()
+        for nxt in self._goto[0].values():
+            queue.append(nxt)
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                fail_state = self._fail[nxt]
+                self._dict_link[nxt] = fail_state if self._out[fail_state] is not None else self._dict_link[fail_state]
+
+    def _step(self, state, ch):
+        goto = self._goto
+        while state and ch not in goto[state]:
+            state = self._fail[state]
+        return goto[state].get(ch, 0)
+
+    def contains_any(self, text):
+        """Return True as soon as any pattern occurs in *text*."""
+        if not self.pattern_count:
+            return False
+        state = 0
+        out = self._out
+        dict_link = self._dict_link
+        for ch in text:
+            state = self._step(state, ch)
+            if out[state] is not None or dict_link[state]:
+                return True
+        return False
+
+    def find_all(self, text):
+        """Return the set of patterns occurring in *text*."""
+        found = set()
+        state = 0
+        for ch in text:
+            state = self._step(state, ch)
+            s = state if self._out[state] is not None else self._dict_link[state]
+            while s:
+                found.add(self._out[s])
+                s = self._dict_link[s]
+        return found
+
+
+# ---------------------------------------------------------------------------
+# Per-test-file reference cache
+# ---------------------------------------------------------------------------
+
+
+class ReferenceCache:
+    """Caches the reference set of each test file by content hash.
+
+    A (mtime_ns, size) stat check short-circuits unchanged files without
+    reading them; when the stat differs the file is hashed and the extractor
+    only runs if the content hash is new.  Reverting a file to an earlier
+    version therefore reuses the earlier parse.
+
+    Args:
+        extractor: Callable(path, source) -> set of referenced names.
+    """
+
+    def __init__(self, extractor):
+        self._extractor = extractor
+        self._by_path = {}  # path str -> (mtime_ns, size, digest)
+        self._by_digest = {}  # digest -> frozenset(names)
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, test_file):
+        """Return the frozenset of names referenced by *test_file*."""
+        path = Path(test_file)
+        key = str(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return frozenset()
+
+        with self._lock:
+            cached = self._by_path.get(key)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                refs = self._by_digest.get(cached[2])
+                if refs is not None:
+                    self.hits += 1
+                    return refs
+
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return frozenset()
+        digest = hashlib.sha1(data).hexdigest()
+
+        with self._lock:
+            refs = self._by_digest.get(digest)
+            if refs is not None:
+                self.hits += 1
+                self._by_path[key] = (st.st_mtime_ns, st.st_size, digest)
+                return refs
+
+        refs = frozenset(self._extractor(path, data.decode("utf-8", errors="ignore")))
+        with self._lock:
+            self.misses += 1
+            self._by_digest[digest] = refs
+            self._by_path[key] = (st.st_mtime_ns, st.st_size, digest)
+        return refs
+
+    def fingerprint(self, test_files):
+        """Return a digest identifying the current content of *test_files*.
+
+        Files are resolved through get() so the cache is warm afterwards.
+        """
+        h = hashlib.sha1()
+        for tf in sorted(str(f) for f in test_files):
+            self.get(tf)
+            entry = self._by_path.get(tf)
+            h.update(tf.encode("utf-8"))
+            h.update((entry[2] if entry else "-").encode("ascii"))
+        return h.hexdigest()
+
+    def clear(self):
+        with self._lock:
+            self._by_path.clear()
+            self._by_digest.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# ---------------------------------------------------------------------------
+# Merged reference index
+# ---------------------------------------------------------------------------
+
+
+class TestReferenceIndex:
+    """Set-based merged index of names referenced across test files.
+
+    Attributes:
+        references: {name: set(test_file_paths)}
+        test_files: list of test file path strings that were indexed.
+    """
+
+    __test__ = False  # not a pytest test class despite the name
+
+    def __init__(self):
+        self.references = {}
+        self.test_files = []
+        self._lower_names = None
+        self._matcher = None
+
+    def add(self, test_file, names):
+        """Merge the *names* referenced by *test_file* into the index."""
+        tf_str = str(test_file)
+        self.test_files.append(tf_str)
+        refs = self.references
+        for name in names:
+            bucket = refs.get(name)
+            if bucket is None:
+                refs[name] = {tf_str}
+            else:
+                bucket.add(tf_str)
+        self._lower_names = None
+        self._matcher = None
+
+    def __contains__(self, name):
+        return name in self.references
+
+    @property
+    def lower_names(self):
+        """Set of lowercase reference names (computed once)."""
+        if self._lower_names is None:
+            self._lower_names = {name.lower() for name in self.references}
+        return self._lower_names
+
+    @property
+    def matcher(self):
+        """AhoCorasick automaton over lowercase reference names (built once)."""
+        if self._matcher is None:
+            self._matcher = AhoCorasick(self.lower_names)
+        return self._matcher
+
+    def as_dict(self):
+        """Return {name: sorted([test_files])} for callers expecting lists."""
+        return {name: sorted(files) for name, files in self.references.items()}
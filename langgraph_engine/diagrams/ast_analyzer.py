@@ -8,9 +8,27 @@ import ast
 import logging
 from pathlib import Path
 
+try:
+    from ..core.source_repository import get_source_repository
+except ImportError:
+    get_source_repository = None
+
 logger = logging.getLogger(__name__)
 
 
+def _load_tree(file_path):
+    """Return the parsed module for *file_path*.
+
+    Goes through the shared SourceRepository so files already parsed by the
+    call graph or coverage stages are not parsed again.
+    Raises OSError / SyntaxError like read_text() + ast.parse().
+    """
+    if get_source_repository is not None:
+        return get_source_repository().get_ast(str(file_path))
+    source = Path(file_path).read_text(encoding="utf-8", errors="replace")
+    return ast.parse(source, filename=str(file_path))
+
+
 # ======================================================================
 # Data helpers (plain dicts, no dataclass dependency)
 # ======================================================================
@@ -66,8 +84,7 @@ class UMLAstAnalyzer:
         file_path = Path(file_path)
         classes = []
         try:
-            source = file_path.read_text(encoding="utf-8", errors="replace")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = _load_tree(file_path)
         except (SyntaxError, OSError) as e:
             logger.debug("Cannot parse %s: %s", file_path, e)
             return classes
@@ -165,8 +182,7 @@ class UMLAstAnalyzer:
         file_path = Path(file_path)
         result = {"imports": [], "from_imports": [], "file": str(file_path)}
         try:
-            source = file_path.read_text(encoding="utf-8", errors="replace")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = _load_tree(file_path)
         except (SyntaxError, OSError):
             return result
 
@@ -231,8 +247,7 @@ class UMLAstAnalyzer:
 
         if _CallGraphVisitor is not None:
             try:
-                source = file_path.read_text(encoding="utf-8", errors="replace")
-                tree = ast.parse(source, filename=str(file_path))
+                tree = _load_tree(file_path)
 
                 try:
                     rel_path = str(file_path.relative_to(self.project_root))
@@ -278,8 +293,7 @@ class UMLAstAnalyzer:
         # Legacy fallback (no class context)
         chains = []
         try:
-            source = file_path.read_text(encoding="utf-8", errors="replace")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = _load_tree(file_path)
         except (SyntaxError, OSError):
             return chains
 
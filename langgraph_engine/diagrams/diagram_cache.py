@@ -0,0 +1,116 @@
+"""diagrams/diagram_cache.py - Fingerprint-keyed disk cache for UML output.
+
+UMLDiagramGenerator.generate_all() used to regenerate all 13 diagrams on
+every Step 13 run, including eight that block on LLM calls.  DiagramCache
+stores generated syntax under a fingerprint of everything that produced it
+(diagram inputs plus a template version, or the full LLM prompt), so an
+unchanged diagram is served from disk instead of being rebuilt.
+
+One JSON file per project root lives under
+``$CACHE_BASE_DIR/uml_diagrams/`` (default ``~/.claude/logs/cache``).
+Entries beyond MAX_ENTRIES are dropped oldest-first.
+
+Windows-safe: ASCII only.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FORMAT_VERSION = 1
+
+
+def fingerprint(*parts):
+    """Return a stable sha256 hex digest of JSON-serialisable *parts*.
+
+    Sets are sorted so that equal inputs always hash identically.
+    """
+
+    def _default(obj):
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj, key=str)
+        return str(obj)
+
+    payload = json.dumps(parts, sort_keys=True, default=_default, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8", errors="replace")).hexdigest()
+
+
+def _default_cache_dir():
+    base = os.environ.get("CACHE_BASE_DIR", str(Path.home() / ".claude" / "logs" / "cache"))
+    return Path(base) / "uml_diagrams"
+
+
+class DiagramCache:
+    """Thread-safe {fingerprint: diagram syntax} store persisted as JSON.
+
+    Args:
+        project_root: Project whose diagrams are cached (selects the file).
+        cache_dir:    Override for the cache directory.
+    """
+
+    MAX_ENTRIES = 500
+
+    def __init__(self, project_root, cache_dir=None):
+        root_key = hashlib.md5(str(Path(project_root).resolve()).encode("utf-8")).hexdigest()
+        self.path = Path(cache_dir or _default_cache_dir()) / ("%s.json" % root_key)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # Keeps snapshots hitting disk in order
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == _CACHE_FORMAT_VERSION:
+            for key, value in (data.get("entries") or {}).items():
+                if isinstance(value, str):
+                    self._entries[key] = value
+
+    def get(self, key):
+        """Return cached syntax for *key* or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store *value* (ignored when empty); call flush() to persist."""
+        if not value:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def flush(self):
+        """Write pending entries to disk atomically (errors are logged only)."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                payload = {"version": _CACHE_FORMAT_VERSION, "entries": dict(self._entries)}
+                self._dirty = False
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_name("%s.%d.%d.tmp" % (self.path.name, os.getpid(), threading.get_ident()))
+                tmp.write_text(json.dumps(payload), encoding="utf-8")
+                os.replace(str(tmp), str(self.path))
+            except OSError as e:
+                logger.debug("Diagram cache write failed: %s", e)
@@ -3,5 +3,16 @@ Refactored from monolithic drawio_converter.py.
 """
 
 from .converter import DrawioConverter  # noqa: F401
+from .layout import layered_layout, strongly_connected_components, summarise_graph  # noqa: F401
 from .url_utils import _encode_drawio_url, get_shareable_url  # noqa: F401
-from .xml_helpers import _edge, _edge_points, _esc, _IDGen, _vertex, _vertex_child, _wrap_mxfile  # noqa: F401
+from .xml_helpers import (  # noqa: F401
+    _edge,
+    _edge_points,
+    _esc,
+    _IDGen,
+    _vertex,
+    _vertex_child,
+    _vertex_link,
+    _wrap_mxfile,
+    _wrap_mxfile_pages,
+)
@@ -9,6 +9,7 @@ except ImportError:
 
     logger = logging.getLogger(__name__)
 
+from .layout import layered_layout, scc_groups, summarise_graph
 from .xml_helpers import (
     S_ABST_HDR,
     S_ACT_ACTION,
@@ -72,7 +73,9 @@ from .xml_helpers import (
     _IDGen,
     _vertex,
     _vertex_child,
+    _vertex_link,
     _wrap_mxfile,
+    _wrap_mxfile_pages,
 )
 
 
@@ -102,18 +105,39 @@ class DrawioConverter:
         "interaction",
     ]
 
-    def convert(self, diagram_type, analysis_data):
+    # Class diagrams with more classes than this are drawn as an overview of
+    # packages with one drill-down page per package (see _class_pages).
+    SUMMARY_THRESHOLD = 150
+
+    # Member rows shown per class box; the rest is folded into "... +N more".
+    MAX_ATTRS = 10
+    MAX_METHODS = 12
+
+    def convert(self, diagram_type, analysis_data, summarise=None):
         """Convert analysis_data to professional draw.io XML.
 
         Args:
             diagram_type: One of SUPPORTED_TYPES.
             analysis_data: Dict from AST/CallGraph analyzer.
+            summarise: Class diagrams only.  None (default) summarises by
+                package when there are more than SUMMARY_THRESHOLD classes;
+                "package" or "scc" forces an overview page whose super-nodes
+                link to drill-down pages; False always draws a single page.
 
         Returns:
             draw.io XML string. Save as .drawio file.
         """
         nid = _IDGen()
         data = analysis_data or {}
+        title = diagram_type.replace("-", " ").title() + " Diagram"
+
+        if diagram_type == "class":
+            mode = self._summary_mode(data, summarise)
+            if mode:
+                try:
+                    return _wrap_mxfile_pages(self._class_pages(data, mode, title))
+                except Exception as exc:
+                    logger.warning("DrawioConverter[class/%s]: %s", mode, exc, exc_info=True)
 
         _generators = {
             "class": self._class_diagram,
@@ -137,50 +161,136 @@ class DrawioConverter:
             logger.warning("DrawioConverter[%s]: %s", diagram_type, exc, exc_info=True)
             cells = [_vertex(nid(), "Error: %s" % exc, S_ACT_ACTION, 100, 100, 400, 50)]
 
-        title = diagram_type.replace("-", " ").title() + " Diagram"
         return _wrap_mxfile(cells, title)
 
     # ------------------------------------------------------------------
     # 1. CLASS DIAGRAM
     # ------------------------------------------------------------------
-    # Layout: Grid (max 4 columns), 3-section boxes with dividers.
+    # Layout: layered (base classes above subclasses, few crossings), see
+    # layout.layered_layout.  3-section boxes with dividers.
     # Relationships: inheritance (hollow triangle), composition (filled diamond),
     #                aggregation (open diamond), association (open arrow).
+    # Large inputs: overview of packages / cycles + one drill-down page each.
+
+    # Class box geometry
+    BOX_W = 220  # class box width
+    HDR_H = 26  # swimlane header height
+    ROW_H = 20  # per-attribute/method row height
+    DIV_H = 8  # divider height
+    MIN_SEC = 24  # minimum section height (empty section)
+
+    _REL_STYLES = {
+        "compose": S_COMPOSE,
+        "aggregate": S_AGGREGATE,
+        "realize": S_REALIZE,
+        "depend": S_DEPEND,
+    }
 
     def _class_diagram(self, data, nid):
         classes = data.get("classes") or []
-        cells = []
+        cells = self._class_cells(classes, nid)
+        if not cells:
+            cells.append(_vertex(nid(), "No classes found", S_ACT_ACTION, 100, 100, 200, 50))
+        return cells
 
-        # Layout constants
-        MAX_COLS = 4
-        BOX_W = 220  # class box width
-        HDR_H = 26  # swimlane header height
-        ROW_H = 20  # per-attribute/method row height
-        DIV_H = 8  # divider height
-        MIN_SEC = 24  # minimum section height (empty section)
-        GAP_X = 70  # horizontal gap
-        GAP_Y = 80  # vertical gap
-        ORIGIN_X = 40
-        ORIGIN_Y = 40
-
-        id_map = {}  # class name -> cell id
-
-        for idx, cls in enumerate(classes[:40]):
-            name = cls.get("name", "Class%d" % idx)
-            attrs = cls.get("attributes", [])[:10]
-            meths = cls.get("methods", [])[:12]
-            cls.get("bases", [])
-            is_iface = cls.get("is_interface", "interface" in name.lower())
-            is_abst = cls.get("is_abstract", False)
+    @staticmethod
+    def _class_name(cls, idx):
+        return cls.get("name") or "Class%d" % idx
 
-            attr_h = max(len(attrs) * ROW_H, MIN_SEC) + 4
-            meth_h = max(len(meths) * ROW_H, MIN_SEC) + 4
-            total_h = HDR_H + attr_h + DIV_H + meth_h
+    @classmethod
+    def _class_key(cls, klass, idx):
+        """(file, class name): same-named classes in different files stay apart."""
+        path = str(klass.get("file_path") or klass.get("file") or klass.get("module") or "")
+        return (path.replace("\\", "/"), cls._class_name(klass, idx))
 
-            col = idx % MAX_COLS
-            row = idx // MAX_COLS
-            x = ORIGIN_X + col * (BOX_W + GAP_X)
-            y = ORIGIN_Y + row * (total_h + GAP_Y)
+    @staticmethod
+    def _resolve_class(name, src_key, keys_by_name):
+        """Key of the class *name* refers to from *src_key*, or None.
+
+        Bases and relationship targets are bare names: prefer a class in the
+        same file, then the same directory, then the first one seen.
+        """
+        candidates = [k for k in keys_by_name.get(name, ()) if k != src_key]
+        if not candidates:
+            return None
+        src_dir = src_key[0].rsplit("/", 1)[0]
+        for same in (lambda k: k[0] == src_key[0], lambda k: k[0].rsplit("/", 1)[0] == src_dir):
+            for key in candidates:
+                if same(key):
+                    return key
+        return candidates[0]
+
+    def _class_edges(self, classes):
+        """Return [(src_key, tgt_key, style)] for edges between *classes*."""
+        keys_by_name = {}
+        for idx, cls in enumerate(classes):
+            key = self._class_key(cls, idx)
+            if key not in keys_by_name.setdefault(key[1], []):
+                keys_by_name[key[1]].append(key)
+        edges = []
+        seen = set()
+        for idx, cls in enumerate(classes):
+            src = self._class_key(cls, idx)
+            if src in seen:
+                continue
+            seen.add(src)
+            for base in cls.get("bases", []):
+                tgt = self._resolve_class(base, src, keys_by_name)
+                if tgt:
+                    edges.append((src, tgt, S_INHERIT))
+            for rel in cls.get("relationships", []):
+                tgt = self._resolve_class(rel.get("target", ""), src, keys_by_name)
+                if tgt:
+                    style = self._REL_STYLES.get(rel.get("type", "associate").lower(), S_ASSOCIATE)
+                    edges.append((src, tgt, style))
+        return edges
+
+    def _member_text(self, items, limit, fmt):
+        lines = [fmt(item) for item in items[:limit]]
+        if len(items) > limit:
+            lines.append("... +%d more" % (len(items) - limit))
+        return lines
+
+    @staticmethod
+    def _attr_line(a):
+        vis = a.get("visibility", "+")
+        hint = a.get("type_hint", "")
+        t = (": " + hint) if hint else ""
+        return "%s %s%s" % (vis, a["name"], t)
+
+    @staticmethod
+    def _method_line(m):
+        vis = m.get("visibility", "+")
+        params = ", ".join(m.get("params", [])[:4])
+        ret = (": " + m["return_type"]) if m.get("return_type") else ""
+        return "%s %s(%s)%s" % (vis, m["name"], params, ret)
+
+    def _class_cells(self, classes, nid):
+        """Return the cells for every class in *classes* plus their edges."""
+        boxes = []  # (key, cls, attr_lines, meth_lines, attr_h, meth_h)
+        sizes = {}
+        for idx, cls in enumerate(classes):
+            key = self._class_key(cls, idx)
+            if key in sizes:
+                continue
+            attr_lines = self._member_text(cls.get("attributes", []), self.MAX_ATTRS, self._attr_line)
+            meth_lines = self._member_text(cls.get("methods", []), self.MAX_METHODS, self._method_line)
+            attr_h = max(len(attr_lines) * self.ROW_H, self.MIN_SEC) + 4
+            meth_h = max(len(meth_lines) * self.ROW_H, self.MIN_SEC) + 4
+            sizes[key] = (self.BOX_W, self.HDR_H + attr_h + self.DIV_H + meth_h)
+            boxes.append((key, cls, attr_lines, meth_lines, attr_h, meth_h))
+
+        edges = self._class_edges(classes)
+        # Layout edges point from the upper box (base / owner) to the lower one.
+        layout_edges = [(tgt, src) if style in (S_INHERIT, S_REALIZE) else (src, tgt) for src, tgt, style in edges]
+        positions = layered_layout([b[0] for b in boxes], layout_edges, sizes)
+
+        cells = []
+        id_map = {}  # class key -> cell id
+        for key, cls, attr_lines, meth_lines, attr_h, meth_h in boxes:
+            name = key[1]
+            is_iface = cls.get("is_interface", "interface" in name.lower())
+            is_abst = cls.get("is_abstract", False)
 
             # Choose header style
             if is_iface:
@@ -194,66 +304,95 @@ class DrawioConverter:
                 label = name
 
             cid = nid()
-            id_map[name] = cid
+            id_map[key] = cid
+            x, y = positions[key]
+            w, total_h = sizes[key]
 
             # Container (swimlane = class box)
-            cells.append(_vertex(cid, label, hdr_style, x, y, BOX_W, total_h))
+            cells.append(_vertex(cid, label, hdr_style, x, y, w, total_h))
 
             # Attributes section (child of container)
-            attr_lines = []
-            for a in attrs:
-                vis = a.get("visibility", "+")
-                hint = a.get("type_hint", "")
-                t = (": " + hint) if hint else ""
-                attr_lines.append("%s %s%s" % (vis, a["name"], t))
             attr_text = "&#xa;".join(attr_lines) if attr_lines else " "
-            cells.append(_vertex_child(nid(), attr_text, S_CLASS_ROW, 0, HDR_H, BOX_W, attr_h, cid))
+            cells.append(_vertex_child(nid(), attr_text, S_CLASS_ROW, 0, self.HDR_H, w, attr_h, cid))
 
             # Divider between attributes and methods
-            cells.append(_vertex_child(nid(), "", S_CLASS_DIV, 0, HDR_H + attr_h, BOX_W, DIV_H, cid))
+            cells.append(_vertex_child(nid(), "", S_CLASS_DIV, 0, self.HDR_H + attr_h, w, self.DIV_H, cid))
 
             # Methods section
-            meth_lines = []
-            for m in meths:
-                vis = m.get("visibility", "+")
-                params = ", ".join(m.get("params", [])[:4])
-                ret = (": " + m["return_type"]) if m.get("return_type") else ""
-                meth_lines.append("%s %s(%s)%s" % (vis, m["name"], params, ret))
             meth_text = "&#xa;".join(meth_lines) if meth_lines else " "
-            cells.append(_vertex_child(nid(), meth_text, S_CLASS_ROW, 0, HDR_H + attr_h + DIV_H, BOX_W, meth_h, cid))
-
-        # Relationships
-        for cls in classes[:40]:
-            src_id = id_map.get(cls.get("name", ""))
-            if not src_id:
-                continue
-            # Inheritance
-            for base in cls.get("bases", [])[:3]:
-                tgt_id = id_map.get(base)
-                if tgt_id:
-                    cells.append(_edge(nid(), "", S_INHERIT, src_id, tgt_id))
-            # Explicit relationships list
-            for rel in cls.get("relationships", [])[:4]:
-                tgt_id = id_map.get(rel.get("target", ""))
-                if not tgt_id:
-                    continue
-                rtype = rel.get("type", "associate").lower()
-                if rtype == "compose":
-                    cells.append(_edge(nid(), "", S_COMPOSE, src_id, tgt_id))
-                elif rtype == "aggregate":
-                    cells.append(_edge(nid(), "", S_AGGREGATE, src_id, tgt_id))
-                elif rtype == "realize":
-                    cells.append(_edge(nid(), "", S_REALIZE, src_id, tgt_id))
-                elif rtype == "depend":
-                    cells.append(_edge(nid(), "", S_DEPEND, src_id, tgt_id))
-                else:
-                    cells.append(_edge(nid(), "", S_ASSOCIATE, src_id, tgt_id))
-
-        if not cells:
-            cells.append(_vertex(nid(), "No classes found", S_ACT_ACTION, 100, 100, 200, 50))
+            meth_y = self.HDR_H + attr_h + self.DIV_H
+            cells.append(_vertex_child(nid(), meth_text, S_CLASS_ROW, 0, meth_y, w, meth_h, cid))
 
+        for src, tgt, style in edges:
+            cells.append(_edge(nid(), "", style, id_map[src], id_map[tgt]))
         return cells
 
+    # --- Summarisation (overview + drill-down pages) ---
+
+    def _summary_mode(self, data, summarise):
+        if summarise in ("package", "scc"):
+            return summarise
+        if summarise is None and len(data.get("classes") or []) > self.SUMMARY_THRESHOLD:
+            return "package"
+        return None
+
+    @staticmethod
+    def _package_of(cls):
+        """Directory of the class' file ('.' for top level), else its module."""
+        file_path = str(cls.get("file_path") or cls.get("file") or "").replace("\\", "/")
+        if file_path:
+            return file_path.rsplit("/", 1)[0] if "/" in file_path else "."
+        return cls.get("module") or "."
+
+    def _class_pages(self, data, mode, title):
+        """Return [(page_id, title, cells)]: overview first, then one page per group.
+
+        Groups are packages (directory of the class' file); in "scc" mode each
+        inheritance/relationship cycle is its own group instead.  Every class
+        is drawn on exactly one drill-down page; edges that leave a group are
+        aggregated into weighted edges on the overview.
+        """
+        classes = data.get("classes") or []
+        by_key = {}
+        for idx, cls in enumerate(classes):
+            by_key.setdefault(self._class_key(cls, idx), cls)
+        names = list(by_key)
+        edges = [(src, tgt) for src, tgt, _style in self._class_edges(classes)]
+
+        groups = {name: self._package_of(by_key[name]) for name in names}
+        if mode == "scc":
+            # Mutually dependent classes become one node; the rest stay in
+            # their package so acyclic code does not explode into 1-class pages.
+            for name, group in scc_groups(names, edges).items():
+                if group != name:
+                    groups[name] = group
+        members, group_edges = summarise_graph(names, edges, groups)
+
+        page_ids = {group: "%s-%d" % (mode, i + 1) for i, group in enumerate(members)}
+        nid = _IDGen()
+        node_w, node_h = 240, 60
+        positions = layered_layout(
+            list(members),
+            list(group_edges),
+            {g: (node_w, node_h) for g in members},
+        )
+        overview = []
+        id_map = {}
+        for group, group_members in members.items():
+            cid = nid()
+            id_map[group] = cid
+            x, y = positions[group]
+            label = "%s&#xa;(%d classes)" % (group, len(group_members))
+            overview.append(_vertex_link(cid, label, S_PKG_BOX, x, y, node_w, node_h, page_ids[group]))
+        for (src, tgt), count in group_edges.items():
+            overview.append(_edge(nid(), str(count) if count > 1 else "", S_DEPEND, id_map[src], id_map[tgt]))
+
+        pages = [("overview", "%s (overview)" % title, overview)]
+        for group, group_members in members.items():
+            cells = self._class_cells([by_key[n] for n in group_members], _IDGen())
+            pages.append((page_ids[group], str(group)[:60], cells))
+        return pages
+
     # ------------------------------------------------------------------
     # 2. SEQUENCE DIAGRAM
     # ------------------------------------------------------------------
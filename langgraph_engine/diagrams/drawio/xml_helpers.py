@@ -363,12 +363,25 @@ def _edge_points(cid, value, style, x1, y1, x2, y2, parent="1"):
     )
 
 
-def _wrap_mxfile(cells, title="Diagram", diagram_id="diagram1"):
-    """Wrap cells in proper draw.io mxfile XML (draw.io v24 format)."""
+def _vertex_link(cid, value, style, x, y, w, h, page_id, parent="1"):
+    """Vertex that jumps to another page of the same file when clicked.
+
+    draw.io stores links on a UserObject wrapper; ``data:page/id,<id>``
+    targets the <diagram> element with that id.
+    """
+    return (
+        '    <UserObject label="%s" link="data:page/id,%s" id="%s">\n'
+        '      <mxCell style="%s" vertex="1" parent="%s">\n'
+        '        <mxGeometry x="%s" y="%s" width="%s" height="%s" as="geometry" />\n'
+        "      </mxCell>\n"
+        "    </UserObject>" % (_esc(value), _esc(page_id), cid, style, parent, x, y, w, h)
+    )
+
+
+def _diagram_page(cells, title, diagram_id):
+    """Return one <diagram> element (a page) holding *cells*."""
     body = "\n".join(cells)
     return (
-        '<?xml version="1.0" encoding="UTF-8"?>\n'
-        '<mxfile host="app.diagrams.net" type="diagram" version="24.0.0">\n'
         '  <diagram id="%s" name="%s">\n'
         '    <mxGraphModel dx="1422" dy="762" grid="1" gridSize="10" guides="1" '
         'tooltips="1" connect="1" arrows="1" fold="1" page="1" pageScale="1" '
@@ -380,8 +393,27 @@ def _wrap_mxfile(cells, title="Diagram", diagram_id="diagram1"):
         "      </root>\n"
         "    </mxGraphModel>\n"
         "  </diagram>\n"
+    ) % (_esc(diagram_id), _esc(title), body)
+
+
+def _wrap_mxfile_pages(pages):
+    """Wrap several pages in one mxfile.
+
+    Args:
+        pages: list of (diagram_id, title, cells) tuples; the first page is
+               the one draw.io opens.
+    """
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<mxfile host="app.diagrams.net" type="diagram" version="24.0.0">\n'
+        "%s"
         "</mxfile>"
-    ) % (diagram_id, _esc(title), body)
+    ) % "".join(_diagram_page(cells, title, diagram_id) for diagram_id, title, cells in pages)
+
+
+def _wrap_mxfile(cells, title="Diagram", diagram_id="diagram1"):
+    """Wrap cells in proper draw.io mxfile XML (draw.io v24 format)."""
+    return _wrap_mxfile_pages([(diagram_id, title, cells)])
 
 
 # ======================================================================
@@ -2,19 +2,143 @@
 Kroki.io renderer for PlantUML/Mermaid diagrams.
 
 Extracted from uml_generators.py (KrokiRenderer class).
+
+Rendered output is cached on disk by content: the key is a sha256 of the
+diagram type, output format and source text, so an unchanged diagram is
+never sent to the server twice.  Cache files live under
+``$CACHE_BASE_DIR/kroki/`` (default ``~/.claude/logs/cache``).
+
+All renderers talking to the same server share one keep-alive
+requests.Session, and render_batch() renders many diagrams concurrently.
+Step 13 renders its UML diagrams this way (through
+UMLDiagramGenerator.render_diagrams()) when UML_RENDER_SVG=1.
+Point KROKI_SERVER (or server_url=) at a self-hosted Kroki, e.g.
+``http://localhost:8000``, to render without leaving the machine.
 """
 
+import hashlib
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_MAX_WORKERS = max(1, int(os.environ.get("KROKI_MAX_WORKERS", "8")))
+
+_sessions = {}  # server url -> requests.Session
+_sessions_lock = threading.Lock()
+
+
+def _default_cache_dir():
+    base = os.environ.get("CACHE_BASE_DIR", str(Path.home() / ".claude" / "logs" / "cache"))
+    return Path(base) / "kroki"
+
+
+def _get_session(server_url, pool_size):
+    """Return the shared keep-alive session for *server_url* (None without requests)."""
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except ImportError:
+        return None
+    with _sessions_lock:
+        session = _sessions.get(server_url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[server_url] = session
+        return session
+
+
+def render_key(diagram_text, diagram_type="plantuml", output_format="svg"):
+    """Return the content address of a rendered diagram."""
+    h = hashlib.sha256()
+    for part in (diagram_type, output_format, diagram_text):
+        h.update(part.encode("utf-8", errors="replace"))
+        h.update(b"\0")
+    return h.hexdigest()
+
 
 class KrokiRenderer:
-    """Render PlantUML/Mermaid via Kroki.io free API."""
+    """Render PlantUML/Mermaid via Kroki.io free API (or a self-hosted Kroki).
+
+    Args:
+        server_url: Kroki endpoint; defaults to $KROKI_SERVER, then KROKI_URL.
+        cache_dir:  Directory for the content-addressed render cache.
+        use_cache:  False disables the cache (also KROKI_CACHE=0).
+        timeout:    Per-request timeout in seconds.
+        max_workers: Concurrency of render_batch().
+    """
 
     KROKI_URL = "https://kroki.io"
 
+    def __init__(self, server_url=None, cache_dir=None, use_cache=None, timeout=30, max_workers=None):
+        self.server_url = (server_url or os.environ.get("KROKI_SERVER") or self.KROKI_URL).rstrip("/")
+        if use_cache is None:
+            use_cache = os.environ.get("KROKI_CACHE", "1") != "0"
+        self.cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+        self.use_cache = use_cache
+        self.timeout = timeout
+        self.max_workers = max_workers or _MAX_WORKERS
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, key, output_format):
+        return self.cache_dir / key[:2] / ("%s.%s" % (key, output_format))
+
+    def _cache_get(self, key, output_format):
+        if not self.use_cache:
+            return None
+        try:
+            data = self._cache_path(key, output_format).read_bytes()
+        except OSError:
+            return None
+        self.hits += 1
+        return data
+
+    def _cache_put(self, key, output_format, data):
+        if not self.use_cache:
+            return
+        path = self._cache_path(key, output_format)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name("%s.tmp.%d.%d" % (path.name, os.getpid(), threading.get_ident()))
+            tmp.write_bytes(data)
+            os.replace(str(tmp), str(path))
+        except OSError as e:
+            logger.debug("Kroki cache write failed: %s", e)
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+
+    def _post(self, diagram_text, diagram_type, output_format):
+        """POST one diagram to the server. Returns bytes or None."""
+        session = _get_session(self.server_url, self.max_workers)
+        if session is None:
+            logger.warning("requests not available for Kroki rendering")
+            return None
+
+        url = "%s/%s/%s" % (self.server_url, diagram_type, output_format)
+        resp = session.post(
+            url,
+            data=diagram_text.encode("utf-8"),
+            headers={"Content-Type": "text/plain"},
+            timeout=self.timeout,
+        )
+        if resp.status_code == 200:
+            return resp.content
+        logger.warning("Kroki API returned %d: %s", resp.status_code, resp.text[:200])
+        return None
+
     def render(self, diagram_text, diagram_type="plantuml", output_format="svg"):
         """Render diagram via Kroki.io API.
 
@@ -25,28 +149,43 @@ class KrokiRenderer:
 
         Returns bytes or None on failure.
         """
-        try:
-            import requests
-        except ImportError:
-            logger.warning("requests not available for Kroki rendering")
-            return None
-
-        url = "%s/%s/%s" % (self.KROKI_URL, diagram_type, output_format)
+        key = render_key(diagram_text, diagram_type, output_format)
+        cached = self._cache_get(key, output_format)
+        if cached is not None:
+            return cached
+        self.misses += 1
 
         try:
-            resp = requests.post(
-                url,
-                data=diagram_text.encode("utf-8"),
-                headers={"Content-Type": "text/plain"},
-                timeout=30,
-            )
-            if resp.status_code == 200:
-                return resp.content
-            logger.warning("Kroki API returned %d: %s", resp.status_code, resp.text[:200])
-            return None
+            data = self._post(diagram_text, diagram_type, output_format)
         except Exception as e:
             logger.warning("Kroki rendering failed: %s", e)
             return None
+        if data is not None:
+            self._cache_put(key, output_format, data)
+        return data
+
+    def render_batch(self, jobs):
+        """Render several diagrams concurrently.
+
+        Args:
+            jobs: Iterable of (diagram_text, diagram_type, output_format)
+                  tuples; identical jobs are rendered once.
+
+        Returns:
+            List of bytes-or-None in the order of *jobs*.
+        """
+        jobs = [tuple(job) for job in jobs]
+        unique = list(dict.fromkeys(jobs))
+        if not unique:
+            return []
+        workers = min(self.max_workers, len(unique))
+        if workers == 1:
+            results = [self.render(*job) for job in unique]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kroki") as pool:
+                results = list(pool.map(lambda job: self.render(*job), unique))
+        by_job = dict(zip(unique, results))
+        return [by_job[job] for job in jobs]
 
     def render_to_file(self, diagram_text, output_path, diagram_type="plantuml", output_format="svg"):
         """Render and save to file. Returns path or None."""
@@ -58,3 +197,31 @@ class KrokiRenderer:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(data)
         return str(output_path)
+
+    def render_all_to_dir(self, diagrams, output_dir, output_format="svg"):
+        """Render {name: syntax} concurrently into output_dir/<name>.<format>.
+
+        The diagram type is detected per entry: "@startuml" means PlantUML,
+        anything else is treated as Mermaid.
+
+        Returns:
+            {name: path or None}
+        """
+        names = [name for name, syntax in diagrams.items() if syntax]
+        jobs = []
+        for name in names:
+            syntax = diagrams[name]
+            dtype = "plantuml" if syntax.lstrip().startswith("@startuml") else "mermaid"
+            jobs.append((syntax, dtype, output_format))
+
+        results = {}
+        out = Path(output_dir)
+        for name, data in zip(names, self.render_batch(jobs)):
+            if data is None:
+                results[name] = None
+                continue
+            out.mkdir(parents=True, exist_ok=True)
+            path = out / ("%s.%s" % (name, output_format))
+            path.write_bytes(data)
+            results[name] = str(path)
+        return results
@@ -4,17 +4,62 @@ Extracted from uml_generators.py. This is the monolithic generator
 that was the original implementation before the Strategy pattern refactoring.
 
 Kept for backward compatibility with documentation_manager.py.
+
+generate_all() runs the 13 diagrams as a small task graph on a thread pool:
+diagrams that need no project analysis start immediately, the rest start
+once the shared inputs (CallGraph, classes, dependency graph, call chains)
+are built.  LLM calls are throttled to UML_LLM_CONCURRENCY at a time.
+AST-based diagrams are cached by a fingerprint of their inputs and LLM
+results by a fingerprint of the prompt (see diagram_cache.py), so unchanged
+diagrams are served from disk.
+
 Windows-safe: ASCII only.
 """
 
+import heapq
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from .ast_analyzer import UMLAstAnalyzer
+from .diagram_cache import DiagramCache, fingerprint
+from .drawio.layout import summarise_graph
 
 logger = logging.getLogger(__name__)
 
+# Bump when the output of an AST-based generate_* method changes so that
+# cached diagrams built by the old code are not served.
+_TEMPLATE_VERSION = 2
+
+_LLM_MODEL = "fast"
+_LLM_CONCURRENCY = max(1, int(os.environ.get("UML_LLM_CONCURRENCY", "4")))
+_MAX_WORKERS = max(1, int(os.environ.get("UML_MAX_WORKERS", "8")))
+
+# Order of the dict returned by generate_all().
+_DIAGRAM_ORDER = (
+    "class-diagram",
+    "package-diagram",
+    "component-diagram",
+    "call-graph-diagram",
+    "sequence-diagram",
+    "activity-diagram",
+    "state-diagram",
+    "usecase-diagram",
+    "object-diagram",
+    "deployment-diagram",
+    "communication-diagram",
+    "composite-structure-diagram",
+    "interaction-overview-diagram",
+)
+
+
+def _mermaid_id(fqn):
+    """Convert an FQN to a valid Mermaid node ID."""
+    return fqn.replace("/", "_").replace("\\", "_").replace("::", "__").replace(".", "_").replace("-", "_")
+
 
 def _make_class_info(name, file_path, bases=None, methods=None, attributes=None):
     """Create a ClassInfo dict."""
@@ -55,15 +100,20 @@ def _make_attr_info(name, type_hint="", visibility="+"):
 class UMLDiagramGenerator:
     """Generate Mermaid/PlantUML syntax from analysis results."""
 
-    def __init__(self, project_root, output_dir=None, call_graph=None):
-        import os
-
+    def __init__(self, project_root, output_dir=None, call_graph=None, use_cache=None, cache_dir=None):
         self.project_root = Path(project_root)
         _env = os.environ.get("UML_OUTPUT_DIR", "").strip()
         _dir = _env or output_dir or "uml"
         self.output_dir = Path(_dir) if Path(_dir).is_absolute() else self.project_root / _dir
         self.analyzer = UMLAstAnalyzer(project_root)
         self._call_graph = call_graph  # pre-built CallGraph or None (lazy)
+        self._call_graph_lock = threading.Lock()
+
+        if use_cache is None:
+            use_cache = os.environ.get("UML_DIAGRAM_CACHE", "1") != "0"
+        self._cache = DiagramCache(self.project_root, cache_dir) if use_cache else None
+        self._llm_slots = threading.BoundedSemaphore(_LLM_CONCURRENCY)
+        self._batch = False  # True while generate_all() defers cache flushes
 
     # ------------------------------------------------------------------
     # CallGraph integration helpers
@@ -76,6 +126,13 @@ class UMLDiagramGenerator:
         """
         if self._call_graph is not None:
             return self._call_graph
+        with self._call_graph_lock:
+            if self._call_graph is None:
+                self._call_graph = self._build_call_graph()
+            return self._call_graph
+
+    def _build_call_graph(self):
+        """Build a CallGraph for the project (None on failure)."""
         try:
             # call_graph_builder lives at langgraph_engine.call_graph_builder,
             # which is the PARENT of this diagrams/ subpackage -- use '..'.
@@ -85,9 +142,7 @@ class UMLDiagramGenerator:
                 from ..call_graph_builder import build_call_graph
             except ImportError:
                 from langgraph_engine.call_graph_builder import build_call_graph
-            cg = build_call_graph(str(self.project_root))
-            self._call_graph = cg
-            return cg
+            return build_call_graph(str(self.project_root))
         except Exception as e:
             logger.debug("CallGraph build failed: %s", e)
             return None
@@ -751,23 +806,29 @@ class UMLDiagramGenerator:
 
         return _plantuml_stub("interaction", "LLM generation unavailable")
 
-    def generate_call_graph_diagram(self, call_graph=None):
+    def generate_call_graph_diagram(self, call_graph=None, max_methods=40, max_edges=60, summarise=None):
         """Generate a Mermaid flowchart showing the method-level call graph.
 
         Tier 1 diagram: AST-based, no LLM required.
         Shows classes as subgraphs, methods as nodes, call edges between them.
         Entry points get bold borders, high-complexity methods get red fill.
 
+        When the graph has more than *max_methods* methods the most connected
+        ones are shown (entry points first) and a note counts what was left
+        out.  With *summarise* (default: automatically above
+        4 * max_methods) one node per class is drawn instead, with call
+        counts on the edges between classes.
+
         Args:
             call_graph: Optional pre-built CallGraph object. If None, builds
                 one via _get_call_graph() lazy builder.
+            max_methods: Method nodes shown in detailed mode.
+            max_edges: Call edges shown (either mode).
+            summarise: True/False to force class-level / method-level output.
 
         Returns:
             str: Mermaid flowchart syntax string.
         """
-        MAX_METHODS = 40
-        MAX_EDGES = 60
-
         # Resolve CallGraph
         if call_graph is None:
             call_graph = self._get_call_graph()
@@ -776,16 +837,52 @@ class UMLDiagramGenerator:
             return "flowchart LR\n    note[Call graph not available]"
 
         try:
+            methods = call_graph.methods
+
+            # One pass over all edges: degrees and callee set for the whole
+            # graph, not just the part that ends up on the diagram.
+            calls = []
+            degree = {}
+            all_callee_fqns = set()
+            for edge in call_graph.get_edges():
+                if edge.get("type") == "inheritance":
+                    continue
+                from_fqn = edge.get("from", "")
+                to_fqn = edge.get("to", "")
+                all_callee_fqns.add(to_fqn)
+                if from_fqn in methods and to_fqn in methods and from_fqn != to_fqn:
+                    calls.append((from_fqn, to_fqn))
+                    degree[from_fqn] = degree.get(from_fqn, 0) + 1
+                    degree[to_fqn] = degree.get(to_fqn, 0) + 1
+
+            if summarise is None:
+                summarise = len(methods) > 4 * max_methods
+            if summarise:
+                return self._call_graph_summary(methods, calls, max_edges)
+
+            def _is_entry(fqn):
+                return not methods[fqn].get("name", "").startswith("_") and fqn not in all_callee_fqns
+
+            # Top-K by (entry point, degree); ties keep dict order.
+            position = {fqn: i for i, fqn in enumerate(methods)}
+            if len(methods) > max_methods:
+                chosen = heapq.nlargest(
+                    max_methods,
+                    methods,
+                    key=lambda f: (_is_entry(f) and degree.get(f, 0) > 0, degree.get(f, 0), -position[f]),
+                )
+                chosen.sort(key=position.get)
+            else:
+                chosen = list(methods)
+
             lines = ["flowchart LR"]
 
             # Group methods by parent class from CallGraph.methods dict
             class_methods = {}  # class_name -> [(fqn, name, params_str, cyclomatic)]
             standalone = []  # [(fqn, name, params_str, cyclomatic)]
-            node_count = 0
 
-            for fqn, m in call_graph.methods.items():
-                if node_count >= MAX_METHODS:
-                    break
+            for fqn in chosen:
+                m = methods[fqn]
                 name = m.get("name", "")
                 params = m.get("params", [])
                 params_str = ", ".join(p.split(":")[0].strip() for p in params[:3])
@@ -798,21 +895,15 @@ class UMLDiagramGenerator:
                     class_methods.setdefault(cls_name, []).append((fqn, name, params_str, cyclomatic))
                 else:
                     standalone.append((fqn, name, params_str, cyclomatic))
-                node_count += 1
-
-            # Build FQN -> node_id mapping for edges
-            def _safe_id(fqn):
-                """Convert FQN to valid Mermaid node ID."""
-                return fqn.replace("/", "_").replace("\\", "_").replace("::", "__").replace(".", "_").replace("-", "_")
 
             fqn_to_nid = {}
 
             # Write class subgraphs
-            for cls_name, methods in sorted(class_methods.items()):
+            for cls_name, group in sorted(class_methods.items()):
                 safe_cls = cls_name.replace(".", "_").replace("-", "_")
                 lines.append("    subgraph %s_group[%s]" % (safe_cls, cls_name))
-                for fqn, mname, params_str, _cx in methods:
-                    nid = _safe_id(fqn)
+                for fqn, mname, params_str, _cx in group:
+                    nid = _mermaid_id(fqn)
                     fqn_to_nid[fqn] = nid
                     lines.append('        %s["%s(%s)"]' % (nid, mname, params_str))
                 lines.append("    end")
@@ -821,36 +912,31 @@ class UMLDiagramGenerator:
             if standalone:
                 lines.append("    subgraph standalone_group[Functions]")
                 for fqn, fname, params_str, _cx in standalone:
-                    nid = _safe_id(fqn)
+                    nid = _mermaid_id(fqn)
                     fqn_to_nid[fqn] = nid
                     lines.append('        %s["%s(%s)"]' % (nid, fname, params_str))
                 lines.append("    end")
 
-            # Collect callee FQNs for entry point detection
-            all_callee_fqns = set()
-            edges = call_graph.get_edges()
-
-            # Write call edges
-            edge_count = 0
-            for edge in edges:
-                if edge_count >= MAX_EDGES:
+            # Write call edges between the chosen methods
+            shown = set()
+            for from_fqn, to_fqn in calls:
+                if len(shown) >= max_edges:
                     break
-                if edge.get("type") == "inheritance":
-                    continue
-                from_fqn = edge.get("from", "")
-                to_fqn = edge.get("to", "")
-                all_callee_fqns.add(to_fqn)
-
                 from_nid = fqn_to_nid.get(from_fqn)
                 to_nid = fqn_to_nid.get(to_fqn)
-                if from_nid and to_nid and from_nid != to_nid:
+                if from_nid and to_nid and from_nid != to_nid and (from_nid, to_nid) not in shown:
+                    shown.add((from_nid, to_nid))
                     lines.append("    %s --> %s" % (from_nid, to_nid))
-                    edge_count += 1
+
+            hidden_methods = len(methods) - len(chosen)
+            hidden_calls = len(set(calls)) - len(shown)
+            if hidden_methods > 0 or hidden_calls > 0:
+                lines.append("    more_note[/+%d methods, +%d calls not shown/]" % (hidden_methods, hidden_calls))
 
             # Style: entry points (bold border) and high-complexity (red fill)
             all_method_data = []
-            for cls_name, methods in class_methods.items():
-                all_method_data.extend(methods)
+            for cls_name, group in class_methods.items():
+                all_method_data.extend(group)
             all_method_data.extend(standalone)
 
             for fqn, mname, _p, cyclomatic in all_method_data:
@@ -871,6 +957,26 @@ class UMLDiagramGenerator:
             logger.warning("Call graph diagram generation failed: %s", e)
             return "flowchart LR\n    note[Call graph not available]"
 
+    def _call_graph_summary(self, methods, calls, max_edges):
+        """Class-level call graph: one node per class, call counts on edges."""
+
+        def _group(fqn):
+            parent = methods[fqn].get("parent_class")
+            if parent:
+                return parent.split("::")[-1] if "::" in parent else parent
+            return "Functions"
+
+        members, group_edges = summarise_graph(list(methods), calls, _group)
+        lines = ["flowchart LR"]
+        for group, fqns in members.items():
+            lines.append('    %s["%s (%d methods)"]' % (_mermaid_id("cls_" + group), group, len(fqns)))
+        heaviest = heapq.nlargest(max_edges, group_edges.items(), key=lambda item: item[1])
+        for (src, tgt), count in heaviest:
+            lines.append("    %s -->|%d| %s" % (_mermaid_id("cls_" + src), count, _mermaid_id("cls_" + tgt)))
+        if len(group_edges) > len(heaviest):
+            lines.append("    more_note[/+%d class links not shown/]" % (len(group_edges) - len(heaviest)))
+        return "\n".join(lines)
+
     # ------------------------------------------------------------------
     # Orchestration
     # ------------------------------------------------------------------
@@ -878,8 +984,10 @@ class UMLDiagramGenerator:
     def generate_all(self, scope="project"):
         """Generate all 13 diagram types.
 
-        Calls _get_call_graph() once upfront so all individual methods share
-        the same CallGraph instance without redundant builds.
+        Runs as a two-level task graph on a thread pool.  Diagrams that need
+        no project analysis (usecase, deployment, activity) start at once;
+        the others start when the shared inputs are ready.  _get_call_graph()
+        is called once so every generator reuses the same CallGraph.
 
         Tier 1 (AST-based, always): class, package, component, call-graph
         Tier 2 (AST + LLM): sequence, activity, state
@@ -888,10 +996,72 @@ class UMLDiagramGenerator:
 
         Returns dict: {diagram_name: syntax_string}
         """
-        results = {}
+        futures = {}
+        self._batch = True
+        try:
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="uml") as pool:
+                futures["usecase-diagram"] = pool.submit(self.generate_usecase_diagram)
+                futures["deployment-diagram"] = pool.submit(self.generate_deployment_diagram)
+                futures["activity-diagram"] = pool.submit(self._generate_entry_activity_diagram)
+
+                cg, classes, dep_graph, cg_chains = self._shared_inputs()
+
+                def _call_graph_inputs():
+                    return (cg.methods, cg.get_edges()) if cg is not None else None
+
+                # ---- Tier 1: AST-based (always generate, fingerprint-cached) ----
+                futures["class-diagram"] = pool.submit(
+                    self._cached, "class-diagram", lambda: classes, lambda: self.generate_class_diagram(classes)
+                )
+                futures["package-diagram"] = pool.submit(
+                    self._cached, "package-diagram", lambda: dep_graph, lambda: self.generate_package_diagram(dep_graph)
+                )
+                futures["component-diagram"] = pool.submit(
+                    self._cached,
+                    "component-diagram",
+                    lambda: dep_graph,
+                    lambda: self.generate_component_diagram(dep_graph),
+                )
+                futures["call-graph-diagram"] = pool.submit(
+                    self._cached,
+                    "call-graph-diagram",
+                    _call_graph_inputs,
+                    lambda: self.generate_call_graph_diagram(call_graph=cg),
+                )
+
+                # ---- Tier 2: AST + LLM hybrid (may fail gracefully) ----
+                if cg_chains:
+                    futures["sequence-diagram"] = pool.submit(
+                        self._cached,
+                        "sequence-diagram",
+                        lambda: cg_chains,
+                        lambda: self.generate_sequence_diagram(call_chains=cg_chains),
+                    )
+                else:
+                    futures["sequence-diagram"] = pool.submit(self.generate_sequence_diagram, call_chains=cg_chains)
+                futures["state-diagram"] = pool.submit(self._generate_project_state_diagram, cg)
+
+                # ---- Tier 3: LLM-powered (best-effort, prompt-cached) ----
+                futures["object-diagram"] = pool.submit(self.generate_object_diagram, classes)
+                futures["communication-diagram"] = pool.submit(self.generate_communication_diagram, dep_graph)
+                futures["composite-structure-diagram"] = pool.submit(self.generate_composite_structure_diagram, classes)
+                futures["interaction-overview-diagram"] = pool.submit(self.generate_interaction_overview, cg_chains)
+
+            results = {}
+            for name in _DIAGRAM_ORDER:
+                try:
+                    results[name] = futures[name].result()
+                except Exception as e:
+                    logger.debug("%s failed: %s", name, e)
+        finally:
+            self._batch = False
+            if self._cache is not None:
+                self._cache.flush()
+
+        return results
 
-        # Build CallGraph once upfront; cache in self._call_graph so that
-        # all generate_* calls below reuse it via _get_call_graph().
+    def _shared_inputs(self):
+        """Return (call_graph, classes, dep_graph, call_chains) for generate_all()."""
         cg = self._get_call_graph()
 
         # Derive shared data sources from CallGraph or AST analyzer
@@ -912,90 +1082,56 @@ class UMLDiagramGenerator:
         except Exception as e:
             logger.warning("Shared data source build failed: %s", e)
 
-        # ---- Tier 1: AST-based (always generate) ----
-        try:
-            results["class-diagram"] = self.generate_class_diagram(classes)
-        except Exception as e:
-            logger.debug("class-diagram failed: %s", e)
-
-        try:
-            results["package-diagram"] = self.generate_package_diagram(dep_graph)
-        except Exception as e:
-            logger.debug("package-diagram failed: %s", e)
-
-        try:
-            results["component-diagram"] = self.generate_component_diagram(dep_graph)
-        except Exception as e:
-            logger.debug("component-diagram failed: %s", e)
-
-        try:
-            results["call-graph-diagram"] = self.generate_call_graph_diagram(call_graph=cg)
-        except Exception as e:
-            logger.debug("call-graph-diagram failed: %s", e)
-
-        # ---- Tier 2: AST + LLM hybrid (may fail gracefully) ----
-        try:
-            results["sequence-diagram"] = self.generate_sequence_diagram(call_chains=cg_chains)
-        except Exception as e:
-            logger.debug("sequence-diagram failed: %s", e)
-
-        try:
-            # Activity diagram: auto-detect main entry point
-            entry_code = ""
-            for entry_name in ["main", "run", "app", "start", "__main__"]:
-                for py_file in self.project_root.rglob("*.py"):
-                    rel = str(py_file.relative_to(self.project_root))
-                    if any(skip in rel for skip in ["__pycache__", ".venv", "test"]):
-                        continue
-                    if entry_name in py_file.stem or entry_name == "__main__":
-                        try:
-                            entry_code = py_file.read_text(encoding="utf-8", errors="replace")[:2000]
-                            break
-                        except OSError:
-                            pass
-                if entry_code:
-                    break
-            results["activity-diagram"] = self.generate_activity_diagram(
-                function_code=entry_code, context="Main application entry point flow"
-            )
-        except Exception as e:
-            logger.debug("activity-diagram failed: %s", e)
-
-        try:
-            # State diagram: auto-detect from flow_state or state patterns
-            state_context = ""
-            if cg:
-                state_classes = [
-                    c.get("name", "")
-                    for c in cg.classes.values()
-                    if any(kw in c.get("name", "").lower() for kw in ["state", "status", "phase", "mode"])
-                ]
-                if state_classes:
-                    state_context = "State-like classes: %s" % ", ".join(state_classes[:10])
-            if not state_context:
-                # Check for TypedDict or enum state patterns
-                state_context = "Pipeline states from project structure"
-            results["state-diagram"] = self.generate_state_diagram(context=state_context)
-        except Exception as e:
-            logger.debug("state-diagram failed: %s", e)
-
-        # ---- Tier 3: LLM-powered (best-effort) ----
-        tier3_items = [
-            ("usecase-diagram", lambda: self.generate_usecase_diagram()),
-            ("object-diagram", lambda: self.generate_object_diagram(classes)),
-            ("deployment-diagram", lambda: self.generate_deployment_diagram()),
-            ("communication-diagram", lambda: self.generate_communication_diagram(dep_graph)),
-            ("composite-structure-diagram", lambda: self.generate_composite_structure_diagram(classes)),
-            ("interaction-overview-diagram", lambda: self.generate_interaction_overview(cg_chains)),
-        ]
+        return cg, classes, dep_graph, cg_chains
 
-        for name, method in tier3_items:
-            try:
-                results[name] = method()
-            except Exception as e:
-                logger.debug("%s failed: %s", name, e)
+    def _cached(self, name, inputs, build):
+        """Return *build()* for diagram *name*, cached by a fingerprint of *inputs()*.
 
-        return results
+        *inputs* is a callable so the fingerprint is computed on the worker
+        thread rather than while the task graph is being scheduled.
+        """
+        if self._cache is None:
+            return build()
+        key = fingerprint("diagram", name, _TEMPLATE_VERSION, inputs())
+        syntax = self._cache.get(key)
+        if syntax is None:
+            syntax = build()
+            self._cache.put(key, syntax)
+        return syntax
+
+    def _generate_entry_activity_diagram(self):
+        """Activity diagram for the auto-detected main entry point."""
+        entry_code = ""
+        for entry_name in ["main", "run", "app", "start", "__main__"]:
+            for py_file in self.project_root.rglob("*.py"):
+                rel = str(py_file.relative_to(self.project_root))
+                if any(skip in rel for skip in ["__pycache__", ".venv", "test"]):
+                    continue
+                if entry_name in py_file.stem or entry_name == "__main__":
+                    try:
+                        entry_code = py_file.read_text(encoding="utf-8", errors="replace")[:2000]
+                        break
+                    except OSError:
+                        pass
+            if entry_code:
+                break
+        return self.generate_activity_diagram(function_code=entry_code, context="Main application entry point flow")
+
+    def _generate_project_state_diagram(self, cg):
+        """State diagram seeded with state-like class names from the CallGraph."""
+        state_context = ""
+        if cg:
+            state_classes = [
+                c.get("name", "")
+                for c in cg.classes.values()
+                if any(kw in c.get("name", "").lower() for kw in ["state", "status", "phase", "mode"])
+            ]
+            if state_classes:
+                state_context = "State-like classes: %s" % ", ".join(state_classes[:10])
+        if not state_context:
+            # Check for TypedDict or enum state patterns
+            state_context = "Pipeline states from project structure"
+        return self.generate_state_diagram(context=state_context)
 
     def save_diagram(self, name, syntax, format="md"):
         """Save diagram to uml/{name}.md with proper markdown wrapper.
@@ -1034,17 +1170,40 @@ class UMLDiagramGenerator:
         logger.info("Saved diagram: %s", out_path)
         return str(out_path)
 
+    def render_diagrams(self, diagrams, output_format="svg", renderer=None):
+        """Render {name: syntax} to output_dir/{name}.{format} via Kroki.
+
+        All diagrams go to KrokiRenderer.render_all_to_dir() as one
+        concurrent batch; unchanged ones are served from its render cache.
+
+        Returns {name: path or None}.
+        """
+        if renderer is None:
+            from .kroki_renderer import KrokiRenderer
+
+            renderer = KrokiRenderer()
+        return renderer.render_all_to_dir(diagrams, self.output_dir, output_format)
+
     # ------------------------------------------------------------------
     # LLM helpers (lazy import)
     # ------------------------------------------------------------------
 
     def _llm_generate(self, prompt):
-        """Call LLM via llm_call.py (lazy import, graceful fallback)."""
+        """Call LLM via llm_call.py (lazy import, graceful fallback).
+
+        Responses are cached by prompt fingerprint; at most
+        UML_LLM_CONCURRENCY calls run at the same time.
+        """
+        key = fingerprint("llm", _LLM_MODEL, prompt)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
         try:
             from langgraph_engine.llm_call import llm_call
 
-            result = llm_call(prompt, model="fast", timeout=60)
-            return result
+            with self._llm_slots:
+                result = llm_call(prompt, model=_LLM_MODEL, timeout=60)
         except ImportError:
             logger.debug("llm_call not available, skipping LLM generation")
             return None
@@ -1052,6 +1211,12 @@ class UMLDiagramGenerator:
             logger.debug("LLM call failed: %s", e)
             return None
 
+        if result and isinstance(result, str) and self._cache is not None:
+            self._cache.put(key, result)
+            if not self._batch:
+                self._cache.flush()
+        return result
+
     def _llm_enrich(self, diagram_syntax, diagram_type, context):
         """Use LLM to enrich an AST-generated diagram."""
         prompt = (
@@ -16,6 +16,7 @@ WorkflowEngineError (base)
   GitHubAPIError         - GitHub REST / MCP API failure
   ConfigurationError     - missing or invalid env var / config value
   StepExecutionError     - a numbered pipeline step raised an error
+  StepCancelledError     - a step was cancelled (timeout) and stopped cooperatively
 
 Usage
 -----
@@ -179,3 +180,18 @@ class StepExecutionError(WorkflowEngineError):
         cls = type(self).__name__
         ctx_part = f", context={self.context!r}" if self.context else ""
         return f"{cls}({str(self)!r}, step_number={self.step_number!r}{ctx_part})"
+
+
+class StepCancelledError(WorkflowEngineError):
+    """Raised inside a step whose cancellation token has been cancelled.
+
+    Steps, LLM calls and subprocess helpers raise this from
+    ``CancellationToken.raise_if_cancelled()`` once the timeout executor has
+    given up on them, so abandoned work stops at the next checkpoint instead
+    of running on in the background.
+
+    Args:
+        message:  Reason the step was cancelled (e.g. ``"timeout after 120s"``).
+        step:     Optional step label.
+        context:  Extra diagnostic values.
+    """
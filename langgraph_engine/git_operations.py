@@ -8,7 +8,10 @@ Provides:
 - PR-related Git operations
 - Status and diff tracking
 
-Uses: Git CLI (via subprocess) - NOT GitPython
+Uses: Git CLI (via subprocess) - NOT GitPython. Read-only queries (branch,
+remote URL, branch list, HEAD hash, staged changes) are answered by
+GitReader from the repository files and a persistent cat-file channel;
+only mutations and working-tree scans (status, diff) fork git.
 """
 
 import subprocess
@@ -17,6 +20,8 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+from .git_reader import get_git_reader, git_available
+
 
 class GitOperations:
     """Manages Git operations via CLI for Level 3 execution."""
@@ -29,6 +34,8 @@ class GitOperations:
         if not self._is_git_available():
             raise RuntimeError("Git CLI not found. Install git and ensure it's in PATH")
 
+        self._reader = get_git_reader(self.repo_path)
+
         # Check if we're in a git repository
         self.is_git_repo = self._is_git_repository()
 
@@ -47,17 +54,12 @@ class GitOperations:
             logger.info(f"Remote origin: {self.origin_url}")
 
     def _is_git_available(self) -> bool:
-        """Check if git CLI is available."""
-        try:
-            result = subprocess.run(["git", "--version"], capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except Exception:
-            return False
+        """Check if git CLI is available (probed once per process)."""
+        return git_available()
 
     def _is_git_repository(self) -> bool:
         """Check if the current directory is a git repository."""
-        result = self._run_git(["rev-parse", "--git-dir"], check=False)
-        return result.get("success", False) and result.get("stdout") != ""
+        return self._reader.is_repository
 
     def _run_git(self, args: List[str], check: bool = True) -> Dict[str, Any]:
         """
@@ -67,9 +69,18 @@ class GitOperations:
             args: Git command arguments (e.g., ["branch", "-v"])
             check: Raise exception on non-zero exit
 
+        Any forked command may move refs, so the reader's ref cache is
+        dropped afterwards.
+
         Returns:
             {"returncode": int, "stdout": str, "stderr": str}
         """
+        try:
+            return self._fork_git(args, check)
+        finally:
+            self._reader.invalidate()
+
+    def _fork_git(self, args: List[str], check: bool) -> Dict[str, Any]:
         try:
             result = subprocess.run(
                 ["git"] + args,
@@ -106,13 +117,11 @@ class GitOperations:
 
     def _get_origin_url(self) -> Optional[str]:
         """Get remote origin URL."""
-        result = self._run_git(["remote", "get-url", "origin"], check=False)
-        return result.get("stdout") if result.get("success") else None
+        return self._reader.remote_url("origin")
 
     def _get_current_branch(self) -> str:
         """Get currently checked out branch."""
-        result = self._run_git(["rev-parse", "--abbrev-ref", "HEAD"], check=False)
-        return result.get("stdout", "unknown") if result.get("success") else "unknown"
+        return self._reader.current_branch() or "unknown"
 
     # ===== HELPER METHODS =====
 
@@ -206,6 +215,7 @@ class GitOperations:
                 # Non-critical error, branch exists locally
                 logger.warning(f"Push error (branch may exist remotely): {result.get('stderr')}")
 
+            self.current_branch = self._get_current_branch()
             logger.info(f"Branch created: {branch_name}")
             return {"success": True, "branch": branch_name, "message": f"Created and pushed {branch_name}"}
 
@@ -239,6 +249,7 @@ class GitOperations:
             result = self._run_git(["checkout", main_branch], check=False)
             if not result.get("success"):
                 return {"success": False, "error": f"Cannot checkout {main_branch}: {result.get('stderr')}"}
+            self.current_branch = main_branch
 
             # Step 2: Pull latest (includes merged PR)
             self._run_git(["pull", "origin", main_branch], check=False)
@@ -278,6 +289,7 @@ class GitOperations:
         result = self._run_git(["checkout", branch_name], check=False)
 
         if result.get("success"):
+            self.current_branch = self._get_current_branch()
             logger.info(f"[x] Switched to {branch_name}")
             return {"success": True, "branch": branch_name}
         else:
@@ -286,11 +298,7 @@ class GitOperations:
 
     def list_branches(self) -> List[str]:
         """List all local branches."""
-        result = self._run_git(["branch", "-v"], check=False)
-        if result.get("success"):
-            branches = [line.split()[0].lstrip("*").strip() for line in result.get("stdout", "").split("\n") if line]
-            return branches
-        return []
+        return self._reader.local_branches()
 
     # ===== COMMIT OPERATIONS =====
 
@@ -348,9 +356,8 @@ class GitOperations:
             if not stage_result.get("success"):
                 return {"success": False, "error": "Staging failed"}
 
-            # Check if there are changes to commit
-            status = self._run_git(["status", "--porcelain"], check=False)
-            if not status.get("stdout"):
+            # Check if there are changes to commit (index vs HEAD, no fork)
+            if not self._reader.has_staged_changes():
                 logger.info("No changes to commit")
                 return {"success": True, "message": "No changes"}
 
@@ -359,8 +366,8 @@ class GitOperations:
 
             if result.get("success"):
                 # Get commit hash
-                hash_result = self._run_git(["rev-parse", "HEAD"], check=False)
-                commit_hash = hash_result.get("stdout", "unknown")[:7] if hash_result.get("success") else "unknown"
+                head = self._reader.resolve_ref("HEAD")
+                commit_hash = head[:7] if head else "unknown"
 
                 logger.info(f"[x] Commit created: {commit_hash}")
                 return {"success": True, "commit_hash": commit_hash, "message": message}
@@ -0,0 +1,677 @@
+"""
+Git Reader - fork-free read access to a git repository.
+
+GitOperations used to spawn one ``git`` process per query (current branch,
+origin URL, branch list, HEAD hash, "anything staged?").  GitReader answers
+those from the repository files directly and keeps long-lived
+``git cat-file --batch-check`` / ``--batch`` processes for object lookups,
+so only mutations (checkout, commit, push, ...) still fork.
+
+Provides:
+- HEAD / branch / ref resolution from loose refs and packed-refs
+- Remote URLs from .git/config
+- Index parsing (v2-v4, cache-tree extension) for staged-change detection
+- Persistent cat-file channels for object and revision lookups
+
+Ref and config lookups are cached.  Every read first re-stats HEAD,
+packed-refs, config and the refs directories; any change, or an entry
+older than _REF_CACHE_TTL_S, drops the cache.  Updates made by other
+processes (a git CLI in a hook, another worktree) are therefore seen without
+an invalidate() call.  GitOperations still calls invalidate() after every
+forked command.
+Layouts the reader does not understand (reftable refs, split index,
+url.*.insteadOf rewrites, config includes) fall back to the git CLI.
+"""
+
+import os
+import re
+import struct
+import subprocess
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+_HEX_RE = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+_PER_WORKTREE_PREFIXES = ("refs/bisect/", "refs/worktree/", "refs/rewritten/")
+_MAX_SYMREF_DEPTH = 5
+_GIT_MODE_TREE = 0o040000
+
+# Cached refs/config are dropped after this long even when no stamped path
+# changed: a loose ref in a nested directory (refs/heads/feature/x) is
+# rewritten without touching any directory the stamp covers.
+_REF_CACHE_TTL_S = 1.0
+# Paths whose (mtime_ns, size, inode) make up the cache stamp.
+_STAMP_GIT_DIR = ("HEAD",)
+_STAMP_COMMON_DIR = ("packed-refs", "config", "refs", "refs/heads", "refs/tags", "refs/remotes")
+
+_git_available = None
+_readers = {}  # resolved repo path -> GitReader
+_readers_lock = threading.Lock()
+
+
+def git_available() -> bool:
+    """Return True if the git CLI can be executed (checked once per process)."""
+    global _git_available
+    if _git_available is None:
+        try:
+            result = subprocess.run(["git", "--version"], capture_output=True, text=True, timeout=5)
+            _git_available = result.returncode == 0
+        except Exception:
+            _git_available = False
+    return _git_available
+
+
+def find_git_dir(path) -> Tuple[Optional[Path], Optional[Path]]:
+    """Locate the git directory for *path* like ``git rev-parse --git-dir``.
+
+    Returns:
+        (git_dir, common_dir); both None outside a repository. common_dir
+        differs from git_dir for linked worktrees.
+    """
+    env_dir = os.environ.get("GIT_DIR")
+    if env_dir:
+        git_dir = Path(env_dir)
+        if not git_dir.is_absolute():
+            git_dir = Path(path) / git_dir
+        return (git_dir, _common_dir(git_dir)) if (git_dir / "HEAD").is_file() else (None, None)
+
+    current = Path(path).resolve()
+    for candidate in [current] + list(current.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir() and (dot_git / "HEAD").is_file():
+            return dot_git, _common_dir(dot_git)
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                content = ""
+            if content.startswith("gitdir:"):
+                git_dir = Path(content[len("gitdir:") :].strip())
+                if not git_dir.is_absolute():
+                    git_dir = (candidate / git_dir).resolve()
+                if (git_dir / "HEAD").is_file():
+                    return git_dir, _common_dir(git_dir)
+        if (candidate / "HEAD").is_file() and (candidate / "objects").is_dir() and (candidate / "refs").is_dir():
+            return candidate, _common_dir(candidate)
+    return None, None
+
+
+def _common_dir(git_dir: Path) -> Path:
+    env_common = os.environ.get("GIT_COMMON_DIR")
+    if env_common:
+        return Path(env_common)
+    try:
+        common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return git_dir
+    common_path = Path(common)
+    return common_path if common_path.is_absolute() else (git_dir / common_path).resolve()
+
+
+# ---------------------------------------------------------------------------
+# Config parsing
+# ---------------------------------------------------------------------------
+
+
+def parse_git_config(text: str) -> Dict[str, List[str]]:
+    """Parse git-config syntax into {"section.subsection.key": [values]}.
+
+    Section and key names are lower-cased; subsection names keep their case,
+    as git does. Multi-valued keys keep every value in file order.
+    """
+    values: Dict[str, List[str]] = {}
+    section = ""
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            end = line.find("]")
+            header = line[1:end].strip() if end > 0 else line[1:]
+            if '"' in header:
+                name, _, sub = header.partition('"')
+                section = "%s.%s" % (name.strip().lower(), sub.rsplit('"', 1)[0].replace('\\"', '"'))
+            elif "." in header:
+                name, _, sub = header.partition(".")
+                section = "%s.%s" % (name.lower(), sub.lower())
+            else:
+                section = header.lower()
+            line = line[end + 1 :].strip() if end > 0 else ""
+            if not line or line[0] in "#;":
+                continue
+        key, sep, value = line.partition("=")
+        key = key.strip().lower()
+        value = _config_value(value) if sep else "true"
+        values.setdefault("%s.%s" % (section, key), []).append(value)
+    return values
+
+
+def _config_value(raw: str) -> str:
+    out = []
+    quoted = False
+    i = 0
+    raw = raw.strip()
+    while i < len(raw):
+        ch = raw[i]
+        if ch == '"':
+            quoted = not quoted
+        elif ch == "\\" and i + 1 < len(raw):
+            i += 1
+            out.append({"n": "\n", "t": "\t", "b": "\b"}.get(raw[i], raw[i]))
+        elif ch in "#;" and not quoted:
+            break
+        else:
+            out.append(ch)
+        i += 1
+    return "".join(out).strip() if not quoted else "".join(out)
+
+
+# ---------------------------------------------------------------------------
+# Index parsing
+# ---------------------------------------------------------------------------
+
+
+class IndexUnsupported(Exception):
+    """The index uses a feature the parser does not handle (e.g. split index)."""
+
+
+def parse_index(data: bytes, hash_len: int = 20):
+    """Parse a git index file.
+
+    Returns:
+        (entries, cache_tree) where entries is a list of
+        (path, mode, sha, stage) and cache_tree maps directory paths
+        ("" for the root) to tree shas for the valid cache-tree nodes.
+    """
+    if data[:4] != b"DIRC":
+        raise IndexUnsupported("not an index file")
+    version, count = struct.unpack(">II", data[4:12])
+    if version not in (2, 3, 4):
+        raise IndexUnsupported("index version %d" % version)
+
+    entries = []
+    pos = 12
+    prev_path = b""
+    fixed = 40 + hash_len + 2
+    for _ in range(count):
+        start = pos
+        mode = struct.unpack(">I", data[pos + 24 : pos + 28])[0]
+        sha = data[pos + 40 : pos + 40 + hash_len].hex()
+        flags = struct.unpack(">H", data[pos + 40 + hash_len : pos + fixed])[0]
+        pos += fixed
+        if flags & 0x4000:
+            if version < 3:
+                raise IndexUnsupported("extended flags in v2 index")
+            pos += 2
+        if version == 4:
+            strip, pos = _read_offset_varint(data, pos)
+            nul = data.index(b"\0", pos)
+            path = prev_path[: len(prev_path) - strip] + data[pos:nul]
+            pos = nul + 1
+        else:
+            nul = data.index(b"\0", pos)
+            path = data[pos:nul]
+            pos = start + ((pos - start + len(path) + 8) & ~7)
+        prev_path = path
+        entries.append((path.decode("utf-8", errors="surrogateescape"), mode, sha, (flags >> 12) & 3))
+
+    cache_tree: Dict[str, str] = {}
+    end = len(data) - hash_len
+    while pos + 8 <= end:
+        sig = data[pos : pos + 4]
+        size = struct.unpack(">I", data[pos + 4 : pos + 8])[0]
+        body = data[pos + 8 : pos + 8 + size]
+        if sig in (b"link", b"sdir"):
+            raise IndexUnsupported("split or sparse index")
+        if sig == b"TREE":
+            _parse_cache_tree(body, 0, "", cache_tree, hash_len)
+        pos += 8 + size
+    return entries, cache_tree
+
+
+def _read_offset_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def _parse_cache_tree(body: bytes, pos: int, parent: str, out: Dict[str, str], hash_len: int) -> int:
+    nul = body.index(b"\0", pos)
+    name = body[pos:nul].decode("utf-8", errors="surrogateescape")
+    pos = nul + 1
+    newline = body.index(b"\n", pos)
+    entry_count, subtrees = (int(x) for x in body[pos:newline].split(b" "))
+    pos = newline + 1
+    path = "%s/%s" % (parent, name) if parent else name
+    if entry_count >= 0:
+        out[path] = body[pos : pos + hash_len].hex()
+        pos += hash_len
+    for _ in range(subtrees):
+        pos = _parse_cache_tree(body, pos, path, out, hash_len)
+    return pos
+
+
+# ---------------------------------------------------------------------------
+# Persistent cat-file channel
+# ---------------------------------------------------------------------------
+
+
+class _CatFile:
+    """One long-lived ``git cat-file --batch[-check]`` process."""
+
+    def __init__(self, repo_path: str, mode: str):
+        self.repo_path = repo_path
+        self.mode = mode
+        self.proc = None
+        self.lock = threading.Lock()
+        self.starts = 0
+
+    def _start(self):
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", self.mode],
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.starts += 1
+
+    def query(self, rev: str) -> Tuple[Optional[Tuple[str, str, int]], Optional[bytes]]:
+        """Return ((sha, type, size), content-or-None), or (None, None) if missing."""
+        if "\n" in rev:
+            return None, None
+        with self.lock:
+            for attempt in (0, 1):
+                if self.proc is None or self.proc.poll() is not None:
+                    self._start()
+                try:
+                    self.proc.stdin.write(rev.encode("utf-8") + b"\n")
+                    self.proc.stdin.flush()
+                    header = self.proc.stdout.readline()
+                    if not header:
+                        raise BrokenPipeError("cat-file exited")
+                    parts = header.decode("utf-8", errors="replace").split()
+                    if len(parts) != 3 or parts[1] in ("missing", "ambiguous"):
+                        return None, None
+                    size = int(parts[2])
+                    content = None
+                    if self.mode == "--batch":
+                        content = self.proc.stdout.read(size + 1)[:size]
+                    return (parts[0], parts[1], size), content
+                except (OSError, ValueError) as e:
+                    logger.debug(f"git cat-file channel restart ({e})")
+                    self.close()
+                    if attempt:
+                        raise
+        return None, None
+
+    def close(self):
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except Exception:
+            proc.kill()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+
+
+def _close_channels(channels):
+    for channel in channels:
+        channel.close()
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+
+class GitReader:
+    """Read-only view of a repository that avoids forking git.
+
+    Args:
+        repo_path: Any path inside the work tree (or the git dir itself).
+    """
+
+    def __init__(self, repo_path="."):
+        self.repo_path = Path(repo_path)
+        self.git_dir, self.common_dir = find_git_dir(self.repo_path)
+        self.direct_refs = self.common_dir is not None and not (self.common_dir / "reftable").exists()
+        self._lock = threading.RLock()
+        self._refs: Dict[str, Optional[str]] = {}
+        self._packed: Optional[Dict[str, str]] = None
+        self._config: Optional[Dict[str, List[str]]] = None
+        self._stamp: Optional[tuple] = None
+        self._cached_at = 0.0
+        self._check = _CatFile(str(self.repo_path), "--batch-check")
+        self._batch = _CatFile(str(self.repo_path), "--batch")
+        self._finalizer = weakref.finalize(self, _close_channels, (self._check, self._batch))
+        self.stats = {"ref_lookups": 0, "ref_cache_hits": 0, "ref_cache_resets": 0, "forks": 0}
+
+    @property
+    def is_repository(self) -> bool:
+        return self.git_dir is not None
+
+    def close(self):
+        """Stop the cat-file processes (they restart on the next query)."""
+        self._check.close()
+        self._batch.close()
+
+    def invalidate(self):
+        """Forget cached refs and config; call after anything that may mutate them."""
+        with self._lock:
+            self._refs.clear()
+            self._packed = None
+            self._config = None
+            self._stamp = None
+
+    def _current_stamp(self) -> tuple:
+        stamp = []
+        for base, names in ((self.git_dir, _STAMP_GIT_DIR), (self.common_dir, _STAMP_COMMON_DIR)):
+            for name in names:
+                try:
+                    st = os.stat(base / name)
+                except (OSError, TypeError):
+                    stamp.append(None)
+                    continue
+                stamp.append((st.st_mtime_ns, st.st_size, st.st_ino))
+        return tuple(stamp)
+
+    def _revalidate(self):
+        """Drop the cache when the repository changed under it (caller holds the lock)."""
+        now = time.monotonic()
+        stamp = self._current_stamp()
+        if stamp != self._stamp or now - self._cached_at > _REF_CACHE_TTL_S:
+            if self._refs or self._packed is not None or self._config is not None:
+                self.stats["ref_cache_resets"] += 1
+            self._refs.clear()
+            self._packed = None
+            self._config = None
+            self._stamp = stamp
+            self._cached_at = now
+
+    def _fork(self, args: List[str]) -> Optional[str]:
+        self.stats["forks"] += 1
+        try:
+            result = subprocess.run(
+                ["git"] + args,
+                cwd=str(self.repo_path),
+                capture_output=True,
+                text=True,
+                timeout=30,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except Exception as e:
+            logger.debug(f"git {args[0]} failed: {e}")
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    # ===== REFS =====
+
+    def _ref_base(self, name: str) -> Path:
+        if "/" not in name or name.startswith(_PER_WORKTREE_PREFIXES):
+            return self.git_dir
+        return self.common_dir
+
+    def _packed_refs(self) -> Dict[str, str]:
+        """Parsed packed-refs (caller holds the lock and has revalidated)."""
+        if self._packed is None:
+            packed = {}
+            try:
+                text = (self.common_dir / "packed-refs").read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                text = ""
+            for line in text.splitlines():
+                if not line or line[0] in "#^":
+                    continue
+                sha, _, ref = line.partition(" ")
+                packed[ref.strip()] = sha
+            self._packed = packed
+        return self._packed
+
+    def _read_ref_file(self, name: str) -> Optional[str]:
+        try:
+            content = (self._ref_base(name) / name).read_text(encoding="utf-8", errors="replace")
+        except (OSError, ValueError):
+            return None
+        return content.split("\n", 1)[0].strip()
+
+    def read_symbolic_ref(self, name: str = "HEAD") -> Optional[str]:
+        """Return the target of a symbolic ref (e.g. "refs/heads/main"), or None."""
+        if not self.direct_refs:
+            return self._fork(["symbolic-ref", "-q", name])
+        content = self._read_ref_file(name)
+        if content and content.startswith("ref:"):
+            return content[4:].strip()
+        return None
+
+    def resolve_ref(self, name: str) -> Optional[str]:
+        """Resolve a full ref name ("HEAD", "refs/heads/x", "FETCH_HEAD") to a sha."""
+        with self._lock:
+            self.stats["ref_lookups"] += 1
+            self._revalidate()
+            if name in self._refs:
+                self.stats["ref_cache_hits"] += 1
+                return self._refs[name]
+            sha = (
+                self._resolve_uncached(name) if self.direct_refs else self._fork(["rev-parse", "-q", "--verify", name])
+            )
+            self._refs[name] = sha
+            return sha
+
+    def _resolve_uncached(self, name: str) -> Optional[str]:
+        for _ in range(_MAX_SYMREF_DEPTH):
+            content = self._read_ref_file(name)
+            if content is None:
+                return self._packed_refs().get(name)
+            if content.startswith("ref:"):
+                name = content[4:].strip()
+                continue
+            sha = content.split()[0] if content.split() else ""
+            return sha if _HEX_RE.match(sha) else None
+        return None
+
+    def rev_parse(self, rev: str) -> Optional[str]:
+        """Resolve a revision to an object id.
+
+        Full ref names and the short forms git accepts ("main", "origin/main",
+        "v1.0") are resolved from the ref files; anything else ("HEAD~2",
+        abbreviated hashes, "HEAD^{tree}") goes through the cat-file channel.
+        """
+        if _HEX_RE.match(rev):
+            return rev
+        if self.direct_refs and rev and not any(ch in rev for ch in "^~:@{} "):
+            for candidate in (rev, "refs/" + rev, "refs/tags/" + rev, "refs/heads/" + rev, "refs/remotes/" + rev):
+                sha = self.resolve_ref(candidate)
+                if sha:
+                    return sha
+            sha = self.resolve_ref("refs/remotes/%s/HEAD" % rev)
+            if sha:
+                return sha
+        info, _ = self._check.query(rev)
+        return info[0] if info else None
+
+    def current_branch(self) -> Optional[str]:
+        """Like ``git rev-parse --abbrev-ref HEAD``: branch name, or "HEAD" if detached."""
+        if not self.is_repository:
+            return None
+        target = self.read_symbolic_ref("HEAD")
+        if target:
+            return target[len("refs/heads/") :] if target.startswith("refs/heads/") else target
+        return "HEAD" if self.resolve_ref("HEAD") else None
+
+    def local_branches(self) -> List[str]:
+        """Names of local branches, sorted like ``git branch``."""
+        if not self.is_repository:
+            return []
+        if not self.direct_refs:
+            out = self._fork(["for-each-ref", "--format=%(refname:short)", "refs/heads/"])
+            return out.splitlines() if out else []
+        with self._lock:
+            self._revalidate()
+            packed = self._packed_refs()
+        names = {ref[len("refs/heads/") :] for ref in packed if ref.startswith("refs/heads/")}
+        heads = self.common_dir / "refs" / "heads"
+        for root, _dirs, files in os.walk(heads):
+            rel_root = os.path.relpath(root, heads)
+            for fname in files:
+                if fname.endswith(".lock"):
+                    continue
+                names.add(fname if rel_root == "." else "%s/%s" % (rel_root.replace(os.sep, "/"), fname))
+        return sorted(names)
+
+    # ===== CONFIG =====
+
+    def config(self) -> Dict[str, List[str]]:
+        """Parsed repository config (cached while the config file is unchanged)."""
+        with self._lock:
+            self._revalidate()
+            if self._config is None:
+                try:
+                    text = (self.common_dir / "config").read_text(encoding="utf-8", errors="replace")
+                except (OSError, TypeError):
+                    text = ""
+                self._config = parse_git_config(text)
+            return self._config
+
+    def remote_url(self, name: str = "origin") -> Optional[str]:
+        """Like ``git remote get-url <name>``; None if the remote is not configured."""
+        if not self.is_repository:
+            return None
+        config = self.config()
+        rewrites = any(key.startswith(("url.", "include.", "includeif.")) for key in config)
+        if rewrites or _global_config_rewrites():
+            return self._fork(["remote", "get-url", name])
+        urls = config.get("remote.%s.url" % name)
+        return urls[0] if urls else None
+
+    def hash_len(self) -> int:
+        fmt = self.config().get("extensions.objectformat", ["sha1"])[-1].lower()
+        return 32 if fmt == "sha256" else 20
+
+    # ===== OBJECTS & INDEX =====
+
+    def read_object(self, rev: str) -> Tuple[Optional[str], Optional[bytes]]:
+        """Return (type, content) for *rev* via the persistent --batch channel."""
+        info, content = self._batch.query(rev)
+        return (info[1], content) if info else (None, None)
+
+    def _tree_entries(self, sha: str, hash_len: int) -> List[Tuple[str, int, str]]:
+        kind, data = self.read_object(sha)
+        if kind != "tree" or data is None:
+            return []
+        entries = []
+        pos = 0
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            mode = int(data[pos:space], 8)
+            name = data[space + 1 : nul].decode("utf-8", errors="surrogateescape")
+            entries.append((name, mode, data[nul + 1 : nul + 1 + hash_len].hex()))
+            pos = nul + 1 + hash_len
+        return entries
+
+    def has_staged_changes(self) -> bool:
+        """True if the index differs from HEAD, i.e. ``git commit`` has something to record.
+
+        Uses the index cache-tree to skip unchanged directories, reading only
+        the HEAD trees that cover modified paths.
+        """
+        try:
+            data = (self.git_dir / "index").read_bytes()
+        except OSError:
+            data = b""
+        head = self.resolve_ref("HEAD")
+        if not data:
+            return False
+        hash_len = self.hash_len()
+        try:
+            entries, cache_tree = parse_index(data, hash_len)
+        except (IndexUnsupported, struct.error, ValueError, IndexError) as e:
+            logger.debug(f"Index not parsed directly ({e}); asking git")
+            self.stats["forks"] += 1
+            result = subprocess.run(
+                ["git", "diff", "--cached", "--quiet"], cwd=str(self.repo_path), capture_output=True, timeout=30
+            )
+            return result.returncode != 0
+        if head is None:
+            return bool(entries)
+        if any(stage for _p, _m, _s, stage in entries):
+            return True
+        head_tree = self.rev_parse("%s^{tree}" % head)
+        if head_tree is None:
+            return True
+
+        index = {path: (mode, sha) for path, mode, sha, _stage in entries}
+        skipped: List[str] = []
+        head_files: Dict[str, Tuple[int, str]] = {}
+        stack = [("", head_tree)]
+        while stack:
+            prefix, tree_sha = stack.pop()
+            if cache_tree.get(prefix) == tree_sha:
+                skipped.append(prefix + "/" if prefix else "")
+                continue
+            for name, mode, sha in self._tree_entries(tree_sha, hash_len):
+                path = "%s/%s" % (prefix, name) if prefix else name
+                if mode == _GIT_MODE_TREE:
+                    stack.append((path, sha))
+                else:
+                    head_files[path] = (mode, sha)
+        if "" in skipped:
+            return False
+        remaining = {p: v for p, v in index.items() if not any(p.startswith(s) for s in skipped)}
+        if len(remaining) != len(head_files):
+            return True
+        for path, (mode, sha) in head_files.items():
+            entry = remaining.get(path)
+            if entry is None or entry != (mode, sha):
+                return True
+        return False
+
+
+_global_rewrites = None
+
+
+def _global_config_rewrites() -> bool:
+    """True if global/system git config defines url.*.insteadOf or includes (checked once)."""
+    global _global_rewrites
+    if _global_rewrites is None:
+        home = Path.home()
+        xdg = Path(os.environ.get("XDG_CONFIG_HOME", str(home / ".config")))
+        candidates = [Path("/etc/gitconfig"), xdg / "git" / "config", home / ".gitconfig"]
+        if os.environ.get("GIT_CONFIG_GLOBAL"):
+            candidates.append(Path(os.environ["GIT_CONFIG_GLOBAL"]))
+        found = bool(os.environ.get("GIT_CONFIG_COUNT"))
+        for path in candidates:
+            try:
+                text = path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            if any(key.startswith(("url.", "include.", "includeif.")) for key in parse_git_config(text)):
+                found = True
+        _global_rewrites = found
+    return _global_rewrites
+
+
+def get_git_reader(repo_path=".") -> GitReader:
+    """Return the shared GitReader for *repo_path*."""
+    key = str(Path(repo_path).resolve())
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None or reader.git_dir is None:
+            reader = GitReader(key)
+            _readers[key] = reader
+        return reader
@@ -110,6 +110,7 @@ class GitHubFacade:
         repo_path: str = ".",
         token: Optional[str] = None,
         use_mcp: bool = True,
+        router: Optional[GitHubOperationRouter] = None,
     ) -> None:
         """Initialise the facade.
 
@@ -117,22 +118,27 @@ class GitHubFacade:
             repo_path: Absolute (or relative) path to the local git repository.
             token:     Optional GitHub PAT.  Falls back to GITHUB_TOKEN env var.
             use_mcp:   When True, try PyGithub MCP first and fall back to gh CLI.
+            router:    Existing GitHubOperationRouter to share instead of
+                       building (and authenticating) a second one.
         """
         self._repo_path = repo_path
         self._token = token or os.getenv("GITHUB_TOKEN")
 
         # GitHub API layer (MCP-primary, gh-CLI-fallback)
-        try:
-            self._router = GitHubOperationRouter(
-                use_mcp=use_mcp,
-                fallback_to_gh=True,
-                token=self._token,
-                repo_path=repo_path,
-            )
-            logger.info("[GitHubFacade] GitHubOperationRouter initialised")
-        except Exception as exc:
-            logger.error(f"[GitHubFacade] Router init failed: {exc}")
-            self._router = None  # type: ignore[assignment]
+        if router is not None:
+            self._router = router
+        else:
+            try:
+                self._router = GitHubOperationRouter(
+                    use_mcp=use_mcp,
+                    fallback_to_gh=True,
+                    token=self._token,
+                    repo_path=repo_path,
+                )
+                logger.info("[GitHubFacade] GitHubOperationRouter initialised")
+            except Exception as exc:
+                logger.error(f"[GitHubFacade] Router init failed: {exc}")
+                self._router = None  # type: ignore[assignment]
 
         # Local git layer
         try:
@@ -9,6 +9,10 @@ Provides:
 
 Uses: gh CLI (GitHub CLI) - already authenticated via keyring
 No need for GITHUB_TOKEN environment variable!
+
+Operations go through the shared GitHubTransport (REST over a pooled
+keep-alive session, token taken from GITHUB_TOKEN or the gh keyring once
+per process).  The gh subprocess is only used when the API is unavailable.
 """
 
 import subprocess
@@ -18,6 +22,8 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+from langgraph_engine.github_transport import GitHubTransportError, check_gh_cli, get_repo_info, get_transport
+
 
 class GitHubIntegration:
     """Manages GitHub operations for Level 3 automation using gh CLI."""
@@ -31,55 +37,45 @@ class GitHubIntegration:
             repo_path: Local repository path (for git operations)
         """
         self.repo_path = Path(repo_path)
+        self._api = get_transport()
 
-        # Verify gh CLI is available
-        try:
-            result = subprocess.run(["gh", "auth", "status"], capture_output=True, text=True, timeout=5)
-            if result.returncode != 0:
-                raise RuntimeError("gh CLI not authenticated. Run: gh auth login")
+        # Verify gh CLI is available (only required when there is no API token)
+        if self._api is None:
+            error = check_gh_cli()
+            if error:
+                raise RuntimeError(error)
             logger.info("[x] gh CLI authenticated and ready")
-        except FileNotFoundError:
-            raise RuntimeError("gh CLI not installed. Install from: https://cli.github.com")
-        except Exception as e:
-            raise RuntimeError(f"gh CLI error: {e}")
 
         # Get repo info from git remote
         self.owner, self.repo_name = self._get_repo_info()
 
     def _get_repo_info(self) -> tuple:
-        """Get owner and repo name from git remote."""
-        try:
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                cwd=str(self.repo_path),
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode != 0:
-                raise RuntimeError("Cannot get git remote URL")
-
-            remote_url = result.stdout.strip()
-
-            # Parse owner/repo from URL
-            if "github.com" not in remote_url:
-                raise RuntimeError(f"Not a GitHub repository: {remote_url}")
-
-            if remote_url.startswith("git@"):
-                # git@github.com:owner/repo.git
-                parts = remote_url.split(":")[-1].replace(".git", "").split("/")
-            else:
-                # https://github.com/owner/repo.git
-                parts = remote_url.rstrip("/").replace(".git", "").split("/")[-2:]
-
-            owner, repo_name = parts[0], parts[1]
+        """Get owner and repo name from git remote (memoised per process)."""
+        owner, repo_name = get_repo_info(str(self.repo_path))
+        if owner and repo_name:
             logger.info(f"[x] Repository detected: {owner}/{repo_name}")
-            return owner, repo_name
+        else:
+            logger.error("Cannot detect repository")
+        return owner, repo_name
+
+    def _via_api(self, operation: str, call) -> Optional[Dict[str, Any]]:
+        """Run *call(transport)*; None means "use the gh CLI instead".
 
+        Client errors (4xx) are returned as failures rather than retried
+        through gh, which would fail the same way.
+        """
+        if self._api is None:
+            return None
+        try:
+            return call(self._api)
+        except GitHubTransportError as e:
+            if e.status is not None and e.status < 500:
+                logger.error(f"{operation} failed: {e}")
+                return {"success": False, "error": str(e)}
+            logger.warning(f"{operation}: API unavailable ({e}), using gh CLI")
         except Exception as e:
-            logger.error(f"Cannot detect repository: {e}")
-            return None, None
+            logger.warning(f"{operation}: API error ({e}), using gh CLI")
+        return None
 
     # ===== ISSUE OPERATIONS =====
 
@@ -109,6 +105,13 @@ class GitHubIntegration:
 
         logger.info(f"Creating issue: {title[:50]}...")
 
+        result = self._via_api(
+            "Issue creation",
+            lambda api: api.create_issue(self.owner, self.repo_name, title, body, labels, assignee),
+        )
+        if result is not None:
+            return result
+
         try:
             cmd = [
                 "gh",
@@ -178,6 +181,12 @@ class GitHubIntegration:
 
         logger.info(f"Adding comment to issue #{issue_number}")
 
+        result = self._via_api(
+            "Comment", lambda api: api.add_issue_comment(self.owner, self.repo_name, issue_number, comment)
+        )
+        if result is not None:
+            return result
+
         try:
             cmd = [
                 "gh",
@@ -224,6 +233,12 @@ class GitHubIntegration:
 
         logger.info(f"Closing issue #{issue_number}")
 
+        result = self._via_api(
+            "Issue closure", lambda api: api.close_issue(self.owner, self.repo_name, issue_number, closing_comment)
+        )
+        if result is not None:
+            return result
+
         try:
             # Add closing comment if provided
             if closing_comment:
@@ -285,6 +300,15 @@ class GitHubIntegration:
 
         logger.info(f"Creating PR: {title[:50]}...")
 
+        result = self._via_api(
+            "PR creation",
+            lambda api: api.create_pull_request(
+                self.owner, self.repo_name, title, body, head_branch, base_branch, labels
+            ),
+        )
+        if result is not None:
+            return result
+
         try:
             cmd = [
                 "gh",
@@ -352,6 +376,13 @@ class GitHubIntegration:
 
         logger.info(f"Merging PR #{pr_number}")
 
+        result = self._via_api(
+            "PR merge",
+            lambda api: api.merge_pull_request(self.owner, self.repo_name, pr_number, commit_message, delete_branch),
+        )
+        if result is not None:
+            return result
+
         try:
             cmd = [
                 "gh",
@@ -391,6 +422,12 @@ class GitHubIntegration:
 
         logger.info(f"Adding comment to PR #{pr_number}")
 
+        result = self._via_api(
+            "PR comment", lambda api: api.add_issue_comment(self.owner, self.repo_name, pr_number, comment)
+        )
+        if result is not None:
+            return result
+
         try:
             cmd = ["gh", "pr", "comment", str(pr_number), "--repo", f"{self.owner}/{self.repo_name}", "--body", comment]
 
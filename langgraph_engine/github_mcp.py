@@ -18,6 +18,8 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
+from langgraph_engine.github_transport import get_gh_token, get_repo_info
+
 try:
     from github import Github, GithubException
 
@@ -74,7 +76,8 @@ class GitHubMCP:
         self.owner, self.repo_name = self._get_repo_info()
         if self.owner and self.repo_name:
             try:
-                self.repo = self.github.get_user(self.owner).get_repo(self.repo_name)
+                # One request by full name instead of get_user(owner) + get_repo(name)
+                self.repo = self.github.get_repo(f"{self.owner}/{self.repo_name}")
                 logger.info(f"[MCP] Repository loaded: {self.owner}/{self.repo_name}")
             except GithubException as e:
                 logger.error(f"[MCP] Cannot load repository: {e}")
@@ -84,57 +87,17 @@ class GitHubMCP:
 
     @staticmethod
     def _get_token_from_gh_cli() -> Optional[str]:
-        """Get GitHub token from gh CLI keyring (zero config needed)."""
-        import subprocess
-
-        try:
-            result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and result.stdout.strip():
-                logger.info("[MCP] Token acquired from gh CLI keyring")
-                return result.stdout.strip()
-        except Exception as e:
-            logger.debug(f"[MCP] gh auth token failed: {e}")
-        return None
+        """Get GitHub token from gh CLI keyring (zero config needed, memoised per process)."""
+        return get_gh_token()
 
     def _get_repo_info(self) -> tuple:
         """
-        Get owner and repo name from git remote.
+        Get owner and repo name from git remote (memoised per process).
 
         Returns:
             (owner, repo_name) tuple or (None, None) if not a GitHub repo
         """
-        try:
-            import subprocess
-
-            result = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                cwd=str(self.repo_path),
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if result.returncode != 0:
-                return None, None
-
-            remote_url = result.stdout.strip()
-
-            if "github.com" not in remote_url:
-                logger.warning(f"[MCP] Not a GitHub repository: {remote_url}")
-                return None, None
-
-            # Parse owner/repo
-            if remote_url.startswith("git@"):
-                parts = remote_url.split(":")[-1].replace(".git", "").split("/")
-            else:
-                parts = remote_url.rstrip("/").replace(".git", "").split("/")[-2:]
-
-            owner, repo_name = parts[0], parts[1]
-            return owner, repo_name
-
-        except Exception as e:
-            logger.warning(f"[MCP] Cannot detect repository: {e}")
-            return None, None
+        return get_repo_info(str(self.repo_path))
 
     # ===== ISSUE OPERATIONS =====
 
@@ -11,6 +11,8 @@ Features:
 - Logging for debugging and metrics
 - Feature flags for progressive rollout
 - ZERO breaking changes to existing code
+- Batched reads (get_pr_status, get_issues) as single GraphQL queries over
+  the shared GitHubTransport
 
 Used by: level3_steps8to12_github.py, github_issue_manager.py, github_pr_workflow.py
 Replaces: Direct GitHubIntegration usage
@@ -22,6 +24,7 @@ from typing import Any, Dict, List, Optional
 from loguru import logger
 
 from langgraph_engine.github_integration import GitHubIntegration
+from langgraph_engine.github_transport import get_repo_info, get_transport
 
 try:
     from langgraph_engine.github_mcp import PYGITHUB_AVAILABLE, GitHubMCP
@@ -323,3 +326,46 @@ class GitHubOperationRouter:
                 return {"success": False, "error": str(e)}
 
         return {"success": False, "error": "No GitHub backend available"}
+
+    # ===== READ OPERATIONS (GraphQL, one round-trip each) =====
+
+    def _api_and_repo(self):
+        api = get_transport(self.token)
+        owner, repo_name = get_repo_info(self.repo_path)
+        if api is None or not owner or not repo_name:
+            return None, None, None
+        return api, owner, repo_name
+
+    def get_pr_status(self, pr_number: int) -> Dict[str, Any]:
+        """
+        Read PR state, mergeability, head/base branch, review decision and
+        CI rollup in a single GraphQL request.
+
+        Returns:
+            {"success": bool, "state": str, "mergeable": bool|None, "head_ref": str,
+             "base_ref": str, "review_decision": str, "checks_state": str}
+        """
+        api, owner, repo_name = self._api_and_repo()
+        if api is None:
+            return {"success": False, "error": "GitHub API not available"}
+        try:
+            return api.get_pull_request_status(owner, repo_name, pr_number)
+        except Exception as e:
+            logger.warning(f"[Router] get_pr_status: {e}")
+            return {"success": False, "error": str(e)}
+
+    def get_issues(self, issue_numbers: List[int]) -> Dict[str, Any]:
+        """
+        Fetch several issues in one GraphQL request.
+
+        Returns:
+            {"success": bool, "issues": {number: {"title", "state", "url", "labels"}}}
+        """
+        api, owner, repo_name = self._api_and_repo()
+        if api is None:
+            return {"success": False, "error": "GitHub API not available"}
+        try:
+            return {"success": True, "issues": api.get_issues(owner, repo_name, issue_numbers)}
+        except Exception as e:
+            logger.warning(f"[Router] get_issues: {e}")
+            return {"success": False, "error": str(e)}
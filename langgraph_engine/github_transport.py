@@ -0,0 +1,445 @@
+"""
+GitHub Transport - shared, pooled GitHub REST/GraphQL client.
+
+GitHubMCP, GitHubIntegration and GitHubOperationRouter used to resolve the
+repository and token on their own (one `git remote` and one `gh auth token`
+subprocess per object) and every issue/PR/comment operation was a separate
+`gh` subprocess.  This module gives them one transport per process:
+
+- get_repo_info(repo_path): (owner, repo) from the origin remote, memoised
+- get_gh_token() / check_gh_cli(): `gh auth token` / `gh auth status`, memoised
+  (failures only for GH_RETRY_AFTER_S, so a later `gh auth login` is seen)
+- GitHubTransport: requests.Session with a keep-alive connection pool,
+  conditional GETs (ETag / If-None-Match) answered from a response cache,
+  and GraphQL batching of several reads into a single query
+- get_transport(): process-wide transport per (API URL, token)
+
+GITHUB_API_URL and GITHUB_GRAPHQL_URL point the transport at GitHub
+Enterprise or a local mock server.
+
+Used by: github_integration.py, github_mcp.py, github_operation_router.py
+"""
+
+import os
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from loguru import logger
+
+DEFAULT_API_URL = "https://api.github.com"
+
+# A missing token / failed `gh auth status` is re-checked after this long
+GH_RETRY_AFTER_S = 30.0
+
+# ===== PROCESS-WIDE MEMOS =====
+
+_memo_lock = threading.Lock()
+_repo_info: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+_gh_token: List[Any] = []  # [] = not resolved yet, else [token, resolved_at]
+_gh_status: List[Any] = []  # [] = not checked yet, else [error, checked_at]
+_transports: Dict[Tuple[str, str], "GitHubTransport"] = {}
+
+
+def parse_github_remote(remote_url: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return (owner, repo) for a github.com remote URL, else (None, None)."""
+    remote_url = (remote_url or "").strip()
+    if "github.com" not in remote_url:
+        return None, None
+    if remote_url.startswith("git@"):
+        # git@github.com:owner/repo.git
+        path = remote_url.split(":", 1)[-1]
+    else:
+        # https://github.com/owner/repo.git, ssh://git@github.com/owner/repo
+        path = remote_url.split("github.com", 1)[-1].lstrip(":/")
+    parts = path.rstrip("/").split("/")
+    if len(parts) < 2:
+        return None, None
+    owner, repo = parts[-2], parts[-1]
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    return owner, repo
+
+
+def get_repo_info(repo_path: str = ".") -> Tuple[Optional[str], Optional[str]]:
+    """(owner, repo) of the origin remote of *repo_path*; one subprocess per path per process."""
+    key = str(Path(repo_path).resolve())
+    with _memo_lock:
+        if key in _repo_info:
+            return _repo_info[key]
+    info: Tuple[Optional[str], Optional[str]] = (None, None)
+    try:
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"],
+            cwd=key,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0:
+            info = parse_github_remote(result.stdout)
+            if info[0] is None:
+                logger.warning(f"[Transport] Not a GitHub repository: {result.stdout.strip()}")
+    except Exception as e:
+        logger.warning(f"[Transport] Cannot detect repository: {e}")
+    with _memo_lock:
+        _repo_info[key] = info
+    return info
+
+
+def get_gh_token() -> Optional[str]:
+    """Token from the gh CLI keyring (`gh auth token`).
+
+    A token is resolved once per process; a miss is retried after
+    GH_RETRY_AFTER_S so logging in later takes effect without a restart.
+    """
+    with _memo_lock:
+        if _gh_token and (_gh_token[0] is not None or time.monotonic() - _gh_token[1] < GH_RETRY_AFTER_S):
+            return _gh_token[0]
+    token = None
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, timeout=5)
+        if result.returncode == 0 and result.stdout.strip():
+            token = result.stdout.strip()
+            logger.info("[Transport] Token acquired from gh CLI keyring")
+    except Exception as e:
+        logger.debug(f"[Transport] gh auth token failed: {e}")
+    with _memo_lock:
+        _gh_token[:] = [token, time.monotonic()]
+    return token
+
+
+def resolve_token(token: Optional[str] = None) -> Optional[str]:
+    """Token precedence: argument > GITHUB_TOKEN > gh CLI keyring."""
+    return token or os.getenv("GITHUB_TOKEN") or get_gh_token()
+
+
+def check_gh_cli() -> Optional[str]:
+    """Run `gh auth status`; returns None when ready, else an error message.
+
+    Success is memoised for the process, an error for GH_RETRY_AFTER_S.
+    """
+    with _memo_lock:
+        if _gh_status and (_gh_status[0] is None or time.monotonic() - _gh_status[1] < GH_RETRY_AFTER_S):
+            return _gh_status[0]
+    try:
+        result = subprocess.run(["gh", "auth", "status"], capture_output=True, text=True, timeout=5)
+        error = None if result.returncode == 0 else "gh CLI not authenticated. Run: gh auth login"
+    except FileNotFoundError:
+        error = "gh CLI not installed. Install from: https://cli.github.com"
+    except Exception as e:
+        error = f"gh CLI error: {e}"
+    with _memo_lock:
+        _gh_status[:] = [error, time.monotonic()]
+    return error
+
+
+def clear_caches() -> None:
+    """Forget memoised repo/token/gh status and shared transports (tests)."""
+    with _memo_lock:
+        _repo_info.clear()
+        del _gh_token[:]
+        del _gh_status[:]
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()
+
+
+# ===== TRANSPORT =====
+
+
+class GitHubTransportError(RuntimeError):
+    """Raised for HTTP errors; status is None for connection failures."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class GitHubTransport:
+    """Pooled GitHub REST + GraphQL client with an ETag response cache.
+
+    GET responses carrying an ETag are cached; the next GET for the same URL
+    sends If-None-Match and a 304 is answered from the cache (304s do not
+    count against the rate limit).  Every GET is revalidated, so the cache
+    never serves data the server considers stale.
+    """
+
+    MAX_CACHE_ENTRIES = 512
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        api_url: Optional[str] = None,
+        graphql_url: Optional[str] = None,
+        pool_size: int = 8,
+        timeout: float = 30,
+    ):
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+        except ImportError:
+            raise RuntimeError("requests not installed. Install with: pip install requests")
+
+        self.token = token
+        self.api_url = (api_url or os.getenv("GITHUB_API_URL") or DEFAULT_API_URL).rstrip("/")
+        self.graphql_url = graphql_url or os.getenv("GITHUB_GRAPHQL_URL") or (self.api_url + "/graphql")
+        self.timeout = timeout
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(
+            {
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "User-Agent": "claude-workflow-engine",
+            }
+        )
+        if token:
+            self._session.headers["Authorization"] = f"Bearer {token}"
+
+        self._cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()  # url -> (etag, body)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "not_modified": 0, "graphql": 0}
+
+    def close(self) -> None:
+        self._session.close()
+
+    # ----- low level -----
+
+    def _url(self, path: str) -> str:
+        return path if path.startswith(("http://", "https://")) else f"{self.api_url}/{path.lstrip('/')}"
+
+    def request(self, method: str, path: str, json: Any = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Send one REST request and return the decoded JSON body (None when empty).
+
+        Raises:
+            GitHubTransportError: on HTTP >= 400 or connection failure.
+        """
+        method = method.upper()
+        url = self._url(path)
+        if params:
+            url += "?" + urlencode(sorted(params.items()))
+
+        headers = {}
+        cached = None
+        if method == "GET":
+            with self._lock:
+                cached = self._cache.get(url)
+            if cached:
+                headers["If-None-Match"] = cached[0]
+
+        try:
+            resp = self._session.request(method, url, json=json, headers=headers, timeout=self.timeout)
+        except Exception as e:
+            raise GitHubTransportError(f"{method} {url} failed: {e}")
+
+        with self._lock:
+            self.stats["requests"] += 1
+            if resp.status_code == 304 and cached:
+                self.stats["not_modified"] += 1
+                self._cache.move_to_end(url)
+                return cached[1]
+
+        if resp.status_code >= 400:
+            try:
+                message = resp.json().get("message") or resp.text
+            except ValueError:
+                message = resp.text
+            raise GitHubTransportError(f"{method} {url} -> {resp.status_code}: {message[:200]}", resp.status_code)
+
+        body = resp.json() if resp.content else None
+        etag = resp.headers.get("ETag")
+        if method == "GET" and etag:
+            with self._lock:
+                self._cache[url] = (etag, body)
+                self._cache.move_to_end(url)
+                while len(self._cache) > self.MAX_CACHE_ENTRIES:
+                    self._cache.popitem(last=False)
+        return body
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return its ``data`` object."""
+        with self._lock:
+            self.stats["graphql"] += 1
+        payload = self.request("POST", self.graphql_url, json={"query": query, "variables": variables or {}})
+        if payload.get("errors"):
+            raise GitHubTransportError("GraphQL error: %s" % payload["errors"][0].get("message", payload["errors"]))
+        return payload.get("data") or {}
+
+    def batch_read(self, owner: str, repo: str, fields: Dict[str, str]) -> Dict[str, Any]:
+        """Read several repository fields in one GraphQL round-trip.
+
+        Args:
+            fields: {alias: selection} e.g. {"pr": "pullRequest(number: 5) { state }"}
+
+        Returns:
+            {alias: value} straight from ``repository { ... }``.
+        """
+        if not fields:
+            return {}
+        selections = "\n".join(f"    {alias}: {selection}" for alias, selection in fields.items())
+        query = "query($owner: String!, $name: String!) {\n  repository(owner: $owner, name: $name) {\n%s\n  }\n}" % (
+            selections
+        )
+        data = self.graphql(query, {"owner": owner, "name": repo})
+        return data.get("repository") or {}
+
+    # ----- operations (same result shapes as GitHubIntegration) -----
+
+    def create_issue(
+        self,
+        owner: str,
+        repo: str,
+        title: str,
+        body: str = "",
+        labels: Optional[List[str]] = None,
+        assignee: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"title": title, "body": body}
+        if labels:
+            payload["labels"] = list(labels)
+        if assignee:
+            payload["assignees"] = [assignee]
+        issue = self.request("POST", f"repos/{owner}/{repo}/issues", json=payload)
+        return {
+            "success": True,
+            "issue_number": issue.get("number"),
+            "issue_url": issue.get("html_url"),
+            "created_at": issue.get("created_at") or datetime.now().isoformat(),
+        }
+
+    def add_issue_comment(self, owner: str, repo: str, number: int, comment: str) -> Dict[str, Any]:
+        created = self.request("POST", f"repos/{owner}/{repo}/issues/{number}/comments", json={"body": comment})
+        return {"success": True, "comment_url": created.get("html_url")}
+
+    def close_issue(self, owner: str, repo: str, number: int, closing_comment: Optional[str] = None) -> Dict[str, Any]:
+        if closing_comment:
+            try:
+                self.add_issue_comment(owner, repo, number, closing_comment)
+            except GitHubTransportError as e:
+                logger.warning(f"[Transport] Could not add closing comment: {e}")
+        issue = self.request("PATCH", f"repos/{owner}/{repo}/issues/{number}", json={"state": "closed"})
+        return {
+            "success": True,
+            "issue_number": number,
+            "closed_at": issue.get("closed_at") or datetime.now().isoformat(),
+        }
+
+    def create_pull_request(
+        self,
+        owner: str,
+        repo: str,
+        title: str,
+        body: str,
+        head_branch: str,
+        base_branch: str = "main",
+        labels: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        pr = self.request(
+            "POST",
+            f"repos/{owner}/{repo}/pulls",
+            json={"title": title, "body": body, "head": head_branch, "base": base_branch},
+        )
+        if labels:
+            try:
+                self.request("POST", f"repos/{owner}/{repo}/issues/{pr['number']}/labels", json={"labels": labels})
+            except GitHubTransportError as e:
+                logger.warning(f"[Transport] Could not add labels: {e}")
+        return {
+            "success": True,
+            "pr_number": pr.get("number"),
+            "pr_url": pr.get("html_url"),
+            "created_at": pr.get("created_at") or datetime.now().isoformat(),
+        }
+
+    def merge_pull_request(
+        self,
+        owner: str,
+        repo: str,
+        number: int,
+        commit_message: Optional[str] = None,
+        delete_branch: bool = True,
+    ) -> Dict[str, Any]:
+        head_ref = None
+        if delete_branch:
+            head_ref = (self.request("GET", f"repos/{owner}/{repo}/pulls/{number}").get("head") or {}).get("ref")
+        payload: Dict[str, Any] = {"merge_method": "squash"}
+        if commit_message:
+            payload["commit_message"] = commit_message
+        self.request("PUT", f"repos/{owner}/{repo}/pulls/{number}/merge", json=payload)
+        if head_ref:
+            try:
+                self.request("DELETE", f"repos/{owner}/{repo}/git/refs/heads/{head_ref}")
+            except GitHubTransportError as e:
+                logger.warning(f"[Transport] Could not delete branch {head_ref}: {e}")
+        return {"success": True, "merged": True}
+
+    def get_pull_request_status(self, owner: str, repo: str, number: int) -> Dict[str, Any]:
+        """Mergeability, state, branch, review decision and CI rollup in one GraphQL query."""
+        data = self.batch_read(
+            owner,
+            repo,
+            {
+                "pr": (
+                    f"pullRequest(number: {int(number)}) {{ state mergeable headRefName baseRefName "
+                    "reviewDecision commits(last: 1) { nodes { commit { statusCheckRollup { state } } } } }"
+                )
+            },
+        )
+        pr = data.get("pr") or {}
+        nodes = (pr.get("commits") or {}).get("nodes") or []
+        rollup = ((nodes[0].get("commit") or {}).get("statusCheckRollup") or {}) if nodes else {}
+        mergeable = {"MERGEABLE": True, "CONFLICTING": False}.get(pr.get("mergeable"))
+        return {
+            "success": bool(pr),
+            "state": pr.get("state"),
+            "mergeable": mergeable,
+            "head_ref": pr.get("headRefName"),
+            "base_ref": pr.get("baseRefName"),
+            "review_decision": pr.get("reviewDecision"),
+            "checks_state": rollup.get("state"),
+        }
+
+    def get_issues(self, owner: str, repo: str, numbers: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Fetch several issues in one GraphQL query: {number: {title, state, url, labels}}."""
+        numbers = [int(n) for n in numbers]
+        fields = {
+            f"i{n}": f"issue(number: {n}) {{ number title state url labels(first: 20) {{ nodes {{ name }} }} }}"
+            for n in numbers
+        }
+        data = self.batch_read(owner, repo, fields)
+        result = {}
+        for n in numbers:
+            issue = data.get(f"i{n}")
+            if issue:
+                issue["labels"] = [node["name"] for node in (issue.get("labels") or {}).get("nodes", [])]
+                result[n] = issue
+        return result
+
+
+def get_transport(token: Optional[str] = None, api_url: Optional[str] = None) -> Optional[GitHubTransport]:
+    """Shared transport for (API URL, token); None when no token or requests is missing."""
+    token = resolve_token(token)
+    if not token:
+        return None
+    url = (api_url or os.getenv("GITHUB_API_URL") or DEFAULT_API_URL).rstrip("/")
+    key = (url, token)
+    with _memo_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            try:
+                transport = GitHubTransport(token=token, api_url=url)
+            except RuntimeError as e:
+                logger.debug(f"[Transport] unavailable: {e}")
+                return None
+            _transports[key] = transport
+        return transport
@@ -94,6 +94,11 @@ class IntegrationRegistry:
         cfg = get_integration_config(name)
         cfg["session_dir"] = self._session_dir
         cfg["repo_path"] = self._repo_path
+        if name == "jenkins":
+            # Pipeline runs overlap the build with later steps: update()
+            # (Step 10) only triggers it, on_review() (Step 11) collects the
+            # result from the background BuildWatcher.
+            cfg.setdefault("jenkins_wait", False)
         cfg.update(self._extra_config)
         return cfg
 
@@ -47,6 +47,7 @@ _SECTION_CONFIG_KEYS: Dict[str, Dict[str, str]] = {
         "user": "jenkins_user",
         "api_token": "jenkins_api_token",
         "verify_ssl": "jenkins_verify_ssl",
+        "wait": "jenkins_wait",
     },
     "figma": {
         "access_token": "figma_access_token",
@@ -8,12 +8,17 @@ are set.
 Lifecycle mapping:
   create()    -> Step 8:  no-op (Jenkins does not create issues)
   on_branch() -> Step 9:  no-op (Jenkins discovers branches automatically)
-  update()    -> Step 10: trigger build on the implementation branch
+  update()    -> Step 10: trigger build on the implementation branch and
+                          wait for it (or return at once with
+                          jenkins_wait=False and keep watching it)
   on_review() -> Step 11: validate build status before PR is merged
+                          (waits on the watch started in Step 10)
   close()     -> Step 12: trigger post-merge build on the default branch
 
 Jenkins REST API uses Basic auth with base64(user:api_token).
-Only stdlib urllib is used (no external dependencies).
+Only the standard library is used (no external dependencies).  All requests
+share one persistent connection, and builds are followed by a BuildWatcher
+(see jenkins_watcher.py) with exponential backoff instead of fixed sleeps.
 
 Environment Variables:
   JENKINS_URL         - Base URL (e.g. https://jenkins.company.com)
@@ -22,6 +27,12 @@ Environment Variables:
   JENKINS_JOB_NAME    - Default job name to trigger (optional)
   JENKINS_VERIFY_SSL  - 'true' (default) or 'false' for self-signed certs
 
+Config keys:
+  jenkins_wait        - False makes update() return as soon as the build is
+                        triggered (pending=True, success=False); Step 11
+                        then waits on the background watch.  Default True:
+                        update() blocks and success means the build passed.
+
 Version: 1.4.1
 """
 
@@ -30,13 +41,12 @@ import json
 import logging
 import os
 import ssl
-import time
-import urllib.error
+import threading
 import urllib.parse
-import urllib.request
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .base import AbstractIntegration, IntegrationState
+from .jenkins_watcher import BuildWatch, BuildWatcher, JenkinsConnection
 
 logger = logging.getLogger(__name__)
 
@@ -45,15 +55,16 @@ logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------
 
 _JENKINS_REQUEST_TIMEOUT = 60  # seconds
-_BUILD_POLL_INTERVAL = 10  # seconds between build status polls
+_BUILD_POLL_MIN_INTERVAL = 1  # first / shortest delay between build polls
+_BUILD_POLL_INTERVAL = 10  # upper bound of the backoff between build polls
 _BUILD_POLL_MAX_WAIT = 300  # seconds before giving up on a build
 
 
 class JenkinsIntegration(AbstractIntegration):
     """Jenkins CI/CD lifecycle integration for pipeline Steps 10-12.
 
-    Calls the Jenkins REST API directly using stdlib urllib.  No external
-    packages are required.
+    Calls the Jenkins REST API directly over a persistent stdlib
+    http.client connection.  No external packages are required.
 
     The integration is stateless between pipeline steps: job_name and
     build_number are resolved from the context dict at each call site and
@@ -76,6 +87,9 @@ class JenkinsIntegration(AbstractIntegration):
             os.environ.get("JENKINS_JOB_NAME", ""),
         )
         self._last_build_number: int = 0
+        self._connection: Optional[JenkinsConnection] = None
+        self._watcher: Optional[BuildWatcher] = None
+        self._client_lock = threading.Lock()
         self._state = IntegrationState.READY if self.is_enabled else IntegrationState.DISABLED
 
     # ------------------------------------------------------------------
@@ -118,6 +132,40 @@ class JenkinsIntegration(AbstractIntegration):
             return ctx
         return None
 
+    def _get_connection(self) -> Optional[JenkinsConnection]:
+        """Return the persistent connection to JENKINS_URL (None when unset)."""
+        base = self._get_base_url()
+        if not base:
+            logger.debug("[JenkinsIntegration] JENKINS_URL not configured")
+            return None
+        with self._client_lock:
+            if self._connection is None or self._connection.base_url != base:
+                if self._connection is not None:
+                    self._connection.close()
+                self._connection = JenkinsConnection(
+                    base,
+                    auth_header=self._build_auth_header(),
+                    ssl_context=self._ssl_context(),
+                    timeout=_JENKINS_REQUEST_TIMEOUT,
+                )
+                self._watcher = None
+            return self._connection
+
+    def _get_watcher(self) -> Optional[BuildWatcher]:
+        """Return the background build watcher bound to the current connection."""
+        conn = self._get_connection()
+        if conn is None:
+            return None
+        with self._client_lock:
+            if self._watcher is None:
+                self._watcher = BuildWatcher(
+                    lambda path: conn.request("GET", path, accept="*/*"),
+                    min_interval=_BUILD_POLL_MIN_INTERVAL,
+                    max_interval=_BUILD_POLL_INTERVAL,
+                    max_wait=_BUILD_POLL_MAX_WAIT,
+                )
+            return self._watcher
+
     def _api_get(self, path: str) -> Optional[Dict[str, Any]]:
         """Perform a GET request to the Jenkins REST API.
 
@@ -127,29 +175,20 @@ class JenkinsIntegration(AbstractIntegration):
         Returns:
             Parsed JSON dict, or None on any error.
         """
-        base = self._get_base_url()
-        if not base:
-            logger.debug("[JenkinsIntegration] JENKINS_URL not configured")
+        conn = self._get_connection()
+        if conn is None:
             return None
 
-        url = base + path
         try:
-            req = urllib.request.Request(url)
-            req.add_header("Accept", "application/json")
-            auth = self._build_auth_header()
-            if auth:
-                req.add_header("Authorization", auth)
-
-            ctx = self._ssl_context()
-            with urllib.request.urlopen(req, timeout=_JENKINS_REQUEST_TIMEOUT, context=ctx) as resp:
-                body = resp.read().decode("utf-8")
-                return json.loads(body) if body.strip() else {}
-
-        except urllib.error.HTTPError as exc:
-            logger.debug("[JenkinsIntegration] GET %s failed: HTTP %d", path, exc.code)
-            return None
-        except urllib.error.URLError as exc:
-            logger.debug("[JenkinsIntegration] GET %s unreachable: %s", path, exc.reason)
+            status, _headers, body = conn.request("GET", path)
+            if status != 200:
+                logger.debug("[JenkinsIntegration] GET %s failed: HTTP %d", path, status)
+                return None
+            text = body.decode("utf-8")
+            return json.loads(text) if text.strip() else {}
+
+        except OSError as exc:
+            logger.debug("[JenkinsIntegration] GET %s unreachable: %s", path, exc)
             return None
         except Exception as exc:
             logger.debug("[JenkinsIntegration] GET %s error: %s", path, exc)
@@ -165,34 +204,23 @@ class JenkinsIntegration(AbstractIntegration):
         Returns:
             True when the server responded with 2xx, False otherwise.
         """
-        base = self._get_base_url()
-        if not base:
-            logger.debug("[JenkinsIntegration] JENKINS_URL not configured")
+        conn = self._get_connection()
+        if conn is None:
             return False
 
-        url = base + path
         if params:
-            url = url + "?" + urllib.parse.urlencode(params)
+            path = path + "?" + urllib.parse.urlencode(params)
 
         try:
-            req = urllib.request.Request(url, data=b"", method="POST")
-            req.add_header("Accept", "application/json")
-            auth = self._build_auth_header()
-            if auth:
-                req.add_header("Authorization", auth)
-
-            ctx = self._ssl_context()
-            with urllib.request.urlopen(req, timeout=_JENKINS_REQUEST_TIMEOUT, context=ctx) as resp:
-                return 200 <= resp.status < 300
-
-        except urllib.error.HTTPError as exc:
             # 201 Created is returned by Jenkins for build triggers.
-            if exc.code == 201:
+            status, _headers, _body = conn.request("POST", path, body=b"")
+            if 200 <= status < 300:
                 return True
-            logger.debug("[JenkinsIntegration] POST %s failed: HTTP %d", path, exc.code)
+            logger.debug("[JenkinsIntegration] POST %s failed: HTTP %d", path, status)
             return False
-        except urllib.error.URLError as exc:
-            logger.debug("[JenkinsIntegration] POST %s unreachable: %s", path, exc.reason)
+
+        except OSError as exc:
+            logger.debug("[JenkinsIntegration] POST %s unreachable: %s", path, exc)
             return False
         except Exception as exc:
             logger.debug("[JenkinsIntegration] POST %s error: %s", path, exc)
@@ -248,8 +276,41 @@ class JenkinsIntegration(AbstractIntegration):
             return None  # still running
         return data.get("result", "UNKNOWN")
 
+    def watch_build(
+        self,
+        job_name: str,
+        build_number: int,
+        on_log: Optional[Callable[[str], None]] = None,
+    ) -> Optional[BuildWatch]:
+        """Follow a build in the background without blocking the caller.
+
+        Several builds can be watched at once; they share one background
+        thread and the persistent connection.  Watching the same build
+        twice returns the existing handle.
+
+        Args:
+            job_name:     Jenkins job name.
+            build_number: Build number to follow.
+            on_log:       Optional callback receiving console text chunks.
+
+        Returns:
+            BuildWatch handle (wait() blocks until the build finishes), or
+            None when JENKINS_URL is not configured.
+        """
+        watcher = self._get_watcher()
+        if watcher is None:
+            return None
+        return watcher.watch(job_name, self._encode_job_path(job_name), build_number, on_log=on_log)
+
+    def pending_builds(self) -> List[BuildWatch]:
+        """Return the watched builds that have not finished yet."""
+        return self._watcher.pending() if self._watcher is not None else []
+
     def _wait_for_build(self, job_name: str, build_number: int) -> Dict[str, Any]:
-        """Poll until a build completes or times out.
+        """Wait until a build completes or times out.
+
+        Reuses the background watch started by update() when there is one,
+        so the wait usually returns immediately.
 
         Args:
             job_name:     Jenkins job name.
@@ -258,37 +319,17 @@ class JenkinsIntegration(AbstractIntegration):
         Returns:
             Dict with keys: result (str), build_number (int), timed_out (bool).
         """
-        deadline = time.monotonic() + _BUILD_POLL_MAX_WAIT
-        while time.monotonic() < deadline:
-            result = self._get_build_result(job_name, build_number)
-            if result is not None:  # None means still building
-                logger.info(
-                    "[JenkinsIntegration] Build #%d result: %s",
-                    build_number,
-                    result,
-                )
-                return {
-                    "result": result,
-                    "build_number": build_number,
-                    "timed_out": False,
-                }
-            logger.debug(
-                "[JenkinsIntegration] Build #%d still running; " "waiting %ds",
+        watch = self.watch_build(job_name, build_number)
+        if watch is None:
+            return {"result": "", "build_number": build_number, "timed_out": False}
+        result = watch.wait(_BUILD_POLL_MAX_WAIT + _BUILD_POLL_INTERVAL)
+        if result.get("timed_out"):
+            logger.warning(
+                "[JenkinsIntegration] Build #%d timed out after %ds",
                 build_number,
-                _BUILD_POLL_INTERVAL,
+                _BUILD_POLL_MAX_WAIT,
             )
-            time.sleep(_BUILD_POLL_INTERVAL)
-
-        logger.warning(
-            "[JenkinsIntegration] Build #%d timed out after %ds",
-            build_number,
-            _BUILD_POLL_MAX_WAIT,
-        )
-        return {
-            "result": "TIMED_OUT",
-            "build_number": build_number,
-            "timed_out": True,
-        }
+        return result
 
     # ------------------------------------------------------------------
     # Lifecycle methods
@@ -338,20 +379,36 @@ class JenkinsIntegration(AbstractIntegration):
             "reason": "Jenkins discovers branches automatically",
         }
 
+    def _wait_requested(self, context: Dict[str, Any]) -> bool:
+        """Whether update() blocks; config values may be strings from JSON."""
+        wait = context.get("jenkins_wait", self._config.get("jenkins_wait", True))
+        if isinstance(wait, str):
+            return wait.strip().lower() not in ("0", "false", "no", "off")
+        return bool(wait)
+
     def update(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Step 10: Trigger a Jenkins build on the implementation branch.
 
-        Triggers the configured job and waits for the build to complete.
-        The build is triggered with the branch name as a parameter when
-        the job supports parameterized builds.
+        Triggers the configured job, watches the build in the background and
+        waits for its result.  With jenkins_wait=False the call returns as
+        soon as the build is triggered and Step 11 (on_review) waits for the
+        result instead, so the pipeline keeps working while Jenkins builds.
+        The build is triggered with the branch name as a parameter when the
+        job supports parameterized builds.
 
         Args:
             context: Pipeline state.  Uses:
                 - 'jenkins_job_name' (str): Job to trigger (overrides default).
                 - 'branch_name' (str): Branch to build.
+                - 'jenkins_wait' (bool): Block until the build finishes.
+                  Defaults to the 'jenkins_wait' config value: True for a
+                  directly constructed adapter, False for one created by
+                  IntegrationRegistry (the pipeline).
 
         Returns:
             Dict with success (bool), build_number (int), result (str).
+            success is True only when the build passed.  A non-blocking
+            call returns result 'BUILDING', pending True and success False.
         """
         job_name = context.get(
             "jenkins_job_name",
@@ -400,18 +457,26 @@ class JenkinsIntegration(AbstractIntegration):
                     "reason": "Failed to trigger Jenkins build for {}".format(job_name),
                 }
 
-            # Wait briefly for Jenkins to assign the build number.
-            time.sleep(2)
+            # The pre-trigger nextBuildNumber is the number Jenkins assigns;
+            # the watcher treats 404 as "still queued".
             build_number = next_build or self._get_next_build_number(job_name)
-            if build_number and next_build and build_number > next_build:
-                build_number = next_build  # Use the pre-trigger number.
 
             self._last_build_number = build_number
             self._artifact_id = str(build_number)
 
-            # Poll until complete.
             wait_result = _NOOP_WAIT_RESULT
             if build_number:
+                self.watch_build(job_name, build_number)
+                if not self._wait_requested(context):
+                    self._state = IntegrationState.IN_PROGRESS
+                    return {
+                        "success": False,
+                        "build_number": build_number,
+                        "result": "BUILDING",
+                        "job_name": job_name,
+                        "timed_out": False,
+                        "pending": True,
+                    }
                 wait_result = self._wait_for_build(job_name, build_number)
 
             build_result = wait_result.get("result", "UNKNOWN")
@@ -438,9 +503,9 @@ class JenkinsIntegration(AbstractIntegration):
     def on_review(self, pr_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Step 11: Validate the build status before PR merge.
 
-        Fetches the result of the most recent build triggered in update().
-        A fresh build may be triggered when no prior build number is cached
-        and the context supplies a build number.
+        Waits on the background watch of the build triggered in update()
+        (usually finished by now).  Without a cached build number the
+        job's last build is checked instead.
 
         Args:
             pr_data: Dict with pr_url (str), pr_number (int).
@@ -476,11 +541,8 @@ class JenkinsIntegration(AbstractIntegration):
 
         try:
             if build_number:
-                result = self._get_build_result(job_name, build_number)
-                if result is None:
-                    # Still building; wait for completion.
-                    wait_result = self._wait_for_build(job_name, build_number)
-                    result = wait_result.get("result", "UNKNOWN")
+                wait_result = self._wait_for_build(job_name, build_number)
+                result = wait_result.get("result", "UNKNOWN")
             else:
                 # No cached build; fetch the last completed build result.
                 job_path = self._encode_job_path(job_name)
@@ -570,7 +632,6 @@ class JenkinsIntegration(AbstractIntegration):
                     "reason": "Failed to trigger post-merge build for {}".format(job_name),
                 }
 
-            time.sleep(2)
             build_number = next_build or 0
             self._last_build_number = build_number
             self._artifact_id = str(build_number)
@@ -0,0 +1,427 @@
+"""
+Jenkins build watcher - background, backoff-based build waiting.
+
+JenkinsIntegration used to block the pipeline thread in a fixed-interval
+poll loop and open a new HTTP connection for every request.  This module
+provides:
+
+  JenkinsConnection - one persistent keep-alive HTTP(S) connection to a
+                      Jenkins server, shared by API calls and the watcher.
+  BuildWatcher      - a single background thread that follows any number
+                      of builds, polling each with exponential backoff and
+                      jitter and streaming its console through
+                      /logText/progressiveText.
+  BuildWatch        - handle for one watched build; callers block on an
+                      event (wait()) instead of sleeping between polls.
+
+The backoff resets to the minimum interval whenever new console output
+arrives, so active builds are followed closely and idle ones (queued,
+long test phases) are polled less and less often.
+
+Only the standard library is used.
+
+Version: 1.4.1
+"""
+
+import heapq
+import http.client
+import itertools
+import json
+import logging
+import random
+import ssl
+import threading
+import time
+import urllib.parse
+import urllib.request
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MAX_CONSOLE_CHARS = 1_000_000  # console text kept per watch (tail)
+_KEEP_FINISHED = 32  # finished watches kept for get()/watch() lookups
+
+
+# ------------------------------------------------------------------
+# Connection
+# ------------------------------------------------------------------
+
+
+class JenkinsConnection:
+    """Persistent HTTP(S) connection to one Jenkins server.
+
+    Requests are serialised on a lock; a dropped keep-alive connection is
+    re-opened transparently (GETs are retried once, POSTs are not, so a
+    build is never triggered twice).
+
+    Args:
+        base_url:    Jenkins base URL, may include a context path.
+        auth_header: Value for the Authorization header ('' for none).
+        ssl_context: SSL context for https (None for the default).
+        timeout:     Socket timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth_header: str = "",
+        ssl_context: Optional[ssl.SSLContext] = None,
+        timeout: float = 60,
+    ) -> None:
+        parts = urllib.parse.urlsplit(base_url)
+        self.base_url = base_url.rstrip("/")
+        self._scheme = parts.scheme or "http"
+        self._host = parts.hostname or ""
+        self._port = parts.port or (443 if self._scheme == "https" else 80)
+        self._prefix = parts.path.rstrip("/")
+        self._auth = auth_header
+        self._ssl_context = ssl_context
+        self._timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._absolute_paths = False
+        self._lock = threading.Lock()
+        self.connects = 0
+
+    def _connect(self) -> http.client.HTTPConnection:
+        proxy = urllib.request.getproxies().get(self._scheme)
+        use_proxy = bool(proxy) and not urllib.request.proxy_bypass(self._host)
+        self._absolute_paths = use_proxy and self._scheme == "http"
+        if use_proxy:
+            p = urllib.parse.urlsplit(proxy)
+            if self._scheme == "https":
+                conn = http.client.HTTPSConnection(
+                    p.hostname, p.port or 80, timeout=self._timeout, context=self._ssl_context
+                )
+                conn.set_tunnel(self._host, self._port)
+            else:
+                conn = http.client.HTTPConnection(p.hostname, p.port or 80, timeout=self._timeout)
+        elif self._scheme == "https":
+            conn = http.client.HTTPSConnection(self._host, self._port, timeout=self._timeout, context=self._ssl_context)
+        else:
+            conn = http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+        self.connects += 1
+        return conn
+
+    def request(
+        self, method: str, path: str, body: Optional[bytes] = None, accept: str = "application/json"
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one request.
+
+        Args:
+            method: HTTP method.
+            path:   Path relative to the base URL, including any query string.
+            body:   Request body (POST).
+            accept: Accept header value.
+
+        Returns:
+            (status, lower-cased headers, body bytes).
+
+        Raises:
+            OSError / http.client.HTTPException when the server is unreachable.
+        """
+        headers = {"Accept": accept}
+        if self._auth:
+            headers["Authorization"] = self._auth
+        if body is not None:
+            headers["Content-Length"] = str(len(body))
+
+        with self._lock:
+            attempts = 2 if method == "GET" else 1
+            for attempt in range(attempts):
+                if self._conn is None:
+                    self._conn = self._connect()
+                target = self._prefix + path
+                if self._absolute_paths:
+                    target = "{}://{}:{}{}".format(self._scheme, self._host, self._port, target)
+                try:
+                    self._conn.request(method, target, body=body, headers=headers)
+                    resp = self._conn.getresponse()
+                    data = resp.read()
+                    resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+                    if resp.will_close:
+                        self._close_locked()
+                    return resp.status, resp_headers, data
+                except (http.client.HTTPException, OSError):
+                    self._close_locked()
+                    if attempt == attempts - 1:
+                        raise
+        raise OSError("unreachable")  # pragma: no cover
+
+    def _close_locked(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            finally:
+                self._conn = None
+
+    def close(self) -> None:
+        """Close the underlying connection (re-opened on the next request)."""
+        with self._lock:
+            self._close_locked()
+
+
+# ------------------------------------------------------------------
+# Watches
+# ------------------------------------------------------------------
+
+
+class BuildWatch:
+    """Handle for one build followed by a BuildWatcher."""
+
+    def __init__(
+        self,
+        job_name: str,
+        job_path: str,
+        build_number: int,
+        deadline: float,
+        initial_delay: float,
+        on_log: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.job_name = job_name
+        self.job_path = job_path
+        self.build_number = build_number
+        self.deadline = deadline
+        self.delay = initial_delay
+        self.on_log = on_log
+        self.log_offset = 0
+        self.polls = 0
+        self.started = time.monotonic()
+        self._chunks: List[str] = []
+        self._chars = 0
+        self._event = threading.Event()
+        self._result: Optional[Dict[str, Any]] = None
+
+    @property
+    def console(self) -> str:
+        """Console output received so far (tail, at most _MAX_CONSOLE_CHARS)."""
+        return "".join(self._chunks)
+
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def _append(self, text: str) -> None:
+        self._chunks.append(text)
+        self._chars += len(text)
+        while self._chars > _MAX_CONSOLE_CHARS and len(self._chunks) > 1:
+            self._chars -= len(self._chunks.pop(0))
+        if self.on_log is not None:
+            try:
+                self.on_log(text)
+            except Exception as exc:
+                logger.debug("[BuildWatcher] on_log callback failed: %s", exc)
+
+    def _finish(self, result: str, timed_out: bool = False) -> None:
+        self._result = {
+            "result": result,
+            "build_number": self.build_number,
+            "timed_out": timed_out,
+            "polls": self.polls,
+            "duration": round(time.monotonic() - self.started, 3),
+        }
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Block until the build finishes (or *timeout* seconds pass).
+
+        Returns:
+            Dict with keys: result (str), build_number (int), timed_out (bool),
+            polls (int), duration (float).  On a wait timeout the result is
+            'TIMED_OUT' while the watch keeps running in the background.
+        """
+        if not self._event.wait(timeout):
+            return {
+                "result": "TIMED_OUT",
+                "build_number": self.build_number,
+                "timed_out": True,
+                "polls": self.polls,
+                "duration": round(time.monotonic() - self.started, 3),
+            }
+        return dict(self._result or {})
+
+
+class BuildWatcher:
+    """Follow Jenkins builds from one background thread.
+
+    Args:
+        fetch:        Callable (path) -> (status, headers, body) performing a GET.
+        min_interval: First/shortest delay between polls of one build.
+        max_interval: Upper bound for the backoff.
+        multiplier:   Backoff growth factor while nothing changes.
+        jitter:       Relative jitter applied to each delay (0.25 = +/-25%).
+        max_wait:     Seconds after which a watch gives up with TIMED_OUT.
+        rng:          random.Random used for jitter (tests pass a seeded one).
+        keep_finished: Finished watches kept (most recent first) so a later
+                      watch()/get() of the same build returns its result
+                      without polling again; older ones are dropped.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Tuple[int, Dict[str, str], bytes]],
+        min_interval: float = 1.0,
+        max_interval: float = 10.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.25,
+        max_wait: float = 300.0,
+        rng: Optional[random.Random] = None,
+        keep_finished: int = _KEEP_FINISHED,
+    ) -> None:
+        self._fetch = fetch
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_wait = max_wait
+        self._rng = rng or random.Random()
+        self._heap: List[Tuple[float, int, BuildWatch]] = []
+        self._seq = itertools.count()
+        self._watches: Dict[Tuple[str, int], BuildWatch] = {}
+        self._finished: Deque[Tuple[str, int]] = deque()
+        self.keep_finished = keep_finished
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def watch(
+        self,
+        job_name: str,
+        job_path: str,
+        build_number: int,
+        on_log: Optional[Callable[[str], None]] = None,
+    ) -> BuildWatch:
+        """Start following a build (idempotent per job/build) and return its handle."""
+        key = (job_path, int(build_number))
+        with self._cond:
+            existing = self._watches.get(key)
+            if existing is not None:
+                return existing
+            watch = BuildWatch(
+                job_name,
+                job_path,
+                int(build_number),
+                time.monotonic() + self.max_wait,
+                self.min_interval,
+                on_log,
+            )
+            self._watches[key] = watch
+            heapq.heappush(self._heap, (time.monotonic(), next(self._seq), watch))
+            self._ensure_thread()
+            self._cond.notify()
+            return watch
+
+    def get(self, job_path: str, build_number: int) -> Optional[BuildWatch]:
+        """Return the watch for a build, if one was started."""
+        with self._cond:
+            return self._watches.get((job_path, int(build_number)))
+
+    def pending(self) -> List[BuildWatch]:
+        """Watches that have not finished yet."""
+        with self._cond:
+            return [w for w in self._watches.values() if not w.done()]
+
+    def stop(self) -> None:
+        """Stop the background thread; unfinished watches stay pending."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def next_delay(self, watch: BuildWatch, progressed: bool) -> float:
+        """Advance *watch*'s backoff and return the jittered delay to the next poll."""
+        if progressed:
+            watch.delay = self.min_interval
+        else:
+            watch.delay = min(self.max_interval, watch.delay * self.multiplier)
+        spread = watch.delay * self.jitter
+        return max(0.0, watch.delay + self._rng.uniform(-spread, spread))
+
+    # ------------------------------------------------------------------
+    # Background loop
+    # ------------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="jenkins-watcher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                due, _seq, watch = self._heap[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                heapq.heappop(self._heap)
+
+            progressed = self._poll(watch)
+            if not watch.done() and time.monotonic() >= watch.deadline:
+                logger.warning(
+                    "[BuildWatcher] Build %s #%d timed out after %ds",
+                    watch.job_name,
+                    watch.build_number,
+                    self.max_wait,
+                )
+                watch._finish("TIMED_OUT", timed_out=True)
+            if watch.done():
+                self._retire(watch)
+                continue
+            delay = min(self.next_delay(watch, progressed), max(0.0, watch.deadline - time.monotonic()))
+            with self._cond:
+                heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), watch))
+
+    def _retire(self, watch: BuildWatch) -> None:
+        """Record a finished watch, dropping the oldest beyond keep_finished."""
+        with self._cond:
+            self._finished.append((watch.job_path, watch.build_number))
+            while len(self._finished) > self.keep_finished:
+                key = self._finished.popleft()
+                old = self._watches.get(key)
+                if old is not None and old.done():
+                    del self._watches[key]
+
+    def _poll(self, watch: BuildWatch) -> bool:
+        """Poll one build; returns True when new console output arrived."""
+        watch.polls += 1
+        base = "{}/{}".format(watch.job_path, watch.build_number)
+        try:
+            status, headers, body = self._fetch("{}/logText/progressiveText?start={}".format(base, watch.log_offset))
+        except Exception as exc:
+            logger.debug("[BuildWatcher] %s unreachable: %s", base, exc)
+            return False
+        if status == 404:
+            return False  # still queued: the build number is not assigned yet
+        if status != 200:
+            logger.debug("[BuildWatcher] %s console: HTTP %d", base, status)
+            return False
+
+        progressed = False
+        if body:
+            watch._append(body.decode("utf-8", errors="replace"))
+            progressed = True
+        try:
+            watch.log_offset = int(headers.get("x-text-size", watch.log_offset + len(body)))
+        except ValueError:
+            watch.log_offset += len(body)
+        if headers.get("x-more-data", "").lower() == "true":
+            return progressed
+
+        try:
+            status, _headers, body = self._fetch("{}/api/json?tree=result,building".format(base))
+            data = json.loads(body.decode("utf-8")) if status == 200 and body.strip() else None
+        except Exception as exc:
+            logger.debug("[BuildWatcher] %s status unavailable: %s", base, exc)
+            data = None
+        if data and not data.get("building") and data.get("result"):
+            logger.info("[BuildWatcher] Build %s #%d result: %s", watch.job_name, watch.build_number, data["result"])
+            watch._finish(data["result"])
+        return progressed
@@ -4,9 +4,6 @@ Canonical location: langgraph_engine/level1_sync/complexity_calculator.py
 Windows-safe: ASCII only, no Unicode characters.
 """
 
-import json
-import subprocess
-import sys
 from pathlib import Path
 
 try:
@@ -14,6 +11,8 @@ try:
 except ImportError:
     FlowState = dict  # type: ignore[misc,assignment]
 
+from ..core.file_walker import iter_project_files
+
 from .helpers import (
     _COMPLEXITY_CALCULATOR_AVAILABLE,
     _LEVEL1_TELEMETRY_DIR,
@@ -37,8 +36,9 @@ except ImportError:
 def node_complexity_calculation(state):
     """Analyze project structure and calculate complexity.
 
-    Uses complexity_calculator.py (new, preferred) when available.
-    Falls back to legacy script or simple heuristic otherwise.
+    Uses the in-process complexity_calculator module (incremental per-file
+    index) when available.  Falls back to a simple file-count heuristic over
+    a pruned walk otherwise; no subprocess is spawned on either path.
     """
     _step_start = _time_mod.time()
     try:
@@ -101,60 +101,9 @@ def node_complexity_calculation(state):
                 pass  # Non-blocking
             return result
 
-        # --- Legacy path: try the old architecture script ---
-        complexity_script = (
-            Path(__file__).parent.parent.parent
-            / "scripts"
-            / "architecture"
-            / "03-execution-system"
-            / "04-model-selection"
-            / "complexity-calculator.py"
-        )
-
-        if complexity_script.exists():
-            result = subprocess.run(
-                [sys.executable, str(complexity_script)],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                cwd=project_root,
-            )
-            if result.returncode == 0:
-                try:
-                    data = json.loads(result.stdout)
-                    _legacy_result = {
-                        "complexity_score": data.get("complexity_score", 5),
-                        "project_graph": data.get("graph", {}),
-                        "architecture": data.get("architecture", {}),
-                        "complexity_calculated": True,
-                    }
-                    # Telemetry
-                    try:
-                        import json as _json_tel
-                        import time as _time_tel
-
-                        _sid_tel = state.get("session_id", "")
-                        if _sid_tel:
-                            _tdir_tel = _LEVEL1_TELEMETRY_DIR
-                            _tdir_tel.mkdir(parents=True, exist_ok=True)
-                            _tfile_tel = _tdir_tel / ("%s.jsonl" % _sid_tel)
-                            _entry_tel = {
-                                "level": 1,
-                                "node": "node_complexity_calculation",
-                                "status": "OK",
-                                "timestamp": _time_tel.strftime("%Y-%m-%dT%H:%M:%S"),
-                            }
-                            with open(str(_tfile_tel), "a", encoding="utf-8") as _f_tel:
-                                _f_tel.write(_json_tel.dumps(_entry_tel) + "\n")
-                    except Exception:
-                        pass  # Non-blocking
-                    return _legacy_result
-                except Exception:
-                    pass
-
         # --- Final fallback: simple file count heuristic ---
-        py_files = list(project_root.glob("**/*.py"))
-        complexity_score = min(10, max(1, len(py_files) // 10))
+        py_file_count = sum(1 for _ in iter_project_files(project_root, {".py"}))
+        complexity_score = min(10, max(1, py_file_count // 10))
 
         result = {
             "complexity_score": complexity_score,
@@ -2,20 +2,39 @@
 Context Deduplicator - Remove redundant information across loaded context files.
 
 Targets duplicate content between SRS, README, and CLAUDE.md.
-Deduplication is only applied when it saves > 20% of total context space.
+Deduplication is only applied when it saves > 20% of total context space
+(a token budget, when given, is always enforced).
 
 Algorithm:
-1. Tokenize each context string into sentences/lines
-2. Build a fingerprint set (normalized line hashes) from the primary doc
-3. Remove lines from secondary docs that already appear in primary
-4. Compute space savings: if >= 20%, return deduplicated dict, else return original
+1. Exact pass: drop lines whose normalized MD5 fingerprint already appeared
+   in a higher-priority doc (or earlier in the same doc)
+2. Chunk each doc into paragraphs (blank-line separated, capped at
+   MAX_CHUNK_LINES lines)
+3. Near-duplicate pass: MinHash signatures over 3-word shingles, bucketed
+   with LSH banding, so each chunk is only compared with the few earlier
+   chunks sharing a band - linear in total context size.  A chunk whose
+   estimated Jaccard similarity to an earlier chunk is >= NEAR_DUP_THRESHOLD
+   is dropped (reflowed or lightly edited paragraphs match; word order
+   within a 3-word window must survive)
+4. Budget pass (optional): rank surviving chunks by BM25-style overlap with
+   the task text, then document priority and position; keep the best
+   chunks that fit token_budget, in original order
+5. Compute space savings: if >= 20% (or the budget dropped anything),
+   return deduplicated dict, else return original
+
+Every dropped chunk is listed in result["_dedup_report"] in document order,
+so the same input always produces the same report.
 
 Usage:
     from context_deduplicator import deduplicate_context
     deduped = deduplicate_context(context_data)
+    packed = deduplicate_context(context_data, task=user_message, token_budget=2000)
 """
 
 import hashlib
+import math
+import random
+import re
 import sys
 from typing import Dict, List, Tuple
 
@@ -26,109 +45,105 @@ MIN_SAVINGS_RATIO = 0.20  # 20%
 # Lines seen in earlier docs are removed from later docs
 PRIORITY_ORDER = ["srs", "readme", "claude_md"]
 
+# Near-duplicate detection
+NEAR_DUP_THRESHOLD = 0.8  # Estimated Jaccard similarity of shingle sets
+MAX_CHUNK_LINES = 40  # Long paragraphs (code blocks, lists) are split
+_SHINGLE_WORDS = 3
+_MIN_CHUNK_WORDS = 6  # Shorter chunks are left to the exact pass
+_NUM_PERM = 64
+_LSH_BANDS = 16  # 16 bands x 4 rows: candidates from ~0.5 similarity upward
+_LSH_ROWS = _NUM_PERM // _LSH_BANDS
+_MERSENNE_PRIME = (1 << 61) - 1
+
+# Fixed seed: signatures (and therefore reports) are stable across runs
+_rng = random.Random(20240601)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(_NUM_PERM)]
+
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n[ \t]*\n\s*")
+_STOPWORDS = frozenset(
+    "the and for with that this from into are was were will can should must not but you your "
+    "our has have had its use using when then than also all any each".split()
+)
+
 
 # ============================================================================
 # PUBLIC API
 # ============================================================================
 
 
-def deduplicate_context(contexts: dict) -> dict:
+def deduplicate_context(contexts: dict, task: str = "", token_budget: int = 0) -> dict:
     """Find and remove duplicate information across context files.
 
     Checks for duplicate content across: SRS, README, CLAUDE.md.
     Only applies deduplication if it saves > 20% of total context space.
 
     Args:
-        contexts: Dict with keys "srs", "readme", "claude_md" (str or None),
-                  plus "files_loaded" list and any other metadata.
+        contexts:     Dict with keys "srs", "readme", "claude_md" (str or None),
+                      plus "files_loaded" list and any other metadata.
+        task:         Task / user message used to rank chunks for the budget.
+        token_budget: Max estimated tokens (4 chars ~= 1 token) across the
+                      docs.  0 = unlimited.
 
     Returns:
-        Deduplicated context dict (same shape as input).
-        If savings < 20%, returns a shallow copy of the original unchanged.
+        Deduplicated context dict (same shape as input) with _dedup_*
+        metadata and a "_dedup_report" of dropped chunks.
+        If savings < 20% and nothing was dropped for the budget, the docs
+        are returned unchanged.
     """
     if not contexts or not isinstance(contexts, dict):
         return contexts
 
     # Extract text values from context
-    texts: Dict[str, str] = {}
-    for key in PRIORITY_ORDER:
-        val = contexts.get(key)
-        if val and isinstance(val, str) and val.strip():
-            texts[key] = val
+    texts = _context_texts(contexts)
 
-    if len(texts) < 2:
+    if len(texts) < 2 and not token_budget:
         # Nothing to deduplicate
         return dict(contexts)
 
     # Calculate original total size
-    original_size = sum(len(t.encode("utf-8", errors="ignore")) for t in texts.values())
+    original_size = sum(_byte_len(t) for t in texts.values())
     if original_size == 0:
         return dict(contexts)
 
-    # Build deduplicated versions
-    seen_fingerprints: set = set()
-    deduped_texts: Dict[str, str] = {}
-    total_removed_bytes = 0
-
-    for key in PRIORITY_ORDER:
-        if key not in texts:
-            continue
-
-        original_text = texts[key]
-        lines = original_text.splitlines(keepends=True)
-        kept_lines: List[str] = []
-
-        for line in lines:
-            normalized = line.strip().lower()
-            if not normalized:
-                # Keep empty/whitespace lines to preserve structure
-                kept_lines.append(line)
-                continue
-
-            fp = _fingerprint(normalized)
-            if fp in seen_fingerprints:
-                # This line already appeared in a higher-priority doc
-                total_removed_bytes += len(line.encode("utf-8", errors="ignore"))
-            else:
-                seen_fingerprints.add(fp)
-                kept_lines.append(line)
-
-        deduped_texts[key] = "".join(kept_lines)
+    deduped_texts, report = _compact(texts, task, token_budget)
 
     # Calculate savings ratio
-    new_size = sum(len(t.encode("utf-8", errors="ignore")) for t in deduped_texts.values())
+    new_size = sum(_byte_len(t) for t in deduped_texts.values())
     savings_ratio = (original_size - new_size) / original_size if original_size > 0 else 0.0
+    budget_enforced = report["budget_drops"] > 0
+
+    result = dict(contexts)
+    result["_dedup_savings_ratio"] = round(savings_ratio, 3)
+    result["_dedup_original_bytes"] = original_size
+    result["_dedup_new_bytes"] = new_size
+    result["_dedup_report"] = report
 
-    # Only apply deduplication if savings >= threshold
-    if savings_ratio >= MIN_SAVINGS_RATIO:
-        result = dict(contexts)
+    # Only apply deduplication if savings >= threshold (or the budget requires it)
+    if savings_ratio >= MIN_SAVINGS_RATIO or budget_enforced:
         for key, deduped_text in deduped_texts.items():
             result[key] = deduped_text
         result["_dedup_applied"] = True
-        result["_dedup_savings_ratio"] = round(savings_ratio, 3)
-        result["_dedup_original_bytes"] = original_size
-        result["_dedup_new_bytes"] = new_size
         print(
-            "[CONTEXT DEDUP] Applied: {:.1f}% savings ({} -> {} bytes)".format(
-                savings_ratio * 100, original_size, new_size
+            "[CONTEXT DEDUP] Applied: {:.1f}% savings ({} -> {} bytes; {} near-dup, {} budget chunks dropped)".format(
+                savings_ratio * 100,
+                original_size,
+                new_size,
+                report["near_duplicates"],
+                report["budget_drops"],
             ),
             file=sys.stderr,
         )
-        return result
     else:
         # Savings below threshold - return original unchanged
-        result = dict(contexts)
         result["_dedup_applied"] = False
-        result["_dedup_savings_ratio"] = round(savings_ratio, 3)
-        result["_dedup_original_bytes"] = original_size
-        result["_dedup_new_bytes"] = new_size
         print(
             "[CONTEXT DEDUP] Skipped: {:.1f}% savings < {:.0f}% threshold".format(
                 savings_ratio * 100, MIN_SAVINGS_RATIO * 100
             ),
             file=sys.stderr,
         )
-        return result
+    return result
 
 
 # ============================================================================
@@ -144,6 +159,199 @@ def _fingerprint(text: str) -> str:
     return hashlib.md5(text.encode("utf-8", errors="ignore")).hexdigest()
 
 
+def _byte_len(text: str) -> int:
+    return len(text.encode("utf-8", errors="ignore"))
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token estimate (4 chars ~= 1 token), as TokenManager.estimate_tokens."""
+    return max(1, len(text) // 4)
+
+
+def _context_texts(contexts: dict) -> Dict[str, str]:
+    texts: Dict[str, str] = {}
+    for key in PRIORITY_ORDER:
+        val = contexts.get(key)
+        if val and isinstance(val, str) and val.strip():
+            texts[key] = val
+    return texts
+
+
+def _remove_exact_lines(texts: Dict[str, str]) -> Tuple[Dict[str, str], int, int]:
+    """Exact pass.  Returns (texts, lines_removed, bytes_removed)."""
+    seen_fingerprints: set = set()
+    deduped: Dict[str, str] = {}
+    lines_removed = bytes_removed = 0
+
+    for key, original_text in texts.items():
+        kept_lines: List[str] = []
+        for line in original_text.splitlines(keepends=True):
+            normalized = line.strip().lower()
+            if not normalized:
+                # Keep empty/whitespace lines to preserve structure
+                kept_lines.append(line)
+                continue
+
+            fp = _fingerprint(normalized)
+            if fp in seen_fingerprints:
+                # This line already appeared in a higher-priority doc
+                lines_removed += 1
+                bytes_removed += _byte_len(line)
+            else:
+                seen_fingerprints.add(fp)
+                kept_lines.append(line)
+        deduped[key] = "".join(kept_lines)
+    return deduped, lines_removed, bytes_removed
+
+
+def _split_chunks(text: str) -> List[str]:
+    """Split *text* into paragraph chunks; "".join(chunks) == text."""
+    chunks: List[str] = []
+    start = 0
+    for match in _PARAGRAPH_BREAK_RE.finditer(text):
+        chunks.append(text[start : match.end()])
+        start = match.end()
+    if start < len(text):
+        chunks.append(text[start:])
+
+    capped: List[str] = []
+    for chunk in chunks:
+        lines = chunk.splitlines(keepends=True)
+        for i in range(0, len(lines), MAX_CHUNK_LINES):
+            capped.append("".join(lines[i : i + MAX_CHUNK_LINES]))
+    return capped
+
+
+def _minhash(words: List[str]) -> Tuple[int, ...]:
+    """MinHash signature of the word-shingle set of *words*."""
+    shingles = {" ".join(words[i : i + _SHINGLE_WORDS]) for i in range(len(words) - _SHINGLE_WORDS + 1)}
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little") for s in shingles]
+    prime = _MERSENNE_PRIME
+    return tuple(min((a * h + b) % prime for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def _similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / _NUM_PERM
+
+
+def _compact(texts: Dict[str, str], task: str, token_budget: int) -> Tuple[Dict[str, str], dict]:
+    """Run the exact, near-duplicate and budget passes over *texts*."""
+    texts, exact_lines, exact_bytes = _remove_exact_lines(texts)
+
+    # chunk records: [doc_rank, key, index, text, words]
+    chunks = []
+    for rank, key in enumerate(texts):
+        for index, chunk in enumerate(_split_chunks(texts[key])):
+            chunks.append([rank, key, index, chunk, _WORD_RE.findall(chunk.lower())])
+
+    dropped: Dict[Tuple[int, int], dict] = {}
+
+    # ---- Near-duplicate pass (MinHash + LSH) ----
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    signatures: Dict[int, Tuple[int, ...]] = {}
+    for pos, (rank, key, index, chunk, words) in enumerate(chunks):
+        if len(words) < _MIN_CHUNK_WORDS:
+            continue
+        sig = _minhash(words)
+        bands = [(b, sig[b * _LSH_ROWS : (b + 1) * _LSH_ROWS]) for b in range(_LSH_BANDS)]
+        candidates = set()
+        for band in bands:
+            candidates.update(buckets.get(band, ()))
+        best, best_sim = None, 0.0
+        for other in sorted(candidates):  # Earliest chunk wins ties
+            sim = _similarity(sig, signatures[other])
+            if sim > best_sim:
+                best, best_sim = other, sim
+        if best is not None and best_sim >= NEAR_DUP_THRESHOLD:
+            original = chunks[best]
+            dropped[(rank, index)] = _drop_entry(
+                key,
+                index,
+                chunk,
+                "near_duplicate",
+                duplicate_of="{}#{}".format(original[1], original[2]),
+                similarity=round(best_sim, 3),
+            )
+            continue
+        signatures[pos] = sig
+        for band in bands:
+            buckets.setdefault(band, []).append(pos)
+
+    # ---- Budget pass (relevance-ranked packing) ----
+    survivors = [c for c in chunks if (c[0], c[2]) not in dropped and c[3].strip()]
+    tokens_before = sum(_estimate_tokens(c[3]) for c in survivors)
+    budget_drops = 0
+    if token_budget and tokens_before > token_budget:
+        scores = _relevance_scores(task, [c[4] for c in survivors])
+        order = sorted(range(len(survivors)), key=lambda i: (-scores[i], survivors[i][0], survivors[i][2]))
+        remaining = token_budget
+        for i in order:
+            rank, key, index, chunk, _ = survivors[i]
+            cost = _estimate_tokens(chunk)
+            if cost <= remaining:
+                remaining -= cost
+                continue
+            budget_drops += 1
+            dropped[(rank, index)] = _drop_entry(key, index, chunk, "budget", relevance=round(scores[i], 3))
+
+    compacted: Dict[str, str] = {key: "" for key in texts}
+    for rank, key, index, chunk, _ in chunks:
+        if (rank, index) not in dropped:
+            compacted[key] += chunk
+
+    report = {
+        "exact_lines_removed": exact_lines,
+        "exact_bytes_removed": exact_bytes,
+        "near_duplicates": sum(1 for d in dropped.values() if d["reason"] == "near_duplicate"),
+        "budget_drops": budget_drops,
+        "token_budget": token_budget or 0,
+        "tokens_before": tokens_before,
+        "tokens_after": sum(_estimate_tokens(t) for t in compacted.values() if t.strip()),
+        "dropped": [dropped[k] for k in sorted(dropped)],
+    }
+    return compacted, report
+
+
+def _drop_entry(key: str, index: int, chunk: str, reason: str, **extra) -> dict:
+    entry = {
+        "doc": key,
+        "chunk": index,
+        "reason": reason,
+        "tokens": _estimate_tokens(chunk),
+        "preview": " ".join(chunk.split())[:80],
+    }
+    entry.update(extra)
+    return entry
+
+
+def _relevance_scores(task: str, chunk_words: List[List[str]]) -> List[float]:
+    """BM25-style score of each chunk against the task terms (0.0 without a task)."""
+    terms = {w for w in _WORD_RE.findall((task or "").lower()) if len(w) > 2 and w not in _STOPWORDS}
+    if not terms:
+        return [0.0] * len(chunk_words)
+
+    n = len(chunk_words)
+    counts = []
+    doc_freq: Dict[str, int] = {}
+    for words in chunk_words:
+        tf: Dict[str, int] = {}
+        for w in words:
+            if w in terms:
+                tf[w] = tf.get(w, 0) + 1
+        counts.append(tf)
+        for w in tf:
+            doc_freq[w] = doc_freq.get(w, 0) + 1
+
+    scores = []
+    for tf in counts:
+        score = 0.0
+        for w, f in tf.items():
+            idf = math.log(1 + (n - doc_freq[w] + 0.5) / (doc_freq[w] + 0.5))
+            score += idf * f / (f + 1.2)
+        scores.append(score)
+    return scores
+
+
 def dedup_savings_estimate(contexts: dict) -> Tuple[float, int, int]:
     """Estimate deduplication savings without actually deduplicating.
 
@@ -153,35 +361,16 @@ def dedup_savings_estimate(contexts: dict) -> Tuple[float, int, int]:
     if not contexts or not isinstance(contexts, dict):
         return 0.0, 0, 0
 
-    texts = {}
-    for key in PRIORITY_ORDER:
-        val = contexts.get(key)
-        if val and isinstance(val, str) and val.strip():
-            texts[key] = val
+    texts = _context_texts(contexts)
 
     if len(texts) < 2:
         return 0.0, 0, 0
 
-    original_size = sum(len(t.encode("utf-8", errors="ignore")) for t in texts.values())
+    original_size = sum(_byte_len(t) for t in texts.values())
     if original_size == 0:
         return 0.0, 0, 0
 
-    seen_fps: set = set()
-    removed = 0
-
-    for key in PRIORITY_ORDER:
-        if key not in texts:
-            continue
-        for line in texts[key].splitlines(keepends=True):
-            normalized = line.strip().lower()
-            if not normalized:
-                continue
-            fp = _fingerprint(normalized)
-            if fp in seen_fps:
-                removed += len(line.encode("utf-8", errors="ignore"))
-            else:
-                seen_fps.add(fp)
-
-    new_size = original_size - removed
-    ratio = removed / original_size if original_size > 0 else 0.0
+    deduped, _ = _compact(texts, "", 0)
+    new_size = sum(_byte_len(t) for t in deduped.values())
+    ratio = (original_size - new_size) / original_size if original_size > 0 else 0.0
     return round(ratio, 3), original_size, new_size
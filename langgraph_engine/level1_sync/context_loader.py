@@ -5,6 +5,7 @@ Windows-safe: ASCII only, no Unicode characters.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -59,10 +60,33 @@ CONTEXT_THRESHOLD_EMERGENCY = 0.95  # 95% - stop loading, trigger cleanup
 STREAMING_THRESHOLD = 1_000_000  # 1 MB
 STREAMING_CHUNK_SIZE = 65_536  # 64 KB per read chunk
 
+# Token budget for the loaded docs (0 = unlimited).  Applied per task after the
+# project-level cache, so cached context is never trimmed for another task.
+CONTEXT_TOKEN_BUDGET = int(os.environ.get("LEVEL1_CONTEXT_TOKEN_BUDGET", "0") or 0)
+
 # Max content per file (5 KB snippet)  # v1.15.2: removed stale "sent to TOON" reference
 MAX_CONTENT_CHARS = 5000
 
 
+def _apply_token_budget(context_data, state):
+    """Pack the docs into CONTEXT_TOKEN_BUDGET, ranked by the user's task.
+
+    No-op when no budget is configured.  Runs after the cache so the cached
+    (task-independent) context is never trimmed for a later task.
+    """
+    if not CONTEXT_TOKEN_BUDGET or not _DEDUPLICATOR_AVAILABLE or deduplicate_context is None:
+        return context_data
+    try:
+        return deduplicate_context(
+            context_data,
+            task=state.get("user_message", "") or "",
+            token_budget=CONTEXT_TOKEN_BUDGET,
+        )
+    except Exception as exc:
+        print("[CONTEXT LOADER] Token budget packing failed (ignored): {}".format(exc), file=sys.stderr)
+        return context_data
+
+
 def _stream_file_head(
     file_path,
     max_chars=MAX_CONTENT_CHARS,
@@ -227,7 +251,7 @@ def node_context_loader(state):
                         },
                     )
                     _cache_hit_result = {
-                        "context_data": cached,
+                        "context_data": _apply_token_budget(cached, state),
                         "context_loaded": True,
                         "files_loaded_count": len(cached.get("files_loaded", [])),
                         "context_skipped_files": [],
@@ -478,7 +502,7 @@ def node_context_loader(state):
 
         # Return partial context - whatever loaded successfully
         result = {
-            "context_data": context_data,
+            "context_data": _apply_token_budget(context_data, state),
             "context_loaded": True,
             "files_loaded_count": len(context_data.get("files_loaded", [])),
             "context_skipped_files": skipped_files,
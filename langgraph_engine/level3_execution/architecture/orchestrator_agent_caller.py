@@ -111,11 +111,31 @@ def _load_prompt(args):
     return None, "No --orchestration-prompt-file and no --task-description provided"
 
 
-def _call_claude_cli(prompt):
+def _run_cli(cmd, token=None, **kwargs):
+    """subprocess.run() through cancellation.run_subprocess when importable.
+
+    The child is then killed when *token* (default: the current step's
+    token) is cancelled.  Falls back to plain subprocess.run().
+    """
+    try:
+        from langgraph_engine.cancellation import run_subprocess
+    except Exception:
+        return subprocess.run(cmd, **kwargs)
+    return run_subprocess(cmd, token=token, **kwargs)
+
+
+def _call_claude_cli(prompt, timeout=None, token=None):
     """Call claude CLI as subprocess with stderr inherited (live streaming).
 
+    Args:
+        prompt: Full prompt text.
+        timeout: Seconds to wait (default: STEP0_ORCHESTRATOR_TIMEOUT).
+        token: CancellationToken that kills the CLI when cancelled
+               (default: the current step's token, if any).
+
     Returns (response_text, error).
     """
+    timeout = timeout or _TIMEOUT
     temp_file = None
     try:
         # Write prompt to temp file (avoids shell escaping issues)
@@ -139,12 +159,13 @@ def _call_claude_cli(prompt):
             print("[orchestrator_agent_caller] Running: claude CLI", file=sys.stderr, flush=True)
 
         # stderr=None inherits parent stderr -- user sees real-time progress
-        result = subprocess.run(
+        result = _run_cli(
             cmd,
+            token=token,
             stdout=subprocess.PIPE,
             stderr=None,  # Inherit: live output visible in terminal
             text=True,
-            timeout=_TIMEOUT,
+            timeout=timeout,
         )
 
         if result.returncode != 0 and not result.stdout:
@@ -164,7 +185,7 @@ def _call_claude_cli(prompt):
             return None, "claude CLI returned empty response"
 
     except subprocess.TimeoutExpired:
-        return None, "claude CLI timed out after %ds" % _TIMEOUT
+        return None, "claude CLI timed out after %ds" % timeout
     except FileNotFoundError:
         return None, "claude CLI binary not found in PATH"
     except Exception as exc:
@@ -1,21 +1,33 @@
 """
 Level 3 - TODO Executor
 
-Executes a list of TODO items produced by todo_decomposer, calling
-orchestrator_agent_caller.py as a subprocess for each TODO.
+Executes a list of TODO items produced by todo_decomposer as a DAG built
+from each item's depends_on list.  Independent TODOs run concurrently on a
+thread pool (up to max_parallel at a time); each worker calls the claude CLI
+directly through orchestrator_agent_caller's helpers instead of spawning a
+second Python interpreter first.  The CLI runs under the calling step's
+cancellation token, so a step timeout kills every in-flight TODO.  Ready
+TODOs are dispatched longest remaining path first, so total wall time
+approaches the critical path.  A TODO whose dependency did not succeed is
+not run: it is reported as SKIPPED, and so are its own dependents.
 
 Supports resume via a sidecar checkpoint file (session_dir/todo_checkpoint.json)
-that is read on entry and updated after each TODO completes.
+that is read on entry and updated as each TODO completes.  TODOs already in
+the checkpoint are reported as SKIPPED and count as satisfied dependencies,
+so a partially finished wavefront resumes where it stopped.
 
 Environment:
-  STEP0_TODO_EXEC_TIMEOUT  seconds to wait per TODO subprocess (default: 300)
+  STEP0_TODO_EXEC_TIMEOUT   seconds to wait per TODO claude call (default: 300)
+  STEP0_TODO_MAX_PARALLEL   TODOs executed concurrently (default: 4)
 """
 
+import heapq
 import json
 import os
-import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -31,8 +43,32 @@ except ImportError:
 # ---------------------------------------------------------------------------
 _ORCHESTRATOR_CALLER_PATH = Path(__file__).resolve().parent / "orchestrator_agent_caller.py"
 _TODO_EXEC_TIMEOUT = int(os.getenv("STEP0_TODO_EXEC_TIMEOUT", "300"))
+_TODO_MAX_PARALLEL = int(os.getenv("STEP0_TODO_MAX_PARALLEL", "4"))
 _CHECKPOINT_FILENAME = "todo_checkpoint.json"
 
+try:
+    from . import orchestrator_agent_caller as _agent_caller
+except ImportError:
+    if str(_ORCHESTRATOR_CALLER_PATH.parent) not in sys.path:
+        sys.path.insert(0, str(_ORCHESTRATOR_CALLER_PATH.parent))
+    import orchestrator_agent_caller as _agent_caller  # noqa: E402
+
+try:
+    from ...cancellation import current_token as _current_token
+except ImportError:
+
+    def _current_token():
+        return None
+
+
+try:
+    from ..search_index import invalidate_search_indexes
+except ImportError:
+
+    def invalidate_search_indexes(project_root=None):
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Checkpoint helpers
 # ---------------------------------------------------------------------------
@@ -61,7 +97,9 @@ def _save_checkpoint(checkpoint_path, completed_ids, results):
             "completed_ids": sorted(completed_ids),
             "results": results,
         }
-        path.write_text(json.dumps(data, ensure_ascii=True, indent=2), encoding="utf-8")
+        tmp = path.with_name("%s.%d.tmp" % (path.name, os.getpid()))
+        tmp.write_text(json.dumps(data, ensure_ascii=True, indent=2), encoding="utf-8")
+        os.replace(str(tmp), str(path))
     except Exception as exc:
         logger.debug("[todo_executor] checkpoint save failed (ignored): %s", exc)
 
@@ -78,74 +116,42 @@ def _resolve_checkpoint_path(session_dir):
 # ---------------------------------------------------------------------------
 
 
-def _execute_single_todo(todo_item):
-    """Call orchestrator_agent_caller.py for one TODO item.
+def _execute_single_todo(todo_item, token=None):
+    """Run one TODO item through the claude CLI, in-process.
+
+    Builds the same result payload orchestrator_agent_caller.main() prints,
+    without the intermediate interpreter.  The CLI subprocess is killed
+    when *token* (the step's CancellationToken) is cancelled.
 
     Returns a result dict with status, llm_response, and error fields.
     Never raises.
     """
     todo_id = todo_item.get("id", "unknown")
-    todo_prompt = todo_item.get("prompt", "")
-    prompt_file = None
+    todo_prompt = (todo_item.get("prompt", "") or "").strip()
 
     try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".txt",
-            delete=False,
-            encoding="utf-8",
-        ) as tf:
-            tf.write(todo_prompt)
-            prompt_file = tf.name
-
-        cmd = [
-            sys.executable,
-            str(_ORCHESTRATOR_CALLER_PATH),
-            "--orchestration-prompt-file",
-            prompt_file,
-        ]
+        if not todo_prompt:
+            return {"status": "FAILED", "todo_id": todo_id, "result": None, "error": "TODO has no prompt"}
 
         logger.info("[todo_executor] Executing TODO %s via orchestrator_agent_caller", todo_id)
 
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=_TODO_EXEC_TIMEOUT,
-        )
-
-        stdout = proc.stdout or ""
-        stderr_preview = (proc.stderr or "")[:200]
-
-        if proc.returncode != 0 and not stdout.strip():
-            return {
-                "status": "FAILED",
-                "todo_id": todo_id,
-                "result": None,
-                "error": "subprocess exit %d: %s" % (proc.returncode, stderr_preview),
-            }
-
-        parsed = {}
-        try:
-            if stdout.strip():
-                parsed = json.loads(stdout)
-        except (json.JSONDecodeError, ValueError):
-            parsed = {"llm_response": stdout.strip()}
+        llm_response, err = _agent_caller._call_claude_cli(todo_prompt, timeout=_TODO_EXEC_TIMEOUT, token=token)
+        if err:
+            return {"status": "FAILED", "todo_id": todo_id, "result": None, "error": err}
 
         return {
             "status": "SUCCESS",
             "todo_id": todo_id,
-            "result": parsed,
+            "result": {
+                "status": "SUCCESS",
+                "agent_output": _agent_caller._parse_agent_output(llm_response),
+                "llm_response": llm_response,
+                "prompt_chars": len(todo_prompt),
+                "schema_warnings": _agent_caller._verify_result_schema(llm_response),
+            },
             "error": None,
         }
 
-    except subprocess.TimeoutExpired:
-        return {
-            "status": "FAILED",
-            "todo_id": todo_id,
-            "result": None,
-            "error": "subprocess timed out after %ds" % _TODO_EXEC_TIMEOUT,
-        }
     except Exception as exc:
         return {
             "status": "FAILED",
@@ -153,12 +159,68 @@ def _execute_single_todo(todo_item):
             "result": None,
             "error": str(exc),
         }
-    finally:
-        if prompt_file:
-            try:
-                Path(prompt_file).unlink(missing_ok=True)
-            except Exception:
-                pass
+
+
+# ---------------------------------------------------------------------------
+# DAG scheduling
+# ---------------------------------------------------------------------------
+
+
+def _todo_key(todo_item, index):
+    """Scheduling key: the TODO id, or a synthetic key for id-less items."""
+    todo_id = todo_item.get("id", "")
+    return todo_id if todo_id else "#%d" % index
+
+
+def _build_dag(todo_list, completed_ids):
+    """Return (keys, deps, dependents) for the TODOs still to run.
+
+    Dependencies on unknown IDs or on TODOs already completed in the
+    checkpoint are treated as satisfied.  Duplicate IDs keep the first item.
+    """
+    keys = []
+    seen = set()
+    for index, todo_item in enumerate(todo_list):
+        key = _todo_key(todo_item, index)
+        if key in seen:
+            key = "#%d" % index
+        seen.add(key)
+        keys.append(key)
+
+    pending = {key for key in keys if key not in completed_ids}
+    deps = {}
+    dependents = {key: [] for key in pending}
+    for key, todo_item in zip(keys, todo_list):
+        if key not in pending:
+            continue
+        raw = todo_item.get("depends_on") or []
+        if isinstance(raw, str):
+            raw = [raw]
+        deps[key] = {dep for dep in raw if dep in pending and dep != key}
+        for dep in deps[key]:
+            dependents[dep].append(key)
+    return keys, deps, dependents
+
+
+def _critical_path_lengths(keys, deps, dependents):
+    """Longest chain of pending TODOs starting at each node (itself included)."""
+    lengths = {}
+    order = {key: i for i, key in enumerate(keys)}
+
+    def visit(key, stack):
+        if key in lengths:
+            return lengths[key]
+        if key in stack:
+            return 0  # cycle: broken later by the scheduler
+        stack.add(key)
+        longest = max((visit(child, stack) for child in dependents[key]), default=0)
+        stack.discard(key)
+        lengths[key] = longest + 1
+        return lengths[key]
+
+    for key in sorted(deps, key=order.get):
+        visit(key, set())
+    return lengths
 
 
 # ---------------------------------------------------------------------------
@@ -171,23 +233,32 @@ def execute_todo_list(
     todo_list: List[Dict[str, Any]],
     checkpoint_manager: Optional[Any] = None,
     step_number: int = 0,
+    max_parallel: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    """Execute a list of TODO items, resuming from sidecar checkpoint if present.
+    """Execute a list of TODO items as a dependency DAG, resuming from checkpoint.
 
     For each TODO in todo_list:
       - Skips items whose ID already appears in the checkpoint's completed_ids.
-      - Calls orchestrator_agent_caller.py as a subprocess with the TODO prompt.
-      - Saves the sidecar checkpoint after each completion.
+      - Waits until every TODO named in its depends_on has finished, then
+        runs it on the worker pool - or, when one of them did not succeed,
+        reports it as SKIPPED without running it (not checkpointed, so a
+        resume retries it).
+      - Saves the sidecar checkpoint as soon as it completes.
+
+    Among ready TODOs the one heading the longest remaining chain runs first.
+    A dependency cycle never deadlocks: the earliest blocked TODO is released
+    with a warning.
 
     Args:
         state: FlowState dict providing session_dir and project_root.
         todo_list: List of TODO dicts from todo_decomposer.
         checkpoint_manager: Reserved for future use; ignored when None.
         step_number: Pipeline step number used in log messages.
+        max_parallel: TODOs run concurrently (default: STEP0_TODO_MAX_PARALLEL).
 
     Returns:
-        List of per-TODO result dicts, each containing todo_id, status,
-        result, and error fields.
+        List of per-TODO result dicts in todo_list order, each containing
+        todo_id, status, result, and error fields.
     """
     session_dir = state.get("session_dir", "") or ""
     checkpoint_path = _resolve_checkpoint_path(session_dir)
@@ -200,37 +271,109 @@ def execute_todo_list(
             len(completed_ids),
         )
 
-    execution_results: List[Dict[str, Any]] = []
+    keys, deps, dependents = _build_dag(todo_list, completed_ids)
+    results_by_key: Dict[str, Dict[str, Any]] = {}
 
-    for todo_item in todo_list:
-        todo_id = todo_item.get("id", "")
+    for key, todo_item in zip(keys, todo_list):
+        if key in deps:
+            continue
+        logger.info("[todo_executor] step=%d Skipping completed TODO %s", step_number, key)
+        results_by_key[key] = {
+            "status": "SKIPPED",
+            "todo_id": key,
+            "result": checkpoint_results.get(key, {}),
+            "error": None,
+        }
 
-        if todo_id and todo_id in completed_ids:
-            logger.info("[todo_executor] step=%d Skipping completed TODO %s", step_number, todo_id)
-            skipped_result = checkpoint_results.get(todo_id, {})
-            execution_results.append(
+    if deps:
+        items = dict(zip(keys, todo_list))
+        order = {key: i for i, key in enumerate(keys)}
+        lengths = _critical_path_lengths(keys, deps, dependents)
+        width = max(1, min(max_parallel or _TODO_MAX_PARALLEL, len(deps)))
+        save_lock = threading.Lock()
+        upstream = {key: set(parents) for key, parents in deps.items()}
+        unsuccessful = set()
+        token = _current_token()
+
+        def ready_entry(key):
+            return (-lengths.get(key, 1), order[key], key)
+
+        ready = [ready_entry(key) for key in deps if not deps[key]]
+        heapq.heapify(ready)
+        blocked = {key for key in deps if deps[key]}
+
+        def release(key):
+            failed_deps = sorted(upstream[key] & unsuccessful)
+            if not failed_deps:
+                heapq.heappush(ready, ready_entry(key))
+                return
+            finish(
+                key,
                 {
                     "status": "SKIPPED",
-                    "todo_id": todo_id,
-                    "result": skipped_result,
-                    "error": None,
-                }
+                    "todo_id": key,
+                    "result": None,
+                    "error": "dependency did not succeed: %s" % ", ".join(failed_deps),
+                },
+                checkpoint=False,
             )
-            continue
 
-        item_result = _execute_single_todo(todo_item)
-        execution_results.append(item_result)
-
-        if todo_id:
-            completed_ids.add(todo_id)
-            checkpoint_results[todo_id] = item_result.get("result") or {}
-            _save_checkpoint(checkpoint_path, completed_ids, checkpoint_results)
+        def finish(key, item_result, checkpoint=True):
+            results_by_key[key] = item_result
+            logger.info(
+                "[todo_executor] step=%d TODO %s -> %s",
+                step_number,
+                key,
+                item_result.get("status", "UNKNOWN"),
+            )
+            if item_result.get("status") != "SUCCESS":
+                unsuccessful.add(key)
+            if checkpoint and items[key].get("id", "") == key:
+                with save_lock:
+                    completed_ids.add(key)
+                    checkpoint_results[key] = item_result.get("result") or {}
+                    _save_checkpoint(checkpoint_path, completed_ids, checkpoint_results)
+            for child in dependents[key]:
+                deps[child].discard(key)
+                if not deps[child] and child in blocked:
+                    blocked.discard(child)
+                    release(child)
 
         logger.info(
-            "[todo_executor] step=%d TODO %s -> %s",
+            "[todo_executor] step=%d Scheduling %d TODOs (width=%d, critical path=%d)",
             step_number,
-            todo_id,
-            item_result.get("status", "UNKNOWN"),
+            len(deps),
+            width,
+            max(lengths.values(), default=0),
         )
 
-    return execution_results
+        with ThreadPoolExecutor(max_workers=width, thread_name_prefix="todo-exec") as pool:
+            running = {}
+            while ready or blocked or running:
+                if not ready and not running:
+                    key = min(blocked, key=order.get)
+                    logger.warning(
+                        "[todo_executor] step=%d dependency cycle at TODO %s (waiting on %s); running it anyway",
+                        step_number,
+                        key,
+                        ", ".join(sorted(deps[key])),
+                    )
+                    blocked.discard(key)
+                    release(key)
+                    continue
+                while ready and len(running) < width:
+                    key = heapq.heappop(ready)[2]
+                    running[pool.submit(_execute_single_todo, items[key], token)] = key
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    try:
+                        item_result = future.result()
+                    except Exception as exc:
+                        item_result = {"status": "FAILED", "todo_id": key, "result": None, "error": str(exc)}
+                    finish(key, item_result)
+
+        # The TODO agents edit project files: later searches must re-walk
+        invalidate_search_indexes(state.get("project_root") or None)
+
+    return [results_by_key[key] for key in keys]
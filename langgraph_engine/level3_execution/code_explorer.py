@@ -8,6 +8,10 @@ WORKFLOW.md SPEC:
 - Read: offset/limit (max 500 lines per file)
 - Grep: head_limit (max 50 matches)
 - Search: max_results optimization (max 10 results)
+
+Grep, Search and find_relevant_files are served from the per-project
+SearchIndex (BM25 inverted index + trigram index, see search_index.py), which
+skips excluded directories and only re-reads files changed since the last run.
 """
 
 from pathlib import Path
@@ -23,6 +27,13 @@ try:
 except ImportError:
     _PERF_AVAILABLE = False
 
+try:
+    from .search_index import get_search_index
+
+    _INDEX_AVAILABLE = True
+except ImportError:
+    _INDEX_AVAILABLE = False
+
 
 def tool_read(
     file_path: str,
@@ -100,15 +111,16 @@ def tool_grep(
         root = base_path if base_path is not None else Path.cwd()
         matches: List[str] = []
         match_count = 0
+        needle = pattern.lower()
 
-        for file_path in root.glob(glob_pattern):
+        for file_path in _grep_candidate_files(root, pattern, glob_pattern):
             if not file_path.is_file():
                 continue
 
             try:
                 with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                     for line_num, line in enumerate(f, 1):
-                        if pattern.lower() in line.lower():
+                        if needle in line.lower():
                             rel_path = file_path.relative_to(root)
                             matches.append(f"{rel_path}:{line_num}: {line.strip()}")
                             match_count += 1
@@ -128,6 +140,19 @@ def tool_grep(
         return f"Error in grep: {e}"
 
 
+def _grep_candidate_files(root: Path, pattern: str, glob_pattern: str):
+    """Return files that may contain *pattern*.
+
+    Uses the trigram index when it covers *glob_pattern*; otherwise falls back
+    to a plain glob over the tree.
+    """
+    if _INDEX_AVAILABLE and root.is_dir():
+        index = get_search_index(root)
+        if index.can_serve_glob(glob_pattern):
+            return [root / rel for rel in index.grep_candidates(pattern, glob_pattern)]
+    return root.glob(glob_pattern)
+
+
 def tool_search(
     query: str,
     max_results: int = 10,
@@ -151,6 +176,13 @@ def tool_search(
         max_results = min(max_results, 10)
 
         root = base_path if base_path is not None else Path.cwd()
+
+        if _INDEX_AVAILABLE and root.is_dir():
+            ranked = get_search_index(root).search(query, max_results=max_results)
+            result = f"=== Search: {query} ({len(ranked)} matches) ===\n"
+            result += "\n".join(f"{path}: {count} matches" for path, _score, count in ranked)
+            return result
+
         keywords = query.lower().split()[:5]  # Take first 5 keywords
         results: Dict[str, int] = {}
 
@@ -332,6 +364,14 @@ def find_relevant_files(requirement: str, root: str) -> List[str]:
 
         relevant: List[str] = []
         keywords = requirement.lower().split()[:5]  # Get first 5 keywords
+        source_exts = (".py", ".java", ".js", ".ts", ".go")
+
+        if _INDEX_AVAILABLE:
+            for rel_path in get_search_index(root_path).file_paths(source_exts):
+                filename_lower = rel_path.rsplit("/", 1)[-1].lower()
+                if any(len(kw) > 2 and kw in filename_lower for kw in keywords):
+                    relevant.append(str(Path(rel_path)))
+            return relevant[:10]
 
         # Search for source files with matching names or content
         for pattern in ["*.py", "*.java", "*.js", "*.ts", "*.go"]:
@@ -22,6 +22,13 @@ try:
 except ImportError:
     _DOC_SESSION_LOGS_DIR = Path.home() / ".claude" / "logs" / "sessions"
 
+try:
+    from ..core.file_walker import is_excluded_dir
+    from ..core.source_repository import get_source_repository
+except ImportError:
+    is_excluded_dir = None
+    get_source_repository = None
+
 logger = logging.getLogger(__name__)
 
 # GitHub owner for generated docs (configurable via env var)
@@ -51,6 +58,34 @@ class CodebaseAnalyzer:
     def __init__(self, project_root: str = "."):
         self.root = Path(project_root)
         self.logger = logging.getLogger(__name__)
+        self._tree_names = None  # (file names, dir names) from one walk
+
+    # ------------------------------------------------------------------
+    # Shared inputs (one tree walk, one read per manifest)
+    # ------------------------------------------------------------------
+
+    def _names(self) -> Tuple[set, set]:
+        """Return (file_names, dir_names) found under the project root.
+
+        Computed with a single pruned os.walk (excluded dirs such as .git,
+        node_modules and virtualenvs are not descended into) and reused by
+        every detector instead of one rglob per extension or indicator.
+        """
+        if self._tree_names is None:
+            files, dirs = set(), set()
+            for _dirpath, dirnames, filenames in os.walk(self.root):
+                if is_excluded_dir is not None:
+                    dirnames[:] = [d for d in dirnames if not is_excluded_dir(d)]
+                dirs.update(dirnames)
+                files.update(filenames)
+            self._tree_names = (files, dirs)
+        return self._tree_names
+
+    def _read_text(self, path: Path) -> str:
+        """Read a manifest through the shared SourceRepository (raises OSError)."""
+        if get_source_repository is not None:
+            return get_source_repository().get_text(path)
+        return path.read_text()
 
     def analyze(self) -> ProjectContext:
         """Scan codebase and extract context."""
@@ -116,8 +151,10 @@ class CodebaseAnalyzer:
             ".kt": "Kotlin",
         }
 
+        files, dirs = self._names()
+        suffixes = {os.path.splitext(n)[1] for n in files} | {os.path.splitext(n)[1] for n in dirs}
         for ext, lang in extensions_map.items():
-            if list(self.root.rglob(f"*{ext}")):
+            if ext in suffixes:
                 languages.add(lang)
 
         return sorted(list(languages))
@@ -139,9 +176,10 @@ class CodebaseAnalyzer:
             "Kubernetes": "k8s|kubernetes|helm",
         }
 
+        files, dirs = self._names()
         for framework, indicator in checks.items():
             for part in indicator.split("|"):
-                if list(self.root.rglob(part)):
+                if part in files or part in dirs:
                     frameworks.add(framework)
                     break
 
@@ -181,11 +219,12 @@ class CodebaseAnalyzer:
     def _detect_tests(self) -> Tuple[bool, str]:
         """Detect test framework and command."""
         # Check for test files
-        test_files = list(self.root.rglob("test_*.py")) + list(self.root.rglob("*_test.py"))
+        files, _dirs = self._names()
+        has_test_files = any(n.endswith(".py") and (n.startswith("test_") or n.endswith("_test.py")) for n in files)
 
-        if test_files:
+        if has_test_files:
             # Check for pytest
-            if (self.root / "pytest.ini").exists() or list(self.root.rglob("conftest.py")):
+            if (self.root / "pytest.ini").exists() or "conftest.py" in files:
                 return True, "pytest"
             # Check for unittest
             return True, "python -m unittest"
@@ -194,10 +233,9 @@ class CodebaseAnalyzer:
         package_json = self.root / "package.json"
         if package_json.exists():
             try:
-                with open(package_json) as f:
-                    pkg = json.load(f)
-                    if pkg.get("scripts", {}).get("test"):
-                        return True, "npm test"
+                pkg = json.loads(self._read_text(package_json))
+                if pkg.get("scripts", {}).get("test"):
+                    return True, "npm test"
             except Exception:
                 pass
 
@@ -226,9 +264,8 @@ class CodebaseAnalyzer:
         req_file = self.root / "requirements.txt"
         if req_file.exists():
             try:
-                with open(req_file) as f:
-                    lines = f.readlines()[:10]  # First 10 deps
-                    deps.extend([line.strip() for line in lines if line.strip()])
+                lines = self._read_text(req_file).splitlines()[:10]  # First 10 deps
+                deps.extend([line.strip() for line in lines if line.strip()])
             except Exception:
                 pass
 
@@ -236,9 +273,8 @@ class CodebaseAnalyzer:
         pkg_file = self.root / "package.json"
         if pkg_file.exists():
             try:
-                with open(pkg_file) as f:
-                    pkg = json.load(f)
-                    deps.extend(list(pkg.get("dependencies", {}).keys())[:10])
+                pkg = json.loads(self._read_text(pkg_file))
+                deps.extend(list(pkg.get("dependencies", {}).keys())[:10])
             except Exception:
                 pass
 
@@ -252,7 +288,7 @@ class CodebaseAnalyzer:
             vf_path = self.root / vf
             if vf_path.exists():
                 try:
-                    return vf_path.read_text().strip().split("\n")[0]
+                    return self._read_text(vf_path).strip().split("\n")[0]
                 except Exception:
                     pass
 
@@ -260,8 +296,7 @@ class CodebaseAnalyzer:
         pkg_file = self.root / "package.json"
         if pkg_file.exists():
             try:
-                with open(pkg_file) as f:
-                    return json.load(f).get("version", "0.1.0")
+                return json.loads(self._read_text(pkg_file)).get("version", "0.1.0")
             except Exception:
                 pass
 
@@ -269,7 +304,7 @@ class CodebaseAnalyzer:
         setup_file = self.root / "setup.py"
         if setup_file.exists():
             try:
-                content = setup_file.read_text()
+                content = self._read_text(setup_file)
                 import re
 
                 match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
@@ -154,6 +154,13 @@ class Level3DocumentationManager:
                 created.extend(["uml/%s.md" % n for n in uml_result])
                 logger.info("UML: generated %d diagrams", len(uml_result))
 
+                # Optional SVG renders (sends diagram source to KROKI_SERVER)
+                import os as _os
+
+                if _os.environ.get("UML_RENDER_SVG", "0") == "1":
+                    rendered = uml_gen.render_diagrams(uml_result)
+                    created.extend(["uml/%s.svg" % n for n, path in rendered.items() if path])
+
                 # Also generate draw.io versions for all diagrams
                 cg = uml_gen._get_call_graph()
                 drawio_data = {
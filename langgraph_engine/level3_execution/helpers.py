@@ -7,6 +7,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+from ..cancellation import run_subprocess
+
 try:
     import sys as _sys
 
@@ -82,7 +84,7 @@ def call_execution_script(script_name: str, args: list = None, model_tier: str =
         if model_tier:
             env["MODEL_TIER"] = model_tier
 
-        result = subprocess.run(
+        result = run_subprocess(
             cmd,
             capture_output=True,
             text=True,
@@ -166,7 +168,7 @@ def call_streaming_script(script_name: str, args: list = None, timeout: int = No
         if DEBUG:
             print(f"[L3-DEBUG] Streaming: {script_name} (timeout={timeout}s)", file=sys.stderr)
 
-        result = subprocess.run(
+        result = run_subprocess(
             cmd,
             stdout=subprocess.PIPE,
             stderr=None,  # Inherit: live output visible in terminal
@@ -59,9 +59,18 @@ except ImportError:  # pragma: no cover
 
 
 try:
-    from ..steps8to12_github import Level3GitHubWorkflow
+    from ..search_index import invalidate_search_indexes
 except ImportError:  # pragma: no cover
-    Level3GitHubWorkflow = None  # type: ignore[misc,assignment]
+
+    def invalidate_search_indexes(project_root=None) -> None:  # type: ignore[misc]
+        return None
+
+
+from ...core.lazy_loader import LazyLoader
+
+# Imported on first use, as in step_implementations_5to9.  None = unavailable.
+Level3GitHubWorkflow = LazyLoader.UNLOADED
+_WORKFLOW_MODULE = "langgraph_engine.level3_execution.steps8to12_github"
 
 
 # ---------------------------------------------------------------------------
@@ -179,6 +188,8 @@ def step10_implementation_execution(state: FlowState) -> Dict[str, Any]:
             temperature=0.2,
             timeout=timeout,
         )
+        # The model edits project files: later searches must re-walk the tree
+        invalidate_search_indexes(project_root)
 
         if not llm_response:
             result["step10_error"] = "llm_call returned None or empty response"
@@ -291,7 +302,8 @@ def step11_pull_request_review(state: FlowState) -> Dict[str, Any]:
             return result
 
         # --- Gate: Level3GitHubWorkflow must be importable ---
-        if Level3GitHubWorkflow is None:
+        workflow_cls = LazyLoader.resolve(globals(), "Level3GitHubWorkflow", _WORKFLOW_MODULE)
+        if workflow_cls is None:
             result["step11_status"] = "SKIPPED"
             result["step11_error"] = "Level3GitHubWorkflow import failed; skipping PR creation"
             logger.warning("[Step11] %s", result["step11_error"])
@@ -345,7 +357,7 @@ def step11_pull_request_review(state: FlowState) -> Dict[str, Any]:
             auto_merge,
         )
 
-        github_wf = Level3GitHubWorkflow(session_dir=session_dir, repo_path=project_root)
+        github_wf = workflow_cls(session_dir=session_dir, repo_path=project_root)
         pr_result: Dict[str, Any] = github_wf.step11_create_pull_request(
             issue_number=issue_number,
             branch_name=branch_name,
@@ -36,10 +36,11 @@ try:
 except ImportError:
     FlowState = dict  # type: ignore[misc,assignment]
 
-try:
-    from ..steps8to12_github import Level3GitHubWorkflow
-except ImportError:  # pragma: no cover
-    Level3GitHubWorkflow = None  # type: ignore[misc,assignment]
+from ...core.lazy_loader import LazyLoader
+
+# Imported on first use, as in step_implementations_5to9.  None = unavailable.
+Level3GitHubWorkflow = LazyLoader.UNLOADED
+_WORKFLOW_MODULE = "langgraph_engine.level3_execution.steps8to12_github"
 
 
 # ---------------------------------------------------------------------------
@@ -80,9 +81,10 @@ def step12_issue_closure(state: FlowState) -> Dict[str, Any]:
         if skill:
             approach += " using %s" % skill
 
-        if Level3GitHubWorkflow is not None:
+        workflow_cls = LazyLoader.resolve(globals(), "Level3GitHubWorkflow", _WORKFLOW_MODULE)
+        if workflow_cls is not None:
             try:
-                workflow = Level3GitHubWorkflow(session_dir=session_path, repo_path=project_root)
+                workflow = workflow_cls(session_dir=session_path, repo_path=project_root)
                 result = workflow.step12_close_issue(
                     issue_number=int(issue_id) if issue_id.isdigit() else 0,
                     pr_number=int(pr_id) if pr_id.isdigit() else 0,
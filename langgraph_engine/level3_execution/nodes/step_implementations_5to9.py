@@ -34,10 +34,13 @@ try:
 except ImportError:
     FlowState = dict  # type: ignore[misc,assignment]
 
-try:
-    from ..steps8to12_github import Level3GitHubWorkflow
-except ImportError:  # pragma: no cover
-    Level3GitHubWorkflow = None  # type: ignore[misc,assignment]
+from ...core.lazy_loader import LazyLoader
+
+# Level3GitHubWorkflow drags in the GitHub client, transport and git stack;
+# resolve it on first use so building the graph (and hook-mode runs, which
+# never reach these steps) does not pay for it.  None = unavailable.
+Level3GitHubWorkflow = LazyLoader.UNLOADED
+_WORKFLOW_MODULE = "langgraph_engine.level3_execution.steps8to12_github"
 
 
 # ---------------------------------------------------------------------------
@@ -177,9 +180,10 @@ def step8_github_issue_creation(state: FlowState) -> Dict[str, Any]:
         if isinstance(plan_text, dict):
             plan_text = str(plan_text)
 
-        if Level3GitHubWorkflow is not None:
+        workflow_cls = LazyLoader.resolve(globals(), "Level3GitHubWorkflow", _WORKFLOW_MODULE)
+        if workflow_cls is not None:
             try:
-                workflow = Level3GitHubWorkflow(session_dir=session_path or ".", repo_path=project_root)
+                workflow = workflow_cls(session_dir=session_path or ".", repo_path=project_root)
                 result = workflow.step8_create_issue(
                     title=title,
                     description=body,
@@ -241,9 +245,10 @@ def step9_branch_creation(state: FlowState) -> Dict[str, Any]:
             logger.info("Step 9: Skipping branch creation -- no GitHub issue created (issue_id=0)")
             return {"step9_branch_name": "", "step9_branch_created": False, "step9_status": "SKIPPED"}
 
-        if Level3GitHubWorkflow is not None:
+        workflow_cls = LazyLoader.resolve(globals(), "Level3GitHubWorkflow", _WORKFLOW_MODULE)
+        if workflow_cls is not None:
             try:
-                workflow = Level3GitHubWorkflow(session_dir=session_path, repo_path=project_root)
+                workflow = workflow_cls(session_dir=session_path, repo_path=project_root)
                 result = workflow.step9_create_branch(
                     issue_number=int(issue_id) if issue_id.isdigit() else 0,
                     label=branch_label,
@@ -10,6 +10,15 @@ Combines all quality signals before allowing a PR to merge:
 Each gate runs independently in a try/except block so a failure in one
 gate never prevents the others from evaluating.
 
+Gates are evaluated concurrently as a small dependency graph on worker
+threads.  Inputs several gates need (test file discovery, the merged test
+reference index, the CallGraph) are computed once per evaluation as graph
+nodes of their own, so the gate phase takes roughly as long as its slowest
+gate.  Every node has a timeout (gate_timeout_seconds) and reports its
+wall time.  A node that overruns has its cancellation token cancelled,
+which kills the subprocesses it started (sonar-scanner), and a gate that
+timed out is reported as not passed, for manual review.
+
 Usage:
     from quality_gate import evaluate_quality_gate, generate_gate_report
 
@@ -27,8 +36,11 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -44,8 +56,13 @@ _DEFAULT_CONFIG: Dict[str, Any] = {
     "allow_breaking_changes": False,  # Block if CallGraph detects breaking changes
     "require_tests_for_modified": True,  # Block if modified files have no test files
     "max_cyclomatic_increase": 10,  # Block if avg cyclomatic complexity rises by >10
+    "gate_timeout_seconds": 120.0,  # Per-gate wall-clock limit (timeout -> not passed, MANUAL_REVIEW)
+    "gate_max_workers": 4,  # Max gates evaluated at once
 }
 
+# Top-level directories searched by the tests-exist gate.
+_TEST_DIR_NAMES = ("tests", "test", "__tests__", "spec", "specs")
+
 # ---------------------------------------------------------------------------
 # Lazy imports
 # ---------------------------------------------------------------------------
@@ -81,6 +98,36 @@ def _import_coverage_analyzer():
             return None
 
 
+def _import_coverage_module():
+    """Lazy import of the coverage_analyzer module (shared-input helpers)."""
+    try:
+        from .. import coverage_analyzer
+
+        return coverage_analyzer
+    except ImportError:
+        try:
+            import coverage_analyzer
+
+            return coverage_analyzer
+        except ImportError:
+            return None
+
+
+def _import_cancellation():
+    """Lazy import of the cancellation module (per-node tokens)."""
+    try:
+        from .. import cancellation
+
+        return cancellation
+    except ImportError:
+        try:
+            import cancellation
+
+            return cancellation
+        except ImportError:
+            return None
+
+
 def _import_test_generator():
     """Lazy import of test_generator.generate_tests_for_modified_files."""
     try:
@@ -241,15 +288,35 @@ def _evaluate_sonar_gate(
     return gate
 
 
+def _coverage_from_state(state: Dict[str, Any]) -> Tuple[float, float]:
+    """Return (coverage_before, coverage_after) stored in state, or (0.0, 0.0)."""
+    for key in (
+        "step10_coverage_results",
+        "step11_coverage_results",
+        "step10_test_scope",
+    ):
+        candidate = state.get(key)
+        if candidate and isinstance(candidate, dict):
+            coverage_before = float(candidate.get("coverage_before", 0.0) or 0.0)
+            coverage_after = float(
+                candidate.get("coverage_after_estimate", 0.0) or candidate.get("coverage_after", 0.0) or 0.0
+            )
+            return coverage_before, coverage_after
+    return 0.0, 0.0
+
+
 def _evaluate_coverage_gate(
     project_root: str,
     state: Dict[str, Any],
     config: Dict[str, Any],
     modified_files: List[str],
+    call_graph: Any = None,
+    reference_index: Any = None,
 ) -> Dict[str, Any]:
     """Gate 2: Test coverage.
 
-    Reads coverage data from state or runs suggest_test_scope().
+    Reads coverage data from state or runs suggest_test_scope(), reusing a
+    pre-built CallGraph and TestReferenceIndex when the caller has them.
 
     Returns a gate result dict.
     """
@@ -268,30 +335,21 @@ def _evaluate_coverage_gate(
         gate["threshold"] = threshold
 
         # Read pre-computed coverage from state
-        coverage_before: float = 0.0
-        coverage_after: float = 0.0
-
-        # Check various state keys where coverage may be stored
-        for key in (
-            "step10_coverage_results",
-            "step11_coverage_results",
-            "step10_test_scope",
-        ):
-            candidate = state.get(key)
-            if candidate and isinstance(candidate, dict):
-                coverage_before = float(candidate.get("coverage_before", 0.0) or 0.0)
-                coverage_after = float(
-                    candidate.get("coverage_after_estimate", 0.0) or candidate.get("coverage_after", 0.0) or 0.0
-                )
-                break
+        coverage_before, coverage_after = _coverage_from_state(state)
 
         # If no state data, run suggest_test_scope
         if coverage_before == 0.0 and coverage_after == 0.0:
             suggest_fn = _import_coverage_analyzer()
             if suggest_fn is not None:
+                shared: Dict[str, Any] = {}
+                if call_graph is not None:
+                    shared["call_graph"] = call_graph
+                if reference_index is not None:
+                    shared["reference_index"] = reference_index
                 scope = suggest_fn(
                     project_root,
                     modified_files=modified_files or None,
+                    **shared,
                 )
                 coverage_before = float(scope.get("coverage_before", 0.0) or 0.0)
                 coverage_after = float(scope.get("coverage_after_estimate", 0.0) or 0.0)
@@ -395,6 +453,7 @@ def _evaluate_tests_exist_gate(
     state: Dict[str, Any],
     config: Dict[str, Any],
     modified_files: List[str],
+    test_files: Optional[Dict[Path, List[Path]]] = None,
 ) -> Dict[str, Any]:
     """Gate 4: Test files exist for every modified source file.
 
@@ -402,6 +461,9 @@ def _evaluate_tests_exist_gate(
     at the project's test directories.  Also checks test_generator output
     stored in state.
 
+    *test_files* is the shared {test_dir: [*.py]} map from
+    _walk_test_dirs(); the directories are walked here when omitted.
+
     Returns a gate result dict.
     """
     gate: Dict[str, Any] = {
@@ -423,18 +485,15 @@ def _evaluate_tests_exist_gate(
         test_file_names: set = set()
 
         # Collect test files from common test directories
-        for test_dir_name in ("tests", "test", "__tests__", "spec", "specs"):
-            test_dir = root / test_dir_name
-            if test_dir.is_dir():
+        if test_files is None:
+            test_files = _walk_test_dirs(project_root)
+        for test_dir_name in _TEST_DIR_NAMES:
+            for f in test_files.get(root / test_dir_name, ()):
+                test_file_names.add(f.name.lower())
+                # Store relative path too
                 try:
-                    for f in test_dir.rglob("*.py"):
-                        test_file_names.add(f.name.lower())
-                        # Store relative path too
-                        try:
-                            test_file_names.add(str(f.relative_to(root)).replace("\\", "/").lower())
-                        except ValueError:
-                            pass
-                except OSError:
+                    test_file_names.add(str(f.relative_to(root)).replace("\\", "/").lower())
+                except ValueError:
                     pass
 
         # Also consult test_generator results stored in state
@@ -562,6 +621,166 @@ def _evaluate_verification_gate(
     return gate
 
 
+# ---------------------------------------------------------------------------
+# Shared inputs and concurrent gate graph
+# ---------------------------------------------------------------------------
+
+
+def _walk_test_dirs(project_root: str) -> Dict[Path, List[Path]]:
+    """Walk every test directory once and return {test_dir: [*.py files]}.
+
+    Covers the top-level test dirs used by the tests-exist gate plus the
+    nested ones coverage_analyzer discovers, so both consumers share one walk.
+    """
+    root = Path(project_root)
+    test_dirs: List[Path] = [root / name for name in _TEST_DIR_NAMES]
+    cov = _import_coverage_module()
+    if cov is not None:
+        try:
+            test_dirs.extend(d for d in cov._find_test_dirs(root) if d not in test_dirs)
+        except Exception as exc:
+            logger.debug("quality_gate: nested test dir discovery failed: %s", exc)
+
+    result: Dict[Path, List[Path]] = {}
+    for test_dir in test_dirs:
+        if not test_dir.is_dir():
+            continue
+        try:
+            result[test_dir] = list(test_dir.rglob("*.py"))
+        except OSError:
+            result[test_dir] = []
+    return result
+
+
+class _GateInputs:
+    """Inputs computed once per evaluation and shared by all gates.
+
+    Attributes are filled in by the preparation nodes of the gate graph and
+    stay None when the corresponding node failed, timed out or was not
+    needed; gates then fall back to computing what they need themselves.
+    """
+
+    def __init__(self, project_root: str, modified_files: List[str]) -> None:
+        self.project_root = project_root
+        self.modified_files = modified_files
+        self.test_files: Optional[Dict[Path, List[Path]]] = None
+        self.reference_index: Any = None
+        self.call_graph: Any = None
+
+    def prepare_test_files(self) -> None:
+        self.test_files = _walk_test_dirs(self.project_root)
+
+    def prepare_reference_index(self) -> None:
+        cov = _import_coverage_module()
+        if cov is None:
+            return
+        files: Optional[List[Path]] = None
+        if self.test_files is not None:
+            files, seen = [], set()
+            for paths in self.test_files.values():
+                for path in paths:
+                    if cov._is_test_file(path) and str(path) not in seen:
+                        seen.add(str(path))
+                        files.append(path)
+        self.reference_index = cov._build_reference_index(self.project_root, test_files=files)
+
+    def prepare_call_graph(self) -> None:
+        cov = _import_coverage_module()
+        if cov is not None:
+            self.call_graph = cov._build_graph(Path(self.project_root))
+
+
+# Node spec: name -> (dependency names, zero-argument callable)
+_GateNodes = Dict[str, Tuple[Sequence[str], Callable[[], Any]]]
+
+
+def _run_gate_graph(
+    nodes: _GateNodes,
+    max_workers: int,
+    timeout_s: float,
+) -> Dict[str, Tuple[Any, float, str]]:
+    """Run *nodes* on worker threads, each as soon as its dependencies finish.
+
+    At most *max_workers* nodes run at once.  A node's clock starts when its
+    thread starts, so time spent waiting for dependencies or a free slot
+    never counts against *timeout_s*.  Each node runs under its own
+    CancellationToken.  A node that overruns is cancelled - killing any
+    subprocess it started through cancellation.run_subprocess - and
+    abandoned: its dependents run without its output, its slot is released,
+    and its thread finishes in the background with the late result
+    discarded.
+
+    Returns:
+        {name: (result, elapsed_ms, status)} with status one of
+        "ok" | "error" | "timeout".  result is None unless status is "ok".
+    """
+    pending = dict(nodes)
+    done: Dict[str, Tuple[Any, float, str]] = {}
+    running: Dict[str, float] = {}  # name -> monotonic start time
+    finished: "queue.Queue[Tuple[str, Any, Optional[BaseException], float]]" = queue.Queue()
+    slots = max(1, max_workers)
+    cancellation = _import_cancellation()
+    parent = cancellation.current_token() if cancellation is not None else None
+    tokens: Dict[str, Any] = {}
+
+    def _worker(name: str, fn: Callable[[], Any], token: Any) -> None:
+        try:
+            if token is None:
+                result = fn()
+            else:
+                with cancellation.use_token(token):
+                    result = fn()
+            error = None
+        except Exception as exc:
+            result, error = None, exc
+        finished.put((name, result, error, time.monotonic()))
+
+    while pending or running:
+        ready = [n for n, (deps, _) in pending.items() if all(d in done for d in deps)]
+        for name in ready[: slots - len(running)]:
+            fn = pending.pop(name)[1]
+            running[name] = time.monotonic()
+            token = None
+            if cancellation is not None:
+                token = tokens[name] = cancellation.CancellationToken("quality-gate-" + name, parent=parent)
+            threading.Thread(target=_worker, args=(name, fn, token), name="quality-gate-" + name, daemon=True).start()
+        if not running:
+            break  # unknown dependency names; nothing left can start
+
+        next_deadline = min(running.values()) + timeout_s
+        try:
+            item = finished.get(timeout=max(0.0, next_deadline - time.monotonic()))
+        except queue.Empty:
+            item = None
+        while item is not None:
+            name, result, error, finished_at = item
+            if name in running:  # late results of abandoned nodes are dropped
+                elapsed_ms = (finished_at - running.pop(name)) * 1000.0
+                if error is None:
+                    done[name] = (result, elapsed_ms, "ok")
+                else:
+                    logger.warning("quality_gate: node %s failed: %s", name, error)
+                    done[name] = (None, elapsed_ms, "error")
+            try:
+                item = finished.get_nowait()
+            except queue.Empty:
+                item = None
+
+        now = time.monotonic()
+        for name, started in list(running.items()):
+            elapsed = now - started
+            if elapsed >= timeout_s:
+                del running[name]
+                logger.warning("quality_gate: node %s timed out after %.1fs; cancelling it", name, elapsed)
+                if name in tokens:
+                    tokens[name].cancel("quality gate node timed out after %.0fs" % timeout_s)
+                done[name] = (None, elapsed * 1000.0, "timeout")
+
+    for name in pending:
+        done[name] = (None, 0.0, "error")
+    return done
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -598,7 +817,13 @@ def evaluate_quality_gate(
             "summary": str,
             "recommendation": str,   # "MERGE" | "FIX_AND_RETRY" | "MANUAL_REVIEW"
             "blocking_gates": [str],
+            "timings_ms": {node_name: float},   # gates and shared-input nodes
+            "wall_time_ms": float,
         }
+
+        Every gate dict also carries "elapsed_ms"; a gate that exceeded
+        gate_timeout_seconds is reported as not passed with
+        "timed_out": True, and the recommendation is MANUAL_REVIEW.
     """
     # Merge configs: defaults -> project file -> caller override
     effective_config = get_gate_config(project_root)
@@ -616,20 +841,64 @@ def evaluate_quality_gate(
         effective_config,
     )
 
-    # Run all five gates independently
-    sonar_gate = _evaluate_sonar_gate(project_root, state, effective_config, modified_files)
-    coverage_gate = _evaluate_coverage_gate(project_root, state, effective_config, modified_files)
-    breaking_gate = _evaluate_breaking_changes_gate(state, effective_config)
-    tests_gate = _evaluate_tests_exist_gate(project_root, state, effective_config, modified_files)
-    verification_gate = _evaluate_verification_gate(state)
-
-    gates = {
-        "sonar": sonar_gate,
-        "coverage": coverage_gate,
-        "breaking_changes": breaking_gate,
-        "tests_exist": tests_gate,
-        "verification": verification_gate,
+    # Shared inputs are only prepared when some gate will use them.
+    inputs = _GateInputs(project_root, modified_files)
+    needs_coverage_run = _coverage_from_state(state) == (0.0, 0.0)
+    cfg = effective_config
+
+    nodes: _GateNodes = {
+        "sonar": ((), lambda: _evaluate_sonar_gate(project_root, state, cfg, modified_files)),
+        "breaking_changes": ((), lambda: _evaluate_breaking_changes_gate(state, cfg)),
+        "verification": ((), lambda: _evaluate_verification_gate(state)),
     }
+    tests_deps: Tuple[str, ...] = ()
+    coverage_deps: Tuple[str, ...] = ()
+    if modified_files or needs_coverage_run:
+        nodes["test_files"] = ((), inputs.prepare_test_files)
+        tests_deps = ("test_files",)
+    if needs_coverage_run:
+        nodes["reference_index"] = (("test_files",), inputs.prepare_reference_index)
+        nodes["call_graph"] = ((), inputs.prepare_call_graph)
+        coverage_deps = ("reference_index", "call_graph")
+    nodes["coverage"] = (
+        coverage_deps,
+        lambda: _evaluate_coverage_gate(
+            project_root,
+            state,
+            cfg,
+            modified_files,
+            call_graph=inputs.call_graph,
+            reference_index=inputs.reference_index,
+        ),
+    )
+    nodes["tests_exist"] = (
+        tests_deps,
+        lambda: _evaluate_tests_exist_gate(project_root, state, cfg, modified_files, test_files=inputs.test_files),
+    )
+
+    timeout_s = float(cfg.get("gate_timeout_seconds", 120.0) or 120.0)
+    wall_start = time.monotonic()
+    outcomes = _run_gate_graph(nodes, int(cfg.get("gate_max_workers", 4) or 1), timeout_s)
+    wall_time_ms = round((time.monotonic() - wall_start) * 1000.0, 1)
+
+    gates: Dict[str, Dict[str, Any]] = {}
+    for name in ("sonar", "coverage", "breaking_changes", "tests_exist", "verification"):
+        result, elapsed_ms, status = outcomes[name]
+        if status == "ok" and isinstance(result, dict):
+            gate = result
+        elif status == "timeout":
+            gate = {
+                "passed": False,  # the gate did not evaluate; a human has to
+                "reason": f"Gate timed out after {timeout_s:.0f}s (manual review required)",
+                "timed_out": True,
+            }
+        else:
+            gate = {"passed": True, "reason": "Gate evaluation error (fail-safe pass)"}
+        gate["elapsed_ms"] = round(elapsed_ms, 1)
+        gates[name] = gate
+
+    sonar_gate = gates["sonar"]
+    breaking_gate = gates["breaking_changes"]
 
     # Determine which gates are blocking
     blocking_gates: List[str] = [name for name, result in gates.items() if not result.get("passed", True)]
@@ -648,7 +917,11 @@ def evaluate_quality_gate(
     # Recommendation
     if gate_passed:
         recommendation = "MERGE"
-    elif breaking_gate.get("risk_assessment") == "risky" or (sonar_gate.get("critical_count", 0) > 0):
+    elif (
+        breaking_gate.get("risk_assessment") == "risky"
+        or sonar_gate.get("critical_count", 0) > 0
+        or any(result.get("timed_out") for result in gates.values())
+    ):
         recommendation = "MANUAL_REVIEW"
     else:
         recommendation = "FIX_AND_RETRY"
@@ -659,6 +932,8 @@ def evaluate_quality_gate(
         "summary": summary,
         "recommendation": recommendation,
         "blocking_gates": blocking_gates,
+        "timings_ms": {name: round(outcome[1], 1) for name, outcome in outcomes.items()},
+        "wall_time_ms": wall_time_ms,
     }
 
 
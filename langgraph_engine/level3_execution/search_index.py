@@ -0,0 +1,598 @@
+"""
+Level 3 - Project Search Index
+
+Per-project, persistent search index backing the code_explorer tools.
+
+Two structures are maintained for every indexed text file:
+
+1. Token inverted index  - term -> {file: term frequency}, ranked with BM25.
+   Serves tool_search().
+2. Trigram index         - lowercase 3-gram -> {files}.  Serves tool_grep()
+   candidate filtering: only files containing every trigram of the required
+   literal(s) are opened and scanned line by line.
+
+The index is refreshed incrementally: a pruned walk (shared EXCLUDED_DIRS)
+stats every file and only files whose (mtime_ns, size) changed are re-read.
+Per-file postings are persisted as JSON under the cache base directory, so a
+warm run only pays for the directory walk.  Back-to-back queries share one
+walk; pipeline steps that write project files call invalidate_search_indexes()
+so the next query re-walks instead of serving pre-write results.
+
+Cache location: ~/.claude/logs/cache/search_index/<md5(project_root)>.json
+
+Usage::
+
+    from .search_index import get_search_index
+    index = get_search_index("/path/to/project")
+    ranked = index.search("checkpoint recovery", max_results=10)
+    candidates = index.grep_candidates("def resume", glob_pattern="**/*.py")
+
+ASCII-only (cp1252-safe for Windows).
+"""
+
+import functools
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+from ..core.file_walker import iter_project_files
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+_INDEX_FORMAT_VERSION = 2
+
+# Text files that are tokenised and trigram-indexed.
+INDEXED_EXTENSIONS = frozenset(
+    {
+        ".py",
+        ".java",
+        ".kt",
+        ".js",
+        ".jsx",
+        ".ts",
+        ".tsx",
+        ".go",
+        ".rs",
+        ".rb",
+        ".php",
+        ".cs",
+        ".c",
+        ".h",
+        ".cpp",
+        ".hpp",
+        ".swift",
+        ".scala",
+        ".sh",
+        ".md",
+        ".txt",
+        ".rst",
+        ".json",
+        ".yml",
+        ".yaml",
+        ".toml",
+        ".ini",
+        ".cfg",
+        ".xml",
+        ".html",
+        ".css",
+        ".sql",
+    }
+)
+
+# Files larger than this are not indexed (generated bundles, lockfiles, data).
+# They are still tracked by path and always returned as grep candidates, so
+# callers scan them directly instead of losing their matches.
+_MAX_INDEXED_FILE_BYTES = 1024 * 1024
+
+# A refresh walk is skipped when the previous one finished this recently.
+# explore_codebase issues one search and several greps back to back.  Writes
+# made by the pipeline reset the interval through invalidate_search_indexes().
+_REFRESH_INTERVAL_SECONDS = 2.0
+
+# BM25 parameters (standard Okapi defaults).
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+_DEFAULT_CACHE_BASE = os.environ.get("CACHE_BASE_DIR", "~/.claude/logs/cache")
+
+_IDENT_RE = re.compile(r"[A-Za-z0-9_]+")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+_REGEX_META = set(".^$*+?{}[]()|\\")
+
+
+# ---------------------------------------------------------------------------
+# Tokenisation helpers
+# ---------------------------------------------------------------------------
+
+
+def tokenize(text: str) -> List[str]:
+    """Split *text* into lowercase search terms.
+
+    Every identifier is emitted whole and, when compound, also split into its
+    snake_case and camelCase parts so ``getUserName`` matches ``user``.
+
+    Args:
+        text: Source text or query string.
+
+    Returns:
+        List of lowercase terms (duplicates preserved for term frequency).
+    """
+    terms: List[str] = []
+    for ident in _IDENT_RE.findall(text):
+        lowered = ident.lower()
+        terms.append(lowered)
+        parts = [p for chunk in ident.split("_") if chunk for p in _CAMEL_RE.findall(chunk)]
+        if len(parts) > 1:
+            terms.extend(p.lower() for p in parts)
+    return terms
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the set of lowercase 3-grams contained in *text*."""
+    lowered = text.lower()
+    return {lowered[i : i + 3] for i in range(len(lowered) - 2)}
+
+
+def required_literals(pattern: str, is_regex: bool = False) -> List[str]:
+    """Return literal substrings that any match of *pattern* must contain.
+
+    For plain substring patterns this is the pattern itself.  For regexes a
+    conservative extraction is done: patterns with alternation or groups
+    yield no literals (every file stays a candidate), otherwise maximal runs
+    of literal characters are collected, dropping a character that is made
+    optional by a following ``?``, ``*`` or ``{`` quantifier.
+
+    Args:
+        pattern:  Grep pattern.
+        is_regex: Treat *pattern* as a regular expression.
+
+    Returns:
+        Lowercase literal fragments of length >= 3 (may be empty).
+    """
+    if not is_regex:
+        return [pattern.lower()] if len(pattern) >= 3 else []
+    if re.search(r"(?<!\\)[|()]", pattern):
+        return []
+
+    literals: List[str] = []
+    run: List[str] = []
+
+    def _flush() -> None:
+        if len(run) >= 3:
+            literals.append("".join(run).lower())
+        run.clear()
+
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\" and i + 1 < len(pattern):
+            nxt = pattern[i + 1]
+            if nxt.isalnum():
+                _flush()  # character class such as \d, \w, \b
+            else:
+                run.append(nxt)
+            i += 2
+            continue
+        if ch in "?*{":
+            if run:
+                run.pop()
+            _flush()
+            if ch == "{":
+                close = pattern.find("}", i)
+                i = close + 1 if close != -1 else len(pattern)
+                continue
+        elif ch == "[":
+            _flush()
+            close = pattern.find("]", i + 1)
+            i = close + 1 if close != -1 else len(pattern)
+            continue
+        elif ch in _REGEX_META:
+            _flush()
+        else:
+            run.append(ch)
+        i += 1
+    _flush()
+    return literals
+
+
+@functools.lru_cache(maxsize=256)
+def _glob_regex(glob_pattern: str) -> "re.Pattern[str]":
+    """Compile a Path.glob-style pattern into a segment-aware regex.
+
+    ``*``, ``?`` and ``[...]`` never match ``/``; ``**`` as a whole segment
+    matches any number of directories (including none).
+    """
+    out: List[str] = []
+    i, n = 0, len(glob_pattern)
+    while i < n:
+        ch = glob_pattern[i]
+        if glob_pattern.startswith("**", i) and (i == 0 or glob_pattern[i - 1] == "/"):
+            if glob_pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+            elif i + 2 == n:
+                out.append(".*")
+                i += 2
+            else:
+                out.append("[^/]*")  # "**x" is just a star within the segment
+                i += 2
+            continue
+        if ch == "*":
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[":
+            close = glob_pattern.find("]", i + 2 if glob_pattern.startswith(("[!", "[^"), i) else i + 1)
+            if close == -1:
+                out.append(re.escape(ch))
+            else:
+                body = glob_pattern[i + 1 : close]
+                if body[:1] in ("!", "^"):
+                    body = "^" + body[1:]
+                out.append("(?!/)[" + body.replace("\\", "\\\\") + "]")
+                i = close + 1
+                continue
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return re.compile("".join(out) + r"\Z", re.DOTALL)
+
+
+def glob_matches(rel_path: str, glob_pattern: str) -> bool:
+    """Return True when the POSIX *rel_path* matches a Path.glob-style pattern.
+
+    Matching is per path segment, as in ``Path.glob``: ``*.py`` only matches
+    files at the project root, ``src/*.py`` does not reach into
+    ``src/pkg/``, and ``**/`` also matches zero directories.
+    """
+    return _glob_regex(glob_pattern).match(rel_path) is not None
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class SearchIndex:
+    """Incrementally maintained BM25 + trigram index for one project root.
+
+    Postings reference files by integer id.  Re-indexing a file assigns it a
+    new id and leaves the old postings behind as tombstones that queries skip;
+    they are purged by _compact() once they outnumber live files.  This keeps
+    both incremental updates and loading the persisted index free of any
+    per-posting rebuild work.
+
+    Args:
+        project_root: Directory to index.
+        cache_dir:    Directory for the persisted index file.  Defaults to
+                      <CACHE_BASE_DIR>/search_index.
+        persist:      Save/load the index to/from disk.  False keeps the
+                      index in memory only.
+    """
+
+    def __init__(self, project_root, cache_dir: Optional[str] = None, persist: bool = True):
+        self.root = Path(project_root).resolve()
+        self.persist = persist
+        base = Path(cache_dir or Path(_DEFAULT_CACHE_BASE) / "search_index").expanduser()
+        root_key = hashlib.md5(str(self.root).encode("utf-8")).hexdigest()
+        self._index_path = base / "{}.json".format(root_key)
+
+        # rel_path -> {"id": file_id, "m": mtime_ns, "s": size, "len": n_terms}
+        self._files: Dict[str, dict] = {}
+        self._id_to_rel: Dict[int, str] = {}
+        # rel_path of files too large to index (rebuilt by every walk)
+        self._oversized: Set[str] = set()
+        # term -> [file_id, tf, file_id, tf, ...]
+        self._postings: Dict[str, List[int]] = {}
+        # trigram -> [file_id, ...]
+        self._trigram_postings: Dict[str, List[int]] = {}
+        self._next_id = 0
+        self._dead_ids = 0
+        self._total_terms = 0
+
+        self._lock = threading.RLock()
+        self._last_refresh = 0.0
+        self._dirty = False
+        self.stats: Dict[str, int] = {"indexed": 0, "reused": 0, "removed": 0, "walks": 0}
+
+        if persist:
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> None:
+        """Bring the index up to date with the working tree.
+
+        Only files whose (mtime_ns, size) changed since the last refresh are
+        re-read.  Deleted files are dropped.  The walk is skipped when the
+        previous one completed within _REFRESH_INTERVAL_SECONDS unless
+        *force* is set.
+        """
+        with self._lock:
+            if not force and time.time() - self._last_refresh < _REFRESH_INTERVAL_SECONDS:
+                return
+            self.stats["walks"] += 1
+            seen: Set[str] = set()
+            oversized: Set[str] = set()
+            for path in iter_project_files(self.root, INDEXED_EXTENSIONS):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                rel = path.relative_to(self.root).as_posix()
+                if st.st_size > _MAX_INDEXED_FILE_BYTES:
+                    oversized.add(rel)
+                    continue
+                seen.add(rel)
+                entry = self._files.get(rel)
+                if entry is not None and entry["m"] == st.st_mtime_ns and entry["s"] == st.st_size:
+                    self.stats["reused"] += 1
+                    continue
+                self._index_file(rel, path, st.st_mtime_ns, st.st_size)
+
+            for rel in [r for r in self._files if r not in seen]:
+                self._remove_file(rel)
+                self.stats["removed"] += 1
+            self._oversized = oversized
+
+            if self._dead_ids > max(len(self._files), 256):
+                self._compact()
+
+            self._last_refresh = time.time()
+            if self._dirty and self.persist:
+                self._save()
+
+    def invalidate(self) -> None:
+        """Make the next query walk the tree even within _REFRESH_INTERVAL_SECONDS."""
+        with self._lock:
+            self._last_refresh = 0.0
+
+    def _index_file(self, rel: str, path: Path, mtime_ns: int, size: int) -> None:
+        try:
+            text = path.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return
+        self._remove_file(rel)
+
+        tf: Dict[str, int] = {}
+        terms = tokenize(text)
+        for term in terms:
+            tf[term] = tf.get(term, 0) + 1
+
+        file_id = self._next_id
+        self._next_id += 1
+        for term, count in tf.items():
+            self._postings.setdefault(term, []).extend((file_id, count))
+        for tri in trigrams(text):
+            self._trigram_postings.setdefault(tri, []).append(file_id)
+
+        self._files[rel] = {"id": file_id, "m": mtime_ns, "s": size, "len": len(terms)}
+        self._id_to_rel[file_id] = rel
+        self._total_terms += len(terms)
+        self._dirty = True
+        self.stats["indexed"] += 1
+
+    def _remove_file(self, rel: str) -> None:
+        entry = self._files.pop(rel, None)
+        if entry is None:
+            return
+        self._id_to_rel.pop(entry["id"], None)
+        self._total_terms -= entry["len"]
+        self._dead_ids += 1
+        self._dirty = True
+
+    def _compact(self) -> None:
+        """Drop postings that point at removed or superseded file ids."""
+        live = self._id_to_rel
+        postings: Dict[str, List[int]] = {}
+        for term, flat in self._postings.items():
+            kept = [v for i in range(0, len(flat), 2) if flat[i] in live for v in (flat[i], flat[i + 1])]
+            if kept:
+                postings[term] = kept
+        trigram_postings: Dict[str, List[int]] = {}
+        for tri, ids in self._trigram_postings.items():
+            kept = [fid for fid in ids if fid in live]
+            if kept:
+                trigram_postings[tri] = kept
+        self._postings = postings
+        self._trigram_postings = trigram_postings
+        self._dead_ids = 0
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            if not self._index_path.exists():
+                return
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+            if data.get("version") != _INDEX_FORMAT_VERSION or data.get("root") != str(self.root):
+                return
+            self._files = data["files"]
+            self._postings = data["postings"]
+            self._trigram_postings = data["trigrams"]
+            self._next_id = data["next_id"]
+            self._dead_ids = data.get("dead_ids", 0)
+            self._id_to_rel = {entry["id"]: rel for rel, entry in self._files.items()}
+            self._total_terms = sum(entry["len"] for entry in self._files.values())
+        except Exception as exc:
+            logger.debug("[SearchIndex] Ignoring unreadable index {}: {}".format(self._index_path, exc))
+            self._files, self._id_to_rel = {}, {}
+            self._postings, self._trigram_postings = {}, {}
+            self._next_id = self._dead_ids = self._total_terms = 0
+
+    def _save(self) -> None:
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {
+                "version": _INDEX_FORMAT_VERSION,
+                "root": str(self.root),
+                "next_id": self._next_id,
+                "dead_ids": self._dead_ids,
+                "files": self._files,
+                "postings": self._postings,
+                "trigrams": self._trigram_postings,
+            }
+            tmp = self._index_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(str(tmp), str(self._index_path))
+            self._dirty = False
+        except Exception as exc:
+            logger.warning("[SearchIndex] Could not persist index: {}".format(exc))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def file_paths(self, extensions: Optional[Iterable[str]] = None) -> List[str]:
+        """Return indexed relative paths, optionally filtered by suffix."""
+        self.refresh()
+        with self._lock:
+            paths = sorted(set(self._files) | self._oversized)
+        if extensions is None:
+            return paths
+        exts = tuple(e.lower() for e in extensions)
+        return [p for p in paths if p.lower().endswith(exts)]
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        extensions: Optional[Iterable[str]] = (".py",),
+    ) -> List[Tuple[str, float, int]]:
+        """Rank files for *query* with Okapi BM25.
+
+        Args:
+            query:       Free-text query; tokenised like the documents.
+            max_results: Number of results to return.
+            extensions:  Restrict results to these suffixes (None = all).
+
+        Returns:
+            List of (rel_path, bm25_score, matched_term_occurrences), best first.
+        """
+        self.refresh()
+        terms = list(dict.fromkeys(_IDENT_RE.findall(query.lower())))[:5]
+        exts = tuple(e.lower() for e in extensions) if extensions is not None else None
+        scores: Dict[str, float] = {}
+        counts: Dict[str, int] = {}
+        with self._lock:
+            n_docs = len(self._files)
+            if not n_docs or not terms:
+                return []
+            avg_len = max(self._total_terms / n_docs, 1.0)
+            for term in terms:
+                flat = self._postings.get(term)
+                if not flat:
+                    continue
+                live = self._id_to_rel
+                hits = [(live[flat[i]], flat[i + 1]) for i in range(0, len(flat), 2) if flat[i] in live]
+                if not hits:
+                    continue
+                df = len(hits)
+                idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                for rel, tf in hits:
+                    if exts is not None and not rel.lower().endswith(exts):
+                        continue
+                    doc_len = self._files[rel]["len"]
+                    denom = tf + _BM25_K1 * (1.0 - _BM25_B + _BM25_B * doc_len / avg_len)
+                    scores[rel] = scores.get(rel, 0.0) + idf * tf * (_BM25_K1 + 1.0) / denom
+                    counts[rel] = counts.get(rel, 0) + tf
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:max_results]
+        return [(rel, score, counts[rel]) for rel, score in ranked]
+
+    def can_serve_glob(self, glob_pattern: str) -> bool:
+        """Return True when every file *glob_pattern* can match is indexed."""
+        suffix = os.path.splitext(glob_pattern)[1].lower()
+        return bool(suffix) and "*" not in suffix and suffix in INDEXED_EXTENSIONS
+
+    def grep_candidates(self, pattern: str, glob_pattern: str = "**/*.py", is_regex: bool = False) -> List[str]:
+        """Return files that may contain *pattern*, narrowed by trigrams.
+
+        Every returned file contains all trigrams of the pattern's required
+        literals, except files too large to index, which are always returned
+        so the caller scans them directly; callers verify matches line by line.
+
+        Returns:
+            Sorted relative POSIX paths matching *glob_pattern*.
+        """
+        self.refresh()
+        literals = required_literals(pattern, is_regex=is_regex)
+        with self._lock:
+            candidates: Optional[Set[int]] = None
+            for literal in literals:
+                # Intersect the rarest trigrams first so the set shrinks fast.
+                needed = sorted(trigrams(literal), key=lambda t: len(self._trigram_postings.get(t, ())))
+                for tri in needed:
+                    ids = self._trigram_postings.get(tri, ())
+                    candidates = set(ids) if candidates is None else candidates.intersection(ids)
+                    if not candidates:
+                        break
+                if candidates is not None and not candidates:
+                    break
+            live = self._id_to_rel
+            if candidates is None:
+                pool = list(self._files)
+            else:
+                pool = [live[fid] for fid in candidates if fid in live]
+            pool.extend(self._oversized)
+        return sorted(rel for rel in pool if glob_matches(rel, glob_pattern))
+
+
+# ---------------------------------------------------------------------------
+# Per-project registry
+# ---------------------------------------------------------------------------
+
+_indexes: Dict[str, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(project_root) -> SearchIndex:
+    """Return the process-wide SearchIndex for *project_root* (created on demand)."""
+    key = str(Path(project_root).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SearchIndex(key)
+            _indexes[key] = index
+        return index
+
+
+def invalidate_search_indexes(project_root=None) -> None:
+    """Force the next query of *project_root*'s index (every index when None) to re-walk.
+
+    Called by pipeline steps after they write project files, so a search
+    issued right after a write never sees the pre-write tree.
+    """
+    with _indexes_lock:
+        if project_root is None:
+            indexes = list(_indexes.values())
+        else:
+            indexes = [_indexes.get(str(Path(project_root).resolve()))]
+    for index in indexes:
+        if index is not None:
+            index.invalidate()
+
+
+def clear_search_indexes() -> None:
+    """Drop all in-memory indexes (persisted files are kept). Useful in tests."""
+    with _indexes_lock:
+        _indexes.clear()
@@ -35,6 +35,11 @@ import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    from .search_index import invalidate_search_indexes
+except ImportError:
+    invalidate_search_indexes = None
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -446,7 +451,8 @@ def run_fix_loop(
     Steps per iteration:
         1. Plan fixes from current findings list.
         2. Apply template fixes (auto-fixable ones).
-        3. Re-scan to verify fixes worked (uses run_basic_scan - fast).
+        3. Re-scan to verify fixes worked (uses run_basic_scan, whose
+           per-file findings cache re-scans only the files just edited).
         4. If new issues found, repeat (up to max_iterations).
         5. Stop early if no progress (same count after fix attempt).
 
@@ -540,6 +546,9 @@ def run_fix_loop(
                 llm_needed.append(f)
                 _seen_llm.add(key)
 
+        if iteration_applied > 0 and invalidate_search_indexes is not None:
+            invalidate_search_indexes(project_root)
+
         # Step 3: re-scan to verify
         new_count = prev_count
         if iteration_applied > 0 and _scanner is not None:
@@ -32,6 +32,7 @@ import urllib.request
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ...cancellation import run_subprocess
 from .config import (
     DEFAULT_SONAR_URL,
     METRIC_KEYS,
@@ -235,7 +236,7 @@ def detect_sonar_installation() -> Dict[str, Any]:
 
     # 1. Check CLI availability
     try:
-        proc = subprocess.run(
+        proc = run_subprocess(
             ["sonar-scanner", "--version"],
             capture_output=True,
             text=True,
@@ -637,7 +638,7 @@ def run_sonar_scan(
             cmd.append(f"-Dsonar.inclusions={inclusions}")
 
         try:
-            proc = subprocess.run(
+            proc = run_subprocess(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -17,20 +17,51 @@ Checks performed:
 Only Python (.py) files are analysed.
 
 Returns dicts with the same schema as api_client.run_sonar_scan so that the
-rest of the pipeline can treat both sources identically.
+rest of the pipeline can treat both sources identically, plus
+``rule_timings_ms``, ``files_scanned`` and ``files_cached``.
 
-Version: 1.4.1
+Incremental scanning:
+  Findings are cached per file keyed by content hash and _RULESET_VERSION
+  (~/.claude/logs/cache/sonar_lightweight/<md5(project_root)>.json).  Only
+  files whose content changed are re-scanned, so the fix-verify loop in
+  sonar_auto_fixer.run_fix_loop pays only for the files it just edited.
+  Cold scans with many files fan out across a process pool.
+
+Version: 1.5.0
 """
 
 import ast
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
 import re
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...core.file_walker import iter_project_files
+from ...core.source_repository import get_source_repository
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever a rule, threshold or finding format changes so cached
+# findings produced by older rules are discarded.
+_RULESET_VERSION = "1.5.0"
+
+# Cold scans with at least this many uncached files use a process pool.
+_PARALLEL_MIN_FILES = 32
+
+# A cached (mtime_ns, size) is only trusted when the file was last modified
+# this long before it was hashed; edits landing within the filesystem's
+# timestamp granularity are re-hashed ("racy clean" handling, as in git).
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+_DEFAULT_CACHE_BASE = os.environ.get("CACHE_BASE_DIR", "~/.claude/logs/cache")
+
 # Directories to skip during file discovery.
 _SKIP_DIRS = {".venv", "venv", "__pycache__", ".git", "node_modules", "dist", "build"}
 
@@ -39,20 +70,47 @@ _RE_BARE_EXCEPT = re.compile(r"^\s*except\s*:")
 _RE_EVAL_EXEC = re.compile(r"\beval\s*\(|\bexec\s*\(")
 _RE_CREDENTIALS = re.compile(r"(?i)(password|passwd|secret|api_key|apikey|token|auth)\s*=\s*[\"'][^\"']{4,}[\"']")
 _RE_TODO = re.compile(r"#\s*(TODO|FIXME|HACK)\b", re.IGNORECASE)
+_RE_WORD = re.compile(r"\w+")
+
+
+class _RuleTimer:
+    """Accumulates wall time per rule id into a shared dict (seconds)."""
+
+    def __init__(self, timings: Optional[Dict[str, float]]) -> None:
+        self._timings = timings
+        self._rule = ""
+        self._start = 0.0
+
+    def start(self, rule: str) -> None:
+        if self._timings is not None:
+            self._rule = rule
+            self._start = time.perf_counter()
 
+    def stop(self) -> None:
+        if self._timings is not None:
+            elapsed = time.perf_counter() - self._start
+            self._timings[self._rule] = self._timings.get(self._rule, 0.0) + elapsed
 
-def _scan_file_lines(rel_path: str, lines: List[str]) -> List[Dict[str, Any]]:
+
+def _scan_file_lines(
+    rel_path: str,
+    lines: List[str],
+    timings: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
     """Run line-by-line regex checks on a single file.
 
     Args:
         rel_path: Relative path string used in finding dicts.
         lines:    Lines of the file (as returned by str.splitlines()).
+        timings:  Optional dict accumulating seconds spent per rule id.
 
     Returns:
         List of finding dicts for this file.
     """
     findings: List[Dict[str, Any]] = []
+    timer = _RuleTimer(timings)
 
+    timer.start("python:bare-except")
     for lineno, raw_line in enumerate(lines, start=1):
         if _RE_BARE_EXCEPT.match(raw_line):
             findings.append(
@@ -69,7 +127,10 @@ def _scan_file_lines(rel_path: str, lines: List[str]) -> List[Dict[str, Any]]:
                     "tags": [],
                 }
             )
+    timer.stop()
 
+    timer.start("python:eval-exec")
+    for lineno, raw_line in enumerate(lines, start=1):
         if _RE_EVAL_EXEC.search(raw_line):
             findings.append(
                 {
@@ -85,7 +146,10 @@ def _scan_file_lines(rel_path: str, lines: List[str]) -> List[Dict[str, Any]]:
                     "tags": ["security"],
                 }
             )
+    timer.stop()
 
+    timer.start("python:hardcoded-credentials")
+    for lineno, raw_line in enumerate(lines, start=1):
         if _RE_CREDENTIALS.search(raw_line):
             findings.append(
                 {
@@ -101,7 +165,10 @@ def _scan_file_lines(rel_path: str, lines: List[str]) -> List[Dict[str, Any]]:
                     "tags": ["security", "credentials"],
                 }
             )
+    timer.stop()
 
+    timer.start("python:todo-comment")
+    for lineno, raw_line in enumerate(lines, start=1):
         if _RE_TODO.search(raw_line):
             findings.append(
                 {
@@ -117,11 +184,19 @@ def _scan_file_lines(rel_path: str, lines: List[str]) -> List[Dict[str, Any]]:
                     "tags": [],
                 }
             )
+    timer.stop()
 
+    # Rules run as separate passes for timing; restore per-line ordering.
+    findings.sort(key=lambda f: f["line"])
     return findings
 
 
-def _scan_file_ast(rel_path: str, source: str, lines: List[str]) -> List[Dict[str, Any]]:
+def _scan_file_ast(
+    rel_path: str,
+    source: str,
+    lines: List[str],
+    timings: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
     """Run AST-based checks on a single file.
 
     Checks:
@@ -133,20 +208,27 @@ def _scan_file_ast(rel_path: str, source: str, lines: List[str]) -> List[Dict[st
         rel_path: Relative path string used in finding dicts.
         source:   Full source text of the file.
         lines:    Lines of the file (for usage counting).
+        timings:  Optional dict accumulating seconds spent per rule id
+                  ("python:ast-parse" covers parsing itself).
 
     Returns:
         List of finding dicts for this file.  Returns empty list on
         SyntaxError so the caller can continue with other files.
     """
     findings: List[Dict[str, Any]] = []
+    timer = _RuleTimer(timings)
 
+    timer.start("python:ast-parse")
     try:
-        tree = ast.parse(source, filename=rel_path)
+        tree = get_source_repository().parse_source(source, rel_path)
     except SyntaxError:
         logger.debug("Syntax error in %s; skipping AST checks", rel_path)
         return findings
+    finally:
+        timer.stop()
 
     # -- Unused imports --
+    timer.start("python:unused-import")
     import_names: Dict[str, int] = {}  # bound_name -> lineno
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
@@ -159,9 +241,17 @@ def _scan_file_ast(rel_path: str, source: str, lines: List[str]) -> List[Dict[st
                 if bound_name != "*":
                     import_names[bound_name] = node.lineno
 
+    # \bname\b matches a line exactly when name is one of its \w+ tokens, so
+    # one tokenisation pass replaces a regex scan of every line per import.
+    token_lines: Dict[str, List[int]] = {}
+    if import_names:
+        for idx, line in enumerate(lines, 1):
+            for token in set(_RE_WORD.findall(line)):
+                if token in import_names:
+                    token_lines.setdefault(token, []).append(idx)
+
     for name, imp_lineno in import_names.items():
-        other_lines = [line for idx, line in enumerate(lines, 1) if idx != imp_lineno]
-        usage_count = sum(1 for line in other_lines if re.search(r"\b" + re.escape(name) + r"\b", line))
+        usage_count = sum(1 for idx in token_lines.get(name, ()) if idx != imp_lineno)
         if usage_count == 0:
             findings.append(
                 {
@@ -178,7 +268,10 @@ def _scan_file_ast(rel_path: str, source: str, lines: List[str]) -> List[Dict[st
                 }
             )
 
+    timer.stop()
+
     # -- Function length and cyclomatic complexity --
+    timer.start("python:function-metrics")
     for node in ast.walk(tree):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
@@ -240,10 +333,144 @@ def _scan_file_ast(rel_path: str, source: str, lines: List[str]) -> List[Dict[st
                     "tags": [],
                 }
             )
+    timer.stop()
 
     return findings
 
 
+def _scan_source(rel_path: str, source: str) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+    """Run every rule on one file; return (findings, per-rule seconds)."""
+    timings: Dict[str, float] = {}
+    lines = source.splitlines()
+    findings = _scan_file_lines(rel_path, lines, timings)
+    findings.extend(_scan_file_ast(rel_path, source, lines, timings))
+    return findings, timings
+
+
+def _scan_source_job(job: Tuple[str, str]) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+    """Process-pool entry point (must be a picklable module-level function)."""
+    return _scan_source(job[0], job[1])
+
+
+# ---------------------------------------------------------------------------
+# Per-file findings cache
+# ---------------------------------------------------------------------------
+
+
+class _FindingsCache:
+    """Per-project findings cache keyed by file content hash and rule set.
+
+    Entries: {rel_path: {"m": mtime_ns, "s": size, "h": sha1, "t": hashed_at_ns,
+    "findings": [...]}}.  Persisted as one JSON file per project root.
+
+    One instance is shared by every scanner thread for a root, so the
+    entries dict and the on-disk file are only touched under self._lock.
+    """
+
+    def __init__(self, root_path: Path, cache_dir: Optional[str] = None) -> None:
+        base = Path(cache_dir or Path(_DEFAULT_CACHE_BASE) / "sonar_lightweight").expanduser()
+        key = hashlib.md5(str(root_path.resolve()).encode("utf-8")).hexdigest()
+        self._path = base / "{}.json".format(key)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        try:
+            if self._path.exists():
+                data = json.loads(self._path.read_text(encoding="utf-8"))
+                if data.get("ruleset") == _RULESET_VERSION:
+                    self.entries = data.get("files", {})
+        except Exception as exc:
+            logger.debug("Ignoring unreadable scan cache %s: %s", self._path, exc)
+
+    def lookup_stat(self, rel_path: str, st: os.stat_result) -> Optional[List[Dict[str, Any]]]:
+        """Return cached findings when (mtime, size) match and are not racy."""
+        with self._lock:
+            entry = self.entries.get(rel_path)
+            if entry is None or entry["m"] != st.st_mtime_ns or entry["s"] != st.st_size:
+                return None
+            if entry["t"] - st.st_mtime_ns < _RACY_WINDOW_NS:
+                return None
+            return entry["findings"]
+
+    def lookup_hash(self, rel_path: str, digest: str, st: os.stat_result) -> Optional[List[Dict[str, Any]]]:
+        """Return cached findings when the content hash matches; refresh stat."""
+        with self._lock:
+            entry = self.entries.get(rel_path)
+            if entry is None or entry["h"] != digest:
+                return None
+            entry.update({"m": st.st_mtime_ns, "s": st.st_size, "t": time.time_ns()})
+            self.dirty = True
+            return entry["findings"]
+
+    def store(self, rel_path: str, digest: str, st: os.stat_result, findings: List[Dict[str, Any]]) -> None:
+        entry = {
+            "m": st.st_mtime_ns,
+            "s": st.st_size,
+            "h": digest,
+            "t": time.time_ns(),
+            "findings": findings,
+        }
+        with self._lock:
+            self.entries[rel_path] = entry
+            self.dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self.dirty:
+                return
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self._path.with_suffix(".tmp")
+                tmp.write_text(
+                    json.dumps({"ruleset": _RULESET_VERSION, "files": self.entries}, separators=(",", ":")),
+                    encoding="utf-8",
+                )
+                os.replace(str(tmp), str(self._path))
+                self.dirty = False
+            except Exception as exc:
+                logger.debug("Could not persist scan cache %s: %s", self._path, exc)
+
+
+# One cache object per (project root, cache dir); guarded for concurrent scans.
+_caches: Dict[Tuple[str, str], _FindingsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _get_findings_cache(root_path: Path, cache_dir: Optional[str]) -> _FindingsCache:
+    key = (str(root_path.resolve()), cache_dir or "")
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _FindingsCache(root_path, cache_dir)
+            _caches[key] = cache
+        return cache
+
+
+def _pool_context():
+    """Start method for scan workers.
+
+    Scans are started from threaded callers (pipeline nodes, MCP servers);
+    forking one can copy a lock held by another thread into the child, so
+    workers come from a forkserver, or are spawned where there is none.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def _scan_jobs(
+    jobs: List[Tuple[str, str]], max_workers: Optional[int]
+) -> List[Tuple[List[Dict[str, Any]], Dict[str, float]]]:
+    """Scan (rel_path, source) jobs, across processes when worthwhile."""
+    workers = max_workers if max_workers is not None else min(os.cpu_count() or 1, 8)
+    if workers > 1 and len(jobs) >= _PARALLEL_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+                return list(pool.map(_scan_source_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+        except Exception as exc:
+            logger.debug("Process pool unavailable (%s); scanning serially", exc)
+    return [_scan_source(rel_path, source) for rel_path, source in jobs]
+
+
 def _resolve_target_files(
     root_path: Path,
     modified_files: Optional[List[str]],
@@ -260,15 +487,17 @@ def _resolve_target_files(
     """
     if modified_files is not None:
         candidates = [root_path / f for f in modified_files if f.endswith(".py") and (root_path / f).exists()]
-    else:
-        candidates = list(root_path.rglob("*.py"))
+        return [p for p in candidates if not any(part in _SKIP_DIRS for part in p.parts)]
 
-    return [p for p in candidates if not any(part in _SKIP_DIRS for part in p.parts)]
+    return list(iter_project_files(root_path, {".py"}, excluded_dirs=_SKIP_DIRS))
 
 
 def run_basic_scan(
     project_root: str,
     modified_files: Optional[List[str]] = None,
+    use_cache: bool = True,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Lightweight code scan without SonarQube using AST and regex.
 
@@ -280,12 +509,19 @@ def run_basic_scan(
         modified_files: Optional list of relative paths to restrict the scan.
                         When omitted all .py files under project_root are
                         scanned.
+        use_cache:      Reuse findings of files whose content is unchanged
+                        since a previous scan (default True).
+        max_workers:    Process pool width for cold scans (default: CPU count,
+                        capped at 8; 1 forces a serial scan).
+        cache_dir:      Override for the findings cache directory.
 
     Returns:
         Dict with the same schema as api_client.run_sonar_scan:
             scan_success (bool), findings (list), summary (dict),
             scan_duration_ms (int), error (str | None),
             api_used (bool), cli_ran (bool).
+        Plus rule_timings_ms (dict rule -> ms, freshly scanned files only),
+        files_scanned (int) and files_cached (int).
     """
     start = time.monotonic()
     root_path = Path(project_root)
@@ -305,6 +541,9 @@ def run_basic_scan(
             "error": "project_root does not exist: {}".format(project_root),
             "api_used": False,
             "cli_ran": False,
+            "rule_timings_ms": {},
+            "files_scanned": 0,
+            "files_cached": 0,
         }
 
     target_files = _resolve_target_files(root_path, modified_files)
@@ -314,21 +553,56 @@ def run_basic_scan(
         project_root,
     )
 
-    all_findings: List[Dict[str, Any]] = []
+    cache = _get_findings_cache(root_path, cache_dir) if use_cache else None
+    per_file: Dict[str, List[Dict[str, Any]]] = {}
+    order: List[str] = []
+    jobs: List[Tuple[str, str]] = []
+    job_meta: List[Tuple[str, os.stat_result]] = []
+    files_cached = 0
 
     for file_path in target_files:
         rel_path = str(file_path.relative_to(root_path))
 
         try:
-            source = file_path.read_text(encoding="utf-8", errors="replace")
+            st = file_path.stat()
+            if cache is not None:
+                cached = cache.lookup_stat(rel_path, st)
+                if cached is not None:
+                    per_file[rel_path] = cached
+                    order.append(rel_path)
+                    files_cached += 1
+                    continue
+            data = file_path.read_bytes()
         except Exception as exc:
             logger.debug("Could not read %s: %s", file_path, exc)
             continue
 
-        lines = source.splitlines()
+        order.append(rel_path)
+        digest = hashlib.sha1(data).hexdigest()
+        if cache is not None:
+            cached = cache.lookup_hash(rel_path, digest, st)
+            if cached is not None:
+                per_file[rel_path] = cached
+                files_cached += 1
+                continue
+        jobs.append((rel_path, data.decode("utf-8", errors="replace")))
+        job_meta.append((digest, st))
+
+    rule_seconds: Dict[str, float] = {}
+    for (rel_path, _source), (digest, st), (findings, timings) in zip(jobs, job_meta, _scan_jobs(jobs, max_workers)):
+        per_file[rel_path] = findings
+        if cache is not None:
+            cache.store(rel_path, digest, st, findings)
+        for rule, secs in timings.items():
+            rule_seconds[rule] = rule_seconds.get(rule, 0.0) + secs
+
+    if cache is not None:
+        with _caches_lock:
+            cache.save()
 
-        all_findings.extend(_scan_file_lines(rel_path, lines))
-        all_findings.extend(_scan_file_ast(rel_path, source, lines))
+    all_findings: List[Dict[str, Any]] = []
+    for rel_path in order:
+        all_findings.extend(dict(f) for f in per_file.get(rel_path, ()))
 
     elapsed_ms = int((time.monotonic() - start) * 1000)
 
@@ -338,11 +612,13 @@ def run_basic_scan(
     quality_gate = "PASSED" if (bugs == 0 and vulnerabilities == 0) else "FAILED"
 
     logger.debug(
-        "[run_basic_scan] Done in %dms: %d bugs, %d vulns, %d smells",
+        "[run_basic_scan] Done in %dms: %d bugs, %d vulns, %d smells (%d scanned, %d cached)",
         elapsed_ms,
         bugs,
         vulnerabilities,
         code_smells,
+        len(jobs),
+        files_cached,
     )
 
     return {
@@ -359,4 +635,7 @@ def run_basic_scan(
         "error": None,
         "api_used": False,
         "cli_ran": False,
+        "rule_timings_ms": {rule: round(secs * 1000.0, 2) for rule, secs in sorted(rule_seconds.items())},
+        "files_scanned": len(jobs),
+        "files_cached": files_cached,
     }
@@ -96,14 +96,15 @@ class Level3GitHubWorkflow:
         # Phase 4: MCP enabled as primary backend with gh CLI fallback
         # Performance: MCP ~80ms vs gh CLI ~300ms (3.33x faster)
         # Fallback: gh CLI used automatically if MCP fails
-        self.github = GitHubOperationRouter(use_mcp=True, fallback_to_gh=True)
+        self.github = GitHubOperationRouter(use_mcp=True, fallback_to_gh=True, repo_path=repo_path)
         self.git = GitOperations(repo_path=repo_path)
 
         # GitHubFacade provides a simplified typed interface for GitHub + Git.
         # Internally delegates to self.github (router) and self.git, so there
         # is no duplicate logic.  New step implementations should prefer
         # self.facade over calling self.github / self.git directly.
-        self.facade = GitHubFacade(repo_path=repo_path, use_mcp=True)
+        # Shares self.github so the backends are authenticated only once.
+        self.facade = GitHubFacade(repo_path=repo_path, use_mcp=True, router=self.github)
 
         # Check if we're in a git repository - this is critical for Steps 8-12
         if not self.git.is_git_repo:
@@ -775,8 +776,8 @@ class Level3GitHubWorkflow:
         # Layer 1: GitHub API
         logger.info("[Layer 1] GitHub API Check (pr.mergeable)...")
         try:
-            pr = self.github.repo.get_pull(pr_number)
-            if not pr.mergeable:
+            status = self.github.get_pr_status(pr_number)
+            if status.get("success") and status.get("mergeable") is False:
                 logger.error("[Layer 1] FAILED: PR not mergeable")
                 return {
                     "safe_to_merge": False,
@@ -327,6 +327,14 @@ def _run_step(
                 fallback=fallback_result or {},
                 step_label=f"STEP {step_number:02d}: {step_label}",
             )
+            # Timed-out / leaked-thread counts of the shared step-timeout pool
+            if metrics:
+                try:
+                    from ..cancellation import get_timeout_executor
+
+                    metrics.record_counters("timeout_executor", get_timeout_executor().snapshot())
+                except Exception:
+                    pass
             # Check if timeout_wrapper returned its own error result
             if result.get("timed_out"):
                 logger.warning(f"[STEP {step_number:02d}] {step_label} - TIMED OUT after {timeout_s}s")
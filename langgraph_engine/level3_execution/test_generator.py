@@ -17,6 +17,16 @@ import ast
 import json
 from pathlib import Path
 
+try:
+    from ..core.source_repository import get_source_repository
+except ImportError:
+    get_source_repository = None
+
+try:
+    from .search_index import invalidate_search_indexes
+except ImportError:
+    invalidate_search_indexes = None
+
 # ---------------------------------------------------------------------------
 # Language detection
 # ---------------------------------------------------------------------------
@@ -232,8 +242,11 @@ def _extract_methods_from_python_ast(file_path):
     """
     methods = []
     try:
-        source = Path(str(file_path)).read_text(encoding="utf-8", errors="replace")
-        tree = ast.parse(source, filename=str(file_path))
+        if get_source_repository is not None:
+            tree = get_source_repository().get_ast(str(file_path))
+        else:
+            source = Path(str(file_path)).read_text(encoding="utf-8", errors="replace")
+            tree = ast.parse(source, filename=str(file_path))
     except Exception:
         return methods
 
@@ -1223,4 +1236,6 @@ def write_test_files(batch_result, dry_run=False):
             written.append(test_path)
     except Exception:
         pass
+    if written and not dry_run and invalidate_search_indexes is not None:
+        invalidate_search_indexes()
     return written
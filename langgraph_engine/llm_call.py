@@ -41,6 +41,8 @@ import subprocess
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
+from .cancellation import run_subprocess
+
 _log = logging.getLogger(__name__)
 
 
@@ -137,7 +139,8 @@ class ClaudeCLIProvider(LLMProvider):
         env["CLAUDE_WORKFLOW_RUNNING"] = "1"
 
         try:
-            result = subprocess.run(
+            # Killed (not abandoned) when the enclosing step times out
+            result = run_subprocess(
                 [self._claude_path, "-p", "--model", cli_model, prompt],
                 capture_output=True,
                 text=True,
@@ -5,6 +5,8 @@ Records:
 - Per-step duration, status, token usage
 - Files created/modified/deleted per step
 - Error occurrences and recovery actions
+- Named counter snapshots from shared components (e.g. the step-timeout
+  executor's timed-out / leaked-thread counts)
 - Session-level summary statistics
 
 Metrics are written to:
@@ -78,6 +80,8 @@ class MetricsCollector:
         self._error_records: List[Dict[str, Any]] = []
         # Aggregate set of all files touched across all steps
         self._all_files_modified: Set[str] = set()
+        # Key: component name  Value: latest counter snapshot
+        self._counters: Dict[str, Dict[str, int]] = {}
 
         # Load existing data if we are resuming
         self._load()
@@ -195,6 +199,17 @@ class MetricsCollector:
         self._save()
         logger.warning(f"[Metrics] Error at step {step}: {error_type} | recovery={recovery}")
 
+    def record_counters(self, name: str, counters: Dict[str, int]) -> None:
+        """
+        Store the latest snapshot of a component's cumulative counters.
+
+        Args:
+            name:     Component name (e.g. "timeout_executor").
+            counters: Counter values; replaces the previous snapshot.
+        """
+        self._counters[name] = dict(counters)
+        self._save()
+
     # ------------------------------------------------------------------
     # Timing helpers
     # ------------------------------------------------------------------
@@ -283,6 +298,7 @@ class MetricsCollector:
             "total_files_modified": len(all_files),
             "files_modified": sorted(all_files),
             "by_step": self._step_metrics,
+            "counters": self._counters,
         }
 
     def print_summary(self) -> None:
@@ -332,6 +348,7 @@ class MetricsCollector:
             "step_metrics": self._step_metrics,
             "error_records": self._error_records,
             "all_files_modified": sorted(self._all_files_modified),
+            "counters": self._counters,
         }
         content = json.dumps(payload, indent=2)
         dir_path = self.metrics_file.parent
@@ -365,6 +382,7 @@ class MetricsCollector:
             # Restore aggregate files set
             saved_files = data.get("all_files_modified", [])
             self._all_files_modified = set(saved_files)
+            self._counters = data.get("counters", {})
             logger.debug(f"[Metrics] Loaded existing metrics from {self.metrics_file}")
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"[Metrics] Could not load existing metrics: {e}")
@@ -50,9 +50,11 @@ CHANGE LOG (v1.16.0):
 """
 
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Dict, Iterable, Literal, Optional, Tuple
 
 try:
     import sys as _sys
@@ -588,8 +590,190 @@ def _save_pipeline_execution_log(state: FlowState, final_status: str) -> None:
 # ============================================================================
 
 
-def create_flow_graph(hook_mode: bool = False):
-    """Create and return the main StateGraph for 3-level flow.
+# ============================================================================
+# COMPILED GRAPH CACHE
+# ============================================================================
+# Registering ~25 nodes and edges and compiling costs far more than a cache
+# lookup, and none of it depends on the run: the topology is fixed by
+# hook_mode (and the level set).  So each fingerprint is compiled once per
+# process, without a checkpointer, and shared.  Checkpointers are per run:
+# create_flow_graph() hands out a copy of the cached graph bound to a fresh
+# saver (Pregel.copy is a shallow attribute copy), so in-memory checkpoints
+# are freed with the run and concurrent runs never share a SQLite
+# connection.
+
+# Levels wired by _build_topology(); part of the fingerprint so a change to
+# the level set can never be served a graph built for another one.
+_GRAPH_LEVELS = ("level_minus1", "level1", "level3")
+
+# Checkpointer kinds create_flow_graph() accepts by name.
+CHECKPOINTER_KINDS = ("sqlite", "memory", "none")
+
+_graph_cache_lock = threading.RLock()  # create_flow_graph -> _get_topology nest
+_topology_cache: Dict[bool, Any] = {}  # hook_mode -> StateGraph (uncompiled)
+_compiled_cache: Dict[Tuple, Any] = {}  # graph_fingerprint() -> graph compiled without checkpointer
+_graph_cache_stats = {"hits": 0, "builds": 0, "compiles": 0, "build_time_s": 0.0}
+
+
+def graph_fingerprint(hook_mode: bool = False) -> Tuple:
+    """Cache key of the compiled graph for a configuration."""
+    return ("hook" if hook_mode else "full", _GRAPH_LEVELS)
+
+
+def create_flow_graph(hook_mode: bool = False, checkpointer: Any = "sqlite", use_cache: bool = True):
+    """Return the compiled 3-level flow graph for one run.
+
+    Args:
+        hook_mode: If True, skip Steps 10-14 (see _build_topology).
+        checkpointer: "sqlite" (default; persistent, falls back to no
+                      checkpointer when SQLite is unavailable), "memory",
+                      "none", or a checkpointer instance.  Every call gets
+                      its own checkpointer (a new MemorySaver or SQLite
+                      connection); "none" returns the shared graph itself.
+        use_cache: False forces a private rebuild (topology and compile).
+
+    Returns:
+        Compiled StateGraph instance.  The compiled topology is shared by
+        all callers with the same graph_fingerprint(); call once per run
+        (or per group of runs that should share checkpoint history).
+
+    Raises:
+        RuntimeError: If LangGraph not installed
+        ValueError: For an unknown checkpointer kind
+    """
+    if isinstance(checkpointer, str) and checkpointer not in CHECKPOINTER_KINDS:
+        raise ValueError("unknown checkpointer kind %r (expected one of %s)" % (checkpointer, CHECKPOINTER_KINDS))
+    if use_cache:
+        compiled = _get_compiled(hook_mode)
+    else:
+        compiled = _compile(_get_topology(hook_mode, False))
+
+    saver = _new_checkpointer(checkpointer) if isinstance(checkpointer, str) else checkpointer
+    if saver is None:
+        return compiled
+    return compiled.copy({"checkpointer": saver})
+
+
+def release_flow_graph(graph) -> None:
+    """Close the checkpointer connection create_flow_graph() opened for a run.
+
+    Only SQLite savers hold one; the graph must not be invoked afterwards.
+    Safe to call on any graph (a no-op without a connection).
+    """
+    conn = getattr(getattr(graph, "checkpointer", None), "conn", None)
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def warm_flow_graphs(hook_modes: Iterable[bool] = (True,), background: bool = False):
+    """Build and cache the compiled graphs for *hook_modes* ahead of first use.
+
+    Long-running processes (servers, batch runners) call this at start-up so
+    the first request does not pay for graph construction.
+
+    Args:
+        hook_modes: hook_mode values to compile.
+        background: Build on a daemon thread and return it immediately.
+
+    Returns:
+        {fingerprint: seconds} when run inline, or the started Thread.
+    """
+    hook_modes = list(hook_modes)
+
+    def _warm() -> Dict[Tuple, float]:
+        timings = {}
+        for hook_mode in hook_modes:
+            started = time.perf_counter()
+            _get_compiled(hook_mode)
+            timings[graph_fingerprint(hook_mode)] = time.perf_counter() - started
+        return timings
+
+    if background:
+        thread = threading.Thread(target=_warm, name="flow-graph-warmup", daemon=True)
+        thread.start()
+        return thread
+    return _warm()
+
+
+def flow_graph_cache_info() -> Dict[str, Any]:
+    """Counters plus the fingerprints currently cached."""
+    with _graph_cache_lock:
+        info = dict(_graph_cache_stats)
+        info["cached"] = sorted(_compiled_cache)
+        info["topologies"] = len(_topology_cache)
+    return info
+
+
+def clear_flow_graph_cache() -> None:
+    """Drop all cached topologies and compiled graphs (tests, hot reload)."""
+    with _graph_cache_lock:
+        _topology_cache.clear()
+        _compiled_cache.clear()
+        for key in _graph_cache_stats:
+            _graph_cache_stats[key] = 0.0 if key == "build_time_s" else 0
+
+
+def _get_compiled(hook_mode: bool):
+    key = graph_fingerprint(hook_mode)
+    with _graph_cache_lock:
+        compiled = _compiled_cache.get(key)
+        if compiled is None:
+            compiled = _compiled_cache[key] = _compile(_get_topology(hook_mode, True))
+        else:
+            _graph_cache_stats["hits"] += 1
+    return compiled
+
+
+def _get_topology(hook_mode: bool, use_cache: bool):
+    if not use_cache:
+        return _timed_build(hook_mode)
+    with _graph_cache_lock:
+        topology = _topology_cache.get(hook_mode)
+        if topology is None:
+            topology = _topology_cache[hook_mode] = _timed_build(hook_mode)
+    return topology
+
+
+def _timed_build(hook_mode: bool):
+    started = time.perf_counter()
+    topology = _build_topology(hook_mode)
+    with _graph_cache_lock:
+        _graph_cache_stats["builds"] += 1
+        _graph_cache_stats["build_time_s"] += time.perf_counter() - started
+    return topology
+
+
+def _compile(topology):
+    """Compile *topology* without a checkpointer (bound per run)."""
+    started = time.perf_counter()
+    try:
+        return topology.compile()
+    finally:
+        with _graph_cache_lock:
+            _graph_cache_stats["compiles"] += 1
+            _graph_cache_stats["build_time_s"] += time.perf_counter() - started
+
+
+def _new_checkpointer(kind: str):
+    """A fresh checkpointer of *kind* for one run; None = run without one."""
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return CheckpointerManager.get_memory_checkpointer()
+    # SqliteSaver checkpointer for state persistence: enables resume from
+    # any step if the pipeline is interrupted
+    try:
+        return CheckpointerManager.get_default_checkpointer(use_sqlite=True)
+    except Exception:
+        # Fallback to no checkpointer if SQLite setup fails
+        return None
+
+
+def _build_topology(hook_mode: bool = False):
+    """Create the (uncompiled) main StateGraph for 3-level flow.
 
     LangGraph 1.0.10: All nodes flattened into single graph.
     Parallel execution: Multiple edges from START or same source
@@ -602,7 +786,7 @@ def create_flow_graph(hook_mode: bool = False):
                    Steps 10-14 can be triggered separately after Claude has context.
 
     Returns:
-        Compiled StateGraph instance
+        StateGraph builder; compiled by _compile()
 
     Raises:
         RuntimeError: If LangGraph not installed
@@ -774,13 +958,7 @@ def create_flow_graph(hook_mode: bool = False):
         graph.add_node("level3_output", output_node)
         graph.add_edge("level3_step9", "level3_output")
         graph.add_edge("level3_output", END)
-
-        try:
-            checkpointer = CheckpointerManager.get_default_checkpointer(use_sqlite=True)
-            compiled_graph = graph.compile(checkpointer=checkpointer)
-        except Exception:
-            compiled_graph = graph.compile()
-        return compiled_graph
+        return graph
 
     # ========================================================================
     # FULL MODE: Steps 10-14 (implementation + PR + merge + close)
@@ -836,16 +1014,7 @@ def create_flow_graph(hook_mode: bool = False):
     graph.add_node("level3_output", output_node)
     graph.add_edge("level3_step14", "level3_output")
     graph.add_edge("level3_output", END)
-
-    # Compile graph with SqliteSaver checkpointer for state persistence
-    # Enables resume from any step if pipeline is interrupted
-    try:
-        checkpointer = CheckpointerManager.get_default_checkpointer(use_sqlite=True)
-        compiled_graph = graph.compile(checkpointer=checkpointer)
-    except Exception:
-        # Fallback to no checkpointer if SQLite setup fails
-        compiled_graph = graph.compile()
-    return compiled_graph
+    return graph
 
 
 def create_initial_state(session_id: str = "", project_root: str = "", user_message: str = "") -> FlowState:
@@ -929,7 +1098,10 @@ def invoke_flow(
     # Set very high recursion limit to debug infinite loops
     config["recursion_limit"] = 1000
 
-    result = graph.invoke(initial_state, config=config)
+    try:
+        result = graph.invoke(initial_state, config=config)
+    finally:
+        release_flow_graph(graph)
     return result
 
 
@@ -18,13 +18,39 @@ Usage:
 ASCII-only (cp1252-safe for Windows).
 """
 
+import importlib
+import threading
+
 from .base import AbstractLanguageParser
 from .config import MAX_FILE_SIZE_KB, MAX_FILES, SUPPORTED_EXTENSIONS
-from .graph_model import CallGraph
-from .java_parser import JavaRegexParser
-from .kotlin_parser import KotlinRegexParser
-from .python_parser import PythonASTParser
-from .typescript_parser import TypeScriptRegexParser
+
+# Concrete parsers and CallGraph are imported on first use (PEP 562).  Most
+# importers only want config constants (core.file_walker imports
+# EXCLUDED_DIRS), and loading all four parsers costs more than the rest of
+# the package together.
+_LAZY_ATTRS = {
+    "CallGraph": "graph_model",
+    "JavaRegexParser": "java_parser",
+    "KotlinRegexParser": "kotlin_parser",
+    "PythonASTParser": "python_parser",
+    "TypeScriptRegexParser": "typescript_parser",
+}
+
+# Registration order decides which parser wins a shared extension.
+_BUILTIN_PARSERS = ("PythonASTParser", "JavaRegexParser", "TypeScriptRegexParser", "KotlinRegexParser")
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module("." + _LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 # =========================================================================
 # Abstract Factory: ParserRegistry
@@ -34,8 +60,9 @@ from .typescript_parser import TypeScriptRegexParser
 class ParserRegistry:
     """Abstract Factory that maps file extensions to parser instances.
 
-    Parsers are registered once at module load time via register().
-    Callers use get_parser(extension) to obtain the right parser for a file.
+    The built-in parsers are registered on the first lookup (not at import
+    time); callers use get_parser(extension) to obtain the right parser for
+    a file.  Additional parsers can be added at any time via register().
 
     Design notes:
     - Each registered parser class is instantiated once (singleton per class).
@@ -45,6 +72,26 @@ class ParserRegistry:
 
     # Extension string -> parser instance
     _parsers = {}  # type: dict
+    _builtins_loaded = False
+    _builtins_lock = threading.Lock()
+
+    @classmethod
+    def _ensure_builtins(cls):
+        """Import and register the built-in parsers once."""
+        if cls._builtins_loaded:
+            return
+        with cls._builtins_lock:
+            if not cls._builtins_loaded:
+                for name in _BUILTIN_PARSERS:
+                    cls._add(__getattr__(name))
+                cls._builtins_loaded = True
+
+    @classmethod
+    def _add(cls, parser_class):
+        instance = parser_class()
+        for ext in instance.file_extensions:
+            if ext not in cls._parsers:
+                cls._parsers[ext] = instance
 
     @classmethod
     def register(cls, parser_class):
@@ -57,10 +104,8 @@ class ParserRegistry:
         Returns:
             None
         """
-        instance = parser_class()
-        for ext in instance.file_extensions:
-            if ext not in cls._parsers:
-                cls._parsers[ext] = instance
+        cls._ensure_builtins()  # Built-ins keep precedence for their extensions
+        cls._add(parser_class)
 
     @classmethod
     def get_parser(cls, file_extension):
@@ -73,6 +118,7 @@ class ParserRegistry:
         Returns:
             AbstractLanguageParser instance, or None if unsupported.
         """
+        cls._ensure_builtins()
         return cls._parsers.get(file_extension)
 
     @classmethod
@@ -82,6 +128,7 @@ class ParserRegistry:
         Returns:
             frozenset of extension strings (each with a leading dot).
         """
+        cls._ensure_builtins()
         return frozenset(cls._parsers.keys())
 
     @classmethod
@@ -98,6 +145,7 @@ class ParserRegistry:
         Returns:
             bool
         """
+        cls._ensure_builtins()
         path_str = str(file_path)
         dot_pos = path_str.rfind(".")
         if dot_pos == -1:
@@ -106,16 +154,6 @@ class ParserRegistry:
         return ext in cls._parsers
 
 
-# =========================================================================
-# Built-in registrations (executed at import time)
-# =========================================================================
-
-ParserRegistry.register(PythonASTParser)
-ParserRegistry.register(JavaRegexParser)
-ParserRegistry.register(TypeScriptRegexParser)
-ParserRegistry.register(KotlinRegexParser)
-
-
 # =========================================================================
 # Public API
 # =========================================================================
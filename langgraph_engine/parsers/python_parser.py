@@ -17,6 +17,18 @@ from .graph_model import make_call_edge, make_class_node, make_method_node
 # =========================================================================
 
 
+def _parse_source(content, file_path):
+    """Parse *content* through the shared SourceRepository.
+
+    Identical text parsed by another consumer (coverage analyzer, scanner,
+    UML analyzer) reuses the same tree instead of parsing again.
+    Raises SyntaxError / ValueError like ast.parse().
+    """
+    from ..core.source_repository import get_source_repository
+
+    return get_source_repository().parse_source(content, file_path)
+
+
 def _annotation_to_str(node):
     """Convert an annotation AST node to a readable string."""
     if isinstance(node, ast.Name):
@@ -339,7 +351,7 @@ class PythonASTParser(AbstractLanguageParser):
             Dict with keys 'classes', 'methods', 'calls', 'imports'.
         """
         try:
-            tree = ast.parse(content, filename=file_path)
+            tree = _parse_source(content, file_path)
         except (SyntaxError, ValueError):
             return {"classes": [], "methods": [], "calls": [], "imports": []}
 
@@ -378,7 +390,7 @@ class PythonASTParser(AbstractLanguageParser):
         """
         effective_rel = rel_path or file_path
         try:
-            tree = ast.parse(content, filename=file_path)
+            tree = _parse_source(content, file_path)
         except (SyntaxError, ValueError):
             result = self._make_visitor(effective_rel, file_path)
             return result
@@ -399,7 +411,7 @@ class PythonASTParser(AbstractLanguageParser):
             List of class node dicts.
         """
         try:
-            tree = ast.parse(content, filename=file_path)
+            tree = _parse_source(content, file_path)
         except (SyntaxError, ValueError):
             return []
 
@@ -419,7 +431,7 @@ class PythonASTParser(AbstractLanguageParser):
             List of method/function node dicts.
         """
         try:
-            tree = ast.parse(content, filename=file_path)
+            tree = _parse_source(content, file_path)
         except (SyntaxError, ValueError):
             return []
 
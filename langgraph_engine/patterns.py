@@ -3,10 +3,13 @@ Design Patterns - Reusable patterns for the LangGraph Workflow Engine.
 
 Pattern 1 (original): Memoize Decorator
   - TTL-based cache expiry (per-entry timestamps)
-  - Key generation from function arguments (args + kwargs)
-  - Thread-safe via threading.Lock
+  - Key generation from function arguments (args + kwargs), with a
+    no-hash fast path for scalar arguments
+  - Thread-safe via threading.Lock; concurrent misses are single-flight
+  - Optional stale-while-revalidate refresh after TTL expiry
   - LRU eviction when cache exceeds max 100 entries
-  - cache_clear() method on the decorated function
+  - cache_clear() / cache_info() (hit/miss/load-time stats) on the
+    decorated function
 
 Pattern 2: Step Decorators (NEW)
   Composable decorators for LangGraph node functions (state: dict -> dict).
@@ -34,6 +37,7 @@ ASCII-only source - cp1252 safe (Windows).
 
 from __future__ import annotations
 
+import copy
 import fnmatch
 import functools
 import hashlib
@@ -69,30 +73,60 @@ class _CacheEntry:
         self.timestamp: float = time.monotonic()
         self.ttl: float = ttl
 
+    def age(self) -> float:
+        """Seconds since the value was stored."""
+        return time.monotonic() - self.timestamp
+
     def is_expired(self) -> bool:
         """Return True when the entry has lived past its TTL."""
         if self.ttl <= 0:
             return False  # ttl=0 means never expire
-        return (time.monotonic() - self.timestamp) >= self.ttl
+        return self.age() >= self.ttl
+
+
+class _Flight:
+    """One in-progress load that concurrent callers of the same key wait on."""
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
 
 
 # ---------------------------------------------------------------------------
 # Key generation helper
 # ---------------------------------------------------------------------------
-def _make_cache_key(args: tuple, kwargs: dict) -> str:
+
+# Argument types whose equality/hash are value-based and cheap.  Calls made
+# only with these skip JSON + MD5 entirely.
+_FAST_KEY_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _make_cache_key(args: tuple, kwargs: dict) -> Any:
     """Stable, hashable cache key from positional and keyword arguments.
 
-    Converts args + kwargs to a deterministic JSON string then hashes it
-    with MD5 for a compact fixed-length key.  Falls back to repr() for
-    types that are not JSON-serialisable.
+    Fast path: when every argument is a str/int/float/bool/bytes/None, the
+    key is the argument tuple itself plus the argument types (so 1, 1.0
+    and True stay distinct, as they were under JSON).  Otherwise args +
+    kwargs are converted to a deterministic JSON string and hashed with
+    MD5, falling back to repr() for types that are not JSON-serialisable.
 
     Args:
         args:   Positional arguments tuple.
         kwargs: Keyword arguments dict.
 
     Returns:
-        Hex-digest string (32 chars).
+        Tuple (fast path) or 32-char hex-digest string.
     """
+    fast = _FAST_KEY_TYPES
+    if all(type(a) in fast for a in args):
+        if not kwargs:
+            return (args, tuple(map(type, args)))
+        if all(type(v) in fast for v in kwargs.values()):
+            items = tuple(sorted(kwargs.items()))
+            return (args, tuple(map(type, args)), items, tuple(type(v) for _, v in items))
     try:
         raw = json.dumps({"args": list(args), "kwargs": kwargs}, sort_keys=True, default=repr)
     except Exception:
@@ -106,29 +140,41 @@ def _make_cache_key(args: tuple, kwargs: dict) -> str:
 def memoize(
     ttl_seconds: float = _DEFAULT_TTL_SECONDS,
     max_size: int = _DEFAULT_MAX_SIZE,
+    stale_while_revalidate: float = 0,
 ) -> Callable[[F], F]:
     """Decorator factory that caches function results with TTL and LRU eviction.
 
     Features:
     - TTL-based expiry: entries older than ttl_seconds are re-computed.
-    - Key generation: stable hash of (args, kwargs).
-    - Thread-safe: a per-instance threading.Lock guards all cache mutations.
+    - Key generation: argument tuple for simple scalar arguments, otherwise
+      a stable hash of (args, kwargs).
+    - Single-flight: concurrent misses on the same key run the function
+      once; the other callers wait for (and share) that result or exception.
+      Exceptions are never cached.
+    - Stale-while-revalidate: an entry expired by less than
+      stale_while_revalidate seconds is returned immediately while one
+      background thread refreshes it.
+    - Thread-safe: a per-instance threading.Lock guards all cache mutations;
+      the function itself always runs outside the lock.
     - LRU eviction: when cache reaches max_size, the least-recently-used
       entry is removed before inserting the new one.
-    - cache_clear(): method injected on the decorated function to flush the
-      entire cache manually.
+    - cache_clear() / cache_info(): flush the cache, and read its size plus
+      hit/miss/load-time statistics.
 
     Args:
-        ttl_seconds: How many seconds a cached value is valid.
-                     0 or negative means "never expire".
-        max_size:    Maximum number of entries before LRU eviction kicks in.
-                     Must be >= 1.
+        ttl_seconds:            How many seconds a cached value is valid.
+                                0 or negative means "never expire".
+        max_size:               Maximum number of entries before LRU eviction
+                                kicks in.  Must be >= 1.
+        stale_while_revalidate: Grace window (seconds) past the TTL during
+                                which the stale value is served while it is
+                                refreshed.  0 disables it.
 
     Returns:
         Decorator that wraps the target function.
 
     Example:
-        @memoize(ttl_seconds=3600)
+        @memoize(ttl_seconds=3600, stale_while_revalidate=60)
         def detect_framework(project_path: str) -> dict:
             # Expensive file scanning - runs at most once per hour per path
             ...
@@ -136,10 +182,48 @@ def memoize(
     if max_size < 1:
         raise ValueError("max_size must be >= 1")
 
+    ttl = float(ttl_seconds)
+    swr = float(stale_while_revalidate) if ttl > 0 else 0.0
+
     def decorator(func: F) -> F:
         # OrderedDict preserves insertion order so we can do O(1) LRU moves.
         cache: OrderedDict = OrderedDict()
+        inflight: Dict[Any, _Flight] = {}
         lock = threading.Lock()
+        stats = _new_memoize_stats()
+        # Bumped by cache_clear() so loads started before a clear are not stored.
+        generation = [0]
+
+        def _load(key: Any, flight: _Flight, args: tuple, kwargs: dict) -> None:
+            """Run func for *key* and publish the result to waiters and the cache."""
+            gen = generation[0]
+            start = time.perf_counter()
+            try:
+                flight.value = func(*args, **kwargs)
+            except BaseException as exc:  # noqa: BLE001 - re-raised by every waiter
+                flight.error = exc
+            elapsed = time.perf_counter() - start
+            with lock:
+                stats["load_time_s"] += elapsed
+                if flight.error is not None:
+                    stats["load_errors"] += 1
+                else:
+                    stats["loads"] += 1
+                    if gen == generation[0]:
+                        if key in cache:
+                            del cache[key]
+                        while len(cache) >= max_size:
+                            cache.popitem(last=False)
+                            stats["evictions"] += 1
+                        cache[key] = _CacheEntry(value=flight.value, ttl=ttl)
+                if inflight.get(key) is flight:
+                    del inflight[key]
+            flight.done.set()
+
+        def _refresh(key: Any, flight: _Flight, args: tuple, kwargs: dict) -> None:
+            _load(key, flight, args, kwargs)
+            if flight.error is not None:
+                _logger.debug(f"[memoize] background refresh of {func.__name__} failed: {flight.error}")
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -147,43 +231,70 @@ def memoize(
 
             with lock:
                 entry = cache.get(key)
-
-                # Cache HIT - not expired
-                if entry is not None and not entry.is_expired():
-                    # Move to end to mark as most-recently-used
-                    cache.move_to_end(key)
-                    return entry.value
-
-                # Cache MISS or EXPIRED - remove stale entry if present
                 if entry is not None:
-                    del cache[key]
-
-            # Call original function outside the lock to avoid holding it
-            # during potentially long I/O operations.
-            result = func(*args, **kwargs)
-
-            with lock:
-                # LRU eviction: if at capacity, remove the oldest entry (front)
-                while len(cache) >= max_size:
-                    cache.popitem(last=False)
-
-                cache[key] = _CacheEntry(value=result, ttl=float(ttl_seconds))
-
-            return result
+                    age = entry.age() if ttl > 0 else 0.0
+                    # Cache HIT - not expired
+                    if age < ttl or ttl <= 0:
+                        cache.move_to_end(key)
+                        stats["hits"] += 1
+                        return entry.value
+                    # Expired but inside the SWR window: serve stale, refresh once
+                    if age < ttl + swr:
+                        cache.move_to_end(key)
+                        stats["stale_hits"] += 1
+                        if key not in inflight:
+                            flight = inflight[key] = _Flight()
+                            stats["refreshes"] += 1
+                            threading.Thread(
+                                target=_refresh,
+                                args=(key, flight, args, kwargs),
+                                daemon=True,
+                                name=f"memoize_refresh_{func.__name__}",
+                            ).start()
+                        return entry.value
+
+                # Cache MISS or EXPIRED - join an in-flight load or start one
+                flight = inflight.get(key)
+                leader = flight is None
+                if leader:
+                    flight = inflight[key] = _Flight()
+                    stats["misses"] += 1
+                else:
+                    stats["coalesced"] += 1
+
+            if leader:
+                _load(key, flight, args, kwargs)
+            else:
+                flight.done.wait()
+            if flight.error is not None:
+                # Each caller gets its own exception object; raising the shared
+                # one would grow a single traceback across waiter threads.
+                raise copy.copy(flight.error) from flight.error
+            return flight.value
 
         def cache_clear() -> None:
-            """Clear all cached entries for this function."""
+            """Clear all cached entries and statistics for this function."""
             with lock:
                 cache.clear()
+                stats.update(_new_memoize_stats())
+                generation[0] += 1
 
         def cache_info() -> dict:
-            """Return current cache size and max_size for introspection."""
+            """Return cache size, limits and hit/miss/load-time statistics."""
             with lock:
-                return {
-                    "size": len(cache),
-                    "max_size": max_size,
-                    "ttl_seconds": ttl_seconds,
-                }
+                info = dict(stats)
+                info.update(
+                    {
+                        "size": len(cache),
+                        "max_size": max_size,
+                        "ttl_seconds": ttl_seconds,
+                        "stale_while_revalidate": stale_while_revalidate,
+                        "in_flight": len(inflight),
+                    }
+                )
+            loads = info["loads"] + info["load_errors"]
+            info["avg_load_time_s"] = info["load_time_s"] / loads if loads else 0.0
+            return info
 
         # Attach helpers directly to the decorated function
         wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
@@ -196,6 +307,20 @@ def memoize(
     return decorator
 
 
+def _new_memoize_stats() -> Dict[str, Any]:
+    return {
+        "hits": 0,
+        "stale_hits": 0,
+        "misses": 0,
+        "coalesced": 0,
+        "refreshes": 0,
+        "loads": 0,
+        "load_errors": 0,
+        "evictions": 0,
+        "load_time_s": 0.0,
+    }
+
+
 # ===========================================================================
 # Pattern 2 - Step Decorators for LangGraph nodes
 # ===========================================================================
@@ -220,12 +345,14 @@ except ImportError:
 def with_timeout(seconds: int) -> Callable[[F], F]:
     """Wrap a LangGraph node function with a per-invocation timeout.
 
-    The node runs in a daemon thread.  If it does not complete within
-    *seconds*, the main thread returns the original state unchanged (no
-    partial updates) and injects a ``_timeout`` flag so downstream steps
-    can detect the condition.
+    The node runs on the shared bounded worker pool
+    (cancellation.get_timeout_executor()).  If it does not complete within
+    *seconds*, its cancellation token is cancelled (killing subprocesses it
+    started through cancellation.run_subprocess), and the original state is
+    returned unchanged (no partial updates) with a ``_timeout`` flag so
+    downstream steps can detect the condition.
 
-    Windows-compatible: uses threading.Thread, not SIGALRM.
+    Windows-compatible: uses worker threads, not SIGALRM.
 
     Args:
         seconds: Maximum allowed wall-clock time for the node.
@@ -244,24 +371,11 @@ def with_timeout(seconds: int) -> Callable[[F], F]:
     def decorator(fn: F) -> F:
         @functools.wraps(fn)
         def wrapper(state: dict) -> dict:
-            result_holder: Dict[str, Any] = {}
-            exc_holder: Dict[str, Any] = {}
+            from .cancellation import get_timeout_executor
 
-            def _target() -> None:
-                try:
-                    result_holder["value"] = fn(state)
-                except Exception as exc:  # noqa: BLE001
-                    exc_holder["error"] = exc
-
-            t = threading.Thread(
-                target=_target,
-                daemon=True,
-                name=f"timeout_{fn.__name__}",
-            )
-            t.start()
-            t.join(timeout=seconds)
+            outcome = get_timeout_executor().run(fn, args=(state,), timeout=seconds, label=fn.__name__)
 
-            if t.is_alive():
+            if outcome.timed_out:
                 _logger.warning(
                     "[with_timeout] '%s' exceeded %ss - returning state unchanged",
                     fn.__name__,
@@ -273,10 +387,10 @@ def with_timeout(seconds: int) -> Callable[[F], F]:
                 fallback["_timeout_limit_s"] = seconds
                 return fallback
 
-            if "error" in exc_holder:
-                raise exc_holder["error"]
+            if outcome.error is not None:
+                raise outcome.error
 
-            return result_holder.get("value", state)
+            return outcome.value if outcome.value is not None else state
 
         return wrapper  # type: ignore[return-value]
 
@@ -7,12 +7,23 @@ Provides:
 - Aggregate metrics per pipeline run (step durations, total time, cache hit rate)
 - Benchmark results saved to ~/.claude/logs/benchmarks/
 - Summary table for Step 14 output
+- ConcurrentPipelineBenchmark: N full pipelines at a fixed concurrency
+  against FakeLLMProvider (deterministic latency / error distribution),
+  reporting per-step latency percentiles, throughput, peak RSS, fd counts
+  and module-lock contention, with baseline regression checks
 
 Windows-safe: ASCII only (cp1252 compatible).
 """
 
+import hashlib
 import json
 import logging
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -193,3 +204,629 @@ class PipelineBenchmark:
                 continue
 
         return results
+
+
+# ===========================================================================
+# Concurrent pipeline load harness
+# ===========================================================================
+#
+# ConcurrentPipelineBenchmark runs N full pipelines (create_flow_graph) at a
+# fixed concurrency against FakeLLMProvider, and reports per-step latency
+# percentiles, throughput, peak RSS, file-descriptor counts and contention on
+# module-level locks.  Reports can be saved as baselines and compared with
+# regression thresholds (see compare_to_baseline).
+
+# Regression thresholds used by compare_to_baseline().  Ratios are relative
+# to the baseline value; steps faster than min_step_ms are ignored (noise).
+DEFAULT_REGRESSION_THRESHOLDS = {
+    "latency_ratio": 0.25,  # p95 pipeline / step latency may grow 25%
+    "throughput_ratio": 0.20,  # throughput may drop 20%
+    "rss_ratio": 0.25,  # peak RSS may grow 25%
+    "lock_wait_ratio": 0.50,  # total lock wait may grow 50%
+    "fd_leak_slack": 4,  # fds still open after the run, above baseline
+    "min_step_ms": 5.0,
+}
+
+_LOCK_TYPE = type(threading.Lock())
+_RLOCK_TYPE = type(threading.RLock())
+
+
+def percentile(values, pct):
+    """Return the *pct* percentile (0-100) of *values*, linearly interpolated.
+
+    Returns 0.0 for an empty sequence.
+    """
+    data = sorted(values)
+    if not data:
+        return 0.0
+    if len(data) == 1:
+        return float(data[0])
+    rank = (len(data) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(data) - 1)
+    return float(data[low] + (data[high] - data[low]) * (rank - low))
+
+
+def _latency_summary(values_ms):
+    return {
+        "count": len(values_ms),
+        "p50_ms": round(percentile(values_ms, 50), 1),
+        "p90_ms": round(percentile(values_ms, 90), 1),
+        "p95_ms": round(percentile(values_ms, 95), 1),
+        "p99_ms": round(percentile(values_ms, 99), 1),
+        "max_ms": round(max(values_ms), 1) if values_ms else 0.0,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Fake LLM provider
+# ---------------------------------------------------------------------------
+
+
+def _fake_outcome(config, prompt, occurrence):
+    """Deterministic (latency_s, kind) for the *occurrence*-th call of *prompt*.
+
+    kind is "ok", "error" or "timeout".  The same prompt, seed and
+    occurrence always give the same outcome, whatever the thread interleaving.
+    """
+
+    digest = hashlib.md5(prompt.encode("utf-8", errors="replace")).hexdigest()
+    rng = random.Random("%s:%s:%d" % (config.get("seed", 0), digest, occurrence))
+    latency = max(0.0, rng.gauss(config.get("latency_ms", 50.0), config.get("jitter_ms", 0.0))) / 1000.0
+    roll = rng.random()
+    if roll < config.get("error_rate", 0.0):
+        return latency, "error"
+    if roll < config.get("error_rate", 0.0) + config.get("timeout_rate", 0.0):
+        return config.get("timeout_s", 1.0), "timeout"
+    return latency, "ok"
+
+
+def _fake_response(prompt, json_mode):
+
+    digest = hashlib.md5(prompt.encode("utf-8", errors="replace")).hexdigest()[:8]
+    if json_mode:
+        return json.dumps({"status": "ok", "fake_llm": True, "prompt_digest": digest})
+    return "FAKE_LLM_RESPONSE %s" % digest
+
+
+class FakeLLMProvider:
+    """Local LLM stand-in with configurable latency and error distribution.
+
+    Duck-types llm_call.LLMProvider (name / is_available / call), so it can
+    replace the provider chain without importing llm_call here.
+
+    Args:
+        latency_ms:   Mean response latency.
+        jitter_ms:    Standard deviation of the latency (gaussian, >= 0).
+        error_rate:   Fraction of calls that fail fast (return None).
+        timeout_rate: Fraction of calls that hang for timeout_s, then fail.
+        timeout_s:    How long a "timeout" call sleeps.
+        seed:         Seed for the deterministic outcome sequence.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency_ms=50.0, jitter_ms=0.0, error_rate=0.0, timeout_rate=0.0, timeout_s=1.0, seed=0):
+        self.config = {
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "error_rate": error_rate,
+            "timeout_rate": timeout_rate,
+            "timeout_s": timeout_s,
+            "seed": seed,
+        }
+        self._lock = threading.Lock()
+        self._occurrences = {}
+        self.stats = {"calls": 0, "errors": 0, "timeouts": 0, "subprocess_calls": 0}
+
+    def is_available(self):
+        return True
+
+    def respond(self, prompt):
+        """Simulate one call.  Returns the response text, or None on failure."""
+        prompt = prompt or ""
+        with self._lock:
+            occurrence = self._occurrences.get(prompt, 0)
+            self._occurrences[prompt] = occurrence + 1
+            self.stats["calls"] += 1
+        delay, kind = _fake_outcome(self.config, prompt, occurrence)
+        time.sleep(delay)
+        if kind != "ok":
+            with self._lock:
+                self.stats["errors" if kind == "error" else "timeouts"] += 1
+            return None
+        return _fake_response(prompt, json_mode=False)
+
+    def call(self, prompt, model="fast", temperature=0.3, timeout=120, json_mode=False):
+        response = self.respond(prompt)
+        if response is not None and json_mode:
+            return _fake_response(prompt, json_mode=True)
+        return response
+
+    def call_cli(self, prompt, timeout=None):
+        """Replacement for the architecture scripts' _call_claude_cli()."""
+        response = self.respond(prompt)
+        if response is None:
+            return None, "fake LLM error"
+        return response, None
+
+
+def _fake_cli_main(argv):
+    """Entry point of the fake ``claude`` executable installed by fake_llm()."""
+
+    config = json.loads(os.environ.get("FAKE_LLM_CONFIG", "{}"))
+    prompt = argv[-1] if argv else ""
+    if prompt.startswith("@"):
+        try:
+            prompt = Path(prompt[1:]).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            pass
+    delay, kind = _fake_outcome(config, prompt, 0)
+    time.sleep(delay)
+    log = os.environ.get("FAKE_LLM_LOG")
+    if log:
+        with open(log, "a", encoding="utf-8") as fh:
+            fh.write(kind + "\n")
+    if kind != "ok":
+        return 1
+    text = _fake_response(prompt, json_mode=False)
+    sys.stdout.write(json.dumps({"type": "result", "result": text}) if "--json" in argv else text)
+    return 0
+
+
+class fake_llm:
+    """Context manager routing every LLM entry point to a FakeLLMProvider.
+
+    - llm_call's provider chain is replaced by the provider.
+    - _call_claude_cli in already-imported architecture modules is patched.
+    - On POSIX a ``claude`` shim is put first on PATH, so scripts run as
+      subprocesses (Step 0 orchestration) hit the same latency/error model.
+      Shim outcomes depend on the prompt only (no per-call occurrence).
+
+    Usage::
+
+        with fake_llm(FakeLLMProvider(latency_ms=20, error_rate=0.05)) as provider:
+            ...
+        provider.stats
+    """
+
+    def __init__(self, provider=None):
+        self.provider = provider or FakeLLMProvider()
+        self._restore = []
+        self._tmpdir = None
+
+    def __enter__(self):
+
+        try:
+            from langgraph_engine import llm_call as _llm_mod
+
+            self._restore.append((_llm_mod, "_provider_chain", _llm_mod._provider_chain))
+            _llm_mod._provider_chain = [self.provider]
+        except Exception as exc:
+            logger.debug("fake_llm: llm_call not patched: %s", exc)
+
+        for name, module in list(sys.modules.items()):
+            if name.startswith("langgraph_engine.level3_execution.architecture") and hasattr(
+                module, "_call_claude_cli"
+            ):
+                self._restore.append((module, "_call_claude_cli", module._call_claude_cli))
+                module._call_claude_cli = self.provider.call_cli
+
+        if os.name == "posix":
+            self._tmpdir = tempfile.mkdtemp(prefix="fake-llm-")
+            shim = Path(self._tmpdir) / "claude"
+            shim.write_text(
+                "#!%s\nimport sys\nsys.path.insert(0, %r)\n"
+                "from performance_benchmarks import _fake_cli_main\n"
+                "sys.exit(_fake_cli_main(sys.argv[1:]))\n" % (sys.executable, str(Path(__file__).resolve().parent)),
+                encoding="utf-8",
+            )
+            shim.chmod(0o755)
+            self._saved_env = {k: os.environ.get(k) for k in ("PATH", "FAKE_LLM_CONFIG", "FAKE_LLM_LOG")}
+            os.environ["PATH"] = self._tmpdir + os.pathsep + os.environ.get("PATH", "")
+            os.environ["FAKE_LLM_CONFIG"] = json.dumps(self.provider.config)
+            os.environ["FAKE_LLM_LOG"] = str(Path(self._tmpdir) / "calls.log")
+        return self.provider
+
+    def __exit__(self, *exc_info):
+
+        for obj, attr, value in reversed(self._restore):
+            setattr(obj, attr, value)
+        self._restore.clear()
+        if self._tmpdir:
+            log = Path(self._tmpdir) / "calls.log"
+            if log.exists():
+                kinds = log.read_text(encoding="utf-8").split()
+                self.provider.stats["subprocess_calls"] += len(kinds)
+                self.provider.stats["calls"] += len(kinds)
+                self.provider.stats["errors"] += kinds.count("error")
+                self.provider.stats["timeouts"] += kinds.count("timeout")
+            for key, value in self._saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Resource sampling
+# ---------------------------------------------------------------------------
+
+try:
+    import psutil as _psutil
+except ImportError:
+    _psutil = None
+
+
+def _current_rss_bytes():
+    if _psutil is not None:
+        return _psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # Peak, Linux kB
+    except Exception:
+        return None
+
+
+def _current_fd_count():
+    if _psutil is not None:
+        try:
+            proc = _psutil.Process()
+            return proc.num_fds() if hasattr(proc, "num_fds") else proc.num_handles()
+        except Exception:
+            pass
+    try:
+
+        return len(os.listdir("/proc/self/fd"))
+    except Exception:
+        return None
+
+
+class ResourceSampler:
+    """Background thread recording peak RSS and file-descriptor counts."""
+
+    def __init__(self, interval_s=0.05):
+        self.interval_s = interval_s
+        self._stop = threading.Event()
+        self._thread = None
+        self.fd_start = self.fd_end = self.fd_peak = None
+        self.rss_start = self.rss_peak = None
+
+    def _sample(self):
+        rss, fds = _current_rss_bytes(), _current_fd_count()
+        if rss is not None:
+            self.rss_peak = max(self.rss_peak or 0, rss)
+        if fds is not None:
+            self.fd_peak = max(self.fd_peak or 0, fds)
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            self._sample()
+
+    def __enter__(self):
+        self.rss_start, self.fd_start = _current_rss_bytes(), _current_fd_count()
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="bench-resource-sampler")
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._sample()
+        self.fd_end = _current_fd_count()
+        return False
+
+    def summary(self):
+        mb = 1024.0 * 1024.0
+        return {
+            "rss_start_mb": round(self.rss_start / mb, 1) if self.rss_start else None,
+            "peak_rss_mb": round(self.rss_peak / mb, 1) if self.rss_peak else None,
+            "fd_start": self.fd_start,
+            "fd_peak": self.fd_peak,
+            "fd_end": self.fd_end,
+            "fd_leaked": (self.fd_end - self.fd_start) if None not in (self.fd_start, self.fd_end) else None,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Lock contention
+# ---------------------------------------------------------------------------
+
+
+class _TimedLock:
+    """Lock proxy counting contended acquisitions and time spent waiting."""
+
+    def __init__(self, lock, record):
+        self._lock = lock
+        self._record = record
+
+    def acquire(self, blocking=True, timeout=-1):
+        if self._lock.acquire(False):
+            self._record(0.0, contended=False)
+            return True
+        if not blocking:
+            self._record(0.0, contended=True)
+            return False
+        start = time.perf_counter()
+        acquired = self._lock.acquire(True, timeout)
+        self._record(time.perf_counter() - start, contended=True)
+        return acquired
+
+    def release(self):
+        self._lock.release()
+
+    def locked(self):
+        return self._lock.locked() if hasattr(self._lock, "locked") else False
+
+    __enter__ = acquire
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+class LockContentionMonitor:
+    """Wrap module-level Lock/RLock objects to measure contention.
+
+    Every ``threading.Lock`` / ``RLock`` bound to a module-level name in an
+    imported module under *prefix* is replaced by a timing proxy for the
+    duration of the block.  Locks captured in closures or instances before
+    entry are not seen.
+    """
+
+    def __init__(self, prefix="langgraph_engine"):
+        self.prefix = prefix
+        self._patched = []
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def _recorder(self, name):
+        def record(wait_s, contended):
+            with self._stats_lock:
+                entry = self._stats.setdefault(
+                    name, {"acquires": 0, "contended": 0, "wait_ms": 0.0, "max_wait_ms": 0.0}
+                )
+                entry["acquires"] += 1
+                if contended:
+                    entry["contended"] += 1
+                    entry["wait_ms"] += wait_s * 1000
+                    entry["max_wait_ms"] = max(entry["max_wait_ms"], wait_s * 1000)
+
+        return record
+
+    def __enter__(self):
+
+        for mod_name, module in list(sys.modules.items()):
+            if module is None or not (mod_name == self.prefix or mod_name.startswith(self.prefix + ".")):
+                continue
+            for attr, value in list(vars(module).items()):
+                if isinstance(value, (_LOCK_TYPE, _RLOCK_TYPE)):
+                    name = "%s.%s" % (mod_name, attr)
+                    setattr(module, attr, _TimedLock(value, self._recorder(name)))
+                    self._patched.append((module, attr, value))
+        return self
+
+    def __exit__(self, *exc_info):
+        for module, attr, value in self._patched:
+            setattr(module, attr, value)
+        self._patched.clear()
+        return False
+
+    def summary(self, top=10):
+        """Locks ordered by total wait time (top *top*), plus totals."""
+        with self._stats_lock:
+            stats = {k: dict(v) for k, v in self._stats.items()}
+        ranked = sorted(stats.items(), key=lambda kv: (-kv[1]["wait_ms"], kv[0]))[:top]
+        return {
+            "locks_instrumented": len(self._patched) or len(stats),
+            "total_acquires": sum(v["acquires"] for v in stats.values()),
+            "total_contended": sum(v["contended"] for v in stats.values()),
+            "total_wait_ms": round(sum(v["wait_ms"] for v in stats.values()), 2),
+            "top": [dict(v, lock=k, wait_ms=round(v["wait_ms"], 2)) for k, v in ranked],
+        }
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+
+def graph_runner(
+    hook_mode=True, project_root="", user_message="Load test: summarise the project", checkpointer="sqlite"
+):
+    """Return a runner executing the real graph from orchestrator.create_flow_graph.
+
+    The graph is compiled once (warmed here) and shared; each run gets its
+    own session ID and, as in production, its own create_flow_graph() call
+    and checkpointer.  *checkpointer* is passed through ("memory" keeps
+    load runs out of the on-disk checkpoint database).  Per-node latency
+    is the wall-clock time between successive node updates from
+    ``graph.stream``; nodes finishing in the same parallel superstep share
+    one interval.
+    """
+    import uuid
+
+    from langgraph_engine.checkpointer import get_invoke_config
+    from langgraph_engine.orchestrator import (
+        create_flow_graph,
+        create_initial_state,
+        release_flow_graph,
+        warm_flow_graphs,
+    )
+
+    warm_flow_graphs([hook_mode])
+
+    def run(index, bench):
+        graph = create_flow_graph(hook_mode=hook_mode, checkpointer=checkpointer)
+        session_id = "load-%d-%s" % (index, uuid.uuid4().hex[:8])
+        state = create_initial_state(session_id, project_root, user_message)
+        config = get_invoke_config(session_id)
+        config["recursion_limit"] = 1000
+        last = time.perf_counter()
+        try:
+            for update in graph.stream(state, config=config, stream_mode="updates"):
+                now = time.perf_counter()
+                for node in update or {}:
+                    bench.record_step(node, now - last)
+                last = now
+        finally:
+            release_flow_graph(graph)
+
+    return run
+
+
+class ConcurrentPipelineBenchmark:
+    """Run many pipelines concurrently and aggregate a load report.
+
+    Args:
+        runner:      callable(index, bench) executing one pipeline and
+                     calling bench.record_step(step, seconds, status) per
+                     step.  Defaults to graph_runner().
+        pipelines:   Total pipelines to run.
+        concurrency: Pipelines in flight at once.
+        provider:    FakeLLMProvider used for every LLM call (a default one
+                     with 50 ms latency when None).
+    """
+
+    def __init__(self, runner=None, pipelines=10, concurrency=4, provider=None):
+        self.runner = runner
+        self.pipelines = pipelines
+        self.concurrency = concurrency
+        self.provider = provider or FakeLLMProvider()
+        self.benches = []
+
+    def run(self):
+        """Execute the load run.  Returns the report dict."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        errors = []
+        durations = []
+        results_lock = threading.Lock()
+
+        with fake_llm(self.provider), ResourceSampler() as sampler, LockContentionMonitor() as locks:
+            runner = self.runner or graph_runner()
+
+            def one(index):
+                bench = PipelineBenchmark(session_id="load-%d" % index)
+                start = time.perf_counter()
+                try:
+                    runner(index, bench)
+                except Exception as exc:
+                    with results_lock:
+                        errors.append({"pipeline": index, "error": "%s: %s" % (type(exc).__name__, exc)})
+                elapsed = time.perf_counter() - start
+                with results_lock:
+                    durations.append(elapsed * 1000)
+                    self.benches.append(bench)
+
+            wall_start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="load-pipeline") as pool:
+                list(pool.map(one, range(self.pipelines)))
+            wall = time.perf_counter() - wall_start
+
+        step_ms = {}
+        step_failures = {}
+        for bench in self.benches:
+            for step, data in bench.steps.items():
+                step_ms.setdefault(str(step), []).append(data["duration_ms"])
+                if data["status"] != "SUCCESS":
+                    step_failures[str(step)] = step_failures.get(str(step), 0) + 1
+
+        report = {
+            "timestamp": datetime.now().isoformat(),
+            "pipelines": self.pipelines,
+            "concurrency": self.concurrency,
+            "wall_time_s": round(wall, 3),
+            "throughput_per_s": round(self.pipelines / wall, 3) if wall > 0 else 0.0,
+            "errors": sorted(errors, key=lambda e: e["pipeline"]),
+            "pipeline_latency": _latency_summary(durations),
+            "steps": {step: _latency_summary(values) for step, values in sorted(step_ms.items())},
+            "step_failures": step_failures,
+            "resources": sampler.summary(),
+            "locks": locks.summary(),
+            "llm": dict(self.provider.stats, config=dict(self.provider.config)),
+        }
+        return report
+
+
+def save_baseline(report, path):
+    """Write *report* as the baseline at *path* (JSON)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+    return str(path)
+
+
+def load_baseline(path):
+    """Return the baseline report at *path*, or None when missing/unreadable."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def compare_to_baseline(report, baseline, thresholds=None):
+    """List regressions of *report* against *baseline*.
+
+    Returns:
+        List of human-readable regression strings (empty = within thresholds).
+    """
+    limits = dict(DEFAULT_REGRESSION_THRESHOLDS)
+    limits.update(thresholds or {})
+    regressions = []
+
+    def grew(label, current, base, ratio):
+        if current is None or not base:
+            return
+        if current > base * (1 + ratio):
+            regressions.append(
+                "%s: %.1f vs baseline %.1f (+%.0f%% > %.0f%%)"
+                % (label, current, base, (current / base - 1) * 100, ratio * 100)
+            )
+
+    grew(
+        "pipeline p95 ms",
+        report["pipeline_latency"]["p95_ms"],
+        baseline["pipeline_latency"]["p95_ms"],
+        limits["latency_ratio"],
+    )
+    for step, base_step in sorted(baseline.get("steps", {}).items()):
+        current = report.get("steps", {}).get(step)
+        if current and max(current["p95_ms"], base_step["p95_ms"]) >= limits["min_step_ms"]:
+            grew("step %s p95 ms" % step, current["p95_ms"], base_step["p95_ms"], limits["latency_ratio"])
+
+    base_tp, cur_tp = baseline.get("throughput_per_s"), report.get("throughput_per_s")
+    if base_tp and cur_tp is not None and cur_tp < base_tp * (1 - limits["throughput_ratio"]):
+        regressions.append(
+            "throughput/s: %.3f vs baseline %.3f (-%.0f%% > %.0f%%)"
+            % (cur_tp, base_tp, (1 - cur_tp / base_tp) * 100, limits["throughput_ratio"] * 100)
+        )
+
+    grew(
+        "peak RSS MB",
+        report["resources"].get("peak_rss_mb"),
+        baseline["resources"].get("peak_rss_mb"),
+        limits["rss_ratio"],
+    )
+    grew(
+        "lock wait ms",
+        report["locks"].get("total_wait_ms"),
+        baseline["locks"].get("total_wait_ms"),
+        limits["lock_wait_ratio"],
+    )
+
+    cur_leak, base_leak = report["resources"].get("fd_leaked"), baseline["resources"].get("fd_leaked")
+    if cur_leak is not None and cur_leak > (base_leak or 0) + limits["fd_leak_slack"]:
+        regressions.append(
+            "fd leaked: %d vs baseline %d (slack %d)" % (cur_leak, base_leak or 0, limits["fd_leak_slack"])
+        )
+    return regressions
@@ -0,0 +1,313 @@
+"""
+Project Fingerprint - One pruned walk answering every project-detection query.
+
+standard_selector used to test marker files one glob at a time (``**/*.py``,
+``**/*.csproj``, ``**/*.sln``) and then re-read the same manifests for
+framework detection.  A ProjectFingerprint is built from a single walk
+(shared EXCLUDED_DIRS via core.file_walker) and records:
+
+  - ext_histogram : lowercase file suffix -> count
+  - manifests     : root-level marker files present (setup.py, pom.xml, ...)
+  - keywords      : framework keywords found in each manifest group
+  - js_deps       : dependency names from package.json
+  - app_imports   : web frameworks imported by a root app.py
+
+Fingerprints are cached in memory and persisted as JSON.  A cached
+fingerprint is reused while the (mtime_ns, size) signature of the manifests
+and the mtime of every directory the walk visited are unchanged, so repeat
+lookups cost one stat() per manifest slot and directory instead of a walk.
+Adding, removing or renaming any file updates its directory's mtime, which
+keeps the extension histogram in step with the tree.
+
+Cache location: ~/.claude/logs/cache/project_fingerprint/<md5(project_root)>.json
+
+Usage::
+
+    from .project_fingerprint import get_project_fingerprint
+    fp = get_project_fingerprint("/path/to/project")
+    fp.has_manifest("pom.xml"), fp.count(".py"), fp.keywords["python"]
+
+ASCII-only (cp1252-safe for Windows).
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .core.file_walker import is_excluded_dir
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+_FINGERPRINT_FORMAT_VERSION = 2
+
+_DEFAULT_CACHE_BASE = os.environ.get("CACHE_BASE_DIR", "~/.claude/logs/cache")
+
+# Root-relative files whose presence or content drives detection.  Their
+# stat signature is the cache key.
+MANIFEST_FILES = (
+    "setup.py",
+    "pyproject.toml",
+    "requirements.txt",
+    "requirements/base.txt",
+    "requirements/prod.txt",
+    "Pipfile",
+    "manage.py",
+    "app.py",
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts",
+    "tsconfig.json",
+    "package.json",
+    "go.mod",
+    "Cargo.toml",
+)
+
+# Manifest group -> (files scanned, keywords looked for in lowercased text).
+_KEYWORD_GROUPS = {
+    "python": (
+        ("requirements.txt", "requirements/base.txt", "requirements/prod.txt", "pyproject.toml"),
+        ("django", "fastapi", "flask", "pyramid", "tornado", "langgraph", "langchain", "celery", "scrapy"),
+    ),
+    "pom": (("pom.xml",), ("spring-boot", "spring", "quarkus", "micronaut")),
+    "gradle": (("build.gradle", "build.gradle.kts"), ("spring-boot", "spring", "quarkus", "micronaut")),
+}
+
+_APP_IMPORTS = {
+    "flask": ("from flask", "import flask"),
+    "fastapi": ("from fastapi", "import fastapi"),
+}
+
+
+# ---------------------------------------------------------------------------
+# Fingerprint
+# ---------------------------------------------------------------------------
+
+
+class ProjectFingerprint:
+    """Immutable summary of a project tree used by detection queries."""
+
+    def __init__(
+        self,
+        root: str,
+        signature: List[list],
+        dirs: List[list],
+        ext_histogram: Dict[str, int],
+        manifests: List[str],
+        keywords: Dict[str, List[str]],
+        js_deps: List[str],
+        app_imports: List[str],
+    ):
+        self.root = root
+        self.signature = signature
+        self.dirs = dirs
+        self.ext_histogram = ext_histogram
+        self.manifests = frozenset(manifests)
+        self.keywords = keywords
+        self.js_deps = frozenset(js_deps)
+        self.app_imports = frozenset(app_imports)
+
+    def has_manifest(self, name: str) -> bool:
+        """Return True when root-relative marker file *name* exists."""
+        return name in self.manifests
+
+    def count(self, extension: str) -> int:
+        """Return the number of files with *extension* (e.g. ".py")."""
+        return self.ext_histogram.get(extension.lower(), 0)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": _FINGERPRINT_FORMAT_VERSION,
+            "root": self.root,
+            "signature": self.signature,
+            "dirs": self.dirs,
+            "ext_histogram": self.ext_histogram,
+            "manifests": sorted(self.manifests),
+            "keywords": self.keywords,
+            "js_deps": sorted(self.js_deps),
+            "app_imports": sorted(self.app_imports),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProjectFingerprint":
+        return cls(
+            data["root"],
+            data["signature"],
+            data["dirs"],
+            data["ext_histogram"],
+            data["manifests"],
+            data["keywords"],
+            data["js_deps"],
+            data["app_imports"],
+        )
+
+
+def _signature(root: Path) -> List[list]:
+    """Stat signature of every manifest slot (missing files included)."""
+    sig = []
+    for rel in MANIFEST_FILES:
+        try:
+            st = (root / rel).stat()
+            sig.append([rel, st.st_mtime_ns, st.st_size])
+        except OSError:
+            sig.append([rel, None, None])
+    return sig
+
+
+def _dir_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _dirs_current(root: Path, dirs: List[list]) -> bool:
+    """True while no walked directory gained, lost or renamed an entry."""
+    return all(_dir_mtime(os.path.join(str(root), rel)) == mtime for rel, mtime in dirs)
+
+
+def _read_lower(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8", errors="replace").lower()
+    except Exception:
+        return ""
+
+
+def build_fingerprint(project_root) -> ProjectFingerprint:
+    """Walk *project_root* once and build its fingerprint (no caching)."""
+    root = Path(project_root).resolve()
+    signature = _signature(root)
+    manifests = [rel for rel, mtime, _ in signature if mtime is not None and (root / rel).is_file()]
+
+    # Same pruning as core.file_walker.iter_project_files, plus the mtime of
+    # each visited directory for revalidation.
+    histogram: Dict[str, int] = {}
+    dirs: List[list] = []
+    for dirpath, dirnames, filenames in os.walk(str(root)):
+        dirnames[:] = sorted(d for d in dirnames if not is_excluded_dir(d))
+        dirs.append([os.path.relpath(dirpath, str(root)), _dir_mtime(dirpath)])
+        for fname in filenames:
+            ext = os.path.splitext(fname)[1].lower()
+            histogram[ext] = histogram.get(ext, 0) + 1
+
+    keywords: Dict[str, List[str]] = {}
+    for group, (files, words) in _KEYWORD_GROUPS.items():
+        text = "".join(_read_lower(root / rel) for rel in files if rel in manifests)
+        keywords[group] = [w for w in words if w in text]
+
+    js_deps: List[str] = []
+    if "package.json" in manifests:
+        try:
+            data = json.loads((root / "package.json").read_text(encoding="utf-8", errors="replace"))
+            deps = {}
+            deps.update(data.get("dependencies", {}))
+            deps.update(data.get("devDependencies", {}))
+            js_deps = sorted(k.lower() for k in deps)
+        except Exception:
+            pass
+
+    app_imports: List[str] = []
+    if "app.py" in manifests:
+        try:
+            content = (root / "app.py").read_text(encoding="utf-8", errors="replace")
+            app_imports = [name for name, needles in _APP_IMPORTS.items() if any(n in content for n in needles)]
+        except Exception:
+            pass
+
+    return ProjectFingerprint(str(root), signature, dirs, histogram, manifests, keywords, js_deps, app_imports)
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class FingerprintCache:
+    """Memory + disk cache of fingerprints, validated by manifest and directory stats.
+
+    Args:
+        cache_dir: Directory for persisted fingerprints.  Defaults to
+                   <CACHE_BASE_DIR>/project_fingerprint.
+        persist:   Save/load fingerprints to/from disk.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, persist: bool = True):
+        self.cache_dir = Path(cache_dir or Path(_DEFAULT_CACHE_BASE) / "project_fingerprint").expanduser()
+        self.persist = persist
+        self._memory: Dict[str, ProjectFingerprint] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "builds": 0}
+
+    def _path(self, root: str) -> Path:
+        return self.cache_dir / "{}.json".format(hashlib.md5(root.encode("utf-8")).hexdigest())
+
+    def get(self, project_root) -> ProjectFingerprint:
+        """Return an up-to-date fingerprint for *project_root*."""
+        root = str(Path(project_root).resolve())
+        signature = _signature(Path(root))
+        with self._lock:
+            fp = self._memory.get(root)
+            if fp is not None and fp.signature == signature and _dirs_current(Path(root), fp.dirs):
+                self.stats["hits"] += 1
+                return fp
+            fp = self._load(root, signature)
+            if fp is not None:
+                self.stats["disk_hits"] += 1
+            else:
+                fp = build_fingerprint(root)
+                self.stats["builds"] += 1
+                self._save(fp)
+            self._memory[root] = fp
+            return fp
+
+    def clear(self) -> None:
+        """Drop in-memory fingerprints (persisted files are kept)."""
+        with self._lock:
+            self._memory.clear()
+
+    def _load(self, root: str, signature: List[list]) -> Optional[ProjectFingerprint]:
+        if not self.persist:
+            return None
+        try:
+            data = json.loads(self._path(root).read_text(encoding="utf-8"))
+            if data.get("version") != _FINGERPRINT_FORMAT_VERSION or data.get("root") != root:
+                return None
+            if data.get("signature") != signature or not _dirs_current(Path(root), data["dirs"]):
+                return None
+            return ProjectFingerprint.from_dict(data)
+        except Exception:
+            return None
+
+    def _save(self, fp: ProjectFingerprint) -> None:
+        if not self.persist:
+            return
+        try:
+            path = self._path(fp.root)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(fp.to_dict(), separators=(",", ":")), encoding="utf-8")
+            os.replace(str(tmp), str(path))
+        except Exception:
+            pass  # Cache only
+
+
+_cache: Optional[FingerprintCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_fingerprint_cache() -> FingerprintCache:
+    """Return the process-wide FingerprintCache (created on demand)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = FingerprintCache()
+        return _cache
+
+
+def get_project_fingerprint(project_root) -> ProjectFingerprint:
+    """Return the cached fingerprint for *project_root*, rebuilding when stale."""
+    return get_fingerprint_cache().get(project_root)
@@ -10,15 +10,20 @@ Implements:
 Priority ordering (higher number wins conflicts):
   custom=4 > team=3 > framework=2 > language=1
 
+Detection queries are answered from a cached ProjectFingerprint
+(project_fingerprint.py): one pruned walk per project, revalidated by
+manifest mtimes, instead of a tree-wide glob per marker.
+
 Uses ErrorLogger from error_logger.py for decision audit trail.
 """
 
-import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from .error_logger import ErrorLogger
-from .patterns import memoize
+from .project_fingerprint import ProjectFingerprint, get_fingerprint_cache, get_project_fingerprint
 
 try:
     import sys as _sys
@@ -48,7 +53,8 @@ PRIORITY_LANGUAGE = 1  # Built-in language rules (python-standards.md, etc.)
 def detect_project_type(project_path: str) -> str:
     """Detect the primary programming language of a project.
 
-    Checks for well-known marker files in order of specificity.
+    Checks for well-known marker files in order of specificity, using the
+    project fingerprint (manifest presence and extension histogram).
 
     Args:
         project_path: Absolute path to the project root directory.
@@ -57,54 +63,47 @@ def detect_project_type(project_path: str) -> str:
         Lowercase language string: "python", "java", "javascript",
         "typescript", "go", "rust", "csharp", or "unknown".
     """
-    root = Path(project_path)
+    fp = get_project_fingerprint(project_path)
 
     # Python
-    if (
-        (root / "setup.py").exists()
-        or (root / "pyproject.toml").exists()
-        or (root / "requirements.txt").exists()
-        or (root / "Pipfile").exists()
-        or list(root.glob("**/*.py"))[:1]
+    if any(fp.has_manifest(m) for m in ("setup.py", "pyproject.toml", "requirements.txt", "Pipfile")) or fp.count(
+        ".py"
     ):
         return "python"
 
     # Java
-    if (root / "pom.xml").exists() or (root / "build.gradle").exists() or (root / "build.gradle.kts").exists():
+    if any(fp.has_manifest(m) for m in ("pom.xml", "build.gradle", "build.gradle.kts")):
         return "java"
 
     # JavaScript / TypeScript (check tsconfig before package.json so TS takes priority)
-    if (root / "tsconfig.json").exists():
+    if fp.has_manifest("tsconfig.json"):
         return "typescript"
 
-    if (root / "package.json").exists():
+    if fp.has_manifest("package.json"):
         return "javascript"
 
     # Go
-    if (root / "go.mod").exists():
+    if fp.has_manifest("go.mod"):
         return "go"
 
     # Rust
-    if (root / "Cargo.toml").exists():
+    if fp.has_manifest("Cargo.toml"):
         return "rust"
 
     # C#
-    cs_files = list(root.glob("**/*.csproj"))
-    sln_files = list(root.glob("**/*.sln"))
-    if cs_files or sln_files:
+    if fp.count(".csproj") or fp.count(".sln"):
         return "csharp"
 
     return "unknown"
 
 
-@memoize(ttl_seconds=3600)
 def detect_framework(project_path: str, project_type: str) -> str:
     """Detect the primary framework used within a project type.
 
-    Results are cached per (project_path, project_type) pair for 1 hour so
-    that repeated calls during the same pipeline run do not re-scan the
-    filesystem each time.  Use detect_framework.cache_clear() to flush the
-    cache manually (e.g. after project files change in tests).
+    Answered from the cached project fingerprint, which is rebuilt only when
+    a manifest changes, so repeated calls during a pipeline run do not
+    re-read the filesystem.  clear_detection_cache() drops the in-memory
+    fingerprints (e.g. in tests).
 
     Args:
         project_path: Absolute path to the project root.
@@ -114,160 +113,88 @@ def detect_framework(project_path: str, project_type: str) -> str:
         Framework name string, e.g. "flask", "django", "fastapi",
         "spring", "react", "angular", "vue", or "unknown".
     """
-    root = Path(project_path)
+    fp = get_project_fingerprint(project_path)
 
     if project_type == "python":
-        return _detect_python_framework(root)
+        return _detect_python_framework(fp)
 
     if project_type == "java":
-        return _detect_java_framework(root)
+        return _detect_java_framework(fp)
 
     if project_type in ("javascript", "typescript"):
-        return _detect_js_framework(root)
+        return _detect_js_framework(fp)
 
     return "unknown"
 
 
+def clear_detection_cache() -> None:
+    """Drop the in-memory project fingerprints behind detect_project_type() / detect_framework()."""
+    get_fingerprint_cache().clear()
+
+
 # ============================================================================
 # FRAMEWORK DETECTION HELPERS
 # ============================================================================
 
 
-def _detect_python_framework(root: Path) -> str:
-    """Detect Python web framework."""
-    requirements_files = [
-        root / "requirements.txt",
-        root / "requirements" / "base.txt",
-        root / "requirements" / "prod.txt",
-    ]
-
-    # Aggregate all requirement files into one text block
-    all_text = ""
-    for req_file in requirements_files:
-        if req_file.exists():
-            try:
-                all_text += req_file.read_text(encoding="utf-8", errors="replace").lower()
-            except Exception:
-                pass
-
-    # Also scan pyproject.toml
-    pyproject = root / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            all_text += pyproject.read_text(encoding="utf-8", errors="replace").lower()
-        except Exception:
-            pass
+def _detect_python_framework(fp: ProjectFingerprint) -> str:
+    """Detect Python web framework from requirements/pyproject keywords."""
+    found = set(fp.keywords.get("python", []))
 
     # Django takes priority because it often includes Flask-like libs too
-    if "django" in all_text:
-        return "django"
-    if "fastapi" in all_text:
-        return "fastapi"
-    if "flask" in all_text:
-        return "flask"
-    if "pyramid" in all_text:
-        return "pyramid"
-    if "tornado" in all_text:
-        return "tornado"
+    for name in ("django", "fastapi", "flask", "pyramid", "tornado"):
+        if name in found:
+            return name
 
     # Check manage.py as Django signal
-    if (root / "manage.py").exists():
+    if fp.has_manifest("manage.py"):
         return "django"
 
     # LangGraph / LangChain detection (before generic checks)
-    if "langgraph" in all_text:
-        return "langgraph"
-    if "langchain" in all_text:
-        return "langchain"
-    if "celery" in all_text:
-        return "celery"
-    if "scrapy" in all_text:
-        return "scrapy"
-
-    # Check for app.py with flask import
-    app_py = root / "app.py"
-    if app_py.exists():
-        try:
-            content = app_py.read_text(encoding="utf-8", errors="replace")
-            if "from flask" in content or "import flask" in content:
-                return "flask"
-            if "from fastapi" in content or "import fastapi" in content:
-                return "fastapi"
-        except Exception:
-            pass
+    for name in ("langgraph", "langchain", "celery", "scrapy"):
+        if name in found:
+            return name
+
+    # Check for app.py with flask/fastapi import
+    for name in ("flask", "fastapi"):
+        if name in fp.app_imports:
+            return name
 
     return "unknown"
 
 
-def _detect_java_framework(root: Path) -> str:
-    """Detect Java framework from build descriptor."""
-    pom_xml = root / "pom.xml"
-    if pom_xml.exists():
-        try:
-            content = pom_xml.read_text(encoding="utf-8", errors="replace").lower()
-            if "spring-boot" in content:
-                return "spring-boot"
-            if "spring" in content:
-                return "spring"
-            if "quarkus" in content:
-                return "quarkus"
-            if "micronaut" in content:
-                return "micronaut"
-        except Exception:
-            pass
-
-    # Gradle
-    for gradle_file in ["build.gradle", "build.gradle.kts"]:
-        gradle_path = root / gradle_file
-        if gradle_path.exists():
-            try:
-                content = gradle_path.read_text(encoding="utf-8", errors="replace").lower()
-                if "spring-boot" in content:
-                    return "spring-boot"
-                if "spring" in content:
-                    return "spring"
-                if "quarkus" in content:
-                    return "quarkus"
-                if "micronaut" in content:
-                    return "micronaut"
-            except Exception:
-                pass
+def _detect_java_framework(fp: ProjectFingerprint) -> str:
+    """Detect Java framework from build descriptor keywords (pom.xml before Gradle)."""
+    for group in ("pom", "gradle"):
+        found = set(fp.keywords.get(group, []))
+        for name in ("spring-boot", "spring", "quarkus", "micronaut"):
+            if name in found:
+                return name
 
     return "unknown"
 
 
-def _detect_js_framework(root: Path) -> str:
-    """Detect JavaScript/TypeScript framework from package.json."""
-    package_json = root / "package.json"
-    if not package_json.exists():
-        return "unknown"
-
-    try:
-        data = json.loads(package_json.read_text(encoding="utf-8", errors="replace"))
-        deps = {}
-        deps.update(data.get("dependencies", {}))
-        deps.update(data.get("devDependencies", {}))
-        dep_names = {k.lower() for k in deps.keys()}
-
-        # Order matters - angular uses @angular/core
-        if any("@angular" in d for d in dep_names):
-            return "angular"
-        if "react" in dep_names or "react-dom" in dep_names:
-            return "react"
-        if "vue" in dep_names:
-            return "vue"
-        if "svelte" in dep_names:
-            return "svelte"
-        if "next" in dep_names:
-            return "nextjs"
-        if "express" in dep_names:
-            return "express"
-        if "fastify" in dep_names:
-            return "fastify"
-        if "nestjs" in dep_names or "@nestjs/core" in dep_names:
-            return "nestjs"
-    except Exception:
-        pass
+def _detect_js_framework(fp: ProjectFingerprint) -> str:
+    """Detect JavaScript/TypeScript framework from package.json dependencies."""
+    dep_names = fp.js_deps
+
+    # Order matters - angular uses @angular/core
+    if any("@angular" in d for d in dep_names):
+        return "angular"
+    if "react" in dep_names or "react-dom" in dep_names:
+        return "react"
+    if "vue" in dep_names:
+        return "vue"
+    if "svelte" in dep_names:
+        return "svelte"
+    if "next" in dep_names:
+        return "nextjs"
+    if "express" in dep_names:
+        return "express"
+    if "fastify" in dep_names:
+        return "fastify"
+    if "nestjs" in dep_names or "@nestjs/core" in dep_names:
+        return "nestjs"
 
     return "unknown"
 
@@ -319,12 +246,34 @@ def load_custom_standards(project_path: str) -> List[Dict[str, Any]]:
     return custom
 
 
+# Team standards cache: (search dirs) -> (stat signature, loaded standards).
+# The signature covers every directory and file seen by the last scan, so a
+# repeat call costs one stat per entry instead of a recursive glob + reads.
+_team_standards_cache: Dict[Tuple[str, ...], Tuple[List[Tuple[str, Any]], List[Dict[str, Any]]]] = {}
+_team_standards_lock = threading.Lock()
+
+
+def _stat_key(path: Path) -> Any:
+    try:
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _signature_current(signature: List[Tuple[str, Any]]) -> bool:
+    return all(_stat_key(Path(p)) == key for p, key in signature)
+
+
 def load_team_standards(project_path: str) -> List[Dict[str, Any]]:
     """Load team-level standards from ~/.claude/.
 
     Scans:
-      - ~/.claude/policies/02-standards-system/*.md
-      - ~/.claude/standards/*.md
+      - ~/.claude/policies/02-standards-system/**/*.md
+      - ~/.claude/standards/**/*.md
+
+    The scan result is cached and reused while no scanned directory or file
+    has changed (checked by mtime/size).
 
     Args:
         project_path: Not used here but kept for API symmetry.
@@ -332,34 +281,49 @@ def load_team_standards(project_path: str) -> List[Dict[str, Any]]:
     Returns:
         List of standard dicts with keys: id, source, content, priority.
     """
-    team: List[Dict[str, Any]] = []
-
     search_dirs = [
         _STANDARD_SELECTOR_POLICIES_DIR / "02-standards-system",
         _STANDARD_SELECTOR_CLAUDE_HOME / "standards",
     ]
+    cache_key = tuple(str(d) for d in search_dirs)
 
-    for standards_dir in search_dirs:
-        if not standards_dir.exists():
-            continue
-        for md_file in standards_dir.glob("**/*.md"):
-            if md_file.name.lower() == "readme.md":
-                continue
-            try:
-                content = md_file.read_text(encoding="utf-8", errors="replace")
-                team.append(
-                    {
-                        "id": f"team_{md_file.stem}",
-                        "source": "team_standards",
-                        "file": str(md_file),
-                        "content": content,
-                        "priority": PRIORITY_TEAM,  # 3 - second highest precedence
-                    }
-                )
-            except Exception:
-                pass
+    with _team_standards_lock:
+        cached = _team_standards_cache.get(cache_key)
+        if cached is not None and _signature_current(cached[0]):
+            return [dict(std) for std in cached[1]]
+
+        team: List[Dict[str, Any]] = []
+        signature: List[Tuple[str, Any]] = []
 
-    return team
+        for standards_dir in search_dirs:
+            signature.append((str(standards_dir), _stat_key(standards_dir)))
+            if not standards_dir.is_dir():
+                continue
+            for dirpath, dirnames, filenames in os.walk(standards_dir):
+                dirnames.sort()
+                if dirpath != str(standards_dir):
+                    signature.append((dirpath, _stat_key(Path(dirpath))))
+                for fname in sorted(filenames):
+                    if not fname.endswith(".md") or fname.lower() == "readme.md":
+                        continue
+                    md_file = Path(dirpath) / fname
+                    signature.append((str(md_file), _stat_key(md_file)))
+                    try:
+                        content = md_file.read_text(encoding="utf-8", errors="replace")
+                        team.append(
+                            {
+                                "id": f"team_{md_file.stem}",
+                                "source": "team_standards",
+                                "file": str(md_file),
+                                "content": content,
+                                "priority": PRIORITY_TEAM,  # 3 - second highest precedence
+                            }
+                        )
+                    except Exception:
+                        pass
+
+        _team_standards_cache[cache_key] = (signature, team)
+        return [dict(std) for std in team]
 
 
 def load_framework_standards(project_type: str, framework: str) -> List[Dict[str, Any]]:
@@ -7,8 +7,10 @@ Provides:
 3. run_with_timeout() - Top-level function for direct use in node wrappers
 4. TimeoutError fallback results - Graceful degradation with detailed logging
 
-All timeouts use threading.Thread (Windows-compatible, no SIGALRM).
-On timeout, the thread is marked as daemon and abandoned - execution
+Steps run on the shared bounded worker pool from cancellation.py
+(Windows-compatible, no SIGALRM).  On timeout the step's cancellation token
+is cancelled - subprocesses it started through run_subprocess() are killed
+and cooperative code stops at its next raise_if_cancelled() - and execution
 continues on the main thread with a fallback result.
 
 Usage:
@@ -26,13 +28,13 @@ Usage:
 #           Removed timeout/label entries for dead steps 1-7 from STEP_TIMEOUTS/STEP_LABELS.
 """
 
-import threading
-import time
 from datetime import datetime
 from typing import Any, Callable, Dict, Optional, Tuple
 
 from loguru import logger
 
+from .cancellation import get_timeout_executor
+
 # ---------------------------------------------------------------------------
 # Canonical timeout values (seconds) per Level 3 step
 # Active steps only: Pre-0 (0), Step 0, Steps 8-14
@@ -63,20 +65,6 @@ STEP_LABELS: Dict[int, str] = {
 }
 
 
-# ---------------------------------------------------------------------------
-# Internal result container for thread-safe value passing
-# ---------------------------------------------------------------------------
-
-
-class _StepResult:
-    """Thread-safe container to pass result/error from worker thread."""
-
-    def __init__(self):
-        self.value: Optional[Dict[str, Any]] = None
-        self.error: Optional[Exception] = None
-        self.completed: bool = False
-
-
 # ---------------------------------------------------------------------------
 # Core timeout execution engine
 # ---------------------------------------------------------------------------
@@ -84,13 +72,13 @@ class _StepResult:
 
 class StepTimeout:
     """
-    Wraps a callable with timeout enforcement using a background thread.
+    Wraps a callable with timeout enforcement on the shared worker pool.
 
-    The callable runs in a daemon thread. If it does not finish within
-    `timeout_seconds`, the main thread returns a fallback result and logs
-    a detailed timeout warning. The daemon thread is abandoned (Python
-    does not support forceful thread termination, but daemon threads are
-    killed when the process exits).
+    If the callable does not finish within `timeout_seconds`, its
+    cancellation token is cancelled and the main thread returns a fallback
+    result with a detailed timeout warning.  Python cannot kill a thread, so
+    work that ignores the token keeps its pool worker until it returns; the
+    executor counts it under stats["leaked"] / stats["leaked_active"].
 
     Example:
         wrapper = StepTimeout(timeout_seconds=30)
@@ -130,33 +118,19 @@ class StepTimeout:
         if kwargs is None:
             kwargs = {}
 
-        container = _StepResult()
-        start_time = time.time()
-
-        def _worker():
-            try:
-                container.value = fn(*args, **kwargs)
-                container.completed = True
-            except Exception as exc:
-                container.error = exc
-                container.completed = True
-
-        thread = threading.Thread(target=_worker, daemon=True, name=f"timeout_{step_label}")
-        thread.start()
-        thread.join(timeout=self.timeout_seconds)
+        executor = get_timeout_executor()
+        outcome = executor.run(fn, args=args, kwargs=kwargs, timeout=self.timeout_seconds, label=step_label)
+        elapsed_ms = outcome.elapsed * 1000
 
-        elapsed_ms = (time.time() - start_time) * 1000
-
-        # --- Thread finished within timeout ---
-        if container.completed:
-            if container.error is not None:
+        # --- Finished within timeout ---
+        if not outcome.timed_out:
+            if outcome.error is not None:
                 logger.error(
-                    f"[TimeoutWrapper] {step_label} raised exception: {container.error} "
-                    f"(elapsed={elapsed_ms:.0f}ms)"
+                    f"[TimeoutWrapper] {step_label} raised exception: {outcome.error} " f"(elapsed={elapsed_ms:.0f}ms)"
                 )
                 return self._build_error_result(
                     step_label=step_label,
-                    reason=f"Exception: {container.error}",
+                    reason=f"Exception: {outcome.error}",
                     elapsed_ms=elapsed_ms,
                     fallback=fallback,
                 )
@@ -164,7 +138,7 @@ class StepTimeout:
             logger.debug(
                 f"[TimeoutWrapper] {step_label} completed in {elapsed_ms:.0f}ms " f"(limit={self.timeout_seconds}s)"
             )
-            result = container.value or {}
+            result = outcome.value or {}
             # Inject timing metadata
             if isinstance(result, dict):
                 result.setdefault("_timeout_enforced", True)
@@ -172,14 +146,12 @@ class StepTimeout:
                 result.setdefault("_timeout_limit_s", self.timeout_seconds)
             return result
 
-        # --- Thread did NOT finish (timeout) ---
+        # --- Did NOT finish (timeout): token cancelled, subprocesses killed ---
+        stats = executor.snapshot()
         logger.warning(
             f"[TimeoutWrapper] TIMEOUT: {step_label} exceeded {self.timeout_seconds}s "
-            f"(elapsed={elapsed_ms:.0f}ms). Abandoning thread and returning fallback."
-        )
-        logger.warning(
-            f"[TimeoutWrapper] Thread '{thread.name}' is alive={thread.is_alive()} "
-            f"- will be abandoned (daemon=True)."
+            f"(elapsed={elapsed_ms:.0f}ms). Cancelled step and returning fallback "
+            f"(killed_processes={outcome.token.killed_processes}, leaked_active={stats['leaked_active']})."
         )
 
         return self._build_error_result(
@@ -61,23 +61,38 @@ except Exception:
 # IMPORTS & SETUP
 # ============================================================================
 
-try:
-    # Try importing LangGraph engine
-    from langgraph_engine.checkpointer import get_invoke_config
-    from langgraph_engine.flow_trace_converter import print_flow_checkpoint, write_flow_trace_json
-    from langgraph_engine.orchestrator import create_flow_graph, create_initial_state
-
-    _LANGGRAPH_AVAILABLE = True
-except ImportError as e:
-    _LANGGRAPH_AVAILABLE = False
-    import_error = str(e)
-    # Log detailed error for debugging
-    import sys
+# The engine (orchestrator, loguru, every step module) costs a few hundred
+# milliseconds to import.  It is loaded by _load_engine() only once argument
+# parsing has decided a pipeline run is needed, so --help and slash-command
+# hook invocations exit without paying for it.
+_LANGGRAPH_AVAILABLE = None  # None = not loaded yet
+import_error = ""
+
+
+def _load_engine() -> bool:
+    """Import the LangGraph engine on first call.  Returns availability."""
+    global _LANGGRAPH_AVAILABLE, import_error
+    global get_invoke_config, print_flow_checkpoint, write_flow_trace_json
+    global create_flow_graph, create_initial_state
+
+    if _LANGGRAPH_AVAILABLE is not None:
+        return _LANGGRAPH_AVAILABLE
+    try:
+        from langgraph_engine.checkpointer import get_invoke_config
+        from langgraph_engine.flow_trace_converter import print_flow_checkpoint, write_flow_trace_json
+        from langgraph_engine.orchestrator import create_flow_graph, create_initial_state
+
+        _LANGGRAPH_AVAILABLE = True
+    except ImportError as e:
+        _LANGGRAPH_AVAILABLE = False
+        import_error = str(e)
+        # Log detailed error for debugging
+        print(f"[IMPORT ERROR] {import_error}", file=sys.stderr)
+        print("[DEBUG] Python path:", file=sys.stderr)
+        for p in sys.path[:5]:
+            print(f"  {p}", file=sys.stderr)
+    return _LANGGRAPH_AVAILABLE
 
-    print(f"[IMPORT ERROR] {import_error}", file=sys.stderr)
-    print("[DEBUG] Python path:", file=sys.stderr)
-    for p in sys.path[:5]:
-        print(f"  {p}", file=sys.stderr)
 
 # Windows-safe encoding
 if sys.platform == "win32":
@@ -248,7 +263,7 @@ def run_langgraph_engine(session_id: str = "", project_root: str = "", user_mess
     Returns:
         Final FlowState as dict
     """
-    if not _LANGGRAPH_AVAILABLE:
+    if not _load_engine():
         raise RuntimeError(
             f"LangGraph engine not available: {import_error}\n"
             "Install with: pip install langgraph>=0.2.0 langchain-core>=0.3.0"
@@ -386,16 +401,6 @@ def main():
                     file=sys.stderr,
                 )
 
-        # Check if LangGraph is available
-        if not _LANGGRAPH_AVAILABLE:
-            print(
-                f"[ERROR] LangGraph not installed.\n"
-                f"Install with: pip install langgraph>=0.2.0 langchain-core>=0.3.0\n"
-                f"Error details: {import_error}",
-                file=sys.stderr,
-            )
-            sys.exit(1)
-
         # Parse arguments
         session_id = ""
         project_root = ""
@@ -448,6 +453,16 @@ def main():
         if user_message.startswith("/") or user_message.startswith("!"):
             sys.exit(0)
 
+        # Check if LangGraph is available (first engine import happens here)
+        if not _load_engine():
+            print(
+                f"[ERROR] LangGraph not installed.\n"
+                f"Install with: pip install langgraph>=0.2.0 langchain-core>=0.3.0\n"
+                f"Error details: {import_error}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+
         print("[DEBUG] Before run_langgraph_engine:", file=sys.stderr)
         print(f"[DEBUG]   session_id={session_id}", file=sys.stderr)
         print(f"[DEBUG]   project_root={project_root}", file=sys.stderr)
@@ -24,9 +24,15 @@ from .session_integration import (
 
 # Use ide_paths for IDE self-contained installations (with fallback for standalone mode)
 try:
-    from ide_paths import SESSION_STATE_FILE
+    from ide_paths import SESSION_STATE_FILE, TRACKER_LOG
 except ImportError:
     SESSION_STATE_FILE = Path.home() / ".claude" / "memory" / "logs" / "session-progress.json"
+    TRACKER_LOG = Path.home() / ".claude" / "memory" / "logs" / "tool-tracker.jsonl"
+
+# helpers/ is a sibling package under scripts/
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent.parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.append(_SCRIPTS_DIR)
 
 
 # ---------------------------------------------------------------------------
@@ -118,16 +124,90 @@ def _get_session_progress_context():
     return {}
 
 
-def _get_tool_activity_for_task(task_id):
-    """Scan tool-tracker.jsonl for tool activity belonging to a specific task.
+def _empty_tool_activity():
+    """Return an empty activity dict as produced by _get_tool_activity_for_task."""
+    return {
+        "files_read": [],
+        "files_written": [],
+        "files_edited": [],
+        "commands_run": [],
+        "searches": [],
+        "edits": [],
+        "total_tools": 0,
+    }
+
+
+def _record_tool_activity(result, entry):
+    """Fold one tool-tracker entry into an activity dict (see _empty_tool_activity)."""
+    tool = entry.get("tool", "")
+    result["total_tools"] += 1
+    file_path = entry.get("file", "")
+
+    if tool == "Read" and file_path:
+        if file_path not in result["files_read"]:
+            result["files_read"].append(file_path)
+    elif tool == "Write" and file_path:
+        if file_path not in result["files_written"]:
+            result["files_written"].append(file_path)
+        lines = entry.get("content_lines", 0)
+        if lines:
+            result["edits"].append(file_path + " (" + str(lines) + " lines written)")
+    elif tool == "Edit" and file_path:
+        if file_path not in result["files_edited"]:
+            result["files_edited"].append(file_path)
+        old_hint = entry.get("old_hint", "")
+        new_hint = entry.get("new_hint", "")
+        edit_size = entry.get("edit_size", 0)
+        if old_hint or new_hint:
+            edit_desc = file_path
+            if edit_size:
+                edit_desc += " (" + ("+" if edit_size > 0 else "") + str(edit_size) + " chars)"
+            result["edits"].append(edit_desc)
+    elif tool == "Bash":
+        cmd = entry.get("command", "")
+        desc = entry.get("desc", "")
+        if cmd:
+            result["commands_run"].append(desc or cmd[:100])
+    elif tool in ("Grep", "Glob"):
+        pattern = entry.get("pattern", "")
+        if pattern:
+            result["searches"].append(tool + ": " + pattern)
+
+
+def _tool_tracker_segment():
+    """Return the current session's tool-tracker segment, or None.
+
+    Tries the session recorded in session-progress.json first, then the most
+    recent session folder.
+    """
+    try:
+        from helpers.tool_tracker_log import segment_path
+    except ImportError:
+        return None
+    from .session_integration import _get_current_session_id
+
+    for session_id in (_get_session_id(), _get_current_session_id()):
+        if session_id:
+            segment = segment_path(TRACKER_LOG, session_id)
+            if segment.exists():
+                return segment
+    return None
+
 
-    Locates the Nth TaskCreate event corresponding to task_id, then records
-    all subsequent tool calls until a TaskUpdate(completed) event for that
-    task is found.
+def _get_tool_activity_for_task(task_id, segment=None):
+    """Collect the tool activity belonging to a specific task.
+
+    The activity window starts after the Nth TaskCreate event (task_id "N")
+    and ends at the TaskUpdate(completed) event for that task.  With a
+    per-session segment (see helpers/tool_tracker_log.py) the window is
+    located through the segment's offset index and read directly, so the
+    cost does not depend on the size of the history.  Without one, the
+    legacy global tool-tracker.jsonl is scanned from the start.
 
     Args:
         task_id: Task ID string or int (e.g. '1') used to locate the
             TaskCreate event by ordinal position.
+        segment: Optional segment path; defaults to the current session's.
 
     Returns:
         dict: Keys files_read, files_written, files_edited (lists of file
@@ -136,25 +216,26 @@ def _get_tool_activity_for_task(task_id):
             All lists are empty and total_tools is 0 if the log is missing
             or no matching activity is found.
     """
-    tracker_log = Path.home() / ".claude" / "memory" / "logs" / "tool-tracker.jsonl"
-    result = {
-        "files_read": [],
-        "files_written": [],
-        "files_edited": [],
-        "commands_run": [],
-        "searches": [],
-        "edits": [],
-        "total_tools": 0,
-    }
+    result = _empty_tool_activity()
     try:
-        if not tracker_log.exists():
+        segment = segment or _tool_tracker_segment()
+        if segment is not None:
+            from helpers.tool_tracker_log import find_task_window, iter_window
+
+            window = find_task_window(segment, task_id)
+            if window is not None:
+                for entry in iter_window(segment, *window):
+                    _record_tool_activity(result, entry)
+            return result
+
+        if not TRACKER_LOG.exists():
             return result
 
-        # Read all entries, find the activity window for THIS specific task
-        # Strategy: Find the TaskCreate that matches task_id, record until its TaskUpdate(completed)
+        # Legacy global log: find the Nth TaskCreate, record until its TaskUpdate(completed)
         recording = False
+        created = 0
         task_id_str = str(task_id)
-        with open(tracker_log, "r", encoding="utf-8") as f:
+        with open(TRACKER_LOG, "r", encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
                 if not line:
@@ -165,27 +246,10 @@ def _get_tool_activity_for_task(task_id):
                     continue
 
                 tool = entry.get("tool", "")
-
-                # Start recording only when we see a TaskCreate followed by
-                # a TaskUpdate for THIS task_id (or the Nth TaskCreate matching task_id order)
                 if not recording and tool == "TaskCreate":
-                    # Match by checking if this is the Nth task (task_id = "1" means 1st TaskCreate)
-                    # We track a counter to find the right TaskCreate
-                    if not hasattr(result, "_tc_count"):
-                        result["_tc_count"] = 0
-                    result["_tc_count"] = result.get("_tc_count", 0) + 1
-                    if str(result.get("_tc_count", 0)) == task_id_str:
+                    created += 1
+                    if str(created) == task_id_str:
                         recording = True
-                        result = {
-                            "files_read": [],
-                            "files_written": [],
-                            "files_edited": [],
-                            "commands_run": [],
-                            "searches": [],
-                            "edits": [],
-                            "total_tools": 0,
-                            "_tc_count": result.get("_tc_count", 0),
-                        }
                     continue
 
                 # Stop recording when this task is marked completed
@@ -193,41 +257,8 @@ def _get_tool_activity_for_task(task_id):
                     if entry.get("task_status") == "completed":
                         break
 
-                if not recording:
-                    continue
-
-                result["total_tools"] += 1
-                file_path = entry.get("file", "")
-
-                if tool == "Read" and file_path:
-                    if file_path not in result["files_read"]:
-                        result["files_read"].append(file_path)
-                elif tool == "Write" and file_path:
-                    if file_path not in result["files_written"]:
-                        result["files_written"].append(file_path)
-                    lines = entry.get("content_lines", 0)
-                    if lines:
-                        result["edits"].append(file_path + " (" + str(lines) + " lines written)")
-                elif tool == "Edit" and file_path:
-                    if file_path not in result["files_edited"]:
-                        result["files_edited"].append(file_path)
-                    old_hint = entry.get("old_hint", "")
-                    new_hint = entry.get("new_hint", "")
-                    edit_size = entry.get("edit_size", 0)
-                    if old_hint or new_hint:
-                        edit_desc = file_path
-                        if edit_size:
-                            edit_desc += " (" + ("+" if edit_size > 0 else "") + str(edit_size) + " chars)"
-                        result["edits"].append(edit_desc)
-                elif tool == "Bash":
-                    cmd = entry.get("command", "")
-                    desc = entry.get("desc", "")
-                    if cmd:
-                        result["commands_run"].append(desc or cmd[:100])
-                elif tool in ("Grep", "Glob"):
-                    pattern = entry.get("pattern", "")
-                    if pattern:
-                        result["searches"].append(tool + ": " + pattern)
+                if recording:
+                    _record_tool_activity(result, entry)
 
     except Exception:
         pass
@@ -0,0 +1,224 @@
+"""helpers/tool_tracker_log.py - Per-session tool-tracker segments with an offset index.
+
+The post-tool-tracker hook appends one JSON line per tool call.  Entries are
+written to a per-session segment:
+
+    logs/sessions/<session_id>/tool-tracker.jsonl
+
+and every TaskCreate / TaskUpdate line is also recorded in a sidecar index
+(tool-tracker.jsonl.idx) holding its byte offset and length.  Readers such
+as github_operations.issue_manager find a task's activity window from the
+small index and seek straight to it, so lookups cost O(window) no matter
+how long the history grows.
+
+Index line format (JSON):
+    {"off": int, "len": int, "tool": "TaskCreate"|"TaskUpdate",
+     "task_id": str, "status": str}
+
+Windows-safe: ASCII only, no Unicode characters.
+"""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import fcntl as _fcntl
+except ImportError:
+    _fcntl = None
+
+try:
+    import msvcrt as _msvcrt
+except ImportError:
+    _msvcrt = None
+
+TASK_TOOLS = ("TaskCreate", "TaskUpdate")
+INDEX_SUFFIX = ".idx"
+
+
+def segment_path(tracker_log, session_id):
+    """Return the per-session segment for the global tracker log path.
+
+    Args:
+        tracker_log: Path of the global tool-tracker.jsonl (TRACKER_LOG).
+        session_id: Session ID string.
+
+    Returns:
+        Path: <tracker_log dir>/sessions/<session_id>/<tracker_log name>.
+    """
+    tracker_log = Path(tracker_log)
+    return tracker_log.parent / "sessions" / session_id / tracker_log.name
+
+
+def index_path(segment):
+    """Return the sidecar index path for a segment."""
+    segment = Path(segment)
+    return segment.with_name(segment.name + INDEX_SUFFIX)
+
+
+def _index_record(entry, offset, length):
+    return {
+        "off": offset,
+        "len": length,
+        "tool": entry.get("tool", ""),
+        "task_id": str(entry.get("task_id", "")),
+        "status": entry.get("task_status", ""),
+    }
+
+
+def _lock(f):
+    """Exclusive lock on an open file (flock on POSIX, best effort on Windows)."""
+    try:
+        if _fcntl is not None:
+            _fcntl.flock(f.fileno(), _fcntl.LOCK_EX)
+        elif _msvcrt is not None:
+            f.seek(0)
+            _msvcrt.locking(f.fileno(), _msvcrt.LK_LOCK, 1)
+    except (IOError, OSError):
+        pass
+
+
+def _unlock(f):
+    try:
+        if _fcntl is not None:
+            _fcntl.flock(f.fileno(), _fcntl.LOCK_UN)
+        elif _msvcrt is not None:
+            f.seek(0)
+            _msvcrt.locking(f.fileno(), _msvcrt.LK_UNLCK, 1)
+    except (IOError, OSError):
+        pass
+
+
+def append_entry(segment, entry):
+    """Append one entry to a segment, indexing TaskCreate/TaskUpdate lines.
+
+    The segment is locked for the duration of both writes, so concurrent
+    hook processes never record a wrong offset.
+
+    Args:
+        segment: Path of the per-session tool-tracker.jsonl.
+        entry (dict): Tool tracking record.
+
+    Returns:
+        int: Byte offset at which the entry was written.
+    """
+    segment = Path(segment)
+    segment.parent.mkdir(parents=True, exist_ok=True)
+    data = (json.dumps(entry) + "\n").encode("utf-8")
+    with open(segment, "ab") as f:
+        _lock(f)
+        try:
+            f.seek(0, os.SEEK_END)
+            offset = f.tell()
+            f.write(data)
+            f.flush()
+            if entry.get("tool") in TASK_TOOLS:
+                with open(index_path(segment), "a", encoding="utf-8") as idx:
+                    idx.write(json.dumps(_index_record(entry, offset, len(data))) + "\n")
+        finally:
+            _unlock(f)
+    return offset
+
+
+def rebuild_index(segment):
+    """Recreate the sidecar index by scanning the whole segment once.
+
+    Returns:
+        list: The index records.
+    """
+    segment = Path(segment)
+    records = []
+    offset = 0
+    with open(segment, "rb") as f:
+        for raw in f:
+            length = len(raw)
+            if b'"Task' in raw:
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    entry = None
+                if isinstance(entry, dict) and entry.get("tool") in TASK_TOOLS:
+                    records.append(_index_record(entry, offset, length))
+            offset += length
+    tmp = index_path(segment).with_name(index_path(segment).name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for rec in records:
+            f.write(json.dumps(rec) + "\n")
+    os.replace(str(tmp), str(index_path(segment)))
+    return records
+
+
+def load_index(segment):
+    """Load the sidecar index, rebuilding it when missing or inconsistent.
+
+    Returns:
+        list: Index records in file order (empty when the segment is missing).
+    """
+    segment = Path(segment)
+    try:
+        size = segment.stat().st_size
+    except OSError:
+        return []
+    idx = index_path(segment)
+    if not idx.exists():
+        return rebuild_index(segment)
+    records = []
+    with open(idx, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                return rebuild_index(segment)
+    if records and records[-1]["off"] + records[-1]["len"] > size:
+        return rebuild_index(segment)  # segment was truncated or replaced
+    return records
+
+
+def find_task_window(segment, task_id):
+    """Locate a task's activity window in a segment.
+
+    The window starts after the Nth TaskCreate line (task_id "N" is the Nth
+    task created in the session) and ends before the first
+    TaskUpdate(status=completed) for that task, or at end of file.
+
+    Returns:
+        tuple or None: (start, end) byte offsets, end None meaning EOF;
+            None when the session has fewer than N TaskCreate events.
+    """
+    task_id = str(task_id)
+    try:
+        ordinal = int(task_id)
+    except ValueError:
+        return None
+    created = 0
+    start = None
+    for rec in load_index(segment):
+        if start is None:
+            if rec.get("tool") == "TaskCreate":
+                created += 1
+                if created == ordinal:
+                    start = rec["off"] + rec["len"]
+            continue
+        if rec.get("tool") == "TaskUpdate" and rec.get("task_id") == task_id and rec.get("status") == "completed":
+            return start, rec["off"]
+    return (start, None) if start is not None else None
+
+
+def iter_window(segment, start, end=None):
+    """Yield the parsed entries between two byte offsets of a segment."""
+    with open(segment, "rb") as f:
+        f.seek(start)
+        pos = start
+        for raw in f:
+            if end is not None and pos >= end:
+                break
+            pos += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                yield entry
@@ -0,0 +1,438 @@
+"""
+Session Chain Graph - memory-resident session chain index for the session MCP server.
+
+The chain index (parent/child links, related sessions, tags) used to be
+re-read from .chain-index.json by every chain tool and rewritten in full by
+every update.  SessionChainGraph keeps it resident instead:
+
+  - sessions:  session_id -> record (the .chain-index.json record format,
+               whose parent / children / related fields are the adjacency
+               lists of the graph)
+  - postings:  tag -> ordered set of session_ids (the tag_index)
+
+Queries (ancestor walk, tag search, top-k related) are dictionary lookups.
+Each mutation is applied in memory and appended as one JSON line to
+<index>.log.jsonl; replaying the log over the last snapshot rebuilds the
+graph.  Every compact_every operations the graph is written back to
+.chain-index.json (same format as before, so older readers still work) and
+the log is truncated.  Replayed operations are idempotent, so a crash
+between snapshot and truncate only replays work already in the snapshot.
+
+Other processes writing the same index are picked up on the next call:
+a changed snapshot triggers a reload, a longer log replays just the new
+tail.  Compaction assumes a single compacting writer.
+
+Windows-Safe: ASCII only (cp1252 compatible)
+"""
+
+import copy
+import heapq
+import json
+import math
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from base.persistence import AtomicJsonStore
+
+INDEX_VERSION = "1.0.0"
+
+# Compact after this many logged operations
+DEFAULT_COMPACT_EVERY = 500
+
+# Sessions sharing at least this many tags are auto-related by tag()
+AUTO_RELATE_MIN_SHARED = 2
+
+
+def new_record(parent: Optional[str] = None, created_at: str = "", **fields) -> dict:
+    """Return an empty chain-index session record."""
+    record = {
+        "parent": parent,
+        "children": [],
+        "related": [],
+        "tags": [],
+        "project": "",
+        "skill": "",
+        "task_type": "",
+        "summary": "",
+        "created_at": created_at,
+        "last_prompt": "",
+    }
+    record.update(fields)
+    return record
+
+
+def _stat(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(str(path))
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class SessionChainGraph:
+    """In-memory session chain graph with an append-only mutation log.
+
+    Args:
+        index_path: The .chain-index.json snapshot file.
+        log_path: Mutation log (default: <index_path>.log.jsonl).
+        compact_every: Logged operations between snapshots.
+    """
+
+    def __init__(
+        self,
+        index_path: Path,
+        log_path: Optional[Path] = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ):
+        self.index_path = Path(index_path)
+        self.log_path = Path(log_path) if log_path else self.index_path.with_name(self.index_path.name + ".log.jsonl")
+        self.compact_every = compact_every
+        self._store = AtomicJsonStore(
+            self.index_path,
+            default_factory=lambda: {"version": INDEX_VERSION, "sessions": {}, "tag_index": {}},
+        )
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._sessions: Dict[str, dict] = {}
+        self._postings: Dict[str, Dict[str, None]] = {}  # dict as ordered set
+        self._related: Dict[str, set] = {}
+        self._position: Dict[str, int] = {}  # insertion order, for stable results
+        self._snapshot_sig = None
+        self._log_offset = 0
+        self._pending_ops = 0
+
+    # =========================================================================
+    # LOADING AND SYNC
+    # =========================================================================
+
+    def _reset(self) -> None:
+        self._sessions, self._postings, self._related, self._position = {}, {}, {}, {}
+
+    def _load(self) -> None:
+        """Rebuild the graph from the snapshot plus the whole log."""
+        self._reset()
+        self._snapshot_sig = _stat(self.index_path)
+        index = self._store.load()
+        for sid, record in index.get("sessions", {}).items():
+            self._put(sid, dict(record))
+        for tag, sids in index.get("tag_index", {}).items():
+            for sid in sids:
+                self._postings.setdefault(tag, {})[sid] = None
+        self._log_offset = 0
+        self._pending_ops = 0
+        self._replay_tail()
+        self._loaded = True
+        if self._pending_ops >= self.compact_every:
+            self.compact()
+
+    def _replay_tail(self) -> None:
+        """Apply log lines written after self._log_offset."""
+        try:
+            with open(self.log_path, "rb") as f:
+                f.seek(self._log_offset)
+                data = f.read()
+        except OSError:
+            return
+        end = data.rfind(b"\n") + 1  # Ignore a torn final line
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply(json.loads(line.decode("utf-8")))
+            except (ValueError, KeyError, TypeError):
+                continue
+            self._pending_ops += 1
+        self._log_offset += end
+
+    def _sync(self) -> None:
+        """Load on first use; pick up writes made by other processes."""
+        if not self._loaded:
+            self._load()
+            return
+        if _stat(self.index_path) != self._snapshot_sig:
+            self._load()
+            return
+        log_sig = _stat(self.log_path)
+        log_size = log_sig[1] if log_sig else 0
+        if log_size < self._log_offset:
+            self._load()  # Log truncated by another compaction
+        elif log_size > self._log_offset:
+            self._replay_tail()
+
+    def refresh(self) -> None:
+        """Force a full reload from disk."""
+        with self._lock:
+            self._load()
+
+    # =========================================================================
+    # MUTATIONS
+    # =========================================================================
+
+    def _reindex_tags(self, sid: str, old_tags: Iterable[str], new_tags: Iterable[str]) -> None:
+        """Move *sid* from the postings of *old_tags* to those of *new_tags*."""
+        new_tags = list(new_tags)
+        for tag in set(old_tags).difference(new_tags):
+            posting = self._postings.get(tag)
+            if posting is not None:
+                posting.pop(sid, None)
+                if not posting:
+                    del self._postings[tag]
+        for tag in new_tags:
+            self._postings.setdefault(tag, {})[sid] = None
+
+    def _put(self, sid: str, record: dict) -> None:
+        if sid not in self._position:
+            self._position[sid] = len(self._position)
+        old = self._sessions.get(sid)
+        self._sessions[sid] = record
+        self._related[sid] = set(record.get("related", []))
+        self._reindex_tags(sid, old.get("tags", []) if old else [], record.get("tags", []))
+
+    def _ensure(self, sid: str, parent: Optional[str] = None, created_at: str = "") -> dict:
+        if sid not in self._sessions:
+            self._put(sid, new_record(parent=parent, created_at=created_at))
+        return self._sessions[sid]
+
+    def _apply(self, op: dict):
+        kind = op["op"]
+        if kind == "create":
+            self._apply_create(op["id"], op["record"])
+            return None
+        if kind == "link":
+            self._apply_link(op["child"], op["parent"], op.get("at", ""))
+            return None
+        if kind == "tag":
+            return self._apply_tag(op["id"], op["tags"], op.get("summary", ""), op.get("at", ""))
+        if kind == "update":
+            return self._apply_update(op["id"], op["fields"])
+        raise KeyError(kind)
+
+    def _apply_create(self, sid: str, record: dict) -> None:
+        old = self._sessions.get(sid)
+        record = dict(record)
+        if old is not None:  # Keep links made before the record arrived
+            for key in ("children", "related"):
+                record[key] = list(dict.fromkeys(old.get(key, []) + record.get(key, [])))
+            record["parent"] = record.get("parent") or old.get("parent")
+        self._put(sid, record)
+
+    def _apply_link(self, child: str, parent: str, at: str) -> None:
+        self._ensure(parent)
+        if child in self._sessions:
+            self._sessions[child]["parent"] = parent
+        else:
+            self._ensure(child, parent=parent, created_at=at)
+        children = self._sessions[parent].setdefault("children", [])
+        if child not in children:
+            children.append(child)
+
+    def _relate(self, a: str, b: str) -> None:
+        for x, y in ((a, b), (b, a)):
+            if y not in self._related[x]:
+                self._related[x].add(y)
+                self._sessions[x].setdefault("related", []).append(y)
+
+    def _apply_tag(self, sid: str, tags: List[str], summary: str, at: str) -> List[str]:
+        session = self._ensure(sid, created_at=at)
+        merged = set(session.get("tags", [])) | set(tags)
+        session["tags"] = sorted(merged)
+        if summary:
+            session["summary"] = summary
+        for tag in tags:
+            self._postings.setdefault(tag, {})[sid] = None
+
+        # Auto-relate: only sessions sharing a posting list can qualify
+        shared = Counter(other for tag in merged for other in self._postings.get(tag, ()) if other != sid)
+        related_found = sorted(
+            (other for other, n in shared.items() if n >= AUTO_RELATE_MIN_SHARED and other in self._sessions),
+            key=self._position.__getitem__,
+        )
+        for other in related_found:
+            self._relate(sid, other)
+        return related_found
+
+    def _apply_update(self, sid: str, fields: dict) -> bool:
+        session = self._sessions.get(sid)
+        if session is None:
+            return False
+        old_tags = list(session.get("tags", []))
+        session.update(fields)
+        if "tags" in fields:
+            self._reindex_tags(sid, old_tags, session.get("tags", []))
+        if "related" in fields:
+            self._related[sid] = set(session.get("related", []))
+        return True
+
+    def _commit(self, op: dict):
+        """Apply *op*, append it to the log and compact when due."""
+        with self._lock:
+            self._sync()
+            result = self._apply(op)
+            line = (json.dumps(op, default=str) + "\n").encode("utf-8")
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_path, "ab") as f:
+                f.write(line)
+                end = f.tell()
+            start = end - len(line)
+            if start > self._log_offset:
+                # Another process appended since our last sync: replay its lines
+                with open(self.log_path, "rb") as f:
+                    f.seek(self._log_offset)
+                    foreign = f.read(start - self._log_offset)
+                for raw in foreign.splitlines():
+                    try:
+                        self._apply(json.loads(raw.decode("utf-8")))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+            self._log_offset = end
+            self._pending_ops += 1
+            if self._pending_ops >= self.compact_every:
+                self.compact()
+            return result
+
+    def create(self, session_id: str, record: dict) -> None:
+        """Register (or replace) a session record."""
+        self._commit({"op": "create", "id": session_id, "record": record})
+
+    def link(self, child_id: str, parent_id: str) -> None:
+        """Make *parent_id* the parent of *child_id* (placeholders created as needed)."""
+        self._commit({"op": "link", "child": child_id, "parent": parent_id, "at": datetime.now().isoformat()})
+
+    def tag(self, session_id: str, tags: Iterable[str], summary: str = "") -> List[str]:
+        """Add tags (and summary); returns the sessions auto-related by shared tags."""
+        op = {"op": "tag", "id": session_id, "tags": list(tags), "summary": summary}
+        op["at"] = datetime.now().isoformat()
+        return self._commit(op)
+
+    def update(self, session_id: str, **fields) -> bool:
+        """Set fields on an existing session; False when it is unknown."""
+        with self._lock:
+            self._sync()
+            if session_id not in self._sessions:
+                return False
+            return self._commit({"op": "update", "id": session_id, "fields": fields})
+
+    def modify(self, session_id: str, fn: Callable[[dict], Optional[dict]]) -> Optional[dict]:
+        """Read-modify-write a session under one lock acquisition.
+
+        *fn* gets a private copy of the record and returns the fields to set
+        (None or {} to leave the session unchanged).  The result is logged as
+        a plain "update", so replay stays idempotent.
+
+        Returns:
+            The fields committed ({} when *fn* made no change), or None when
+            the session is unknown.
+        """
+        with self._lock:
+            self._sync()
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            fields = fn(copy.deepcopy(session)) or {}
+            if fields:
+                self._commit({"op": "update", "id": session_id, "fields": fields})
+            return fields
+
+    def compact(self) -> None:
+        """Write the snapshot and truncate the log."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            self._store.save(self.to_dict())
+            with open(self.log_path, "wb"):
+                pass
+            self._snapshot_sig = _stat(self.index_path)
+            self._log_offset = 0
+            self._pending_ops = 0
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            self._sync()
+            return session_id in self._sessions
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._sync()
+            return len(self._sessions)
+
+    def get(self, session_id: str) -> Optional[dict]:
+        """Return the session record (treat as read-only), or None."""
+        with self._lock:
+            self._sync()
+            return self._sessions.get(session_id)
+
+    def ancestors(self, session_id: str, limit: int) -> List[Tuple[str, dict]]:
+        """Walk parent links from *session_id*: [(id, record)], nearest first."""
+        with self._lock:
+            self._sync()
+            session = self._sessions.get(session_id)
+            chain = []
+            current = session.get("parent") if session else None
+            visited = {session_id}
+            while current and len(chain) < limit and current not in visited:
+                visited.add(current)
+                parent = self._sessions.get(current)
+                if parent is None:
+                    break
+                chain.append((current, parent))
+                current = parent.get("parent")
+            return chain
+
+    def search_tags(self, tags: Iterable[str]) -> Dict[str, List[str]]:
+        """Return {session_id: matched tags} for sessions with ANY of *tags*."""
+        with self._lock:
+            self._sync()
+            matching: Dict[str, List[str]] = {}
+            for tag in tags:
+                for sid in self._postings.get(tag, ()):
+                    matching.setdefault(sid, []).append(tag)
+            return matching
+
+    def top_related(self, session_id: str, k: int = 5) -> List[Tuple[str, float, List[str]]]:
+        """Rank sessions by weighted tag overlap with *session_id*.
+
+        Each shared tag counts log(N / df): a tag carried by few sessions is
+        stronger evidence than one most sessions have.  Ties go to the more
+        recently created session.
+
+        Returns:
+            [(session_id, score, shared_tags)] best first, at most *k*.
+        """
+        with self._lock:
+            self._sync()
+            session = self._sessions.get(session_id)
+            if session is None or k <= 0:
+                return []
+            total = max(len(self._sessions), 1)
+            scores: Dict[str, float] = {}
+            shared: Dict[str, List[str]] = {}
+            for tag in session.get("tags", []):
+                posting = self._postings.get(tag, {})
+                weight = math.log((total + 1.0) / len(posting)) if posting else 0.0
+                for other in posting:
+                    if other != session_id and other in self._sessions:
+                        scores[other] = scores.get(other, 0.0) + weight
+                        shared.setdefault(other, []).append(tag)
+            best = heapq.nlargest(
+                k, scores, key=lambda sid: (scores[sid], self._sessions[sid].get("created_at", ""), sid)
+            )
+            return [(sid, round(scores[sid], 4), sorted(shared[sid])) for sid in best]
+
+    def to_dict(self) -> dict:
+        """Return the graph in .chain-index.json format."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            return {
+                "version": INDEX_VERSION,
+                "sessions": self._sessions,
+                "tag_index": {tag: list(sids) for tag, sids in self._postings.items()},
+            }
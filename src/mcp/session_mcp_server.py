@@ -6,11 +6,15 @@ ID generation, tag extraction, and flow context building.
 Backend: Direct file I/O with pathlib
 Transport: stdio
 
-Tools (14):
+Tools (15):
   session_save, session_load, session_list, session_archive, session_query,
   session_create, session_link, session_tag, session_get_context,
-  session_search_tags, session_accumulate, session_finalize,
-  session_add_work_item, session_complete_work_item
+  session_search_tags, session_top_related, session_accumulate,
+  session_finalize, session_add_work_item, session_complete_work_item
+
+The chain index is held in memory by SessionChainGraph (session_chain.py);
+chain tools query it directly and mutations go to an append log that is
+compacted back into .chain-index.json.
 """
 
 import json
@@ -28,6 +32,7 @@ from utils.path_resolver import get_config_dir
 from mcp.server.fastmcp import FastMCP
 from base.decorators import mcp_tool_handler
 from base.persistence import AtomicJsonStore
+from session_chain import SessionChainGraph, new_record
 
 mcp = FastMCP("session-mgr", instructions="Session management with direct file I/O")
 
@@ -39,11 +44,8 @@ CHAIN_INDEX_FILE = MEMORY_PATH / ".chain-index.json"
 CURRENT_SESSION_FILE = MEMORY_PATH / ".current-session.json"
 LOGS_PATH = MEMORY_PATH / "logs" / "sessions"
 
-# Chain index store (module-level singleton)
-_chain_store = AtomicJsonStore(
-    CHAIN_INDEX_FILE,
-    default_factory=lambda: {"version": "1.0.0", "sessions": {}, "tag_index": {}}
-)
+# Chain graph (module-level singleton, loaded on first use)
+_chain_graph = SessionChainGraph(CHAIN_INDEX_FILE)
 
 # Tech keywords for auto-tag extraction
 _TECH_KEYWORDS = [
@@ -428,29 +430,15 @@ def session_create(
     # Auto-extract tags
     tags = _extract_tags(prompt, task_type, skill, project_cwd)
 
-    # Register in chain index
-    index = _chain_store.load()
-    index["sessions"][session_id] = {
-        "parent": None,
-        "children": [],
-        "related": [],
-        "tags": tags,
-        "project": project,
-        "skill": skill,
-        "task_type": task_type,
-        "summary": "",
-        "created_at": now.isoformat(),
-        "last_prompt": prompt[:200] if prompt else ""
-    }
-
-    # Update tag index
-    for tag in tags:
-        if tag not in index["tag_index"]:
-            index["tag_index"][tag] = []
-        if session_id not in index["tag_index"][tag]:
-            index["tag_index"][tag].append(session_id)
-
-    _chain_store.save(index)
+    # Register in chain index (also updates the tag index)
+    _chain_graph.create(session_id, new_record(
+        tags=tags,
+        project=project,
+        skill=skill,
+        task_type=task_type,
+        created_at=now.isoformat(),
+        last_prompt=prompt[:200] if prompt else ""
+    ))
 
     # Update current session pointer
     CURRENT_SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -483,29 +471,7 @@ def session_link(
         child_id: New session ID (child)
         parent_id: Previous session ID (parent)
     """
-    index = _chain_store.load()
-
-    if parent_id not in index["sessions"]:
-        index["sessions"][parent_id] = {
-            "parent": None, "children": [], "related": [],
-            "tags": [], "project": "", "skill": "", "task_type": "",
-            "summary": "", "created_at": "", "last_prompt": ""
-        }
-
-    if child_id not in index["sessions"]:
-        index["sessions"][child_id] = {
-            "parent": parent_id, "children": [], "related": [],
-            "tags": [], "project": "", "skill": "", "task_type": "",
-            "summary": "", "created_at": datetime.now().isoformat(),
-            "last_prompt": ""
-        }
-    else:
-        index["sessions"][child_id]["parent"] = parent_id
-
-    if child_id not in index["sessions"][parent_id]["children"]:
-        index["sessions"][parent_id]["children"].append(child_id)
-
-    _chain_store.save(index)
+    _chain_graph.link(child_id, parent_id)
 
     return {
         "success": True,
@@ -529,52 +495,15 @@ def session_tag(
         tags: Comma-separated tag list (e.g., 'spring-boot,docker,scheduler')
         summary: Optional session summary text
     """
-    index = _chain_store.load()
     tag_list = [t.strip() for t in tags.split(",") if t.strip()]
 
-    if session_id not in index["sessions"]:
-        index["sessions"][session_id] = {
-            "parent": None, "children": [], "related": [],
-            "tags": [], "project": "", "skill": "", "task_type": "",
-            "summary": "", "created_at": datetime.now().isoformat(),
-            "last_prompt": ""
-        }
-
-    session = index["sessions"][session_id]
-    existing_tags = set(session.get("tags", []))
-    new_tags = existing_tags | set(tag_list)
-    session["tags"] = sorted(new_tags)
-
-    if summary:
-        session["summary"] = summary
-
-    # Update tag index
-    for tag in tag_list:
-        if tag not in index["tag_index"]:
-            index["tag_index"][tag] = []
-        if session_id not in index["tag_index"][tag]:
-            index["tag_index"][tag].append(session_id)
-
-    # Auto-relate sessions that share 2+ tags
-    related_found = []
-    for other_id, other_session in index["sessions"].items():
-        if other_id == session_id:
-            continue
-        other_tags = set(other_session.get("tags", []))
-        shared = new_tags & other_tags
-        if len(shared) >= 2:
-            if other_id not in session.get("related", []):
-                session.setdefault("related", []).append(other_id)
-            if session_id not in other_session.get("related", []):
-                other_session.setdefault("related", []).append(session_id)
-            related_found.append(other_id)
-
-    _chain_store.save(index)
+    # Auto-relates sessions that share 2+ tags (candidates come from the tag index)
+    related_found = _chain_graph.tag(session_id, tag_list, summary)
 
     return {
         "success": True,
         "session_id": session_id,
-        "tags": session["tags"],
+        "tags": list(_chain_graph.get(session_id)["tags"]),
         "auto_related": related_found
     }
 
@@ -595,9 +524,9 @@ def session_get_context(
         max_ancestors: Max parent sessions to walk (default: 5)
         max_related: Max related sessions to include (default: 5)
     """
-    index = _chain_store.load()
+    session = _chain_graph.get(session_id)
 
-    if session_id not in index["sessions"]:
+    if session is None:
         return {
             "success": True,
             "session_id": session_id,
@@ -606,33 +535,23 @@ def session_get_context(
             "message": "Session not found in chain index"
         }
 
-    session = index["sessions"][session_id]
-
     # Walk parent chain
     ancestors = []
-    current = session.get("parent")
-    visited = {session_id}
-    while current and len(ancestors) < max_ancestors and current not in visited:
-        visited.add(current)
-        if current in index["sessions"]:
-            parent = index["sessions"][current]
-            ancestors.append({
-                "session_id": current,
-                "summary": parent.get("summary", ""),
-                "tags": parent.get("tags", []),
-                "task_type": parent.get("task_type", ""),
-                "skill": parent.get("skill", ""),
-                "created_at": parent.get("created_at", "")
-            })
-            current = parent.get("parent")
-        else:
-            break
+    for parent_id, parent in _chain_graph.ancestors(session_id, max_ancestors):
+        ancestors.append({
+            "session_id": parent_id,
+            "summary": parent.get("summary", ""),
+            "tags": parent.get("tags", []),
+            "task_type": parent.get("task_type", ""),
+            "skill": parent.get("skill", ""),
+            "created_at": parent.get("created_at", "")
+        })
 
     # Find related sessions
     related = []
     for rel_id in session.get("related", [])[:max_related]:
-        if rel_id in index["sessions"]:
-            rel = index["sessions"][rel_id]
+        rel = _chain_graph.get(rel_id)
+        if rel is not None:
             shared_tags = set(session.get("tags", [])) & set(rel.get("tags", []))
             related.append({
                 "session_id": rel_id,
@@ -669,19 +588,16 @@ def session_search_tags(
         tags: Comma-separated tag list to search for
         limit: Max results (default: 20)
     """
-    index = _chain_store.load()
     tag_list = [t.strip() for t in tags.split(",") if t.strip()]
 
     matching = {}
-    for tag in tag_list:
-        for sid in index.get("tag_index", {}).get(tag, []):
-            if sid not in matching:
-                matching[sid] = {"session_id": sid, "matched_tags": [], "all_tags": []}
-            matching[sid]["matched_tags"].append(tag)
-            if sid in index["sessions"]:
-                matching[sid]["all_tags"] = index["sessions"][sid].get("tags", [])
-                matching[sid]["summary"] = index["sessions"][sid].get("summary", "")
-                matching[sid]["project"] = index["sessions"][sid].get("project", "")
+    for sid, matched_tags in _chain_graph.search_tags(tag_list).items():
+        matching[sid] = {"session_id": sid, "matched_tags": matched_tags, "all_tags": []}
+        session = _chain_graph.get(sid)
+        if session is not None:
+            matching[sid]["all_tags"] = session.get("tags", [])
+            matching[sid]["summary"] = session.get("summary", "")
+            matching[sid]["project"] = session.get("project", "")
 
     # Sort by number of matched tags (most relevant first)
     results = sorted(matching.values(),
@@ -695,6 +611,41 @@ def session_search_tags(
     }
 
 
+@mcp.tool()
+@mcp_tool_handler
+def session_top_related(
+    session_id: str,
+    k: int = 5
+) -> dict:
+    """Rank the sessions most related to a session by weighted tag overlap.
+
+    Shared tags are weighted by rarity (a tag few sessions carry counts more
+    than a common one); ties go to the more recent session.
+
+    Args:
+        session_id: Session to find related sessions for
+        k: Max results (default: 5)
+    """
+    results = []
+    for sid, score, shared_tags in _chain_graph.top_related(session_id, k):
+        other = _chain_graph.get(sid)
+        results.append({
+            "session_id": sid,
+            "score": score,
+            "shared_tags": shared_tags,
+            "summary": other.get("summary", ""),
+            "project": other.get("project", ""),
+            "created_at": other.get("created_at", "")
+        })
+
+    return {
+        "success": True,
+        "session_id": session_id,
+        "results": results,
+        "count": len(results)
+    }
+
+
 @mcp.tool()
 @mcp_tool_handler
 def session_accumulate(
@@ -991,13 +942,10 @@ def session_finalize(session_id: str) -> dict:
     store.save(data)
 
     # Update chain index summary
-    index = _chain_store.load()
-    if session_id in index.get("sessions", {}):
-        index["sessions"][session_id]["summary"] = (
-            f"{req_count} requests, {', '.join(data.get('skills_used', [])[:3])}, "
-            f"complexity avg {avg_complexity}"
-        )
-        _chain_store.save(index)
+    _chain_graph.update(session_id, summary=(
+        f"{req_count} requests, {', '.join(data.get('skills_used', [])[:3])}, "
+        f"complexity avg {avg_complexity}"
+    ))
 
     return {
         "success": True,
@@ -1027,13 +975,6 @@ def session_add_work_item(
         work_type: Type prefix for work item ID (e.g., 'TASK', 'WORK', 'BUG')
         metadata: JSON string of additional fields
     """
-    index = _chain_store.load()
-
-    if session_id not in index["sessions"]:
-        return {"success": False, "error": f"Session not found: {session_id}"}
-
-    session = index["sessions"][session_id]
-
     # Generate work item ID
     suffix = "".join(random.choices(string.ascii_uppercase + string.digits, k=4))
     work_id = f"{work_type}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{suffix}"
@@ -1054,8 +995,13 @@ def session_add_work_item(
         "metadata": meta
     }
 
-    session.setdefault("work_items", []).append(work_item)
-    _chain_store.save(index)
+    appended = _chain_graph.modify(
+        session_id,
+        lambda session: {"work_items": session.get("work_items", []) + [work_item]}
+    )
+
+    if appended is None:
+        return {"success": False, "error": f"Session not found: {session_id}"}
 
     return {
         "success": True,
@@ -1080,27 +1026,22 @@ def session_complete_work_item(
         work_id: Work item ID to complete
         status: Final status (COMPLETED, FAILED, SKIPPED)
     """
-    index = _chain_store.load()
-
-    if session_id not in index["sessions"]:
+    def complete(session):
+        work_items = session.get("work_items", [])
+        for item in work_items:
+            if item["work_id"] == work_id:
+                item["completed_at"] = datetime.now().isoformat()
+                item["status"] = status
+                return {"work_items": work_items}
+        return None
+
+    completed = _chain_graph.modify(session_id, complete)
+
+    if completed is None:
         return {"success": False, "error": f"Session not found: {session_id}"}
-
-    session = index["sessions"][session_id]
-    work_items = session.get("work_items", [])
-
-    found = False
-    for item in work_items:
-        if item["work_id"] == work_id:
-            item["completed_at"] = datetime.now().isoformat()
-            item["status"] = status
-            found = True
-            break
-
-    if not found:
+    if not completed:
         return {"success": False, "error": f"Work item not found: {work_id}"}
 
-    _chain_store.save(index)
-
     return {
         "success": True,
         "work_id": work_id,
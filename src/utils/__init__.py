@@ -9,6 +9,10 @@ Modules:
                         (claude-global-library) or from the local cache.
                         Provides ``ImportManager.get_skill()`` and
                         ``ImportManager.get_agent()`` class methods.
+    resource_cache   -- Offline-first disk cache behind ImportManager:
+                        content store, ETag/Last-Modified revalidation,
+                        stale-while-revalidate, batch prefetch and local
+                        mirrors for offline use.
     path_resolver    -- Cross-platform path resolution for the memory system
                         directories. Handles Windows/Unix differences and
                         respects the ``CLAUDE_INSIGHT_DATA_DIR`` env override.
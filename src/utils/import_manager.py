@@ -10,6 +10,13 @@ Resources are sourced from:
 2. claude-global-library - GitHub raw URLs (skills and agents)
 3. claude-insight - GitHub raw URLs (architecture policies)
 
+Remote resources go through a shared ResourceCache (resource_cache.py):
+fresh copies are a local disk read, stale ones are served while they are
+revalidated with ETag / Last-Modified, and CLAUDE_IMPORT_OFFLINE=1 serves
+only from the local mirrors (CLAUDE_GLOBAL_LIB_MIRROR, a checkout of
+claude-global-library; CLAUDE_PROJECT_MIRROR, default PROJECT_ROOT) and the
+cache.
+
 Module-level constants:
     GITHUB_BASE (str): Base GitHub raw-content URL prefix.
     GLOBAL_LIB_URL (str): Raw URL prefix for claude-global-library main branch.
@@ -21,6 +28,10 @@ Module-level constants:
 
 Classes:
     ImportManager: Static utility class for loading remote and local resources.
+
+Functions:
+    get_resource_cache(): Process-wide ResourceCache used by ImportManager.
+    set_resource_cache(cache): Replace it (custom directory, TTL, tests).
 """
 
 # Fix encoding for Windows console
@@ -39,9 +50,15 @@ if sys.stderr.encoding != 'utf-8':
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 import os
-import urllib.request
+import re
+import threading
 from pathlib import Path
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Iterable
+
+try:
+    from .resource_cache import ResourceCache
+except ImportError:  # Run as a script: python src/utils/import_manager.py
+    from resource_cache import ResourceCache
 
 # GitHub base URLs (configurable via env vars for portability)
 _GITHUB_OWNER = os.environ.get("CLAUDE_GITHUB_OWNER", "piyushmakhija28")
@@ -52,12 +69,62 @@ INSIGHT_URL = os.environ.get("CLAUDE_PROJECT_URL", f"{GITHUB_BASE}/claude-workfl
 # Project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# Local mirrors used offline and when GitHub is unreachable
+GLOBAL_LIB_MIRROR = os.environ.get("CLAUDE_GLOBAL_LIB_MIRROR", "")
+PROJECT_MIRROR = os.environ.get("CLAUDE_PROJECT_MIRROR", str(PROJECT_ROOT))
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_resource_cache() -> ResourceCache:
+    """Return the process-wide ResourceCache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResourceCache(mirrors={GLOBAL_LIB_URL: GLOBAL_LIB_MIRROR, INSIGHT_URL: PROJECT_MIRROR})
+        return _cache
+
+
+def set_resource_cache(cache: Optional[ResourceCache]) -> None:
+    """Replace the process-wide ResourceCache (None = recreate from env on next use)."""
+    global _cache
+    with _cache_lock:
+        old, _cache = _cache, cache
+    if old is not None and old is not cache:
+        old.close()
+
+
+def _fetch_text(url: str):
+    """Return (text, source) for *url* via the resource cache, or None.
+
+    source is 'github' for a fresh download and 'cache' / 'stale' / 'mirror'
+    when served locally.
+    """
+    resource = get_resource_cache().fetch(url)
+    if resource is None:
+        return None
+    source = 'github' if resource.source == 'network' else resource.source
+    return resource.content.decode('utf-8'), source
+
+
+def _index_names(lines, filename: str) -> list:
+    """Extract resource names from an index file's links to */<filename>."""
+    pattern = re.compile(r'([A-Za-z0-9_.-]+)/' + re.escape(filename), re.IGNORECASE)
+    names = []
+    for line in lines or ():
+        for name in pattern.findall(line):
+            if name not in names:
+                names.append(name)
+    return names
+
 
 class ImportManager:
     """Unified import manager for local project modules and GitHub-hosted resources.
 
-    All methods are static - no instance is required. Resources are fetched
-    directly over HTTPS using urllib and decoded as UTF-8.
+    All methods are static - no instance is required. Remote resources are
+    read through get_resource_cache() and decoded as UTF-8; network errors
+    fall back to the local mirror or a cached copy instead of raising.
 
     GitHub base URLs used:
         Skills:  https://raw.../claude-global-library/main/skills/{name}/skill.md
@@ -81,21 +148,20 @@ class ImportManager:
             dict or None: On success, a dict with keys:
                 name (str): The skill_name argument.
                 content (str): Raw skill.md markdown content.
-                source (str): Always 'github'.
-                url (str): The full raw URL that was fetched.
-            Returns None on HTTP error (skill not found).
+                source (str): 'github', 'cache', 'stale' or 'mirror'.
+                url (str): The full raw URL of the skill.
+            Returns None when the skill does not exist or is unavailable.
         """
         url = f"{GLOBAL_LIB_URL}/skills/{skill_name}/skill.md"
-        try:
-            with urllib.request.urlopen(url) as response:
-                return {
-                    'name': skill_name,
-                    'content': response.read().decode('utf-8'),
-                    'source': 'github',
-                    'url': url
-                }
-        except urllib.error.HTTPError:
+        fetched = _fetch_text(url)
+        if fetched is None:
             return None
+        return {
+            'name': skill_name,
+            'content': fetched[0],
+            'source': fetched[1],
+            'url': url
+        }
 
     @staticmethod
     def get_agent(agent_name: str) -> Optional[Dict]:
@@ -113,21 +179,20 @@ class ImportManager:
             dict or None: On success, a dict with keys:
                 name (str): The agent_name argument.
                 content (str): Raw agent.md markdown content.
-                source (str): Always 'github'.
-                url (str): The full raw URL that was fetched.
-            Returns None on HTTP error (agent not found).
+                source (str): 'github', 'cache', 'stale' or 'mirror'.
+                url (str): The full raw URL of the agent.
+            Returns None when the agent does not exist or is unavailable.
         """
         url = f"{GLOBAL_LIB_URL}/agents/{agent_name}/agent.md"
-        try:
-            with urllib.request.urlopen(url) as response:
-                return {
-                    'name': agent_name,
-                    'content': response.read().decode('utf-8'),
-                    'source': 'github',
-                    'url': url
-                }
-        except urllib.error.HTTPError:
+        fetched = _fetch_text(url)
+        if fetched is None:
             return None
+        return {
+            'name': agent_name,
+            'content': fetched[0],
+            'source': fetched[1],
+            'url': url
+        }
 
     @staticmethod
     def get_policy(policy_path: str) -> Optional[str]:
@@ -142,14 +207,11 @@ class ImportManager:
 
         Returns:
             str or None: Raw markdown content of the policy file, or None
-                on HTTP error (file not found).
+                when it does not exist or is unavailable.
         """
         url = f"{INSIGHT_URL}/scripts/architecture/{policy_path}"
-        try:
-            with urllib.request.urlopen(url) as response:
-                return response.read().decode('utf-8')
-        except urllib.error.HTTPError:
-            return None
+        fetched = _fetch_text(url)
+        return fetched[0] if fetched else None
 
     @staticmethod
     def get_local_module(module_path: str) -> Any:
@@ -188,13 +250,9 @@ class ImportManager:
                 file does not exist or cannot be fetched.
         """
         url = f"{GLOBAL_LIB_URL}/skills/INDEX.md"
-        try:
-            with urllib.request.urlopen(url) as response:
-                content = response.read().decode('utf-8')
-                # Parse INDEX.md to extract skill list
-                return content.split('\n')
-        except urllib.error.HTTPError:
-            return None
+        fetched = _fetch_text(url)
+        # Parse INDEX.md to extract skill list
+        return fetched[0].split('\n') if fetched else None
 
     @staticmethod
     def list_agents() -> Optional[list]:
@@ -207,13 +265,45 @@ class ImportManager:
                 file does not exist or cannot be fetched.
         """
         url = f"{GLOBAL_LIB_URL}/agents/README.md"
-        try:
-            with urllib.request.urlopen(url) as response:
-                content = response.read().decode('utf-8')
-                # Parse README.md to extract agent list
-                return content.split('\n')
-        except urllib.error.HTTPError:
-            return None
+        fetched = _fetch_text(url)
+        # Parse README.md to extract agent list
+        return fetched[0].split('\n') if fetched else None
+
+    @staticmethod
+    def prefetch_skills(skill_names: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, bool]:
+        """Download or revalidate a set of skills concurrently.
+
+        Args:
+            skill_names: Skills to prefetch. Defaults to every skill linked
+                from skills/INDEX.md.
+            force: Revalidate entries that are still fresh as well.
+
+        Returns:
+            dict: skill name -> True when it can now be loaded locally.
+        """
+        if skill_names is None:
+            skill_names = _index_names(ImportManager.list_skills(), 'skill.md')
+        urls = {name: f"{GLOBAL_LIB_URL}/skills/{name}/skill.md" for name in skill_names}
+        ready = get_resource_cache().prefetch(urls.values(), force=force)
+        return {name: ready[url] for name, url in urls.items()}
+
+    @staticmethod
+    def prefetch_agents(agent_names: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, bool]:
+        """Download or revalidate a set of agents concurrently.
+
+        Args:
+            agent_names: Agents to prefetch. Defaults to every agent linked
+                from agents/README.md.
+            force: Revalidate entries that are still fresh as well.
+
+        Returns:
+            dict: agent name -> True when it can now be loaded locally.
+        """
+        if agent_names is None:
+            agent_names = _index_names(ImportManager.list_agents(), 'agent.md')
+        urls = {name: f"{GLOBAL_LIB_URL}/agents/{name}/agent.md" for name in agent_names}
+        ready = get_resource_cache().prefetch(urls.values(), force=force)
+        return {name: ready[url] for name, url in urls.items()}
 
 
 # Quick reference URLs
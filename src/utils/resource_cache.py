@@ -0,0 +1,392 @@
+"""
+Resource Cache for Claude Insight.
+
+Offline-first, revalidating disk cache for the remote markdown resources
+ImportManager loads (skills, agents, policies, index files).
+
+Storage layout (under CLAUDE_IMPORT_CACHE_DIR, default
+{CLAUDE_HOME}/cache/imports/):
+
+    objects/<sha256[:2]>/<sha256>      content store, deduplicated by hash
+    entries/<key[:2]>/<key>.json       per-URL metadata (key = sha256 of URL):
+                                       status, sha256, etag, last_modified,
+                                       fetched_at
+
+Lookup order for ResourceCache.fetch(url):
+
+    1. Fresh entry (younger than ttl_s)         -> disk read, no network
+    2. Stale entry (younger than ttl_s+stale_s) -> disk read now, conditional
+                                                   GET in the background
+    3. Otherwise                                -> conditional GET now
+                                                   (If-None-Match /
+                                                   If-Modified-Since; 304
+                                                   only refreshes the entry)
+    4. Network failure                          -> local mirror, then any
+                                                   cached copy however old
+
+404 answers are cached for ttl_s as well, so a missing skill does not cost
+a round-trip on every call.  In offline mode (CLAUDE_IMPORT_OFFLINE=1) the
+network is never touched: the mirror directory is read first, then the
+cache.  A mirror maps a URL prefix to a local directory with the same
+layout, e.g. a checkout of claude-global-library.
+
+Requests share one keep-alive requests.Session with a bounded timeout;
+prefetch() revalidates a whole batch of URLs on a thread pool.
+
+Environment:
+    CLAUDE_IMPORT_CACHE_DIR  Cache directory.
+    CLAUDE_IMPORT_TTL        Seconds an entry is served without revalidation
+                             (default 3600).
+    CLAUDE_IMPORT_STALE      Further seconds a stale entry is served while it
+                             revalidates in the background (default 604800).
+    CLAUDE_IMPORT_TIMEOUT    Per-request timeout in seconds (default 10).
+    CLAUDE_IMPORT_OFFLINE    "1" disables the network entirely.
+
+Classes:
+    CachedResource: (content, source) result of a fetch.
+    ResourceCache: The cache itself.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_TTL_S = float(os.environ.get("CLAUDE_IMPORT_TTL", "3600"))
+DEFAULT_STALE_S = float(os.environ.get("CLAUDE_IMPORT_STALE", str(7 * 24 * 3600)))
+DEFAULT_TIMEOUT_S = float(os.environ.get("CLAUDE_IMPORT_TIMEOUT", "10"))
+
+# content: bytes; source: "network", "cache", "stale" or "mirror"
+CachedResource = namedtuple("CachedResource", ["content", "source"])
+
+
+def default_cache_dir():
+    """Return the cache directory (CLAUDE_IMPORT_CACHE_DIR or {CLAUDE_HOME}/cache/imports)."""
+    override = os.environ.get("CLAUDE_IMPORT_CACHE_DIR")
+    if override:
+        return Path(override)
+    claude_home = os.environ.get("CLAUDE_HOME")
+    return (Path(claude_home) if claude_home else Path.home() / ".claude") / "cache" / "imports"
+
+
+def offline_from_env():
+    """True when CLAUDE_IMPORT_OFFLINE is set to a truthy value."""
+    return os.environ.get("CLAUDE_IMPORT_OFFLINE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name("%s.%d.%d.tmp" % (path.name, os.getpid(), threading.get_ident()))
+    tmp.write_bytes(data)
+    os.replace(str(tmp), str(path))
+
+
+class ResourceCache:
+    """Disk cache for HTTP GET resources with revalidation and offline mode.
+
+    Args:
+        cache_dir: Cache directory (default: default_cache_dir()).
+        ttl_s: Seconds an entry is served without contacting the server.
+        stale_s: Seconds past ttl_s an entry is still served while it is
+            revalidated in the background.
+        offline: Never use the network (default: CLAUDE_IMPORT_OFFLINE).
+        mirrors: Dict of URL prefix -> local directory used in offline mode
+            and as a fallback when the network fails.
+        timeout: Per-request timeout in seconds.
+        max_workers: Thread pool size for prefetch and background
+            revalidation.
+        session: Optional requests.Session-like object (for tests).
+        clock: Optional time source returning seconds (for tests).
+    """
+
+    def __init__(
+        self,
+        cache_dir=None,
+        ttl_s=DEFAULT_TTL_S,
+        stale_s=DEFAULT_STALE_S,
+        offline=None,
+        mirrors=None,
+        timeout=DEFAULT_TIMEOUT_S,
+        max_workers=8,
+        session=None,
+        clock=None,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.objects_dir = self.cache_dir / "objects"
+        self.entries_dir = self.cache_dir / "entries"
+        self.ttl_s = ttl_s
+        self.stale_s = stale_s
+        self.offline = offline_from_env() if offline is None else offline
+        self.mirrors = {prefix.rstrip("/"): Path(root) for prefix, root in (mirrors or {}).items() if root}
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._session = session
+        self._clock = clock or time.time
+        self._lock = threading.RLock()
+        self._entries = {}  # url -> entry dict (None = known absent)
+        self._inflight = {}  # url -> threading.Event of the fetch in progress
+        self._executor = None
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "mirror_hits": 0,
+            "fetched": 0,
+            "not_modified": 0,
+            "errors": 0,
+        }
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    def fetch(self, url):
+        """Return a CachedResource for *url*, or None when it is unavailable.
+
+        Unavailable means 404, or no network and nothing local to serve.
+        """
+        if self.offline:
+            return self._local(url)
+
+        entry = self._entry(url)
+        age = self._age(entry)
+        if entry is not None and age < self.ttl_s:
+            self._count("hits")
+            return self._resource(entry, "cache")
+        if entry is not None and age < self.ttl_s + self.stale_s:
+            self._count("stale_hits")
+            self._revalidate_async(url)
+            return self._resource(entry, "stale")
+
+        try:
+            entry, source = self._refresh(url), "network"
+        except Exception:
+            self._count("errors")
+            return self._local(url)
+        if entry is None:
+            return self._local(url)
+        return self._resource(entry, source)
+
+    def get(self, url):
+        """Return the content bytes of *url*, or None."""
+        resource = self.fetch(url)
+        return resource.content if resource else None
+
+    def prefetch(self, urls, force=False):
+        """Fetch or revalidate *urls* concurrently.
+
+        Entries that are still fresh are skipped unless *force* is set.
+
+        Returns:
+            dict: url -> True when content is available locally afterwards.
+        """
+        urls = list(dict.fromkeys(urls))
+        if self.offline:
+            return {url: self._local(url) is not None for url in urls}
+
+        def _one(url):
+            if not force and self._age(self._entry(url)) < self.ttl_s:
+                return url, self._resource(self._entry(url), "cache") is not None
+            try:
+                entry = self._refresh(url)
+            except Exception:
+                self._count("errors")
+                entry = self._entry(url)
+            return url, self._resource(entry, "cache") is not None
+
+        return dict(self._pool().map(_one, urls))
+
+    def invalidate(self, url=None):
+        """Forget one URL (or every URL when None); objects stay in the store."""
+        with self._lock:
+            targets = [url] if url is not None else list(self._entries)
+            for target in targets:
+                self._entries.pop(target, None)
+                try:
+                    self._entry_path(target).unlink()
+                except OSError:
+                    pass
+            if url is None and self.entries_dir.exists():
+                for path in self.entries_dir.rglob("*.json"):
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
+    def close(self):
+        """Shut down the worker pool and HTTP session."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            session, self._session = self._session, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if session is not None and hasattr(session, "close"):
+            session.close()
+
+    # =========================================================================
+    # ENTRIES AND CONTENT STORE
+    # =========================================================================
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _age(self, entry):
+        if entry is None:
+            return float("inf")
+        return self._clock() - entry.get("fetched_at", 0)
+
+    def _entry_path(self, url):
+        key = _sha256(url.encode("utf-8"))
+        return self.entries_dir / key[:2] / (key + ".json")
+
+    def _object_path(self, digest):
+        return self.objects_dir / digest[:2] / digest
+
+    def _entry(self, url):
+        """Entry for *url* from memory, else from disk (None when absent)."""
+        with self._lock:
+            if url in self._entries:
+                return self._entries[url]
+        entry = None
+        try:
+            entry = json.loads(self._entry_path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+        if entry is not None and entry.get("status") == 200:
+            if not self._object_path(entry.get("sha256", "")).exists():
+                entry = None  # Object store was pruned: treat as a miss
+        with self._lock:
+            self._entries[url] = entry
+        return entry
+
+    def _save_entry(self, url, entry):
+        _write_atomic(self._entry_path(url), json.dumps(entry, sort_keys=True).encode("utf-8"))
+        with self._lock:
+            self._entries[url] = entry
+
+    def _store_object(self, data):
+        digest = _sha256(data)
+        path = self._object_path(digest)
+        if not path.exists():
+            _write_atomic(path, data)
+        return digest
+
+    def _resource(self, entry, source):
+        if entry is None or entry.get("status") != 200:
+            return None
+        try:
+            return CachedResource(self._object_path(entry["sha256"]).read_bytes(), source)
+        except (OSError, KeyError):
+            return None
+
+    def _mirror(self, url):
+        for prefix, root in self.mirrors.items():
+            if not url.startswith(prefix + "/"):
+                continue
+            path = (root / url[len(prefix) + 1 :]).resolve()
+            if root.resolve() not in path.parents:
+                continue  # "../" in the URL
+            try:
+                return path.read_bytes()
+            except OSError:
+                continue
+        return None
+
+    def _local(self, url):
+        """Offline answer: mirror first, then a cached copy of any age."""
+        data = self._mirror(url)
+        if data is not None:
+            self._count("mirror_hits")
+            return CachedResource(data, "mirror")
+        return self._resource(self._entry(url), "stale")
+
+    # =========================================================================
+    # NETWORK
+    # =========================================================================
+
+    def _get_session(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="resource-cache")
+            return self._executor
+
+    def _refresh(self, url):
+        """Conditional GET for *url*, single-flight per URL; returns the entry."""
+        with self._lock:
+            event = self._inflight.get(url)
+            leader = event is None
+            if leader:
+                event = self._inflight[url] = threading.Event()
+        if not leader:
+            event.wait(self.timeout * 2)
+            with self._lock:
+                return self._entries.get(url)
+        try:
+            return self._request(url, self._entry(url))
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+            event.set()
+
+    def _request(self, url, entry):
+        headers = {}
+        if entry is not None and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry is not None and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._get_session().get(url, headers=headers, timeout=self.timeout)
+        now = self._clock()
+        if response.status_code == 304 and entry is not None:
+            self._count("not_modified")
+            entry = dict(entry, fetched_at=now)
+        elif response.status_code == 200:
+            self._count("fetched")
+            entry = {
+                "url": url,
+                "status": 200,
+                "sha256": self._store_object(response.content),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": now,
+            }
+        elif response.status_code == 404:
+            entry = {"url": url, "status": 404, "fetched_at": now}
+        else:
+            raise IOError("GET %s returned HTTP %d" % (url, response.status_code))
+        self._save_entry(url, entry)
+        return entry
+
+    def _revalidate_async(self, url):
+        with self._lock:
+            if url in self._inflight:
+                return
+
+        def _run():
+            try:
+                self._refresh(url)
+            except Exception:
+                self._count("errors")
+
+        self._pool().submit(_run)
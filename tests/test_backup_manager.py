@@ -0,0 +1,164 @@
+"""
+Tests for langgraph_engine/backup_manager.py - content-addressed blob store,
+deduplication, compression and the append-only metadata log.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import pytest
+
+from langgraph_engine.backup_manager import BackupManager
+
+
+@pytest.fixture
+def target(tmp_path):
+    path = tmp_path / "work" / "module.py"
+    path.parent.mkdir()
+    path.write_text("print('original')\n")
+    return path
+
+
+def _settle(path):
+    """Backdate mtime past the racy-clean window so (mtime, size) is trusted."""
+    old = time.time() - 60
+    os.utime(str(path), (old, old))
+
+
+def _blobs(manager):
+    return sorted(p for p in manager.blob_dir.rglob("*") if p.is_file())
+
+
+class TestBlobStore:
+    def test_identical_content_is_stored_once(self, tmp_path, target):
+        manager = BackupManager("s1", backup_base_dir=str(tmp_path / "logs"))
+        other = target.with_name("copy.py")
+        other.write_bytes(target.read_bytes())
+
+        assert manager.backup_file(str(target), "step1")
+        assert manager.backup_file(str(target), "step2")
+        assert manager.backup_file(str(other), "step2")
+
+        assert len(_blobs(manager)) == 1
+        assert manager.stats["dedup_hits"] == 2
+        history = manager.get_backup_history()
+        assert len({entry["backup_path"] for entry in history}) == 1
+
+    def test_unchanged_file_is_not_reread(self, tmp_path, target):
+        manager = BackupManager("s1", backup_base_dir=str(tmp_path / "logs"))
+        _settle(target)
+        manager.backup_file(str(target), "step1")
+        hashed = manager.stats["bytes_hashed"]
+
+        for step in ("step2", "step3"):
+            manager.backup_file(str(target), step)
+        assert manager.stats["bytes_hashed"] == hashed
+        assert manager.stats["stat_hits"] == 2
+
+    def test_recent_same_size_edit_is_rehashed(self, tmp_path, target):
+        manager = BackupManager("s1", backup_base_dir=str(tmp_path / "logs"))
+        manager.backup_file(str(target), "step1")
+        target.write_text("print('ORIGINAL')\n")  # Same size, possibly same mtime tick
+        manager.backup_file(str(target), "step2")
+        assert len(_blobs(manager)) == 2
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_file_rewritten_after_hashing_is_named_by_stored_bytes(self, tmp_path, target, compress):
+        manager = BackupManager("s1", backup_base_dir=str(tmp_path / "logs"), compress=compress)
+        real_digest = manager._file_digest
+
+        def digest_then_rewrite(path, st):
+            digest = real_digest(path, st)
+            path.write_text("print('rewritten mid-backup')\n")
+            return digest
+
+        manager._file_digest = digest_then_rewrite
+        assert manager.backup_file(str(target), "step1")
+
+        (entry,) = manager.get_backup_history()
+        (blob,) = _blobs(manager)
+        with manager._open_blob(entry) as fh:
+            stored = fh.read()
+        assert stored == b"print('rewritten mid-backup')\n"
+        assert entry["sha256"] == hashlib.sha256(stored).hexdigest()
+        assert blob.name.startswith(entry["sha256"])
+        assert entry["file_size"] == len(stored)
+
+    def test_compressed_round_trip(self, tmp_path, target):
+        manager = BackupManager("s1", backup_base_dir=str(tmp_path / "logs"), compress=True)
+        original = ("x = 1\n" * 2000).encode()
+        target.write_bytes(original)
+        manager.backup_file(str(target), "Level -1")
+        (blob,) = _blobs(manager)
+        assert blob.suffix == ".gz" and blob.stat().st_size < len(original)
+
+        target.write_text("broken(\n")
+        assert manager.restore_file(str(target), "Level -1")
+        assert target.read_bytes() == original
+
+
+class TestMetadataLog:
+    def test_log_is_append_only_and_replayed(self, tmp_path, target):
+        base = str(tmp_path / "logs")
+        manager = BackupManager("s1", backup_base_dir=base)
+        manager.backup_file(str(target), "step1", "first")
+        target.write_text("print('changed')\n")
+        manager.backup_file(str(target), "step2")
+        manager.restore_file(str(target), "step1")
+
+        lines = manager.log_file.read_text().splitlines()
+        assert [json.loads(line)["op"] for line in lines] == ["backup", "backup", "restore"]
+        assert not manager.metadata_file.exists()
+
+        reloaded = BackupManager("s1", backup_base_dir=base)
+        history = reloaded.get_backup_history(str(target))
+        assert len(history) == 2
+        assert [e for e in history if e["step"] == "step1"][0]["restored"] is True
+        comparison = reloaded.compare_files(str(target), "step1")
+        assert comparison["content_identical"] is True
+
+    def test_legacy_metadata_snapshot_still_restores(self, tmp_path, target):
+        base = tmp_path / "logs"
+        backup_dir = base / "sessions" / "old" / "backup"
+        backup_dir.mkdir(parents=True)
+        legacy_copy = backup_dir / "Level -1_module_20240101_000000.py"
+        legacy_copy.write_text("print('legacy')\n")
+        (backup_dir / "backup_metadata.json").write_text(
+            json.dumps(
+                {
+                    "session_id": "old",
+                    "backups": [
+                        {
+                            "timestamp": "2024-01-01T00:00:00",
+                            "original_path": str(target),
+                            "backup_path": str(legacy_copy),
+                            "step": "Level -1",
+                            "description": "",
+                            "file_size": legacy_copy.stat().st_size,
+                        }
+                    ],
+                }
+            )
+        )
+
+        manager = BackupManager("old", backup_base_dir=str(base))
+        assert manager.compare_files(str(target), "Level -1")["content_identical"] is False
+        assert manager.restore_file(str(target), "Level -1")
+        assert target.read_text() == "print('legacy')\n"
+
+
+class TestDiff:
+    def test_diff_reads_blob_and_short_circuits_when_unchanged(self, tmp_path, target):
+        manager = BackupManager("s1", backup_base_dir=str(tmp_path / "logs"))
+        manager.backup_file(str(target), "step1")
+
+        unchanged = manager.generate_diff(str(target), "step1", "same")
+        assert open(unchanged).read() == ""
+
+        target.write_text("print('original')\nprint('added')\n")
+        diff_path = manager.generate_diff(str(target), "step1", "edit")
+        assert "+print('added')" in open(diff_path).read()
@@ -0,0 +1,167 @@
+"""
+Tests for langgraph_engine/cancellation.py - bounded step-timeout pool,
+cancellation tokens and subprocess kill-on-timeout.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from langgraph_engine import cancellation
+from langgraph_engine.cancellation import CancellationToken, TimeoutExecutor, run_subprocess, use_token
+from langgraph_engine.exceptions import StepCancelledError
+
+
+@pytest.fixture
+def executor():
+    ex = TimeoutExecutor(max_workers=2, name="test-timeout")
+    yield ex
+    ex.shutdown()
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    # Reaped children are gone; zombies still answer kill(0) on some kernels
+    try:
+        with open("/proc/{}/stat".format(pid)) as fh:
+            return fh.read().split()[2] != "Z"
+    except OSError:
+        return True
+
+
+class TestTimeoutExecutor:
+    def test_completed_value_and_error(self, executor):
+        assert executor.run(lambda x: x * 2, args=(21,), timeout=5).value == 42
+
+        def boom():
+            raise ValueError("bad")
+
+        outcome = executor.run(boom, timeout=5)
+        assert not outcome.timed_out and isinstance(outcome.error, ValueError)
+        assert executor.snapshot()["failed"] == 1
+
+    def test_repeated_timeouts_reuse_bounded_pool(self, executor):
+        def cooperative():
+            cancellation.current_token().wait(10)
+            cancellation.raise_if_cancelled()
+
+        for _ in range(6):
+            outcome = executor.run(cooperative, timeout=0.05)
+            assert outcome.timed_out and outcome.token.cancelled
+        assert executor.thread_count <= 2
+        stats = executor.snapshot()
+        assert stats["timed_out"] == 6 and stats["leaked"] == 0
+
+    def test_uncooperative_work_is_counted_as_leaked(self, executor):
+        release = threading.Event()
+        outcome = executor.run(release.wait, args=(10,), timeout=0.05)
+        assert outcome.timed_out
+        assert executor.snapshot()["leaked_active"] == 1
+
+        release.set()
+        deadline = time.time() + 5
+        while executor.snapshot()["leaked_active"] and time.time() < deadline:
+            time.sleep(0.01)
+        stats = executor.snapshot()
+        assert stats["leaked"] == 1 and stats["leaked_recovered"] == 1
+
+    def test_nested_call_runs_inline_with_own_token(self, executor):
+        seen = {}
+
+        def inner():
+            seen["inner"] = cancellation.current_token()
+            return "ok"
+
+        def outer():
+            seen["outer"] = cancellation.current_token()
+            return executor.run(inner, timeout=5).value
+
+        assert executor.run(outer, timeout=5).value == "ok"
+        assert seen["inner"] is not seen["outer"]
+        assert executor.snapshot()["inline"] == 1
+
+    def test_deadline_starts_when_the_call_starts(self, executor):
+        outcomes = [None] * 4
+
+        def call(i):
+            outcomes[i] = executor.run(time.sleep, args=(0.3,), timeout=0.5)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+        assert [o.timed_out for o in outcomes] == [False] * 4
+        assert executor.snapshot()["completed"] == 4
+
+    def test_queued_call_runs_inline_once_pool_is_leaked(self):
+        executor = TimeoutExecutor(max_workers=1, name="test-leak")
+        release = threading.Event()
+        leaker = threading.Thread(target=executor.run, args=(release.wait,), kwargs={"args": (10,), "timeout": 0.1})
+        leaker.start()
+        time.sleep(0.02)
+        try:
+            outcome = executor.run(lambda: "inline", timeout=5)
+        finally:
+            release.set()
+            leaker.join(5)
+            executor.shutdown()
+        assert outcome.value == "inline"
+        stats = executor.snapshot()
+        assert stats["not_started"] == 1 and stats["inline"] == 1
+
+    def test_counters_reach_metrics_collector(self, executor, tmp_path):
+        from langgraph_engine.metrics_collector import MetricsCollector
+
+        executor.run(time.sleep, args=(1,), timeout=0.05)
+        MetricsCollector("s1", base_log_dir=str(tmp_path)).record_counters("timeout_executor", executor.snapshot())
+        counters = MetricsCollector("s1", base_log_dir=str(tmp_path)).summary()["counters"]["timeout_executor"]
+        assert counters["timed_out"] == 1 and counters["leaked"] == 1
+
+    def test_outer_cancellation_propagates_to_child_token(self):
+        parent = CancellationToken("outer")
+        child = CancellationToken("inner", parent=parent)
+        parent.cancel("stop")
+        assert child.cancelled
+        with use_token(child), pytest.raises(StepCancelledError):
+            cancellation.raise_if_cancelled()
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+class TestSubprocessCancellation:
+    def test_timeout_kills_child_process(self, executor, monkeypatch):
+        pids = []
+        track = CancellationToken.track_process
+        monkeypatch.setattr(CancellationToken, "track_process", lambda self, p: pids.append(p.pid) or track(self, p))
+
+        start = time.time()
+        outcome = executor.run(
+            run_subprocess, args=([sys.executable, "-c", "import time; time.sleep(30)"],), timeout=0.5
+        )
+
+        assert outcome.timed_out and time.time() - start < 5
+        assert outcome.token.killed_processes == 1
+        assert executor.snapshot()["processes_killed"] == 1
+        assert executor.snapshot()["leaked"] == 0
+        deadline = time.time() + 5
+        while _pid_alive(pids[0]) and time.time() < deadline:
+            time.sleep(0.05)
+        assert not _pid_alive(pids[0])
+
+    def test_without_token_behaves_like_subprocess_run(self):
+        result = run_subprocess([sys.executable, "-c", "print('hi')"], capture_output=True, text=True, timeout=10)
+        assert result.returncode == 0 and result.stdout.strip() == "hi"
+
+    def test_cancelled_token_refuses_to_start(self):
+        token = CancellationToken("done")
+        token.cancel()
+        with pytest.raises(StepCancelledError):
+            run_subprocess([sys.executable, "-c", "pass"], token=token)
@@ -0,0 +1,99 @@
+"""
+Tests for coverage_index.py and its use by coverage_analyzer.py.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import os
+
+from langgraph_engine import coverage_analyzer
+from langgraph_engine.coverage_index import AhoCorasick, ReferenceCache, TestReferenceIndex
+
+
+class TestAhoCorasick:
+    def test_find_all_matches_naive_substring_search(self):
+        patterns = ["he", "she", "his", "hers", "calc", "tax", "x"]
+        ac = AhoCorasick(patterns)
+        for text in ["ushers", "calculate_tax", "nothing", "ahishers", ""]:
+            expected = {p for p in patterns if p in text}
+            assert ac.find_all(text) == expected
+            assert ac.contains_any(text) == bool(expected)
+
+    def test_empty_automaton_never_matches(self):
+        ac = AhoCorasick(["", ""])
+        assert ac.pattern_count == 0
+        assert ac.contains_any("anything") is False
+
+
+class TestReferenceCache:
+    def test_parses_each_content_once(self, tmp_path):
+        calls = []
+
+        def extractor(path, source):
+            calls.append(path)
+            return {source.strip()}
+
+        cache = ReferenceCache(extractor)
+        tf = tmp_path / "test_a.py"
+        tf.write_text("alpha", encoding="utf-8")
+
+        assert cache.get(tf) == frozenset({"alpha"})
+        assert cache.get(tf) == frozenset({"alpha"})
+        assert len(calls) == 1
+
+        tf.write_text("beta!", encoding="utf-8")
+        st = tf.stat()
+        os.utime(tf, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert cache.get(tf) == frozenset({"beta!"})
+        assert len(calls) == 2
+        assert cache.hits == 1
+
+
+class TestTestReferenceIndex:
+    def test_merges_files_into_sets(self):
+        index = TestReferenceIndex()
+        index.add("t1.py", {"foo", "Bar"})
+        index.add("t2.py", {"foo"})
+        assert index.references["foo"] == {"t1.py", "t2.py"}
+        assert "Bar" in index
+        assert index.as_dict()["foo"] == ["t1.py", "t2.py"]
+        assert index.matcher.contains_any("pkg.bar.baz")
+
+
+class TestCoverageAnalyzerIntegration:
+    def test_index_and_dict_paths_agree(self, tmp_path):
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        (tests_dir / "test_tax.py").write_text(
+            "from app.tax import TaxService\n\ndef test_calculate_total():\n    TaxService().compute()\n",
+            encoding="utf-8",
+        )
+
+        index = coverage_analyzer._build_reference_index(tmp_path)
+        as_dict = coverage_analyzer._collect_all_references(tmp_path)
+        methods = [
+            {"name": "compute", "id": "app/tax.py::TaxService.compute"},
+            {"name": "calculate_total_tax", "id": "app/tax.py::calculate_total_tax"},
+            {"name": "zz", "id": "q/w.py::zz"},
+        ]
+        for method in methods:
+            assert coverage_analyzer._is_method_tested(method, index) == coverage_analyzer._is_method_tested(
+                method, as_dict
+            )
+        assert coverage_analyzer._is_method_tested(methods[1], index) is True
+
+    def test_index_reused_until_test_files_change(self, tmp_path):
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        tf = tests_dir / "test_one.py"
+        tf.write_text("def test_alpha():\n    pass\n", encoding="utf-8")
+
+        first = coverage_analyzer._build_reference_index(tmp_path)
+        assert coverage_analyzer._build_reference_index(tmp_path) is first
+
+        tf.write_text("def test_beta_gamma():\n    pass\n", encoding="utf-8")
+        st = tf.stat()
+        os.utime(tf, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        second = coverage_analyzer._build_reference_index(tmp_path)
+        assert second is not first
+        assert "beta_gamma" in second
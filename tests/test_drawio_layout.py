@@ -0,0 +1,183 @@
+"""
+Tests for langgraph_engine/diagrams/drawio/layout.py, the layered class
+diagram in DrawioConverter and the ranked call-graph diagram.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import random
+import xml.etree.ElementTree as ET
+
+from langgraph_engine.diagrams.drawio import layout
+from langgraph_engine.diagrams.drawio_converter import DrawioConverter
+from langgraph_engine.diagrams.legacy_generator import UMLDiagramGenerator
+
+
+def _crossings(positions, edges):
+    """Brute-force crossing count between edges of adjacent rows."""
+    segs = [(positions[a], positions[b]) for a, b in edges]
+    total = 0
+    for i, (p1, q1) in enumerate(segs):
+        for p2, q2 in segs[i + 1 :]:
+            if p1[1] == p2[1] and q1[1] == q2[1] and (p1[0] - p2[0]) * (q1[0] - q2[0]) < 0:
+                total += 1
+    return total
+
+
+class TestLayeredLayout:
+    def test_edges_point_down_and_cycles_are_tolerated(self):
+        edges = [("a", "b"), ("b", "c"), ("a", "c"), ("c", "a"), ("d", "e")]
+        pos = layout.layered_layout(["a", "b", "c", "d", "e", "lonely"], edges)
+        assert pos["a"][1] < pos["b"][1] < pos["c"][1]
+        assert pos["d"][1] < pos["e"][1]
+        # Nodes without edges are placed below the layered block.
+        assert pos["lonely"][1] > pos["c"][1]
+
+    def test_barycenter_removes_avoidable_crossings(self):
+        top = ["t%d" % i for i in range(6)]
+        bottom = ["b%d" % i for i in range(6)]
+        edges = [(top[i], bottom[5 - i]) for i in range(6)]
+        pos = layout.layered_layout(top + bottom, edges)
+        assert _crossings(pos, edges) == 0
+
+    def test_wide_layers_wrap(self):
+        nodes = ["n%d" % i for i in range(30)]
+        pos = layout.layered_layout(nodes, [], max_row_width=1000)
+        assert len({y for _x, y in pos.values()}) > 1
+        assert max(x for x, _y in pos.values()) < 1100
+
+    def test_count_crossings_matches_brute_force(self):
+        rng = random.Random(7)
+        layers = [list(range(0, 8)), list(range(8, 16))]
+        layer_of = [0] * 8 + [1] * 8
+        edges = [(rng.randrange(8), 8 + rng.randrange(8)) for _ in range(20)]
+        pos = {v: (p, lv) for lv, nodes in enumerate(layers) for p, v in enumerate(nodes)}
+        assert layout.count_crossings(layers, edges, layer_of) == _crossings(pos, edges)
+
+
+class TestSummarise:
+    def test_strongly_connected_components(self):
+        comps = layout.strongly_connected_components("abcde", [("a", "b"), ("b", "a"), ("b", "c"), ("d", "e")])
+        assert sorted(map(sorted, comps)) == [["a", "b"], ["c"], ["d"], ["e"]]
+
+    def test_summarise_graph_weights_cross_group_edges(self):
+        members, group_edges = layout.summarise_graph(
+            ["a1", "a2", "b1"], [("a1", "b1"), ("a2", "b1"), ("a1", "a2")], lambda n: n[0]
+        )
+        assert members == {"a": ["a1", "a2"], "b": ["b1"]}
+        assert group_edges == {("a", "b"): 2}
+
+
+def _classes(count, packages=20, seed=3):
+    rng = random.Random(seed)
+    classes = []
+    for i in range(count):
+        bases = ["C%d" % rng.randrange(i)] if i and rng.random() < 0.6 else []
+        classes.append(
+            {
+                "name": "C%d" % i,
+                "file_path": "pkg%d/mod%d.py" % (i % packages, i),
+                "bases": bases,
+                "methods": [{"name": "m%d" % k} for k in range(15)],
+                "attributes": [],
+            }
+        )
+    return classes
+
+
+class TestClassDiagram:
+    def test_small_diagram_is_single_page_with_overflow_rows(self):
+        xml = DrawioConverter().convert("class", {"classes": _classes(5)})
+        root = ET.fromstring(xml)
+        assert len(root.findall("diagram")) == 1
+        assert "... +3 more" in xml
+
+    def test_large_project_renders_every_class_with_drill_down(self):
+        classes = _classes(2000)
+        xml = DrawioConverter().convert("class", {"classes": classes})
+        root = ET.fromstring(xml)
+        pages = root.findall("diagram")
+        assert pages[0].get("id") == "overview"
+        assert len(pages) == 21
+        links = {u.get("link") for u in pages[0].iter("UserObject")}
+        assert links == {"data:page/id,%s" % p.get("id") for p in pages[1:]}
+        headers = {c.get("value") for p in pages[1:] for c in p.iter("mxCell") if c.get("parent") == "1"}
+        assert {"C%d" % i for i in range(2000)} <= headers
+
+    def test_single_page_can_be_forced(self):
+        xml = DrawioConverter().convert("class", {"classes": _classes(300)}, summarise=False)
+        root = ET.fromstring(xml)
+        assert len(root.findall("diagram")) == 1
+        assert xml.count('value="C') >= 300
+
+    def test_scc_mode_groups_cycles(self):
+        classes = [
+            {"name": "A", "file_path": "x/a.py", "relationships": [{"target": "B"}]},
+            {"name": "B", "file_path": "y/b.py", "relationships": [{"target": "A"}]},
+            {"name": "C", "file_path": "y/c.py", "bases": ["A"]},
+        ]
+        root = ET.fromstring(DrawioConverter().convert("class", {"classes": classes}, summarise="scc"))
+        pages = root.findall("diagram")[1:]
+        by_name = {p.get("name"): p for p in pages}
+        assert len(pages) == 2 and "y" in by_name
+        cycle = next(p for name, p in by_name.items() if name.startswith("cycle-"))
+        values = {c.get("value") for c in cycle.iter("mxCell")}
+        assert {"A", "B"} <= values
+
+    def test_same_class_name_in_two_packages_stays_two_classes(self):
+        classes = [
+            {"name": "Config", "file_path": "a/config.py"},
+            {"name": "Config", "file_path": "b/config.py"},
+            {"name": "Loader", "file_path": "b/loader.py", "relationships": [{"target": "Config"}]},
+        ]
+        root = ET.fromstring(DrawioConverter().convert("class", {"classes": classes}, summarise=False))
+        cells = list(root.iter("mxCell"))
+        boxes = {c.get("id"): c.get("value") for c in cells if c.get("parent") == "1" and c.get("vertex") == "1"}
+        assert sorted(boxes.values()) == ["Config", "Config", "Loader"]
+        edges = [c for c in cells if c.get("edge") == "1"]
+        assert len(edges) == 1
+
+        pages = ET.fromstring(DrawioConverter().convert("class", {"classes": classes}, summarise="package"))
+        by_name = {p.get("name"): p for p in pages.findall("diagram")[1:]}
+        assert set(by_name) == {"a", "b"}
+        values = [c.get("value") for c in by_name["b"].iter("mxCell") if c.get("parent") == "1"]
+        assert sorted(v for v in values if v) == ["Config", "Loader"]
+        # Loader's target resolves to the Config of its own package: no cross-package edge
+        overview = pages.findall("diagram")[0]
+        assert not [c for c in overview.iter("mxCell") if c.get("edge") == "1"]
+
+
+class _FakeCallGraph:
+    def __init__(self, n_methods, calls, classes=5):
+        self.classes = {}
+        self.methods = {}
+        for i in range(n_methods):
+            self.methods["m.py::C%d.f%d" % (i % classes, i)] = {
+                "name": "f%d" % i,
+                "params": [],
+                "parent_class": "m.py::C%d" % (i % classes),
+            }
+        names = list(self.methods)
+        self._edges = [{"from": names[a], "to": names[b], "type": "call"} for a, b in calls]
+
+    def get_edges(self):
+        return self._edges
+
+
+class TestCallGraphRanking:
+    def test_most_connected_methods_are_kept(self, tmp_path):
+        # Method 99 (last in dict order) is the hub; dict order used to drop it.
+        calls = [(99, i) for i in range(10)]
+        cg = _FakeCallGraph(100, calls)
+        syntax = UMLDiagramGenerator(str(tmp_path)).generate_call_graph_diagram(call_graph=cg, summarise=False)
+        assert "f99(" in syntax
+        assert "+60 methods" in syntax
+        assert syntax.count(" --> ") == 10
+
+    def test_summary_mode_collapses_classes(self, tmp_path):
+        calls = [(i, (i + 1) % 400) for i in range(400)]
+        cg = _FakeCallGraph(400, calls)
+        syntax = UMLDiagramGenerator(str(tmp_path)).generate_call_graph_diagram(call_graph=cg)
+        assert "(80 methods)" in syntax
+        assert "-->|80|" in syntax
+        assert "subgraph" not in syntax
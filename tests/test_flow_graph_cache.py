@@ -0,0 +1,156 @@
+"""
+Tests for the compiled-graph cache in langgraph_engine/orchestrator.py -
+fingerprints, topology reuse, per-run checkpointer binding, thread safety
+and the warm-up API.
+
+Graph construction is replaced by a recording fake so the cache logic runs
+without LangGraph; the last test compiles the real graph when it is installed.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from langgraph_engine import orchestrator
+
+
+class _FakeCompiled:
+    def __init__(self, topology, checkpointer=None):
+        self.topology = topology
+        self.checkpointer = checkpointer
+
+    def copy(self, update):
+        return _FakeCompiled(self.topology, update.get("checkpointer", self.checkpointer))
+
+
+class _FakeTopology:
+    def __init__(self, hook_mode):
+        self.hook_mode = hook_mode
+        self.compiled_with = []
+
+    def compile(self, checkpointer=None):
+        self.compiled_with.append(checkpointer)
+        return _FakeCompiled(self, checkpointer)
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    calls = []
+
+    def fake_build(hook_mode=False):
+        calls.append(hook_mode)
+        time.sleep(0.02)  # Widen the race window for the concurrency test
+        return _FakeTopology(hook_mode)
+
+    monkeypatch.setattr(orchestrator, "_build_topology", fake_build)
+    orchestrator.clear_flow_graph_cache()
+    yield calls
+    orchestrator.clear_flow_graph_cache()
+
+
+def test_same_fingerprint_is_built_once(builds):
+    first = orchestrator.create_flow_graph(hook_mode=True, checkpointer="none")
+    assert orchestrator.create_flow_graph(hook_mode=True, checkpointer="none") is first
+    full = orchestrator.create_flow_graph(hook_mode=False, checkpointer="none")
+    assert full is not first
+    assert builds == [True, False]
+
+    info = orchestrator.flow_graph_cache_info()
+    assert info["hits"] == 1 and info["builds"] == 2 and info["compiles"] == 2
+    assert info["cached"] == sorted([orchestrator.graph_fingerprint(True), orchestrator.graph_fingerprint(False)])
+
+
+def test_checkpointer_kinds_share_one_compile(builds, monkeypatch):
+    monkeypatch.setattr(orchestrator.CheckpointerManager, "get_memory_checkpointer", staticmethod(object))
+    monkeypatch.setattr(orchestrator.CheckpointerManager, "get_default_checkpointer", lambda use_sqlite: object())
+    persistent = orchestrator.create_flow_graph(hook_mode=True, checkpointer="sqlite")
+    memory = orchestrator.create_flow_graph(hook_mode=True, checkpointer="memory")
+    bare = orchestrator.create_flow_graph(hook_mode=True, checkpointer="none")
+    assert bare.checkpointer is None
+    assert persistent.topology is memory.topology is bare.topology
+    assert persistent.topology.compiled_with == [None]
+    assert builds == [True]
+
+
+def test_each_run_gets_its_own_checkpointer(builds, monkeypatch):
+    monkeypatch.setattr(orchestrator.CheckpointerManager, "get_memory_checkpointer", staticmethod(object))
+    first = orchestrator.create_flow_graph(hook_mode=True, checkpointer="memory")
+    second = orchestrator.create_flow_graph(hook_mode=True, checkpointer="memory")
+    assert first is not second
+    assert first.checkpointer is not None and first.checkpointer is not second.checkpointer
+
+    saver = object()
+    run = orchestrator.create_flow_graph(hook_mode=True, checkpointer=saver)
+    assert run.checkpointer is saver
+    assert orchestrator.flow_graph_cache_info()["cached"] == [orchestrator.graph_fingerprint(True)]
+    assert builds == [True]
+
+
+def test_sqlite_failure_runs_without_checkpointer(builds, monkeypatch):
+    def broken(use_sqlite):
+        raise RuntimeError("no sqlite")
+
+    monkeypatch.setattr(orchestrator.CheckpointerManager, "get_default_checkpointer", broken)
+    assert orchestrator.create_flow_graph(hook_mode=True).checkpointer is None
+
+
+def test_release_closes_the_run_connection(builds):
+    saver = type("Saver", (), {})()
+    saver.conn = sqlite3.connect(":memory:")
+    run = orchestrator.create_flow_graph(hook_mode=True, checkpointer=saver)
+    orchestrator.release_flow_graph(run)
+    with pytest.raises(sqlite3.ProgrammingError):
+        saver.conn.execute("SELECT 1")
+    orchestrator.release_flow_graph(orchestrator.create_flow_graph(hook_mode=True, checkpointer="none"))
+
+
+def test_unknown_checkpointer_kind_is_rejected(builds):
+    with pytest.raises(ValueError):
+        orchestrator.create_flow_graph(checkpointer="redis")
+
+
+def test_concurrent_first_use_builds_once(builds):
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        results.append(orchestrator.create_flow_graph(hook_mode=True, checkpointer="none"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+
+    assert len(results) == 8 and all(r is results[0] for r in results)
+    assert builds == [True]
+
+
+def test_warm_up_populates_cache(builds):
+    timings = orchestrator.warm_flow_graphs([True, False])
+    assert set(timings) == {orchestrator.graph_fingerprint(True), orchestrator.graph_fingerprint(False)}
+
+    thread = orchestrator.warm_flow_graphs([True], background=True)
+    thread.join(10)
+    orchestrator.create_flow_graph(hook_mode=True, checkpointer="none")
+    assert orchestrator.flow_graph_cache_info()["hits"] == 2
+    assert sorted(builds) == [False, True]
+
+
+def test_real_graph_is_reused():
+    if not orchestrator._LANGGRAPH_AVAILABLE:
+        pytest.skip("langgraph not installed")
+    orchestrator.clear_flow_graph_cache()
+    try:
+        graph = orchestrator.create_flow_graph(hook_mode=True, checkpointer="memory")
+        other = orchestrator.create_flow_graph(hook_mode=True, checkpointer="memory")
+        assert other.checkpointer is not graph.checkpointer
+        assert orchestrator.flow_graph_cache_info()["compiles"] == 1
+        assert "level3_output" in graph.get_graph().nodes
+    finally:
+        orchestrator.clear_flow_graph_cache()
@@ -0,0 +1,197 @@
+"""
+Tests for langgraph_engine/git_reader.py and the fork-free read path of
+GitOperations, checked against the git CLI on throwaway repositories.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import shutil
+import subprocess
+
+import pytest
+
+pytest.importorskip("loguru")
+
+if shutil.which("git") is None:
+    pytest.skip("git CLI not available", allow_module_level=True)
+
+from langgraph_engine import git_operations, git_reader  # noqa: E402
+from langgraph_engine.git_reader import GitReader, parse_git_config  # noqa: E402
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-C", str(repo)] + list(args), capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    for var in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv("GIT_%s_NAME" % var, "Test")
+        monkeypatch.setenv("GIT_%s_EMAIL" % var, "test@example.com")
+    monkeypatch.setattr(git_reader, "_global_rewrites", None)
+    monkeypatch.setattr(git_reader, "_readers", {})
+
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    (path / "src").mkdir()
+    (path / "src" / "a.py").write_text("a = 1\n")
+    (path / "README.md").write_text("hello\n")
+    _git(path, "add", "-A")
+    _git(path, "commit", "-q", "-m", "init")
+    _git(path, "remote", "add", "origin", "git@github.com:acme/widgets.git")
+    _git(path, "branch", "feature/nested")
+    return path
+
+
+class TestRefs:
+    def test_matches_git_cli_with_loose_and_packed_refs(self, repo):
+        _git(repo, "pack-refs", "--all")
+        _git(repo, "branch", "loose-one")
+        reader = GitReader(repo)
+        assert reader.current_branch() == "main"
+        assert reader.resolve_ref("HEAD") == _git(repo, "rev-parse", "HEAD")
+        assert reader.rev_parse("feature/nested") == _git(repo, "rev-parse", "feature/nested")
+        assert reader.rev_parse("HEAD^{tree}") == _git(repo, "rev-parse", "HEAD^{tree}")
+        assert reader.local_branches() == _git(repo, "for-each-ref", "--format=%(refname:short)", "refs/heads/").split()
+        assert reader.remote_url("origin") == _git(repo, "remote", "get-url", "origin")
+        assert reader.remote_url("upstream") is None
+
+    def test_detached_head_and_subdirectory(self, repo):
+        _git(repo, "checkout", "-q", "--detach")
+        reader = GitReader(repo / "src")
+        assert reader.current_branch() == "HEAD"
+        assert reader.git_dir == repo / ".git"
+
+    def test_linked_worktree(self, repo, tmp_path):
+        wt = tmp_path / "wt"
+        _git(repo, "worktree", "add", "-q", str(wt), "feature/nested")
+        reader = GitReader(wt)
+        assert reader.current_branch() == "feature/nested"
+        assert reader.common_dir == (repo / ".git").resolve()
+        assert "main" in reader.local_branches()
+
+    def test_cache_is_reused_while_refs_are_unchanged(self, repo):
+        reader = GitReader(repo)
+        before = reader.resolve_ref("refs/heads/main")
+        assert reader.resolve_ref("refs/heads/main") == before
+        assert reader.stats["ref_cache_hits"] == 1
+
+    def test_external_updates_are_seen_without_invalidate(self, repo):
+        reader = GitReader(repo)
+        reader.resolve_ref("HEAD")
+        assert reader.remote_url("origin") == "git@github.com:acme/widgets.git"
+
+        (repo / "README.md").write_text("changed\n")
+        _git(repo, "commit", "-q", "-am", "second")
+        assert reader.resolve_ref("HEAD") == _git(repo, "rev-parse", "HEAD")
+        _git(repo, "pack-refs", "--all")
+        _git(repo, "checkout", "-q", "feature/nested")
+        assert reader.current_branch() == "feature/nested"
+        _git(repo, "remote", "set-url", "origin", "git@github.com:acme/gadgets.git")
+        assert reader.remote_url("origin") == "git@github.com:acme/gadgets.git"
+        assert reader.stats["ref_cache_resets"] >= 2
+
+    def test_nested_ref_update_is_seen_after_the_ttl(self, repo, monkeypatch):
+        monkeypatch.setattr(git_reader, "_REF_CACHE_TTL_S", 0.0)
+        reader = GitReader(repo)
+        reader.resolve_ref("refs/heads/feature/nested")
+        commit = _git(repo, "commit-tree", "HEAD^{tree}", "-p", "HEAD", "-m", "nested")
+        _git(repo, "update-ref", "refs/heads/feature/nested", commit)
+        assert reader.resolve_ref("refs/heads/feature/nested") == _git(repo, "rev-parse", "feature/nested")
+
+    def test_cat_file_channel_is_reused(self, repo):
+        reader = GitReader(repo)
+        for rev in ("HEAD~0", "HEAD^{tree}", "HEAD:README.md"):
+            assert reader.rev_parse(rev) == _git(repo, "rev-parse", rev)
+        assert reader.rev_parse("no-such-rev~3") is None
+        assert reader._check.starts == 1
+        assert reader.read_object("HEAD:README.md") == ("blob", b"hello\n")
+        reader.close()
+
+    def test_insteadof_falls_back_to_git(self, repo):
+        _git(repo, "config", "url.https://mirror.example/.insteadOf", "git@github.com:")
+        reader = GitReader(repo)
+        assert reader.remote_url("origin") == "https://mirror.example/acme/widgets.git"
+        assert reader.stats["forks"] == 1
+
+
+class TestStagedChanges:
+    @pytest.mark.parametrize("index_version", ["2", "3", "4"])
+    def test_matches_diff_cached(self, repo, index_version):
+        _git(repo, "update-index", "--index-version", index_version)
+        reader = GitReader(repo)
+
+        def check():
+            reader.invalidate()
+            expected = subprocess.run(["git", "-C", str(repo), "diff", "--cached", "--quiet"]).returncode != 0
+            assert reader.has_staged_changes() is expected
+            return expected
+
+        assert check() is False
+        (repo / "src" / "b.py").write_text("b = 2\n")
+        _git(repo, "add", "-A")
+        assert check() is True
+        _git(repo, "commit", "-q", "-m", "b")
+        assert check() is False
+        _git(repo, "rm", "-q", "README.md")
+        assert check() is True
+        _git(repo, "reset", "-q")
+        (repo / "src" / "a.py").chmod(0o755)
+        _git(repo, "add", "-A")
+        assert check() is True
+
+    def test_unborn_branch(self, tmp_path):
+        path = tmp_path / "fresh"
+        subprocess.run(["git", "init", "-q", "-b", "trunk", str(path)], check=True)
+        reader = GitReader(path)
+        assert reader.current_branch() == "trunk"
+        assert reader.has_staged_changes() is False
+        (path / "x.txt").write_text("x")
+        _git(path, "add", "x.txt")
+        assert reader.has_staged_changes() is True
+
+
+class TestConfigParser:
+    def test_sections_quotes_and_comments(self):
+        config = parse_git_config(
+            '[core]\n\tbare = false ; comment\n[remote "Origin"]\n'
+            '\turl = "git@host:a/b.git"\n\tfetch = +a\n\tfetch = +b\n[branch.Main]\nremote=origin\n'
+        )
+        assert config["core.bare"] == ["false"]
+        assert config["remote.Origin.url"] == ["git@host:a/b.git"]
+        assert config["remote.Origin.fetch"] == ["+a", "+b"]
+        assert config["branch.main.remote"] == ["origin"]
+
+
+class TestGitOperationsReads:
+    def test_queries_do_not_fork(self, repo, monkeypatch):
+        ops = git_operations.GitOperations(str(repo))
+        assert ops.current_branch == "main"
+        assert ops.origin_url == "git@github.com:acme/widgets.git"
+
+        def no_fork(*args, **kwargs):
+            raise AssertionError("unexpected fork: %r" % (args,))
+
+        monkeypatch.setattr(git_operations.subprocess, "run", no_fork)
+        monkeypatch.setattr(git_reader.subprocess, "run", no_fork)
+        assert ops.list_branches() == ["feature/nested", "main"]
+        assert ops._get_current_branch() == "main"
+        assert ops._is_git_repository() is True
+
+    def test_commit_reports_hash_and_skips_empty(self, repo):
+        ops = git_operations.GitOperations(str(repo))
+        assert ops.commit("nothing") == {"success": True, "message": "No changes"}
+        (repo / "new.txt").write_text("n\n")
+        result = ops.commit("add new")
+        assert result["success"] is True
+        assert result["commit_hash"] == _git(repo, "rev-parse", "HEAD")[:7]
+
+    def test_switch_branch_refreshes_current_branch(self, repo):
+        ops = git_operations.GitOperations(str(repo))
+        assert ops.switch_branch("feature/nested")["success"] is True
+        assert ops.current_branch == "feature/nested"
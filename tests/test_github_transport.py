@@ -0,0 +1,263 @@
+"""
+Tests for langgraph_engine/github_transport.py and its use by
+GitHubIntegration / GitHubOperationRouter, against a local mock GitHub
+server (no network, no gh CLI).
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import json
+import re
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("loguru")
+
+from langgraph_engine import github_transport as gt  # noqa: E402
+
+
+class _MockGitHub(BaseHTTPRequestHandler):
+    """Just enough of the GitHub REST + GraphQL API for the transport."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, body=None, headers=None):
+        payload = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _record(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length)) if length else None
+        self.server.log.append((self.command, self.path, body, self.client_address[1]))
+        return body
+
+    def do_GET(self):
+        self._record()
+        if self.path == "/repos/o/r/pulls/7":
+            if self.headers.get("If-None-Match") == '"v1"':
+                return self._send(304)
+            return self._send(200, {"number": 7, "head": {"ref": "feat"}}, {"ETag": '"v1"'})
+        self._send(404, {"message": "Not Found"})
+
+    def do_POST(self):
+        body = self._record()
+        if self.path == "/repos/o/r/issues":
+            return self._send(201, {"number": 42, "html_url": "http://x/issues/42", "created_at": "2026-01-01"})
+        if self.path == "/repos/o/r/issues/42/comments":
+            return self._send(201, {"html_url": "http://x/issues/42#c1"})
+        if self.path == "/graphql":
+            query = body["query"]
+            if "pullRequest" in query:
+                pr = {
+                    "state": "OPEN",
+                    "mergeable": "CONFLICTING",
+                    "headRefName": "feat",
+                    "baseRefName": "main",
+                    "reviewDecision": None,
+                    "commits": {"nodes": [{"commit": {"statusCheckRollup": {"state": "SUCCESS"}}}]},
+                }
+                return self._send(200, {"data": {"repository": {"pr": pr}}})
+            issues = {
+                "i%s" % n: {"number": int(n), "title": "T%s" % n, "state": "OPEN", "url": "u", "labels": {"nodes": []}}
+                for n in re.findall(r"issue\(number: (\d+)\)", query)
+            }
+            return self._send(200, {"data": {"repository": issues}})
+        self._send(404, {"message": "Not Found"})
+
+    def do_PATCH(self):
+        self._record()
+        self._send(200, {"closed_at": "2026-01-02"})
+
+    def do_PUT(self):
+        self._record()
+        self._send(200, {"merged": True})
+
+    def do_DELETE(self):
+        self._record()
+        self._send(204)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def github_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockGitHub)
+    server.log = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = "http://127.0.0.1:%d" % server.server_address[1]
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    monkeypatch.setenv("GITHUB_API_URL", url)
+    gt.clear_caches()
+    yield server
+    gt.clear_caches()
+    server.shutdown()
+    server.server_close()
+
+
+def _no_gh(*args, **kwargs):
+    raise AssertionError("unexpected subprocess: %r" % (args,))
+
+
+class TestTransport:
+    def test_conditional_get_is_answered_from_cache(self, github_server):
+        api = gt.get_transport()
+        first = api.request("GET", "repos/o/r/pulls/7")
+        second = api.request("GET", "repos/o/r/pulls/7")
+        assert first == second == {"number": 7, "head": {"ref": "feat"}}
+        assert api.stats["not_modified"] == 1
+        # Keep-alive: both requests used the same client connection.
+        assert len({entry[3] for entry in github_server.log}) == 1
+
+    def test_query_params_are_encoded(self, github_server):
+        with pytest.raises(gt.GitHubTransportError):
+            gt.get_transport().request("GET", "search/issues", params={"q": "is:open label:a&b", "per_page": 5})
+        assert github_server.log[-1][1] == "/search/issues?per_page=5&q=is%3Aopen+label%3Aa%26b"
+
+    def test_transport_is_shared_per_token(self, github_server):
+        assert gt.get_transport() is gt.get_transport("test-token")
+
+    def test_batch_read_is_one_request(self, github_server):
+        issues = gt.get_transport().get_issues("o", "r", [1, 2, 3])
+        assert sorted(issues) == [1, 2, 3]
+        assert [entry[1] for entry in github_server.log] == ["/graphql"]
+
+
+class TestGitHubIntegrationOverTransport:
+    def _integration(self, monkeypatch):
+        from langgraph_engine import github_integration
+
+        monkeypatch.setattr(github_integration, "get_repo_info", lambda path: ("o", "r"))
+        monkeypatch.setattr(github_integration.subprocess, "run", _no_gh)
+        return github_integration.GitHubIntegration()
+
+    def test_issue_lifecycle_without_subprocesses(self, github_server, monkeypatch):
+        gh = self._integration(monkeypatch)
+        created = gh.create_issue("Title", "Body", labels=["bug"], assignee="me")
+        assert created["success"] and created["issue_number"] == 42
+        closed = gh.close_issue(42, "done")
+        assert closed["success"] and closed["closed_at"] == "2026-01-02"
+
+        calls = [(m, p) for m, p, _b, _c in github_server.log]
+        assert calls == [
+            ("POST", "/repos/o/r/issues"),
+            ("POST", "/repos/o/r/issues/42/comments"),
+            ("PATCH", "/repos/o/r/issues/42"),
+        ]
+        # Assignee is sent with the create request, not as a second call.
+        assert github_server.log[0][2]["assignees"] == ["me"]
+
+    def test_client_errors_do_not_fall_back_to_gh(self, github_server, monkeypatch):
+        gh = self._integration(monkeypatch)
+        result = gh.add_issue_comment(999, "hi")
+        assert result["success"] is False
+        assert "404" in result["error"]
+
+    def test_merge_deletes_head_branch(self, github_server, monkeypatch):
+        gh = self._integration(monkeypatch)
+        assert gh.merge_pull_request(7, "msg", delete_branch=True) == {"success": True, "merged": True}
+        assert ("DELETE", "/repos/o/r/git/refs/heads/feat") in [(m, p) for m, p, _b, _c in github_server.log]
+
+
+class TestRouterReads:
+    def test_pr_status_in_one_graphql_request(self, github_server, monkeypatch):
+        from langgraph_engine import github_integration, github_operation_router
+
+        monkeypatch.setattr(github_integration, "get_repo_info", lambda path: ("o", "r"))
+        monkeypatch.setattr(github_operation_router, "get_repo_info", lambda path: ("o", "r"))
+        router = github_operation_router.GitHubOperationRouter(use_mcp=False)
+        status = router.get_pr_status(7)
+        assert status["success"] is True
+        assert status["mergeable"] is False
+        assert status["checks_state"] == "SUCCESS"
+        assert len(github_server.log) == 1
+
+
+class TestMemoisation:
+    def setup_method(self):
+        gt.clear_caches()
+
+    def teardown_method(self):
+        gt.clear_caches()
+
+    def test_parse_github_remote(self):
+        assert gt.parse_github_remote("git@github.com:acme/widgets.git") == ("acme", "widgets")
+        assert gt.parse_github_remote("https://github.com/acme/widgets") == ("acme", "widgets")
+        assert gt.parse_github_remote("ssh://git@github.com/acme/w.gitx.git") == ("acme", "w.gitx")
+        assert gt.parse_github_remote("https://gitlab.com/acme/widgets") == (None, None)
+
+    def test_repo_info_resolved_once_per_path(self, tmp_path, monkeypatch):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        subprocess.run(
+            ["git", "-C", str(tmp_path), "remote", "add", "origin", "git@github.com:acme/widgets.git"], check=True
+        )
+        calls = []
+        real_run = subprocess.run
+
+        def counting_run(*args, **kwargs):
+            calls.append(args[0])
+            return real_run(*args, **kwargs)
+
+        monkeypatch.setattr(gt.subprocess, "run", counting_run)
+        assert gt.get_repo_info(str(tmp_path)) == ("acme", "widgets")
+        assert gt.get_repo_info(str(tmp_path)) == ("acme", "widgets")
+        assert len(calls) == 1
+
+    def test_gh_token_resolved_once(self, monkeypatch):
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="tok\n", stderr="")
+
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setattr(gt.subprocess, "run", fake_run)
+        assert [gt.resolve_token() for _ in range(3)] == ["tok", "tok", "tok"]
+        assert len(calls) == 1
+
+    def test_missing_gh_token_is_retried_after_ttl(self, monkeypatch):
+        now = [1000.0]
+        outputs = ["", "tok\n"]
+
+        def fake_run(cmd, **kwargs):
+            return subprocess.CompletedProcess(cmd, 0 if outputs[0] else 1, stdout=outputs.pop(0), stderr="")
+
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.setattr(gt.subprocess, "run", fake_run)
+        monkeypatch.setattr(gt.time, "monotonic", lambda: now[0])
+        assert gt.get_gh_token() is None
+        assert gt.get_gh_token() is None  # Within the TTL: no second subprocess
+        assert outputs == ["tok\n"]
+
+        now[0] += gt.GH_RETRY_AFTER_S
+        assert gt.get_gh_token() == "tok"
+        now[0] += 10 * gt.GH_RETRY_AFTER_S
+        assert gt.get_gh_token() == "tok"  # Successes never expire
+        assert outputs == []
+
+    def test_gh_status_error_is_retried_after_ttl(self, monkeypatch):
+        now = [1000.0]
+        codes = [1, 0]
+
+        def fake_run(cmd, **kwargs):
+            return subprocess.CompletedProcess(cmd, codes.pop(0), stdout="", stderr="")
+
+        monkeypatch.setattr(gt.subprocess, "run", fake_run)
+        monkeypatch.setattr(gt.time, "monotonic", lambda: now[0])
+        assert "not authenticated" in gt.check_gh_cli()
+        assert "not authenticated" in gt.check_gh_cli()
+        now[0] += gt.GH_RETRY_AFTER_S
+        assert gt.check_gh_cli() is None
+        assert gt.check_gh_cli() is None
+        assert codes == []
@@ -0,0 +1,236 @@
+"""
+Tests for src/utils/resource_cache.py and its use by ImportManager, against
+a local HTTP stand-in for raw.githubusercontent.com (no network).
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import hashlib
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("requests")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils import import_manager as im  # noqa: E402
+from src.utils.resource_cache import ResourceCache  # noqa: E402
+
+FILES = {
+    "/skills/docker/skill.md": b"# Docker skill\n",
+    "/skills/kubernetes/skill.md": b"# Kubernetes skill\n",
+    "/skills/INDEX.md": b"- [docker](docker/skill.md)\n- [kubernetes](kubernetes/skill.md)\n",
+    "/agents/devops-engineer/agent.md": b"# DevOps agent\n",
+    "/agents/README.md": b"| [devops-engineer](devops-engineer/agent.md) |\n",
+}
+
+
+class _RawGitHubStandIn(BaseHTTPRequestHandler):
+    """Static files with strong ETags and conditional GET support."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.log.append((self.path, self.headers.get("If-None-Match")))
+        server.gate.wait(5)
+        if server.delay:
+            time.sleep(server.delay)
+        body = server.files.get(self.path)
+        if body is None:
+            self._send(404, b"Not Found")
+            return
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, b"", {"ETag": etag})
+            return
+        self._send(200, body, {"ETag": etag, "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _RawGitHubStandIn)
+    srv.files = dict(FILES)
+    srv.log = []
+    srv.lock = threading.Lock()
+    srv.delay = 0
+    srv.gate = threading.Event()  # Cleared = hold responses
+    srv.gate.set()
+    srv.url = "http://127.0.0.1:%d" % srv.server_address[1]
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def make_cache(tmp_path, clock):
+    caches = []
+
+    def make(**kwargs):
+        kwargs.setdefault("cache_dir", tmp_path / "cache")
+        kwargs.setdefault("ttl_s", 60)
+        kwargs.setdefault("stale_s", 600)
+        kwargs.setdefault("timeout", 2)
+        kwargs.setdefault("offline", False)
+        kwargs.setdefault("clock", clock)
+        cache = ResourceCache(**kwargs)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+class TestResourceCache:
+    def test_fresh_entry_is_a_disk_read(self, server, make_cache):
+        url = server.url + "/skills/docker/skill.md"
+        assert make_cache().fetch(url) == (b"# Docker skill\n", "network")
+
+        reopened = make_cache()  # New process: entry comes from disk
+        assert reopened.fetch(url) == (b"# Docker skill\n", "cache")
+        assert len(server.log) == 1
+        assert reopened.stats["hits"] == 1
+
+    def test_expired_entry_is_revalidated_with_etag(self, server, make_cache, clock):
+        cache = make_cache(stale_s=0)
+        url = server.url + "/skills/docker/skill.md"
+        cache.fetch(url)
+        clock.now += 61
+        assert cache.fetch(url) == (b"# Docker skill\n", "network")
+        assert server.log[-1][1] is not None  # If-None-Match sent
+        assert cache.stats["not_modified"] == 1
+
+        server.files["/skills/docker/skill.md"] = b"# Docker skill v2\n"
+        clock.now += 61
+        assert cache.get(url) == b"# Docker skill v2\n"
+
+    def test_stale_entry_is_served_while_revalidating(self, server, make_cache, clock):
+        cache = make_cache()
+        url = server.url + "/skills/docker/skill.md"
+        cache.fetch(url)
+        server.files["/skills/docker/skill.md"] = b"# updated\n"
+        server.gate.clear()
+        clock.now += 120
+
+        # Answered while the revalidation request is still held by the server
+        assert cache.fetch(url) == (b"# Docker skill\n", "stale")
+        assert cache.stats["fetched"] == 1
+        server.gate.set()
+
+        deadline = time.monotonic() + 5
+        while cache.stats["fetched"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert cache.fetch(url) == (b"# updated\n", "cache")
+
+    def test_missing_resource_is_negatively_cached(self, server, make_cache):
+        cache = make_cache()
+        url = server.url + "/skills/nope/skill.md"
+        assert cache.fetch(url) is None
+        assert cache.fetch(url) is None
+        assert len(server.log) == 1
+
+    def test_unreachable_server_falls_back_to_old_copy(self, server, make_cache, clock):
+        url = server.url + "/skills/docker/skill.md"
+        make_cache().fetch(url)
+        clock.now += 10**6
+        dead = make_cache(mirrors={})
+        server.shutdown()
+        server.server_close()
+        assert dead.fetch(url) == (b"# Docker skill\n", "stale")
+        assert dead.stats["errors"] == 1
+
+    def test_offline_mode_reads_mirror_then_cache(self, server, make_cache, tmp_path):
+        url = server.url + "/skills/docker/skill.md"
+        make_cache().fetch(url)
+
+        mirror = tmp_path / "mirror"
+        (mirror / "skills" / "kubernetes").mkdir(parents=True)
+        (mirror / "skills" / "kubernetes" / "skill.md").write_bytes(b"# mirrored\n")
+        offline = make_cache(offline=True, mirrors={server.url: mirror})
+        before = len(server.log)
+
+        assert offline.fetch(server.url + "/skills/kubernetes/skill.md") == (b"# mirrored\n", "mirror")
+        assert offline.fetch(url) == (b"# Docker skill\n", "stale")
+        assert offline.fetch(server.url + "/skills/../../etc/skill.md") is None
+        assert offline.fetch(server.url + "/skills/other/skill.md") is None
+        assert len(server.log) == before
+
+    def test_prefetch_is_concurrent_and_skips_fresh(self, server, make_cache):
+        cache = make_cache()
+        server.delay = 0.3
+        urls = [server.url + path for path in FILES] + [server.url + "/skills/nope/skill.md"]
+
+        started = time.monotonic()
+        ready = cache.prefetch(urls)
+        assert time.monotonic() - started < 0.3 * len(urls) / 2
+        assert [ready[u] for u in urls] == [True] * len(FILES) + [False]
+
+        logged = len(server.log)
+        cache.prefetch(urls)
+        assert len(server.log) == logged
+
+    def test_identical_bodies_share_one_object(self, server, make_cache, tmp_path):
+        server.files["/skills/copy/skill.md"] = FILES["/skills/docker/skill.md"]
+        cache = make_cache()
+        cache.prefetch([server.url + "/skills/docker/skill.md", server.url + "/skills/copy/skill.md"])
+        objects = [p for p in (tmp_path / "cache" / "objects").rglob("*") if p.is_file()]
+        assert len(objects) == 1
+
+
+class TestImportManager:
+    @pytest.fixture(autouse=True)
+    def wired(self, server, make_cache, monkeypatch):
+        monkeypatch.setattr(im, "GLOBAL_LIB_URL", server.url)
+        cache = make_cache(mirrors={})
+        im.set_resource_cache(cache)
+        yield cache
+        im.set_resource_cache(None)
+
+    def test_skill_and_agent_loading(self, server):
+        skill = im.ImportManager.get_skill("docker")
+        assert skill["content"] == "# Docker skill\n" and skill["source"] == "github"
+        assert im.ImportManager.get_skill("docker")["source"] == "cache"
+        assert im.ImportManager.get_agent("devops-engineer")["content"] == "# DevOps agent\n"
+        assert im.ImportManager.get_skill("missing") is None
+        assert im.ImportManager.list_agents()[0].startswith("| [devops-engineer]")
+
+    def test_prefetch_whole_sets_from_index(self, server, wired):
+        assert im.ImportManager.prefetch_skills() == {"docker": True, "kubernetes": True}
+        assert im.ImportManager.prefetch_agents() == {"devops-engineer": True}
+
+        requests_before = len(server.log)
+        assert im.ImportManager.get_skill("kubernetes")["source"] == "cache"
+        assert len(server.log) == requests_before
@@ -0,0 +1,212 @@
+"""
+Tests for langgraph_engine/integrations/jenkins_watcher.py and the
+background build waiting in JenkinsIntegration, against a local Jenkins
+stand-in (no network).
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from langgraph_engine.integrations import IntegrationRegistry, jenkins_integration
+from langgraph_engine.integrations.jenkins_integration import JenkinsIntegration
+from langgraph_engine.integrations.jenkins_watcher import BuildWatch, BuildWatcher, JenkinsConnection
+
+
+class _Build:
+    def __init__(self, lines, result, queued_polls=0):
+        self.lines = lines
+        self.result = result
+        self.queued_polls = queued_polls
+        self.emitted = 0
+
+    @property
+    def log(self):
+        return "".join(self.lines[: self.emitted])
+
+    @property
+    def building(self):
+        return self.emitted < len(self.lines)
+
+
+class _JenkinsStandIn(BaseHTTPRequestHandler):
+    """Jobs, build triggers, build status and progressive console text."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, body=b"", headers=None, ctype="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        self.server.clients.add(self.client_address[1])
+        path = urllib.parse.urlsplit(self.path).path
+        if path == "/job/app/buildWithParameters":
+            number = self.server.next_build
+            self.server.next_build += 1
+            self.server.builds[number] = self.server.pending_builds.pop(0)
+            return self._send(201, headers={"Location": "/queue/item/%d/" % number})
+        self._send(404)
+
+    def do_GET(self):
+        self.server.clients.add(self.client_address[1])
+        parts = urllib.parse.urlsplit(self.path)
+        path = parts.path.strip("/").split("/")
+        if path == ["job", "app", "api", "json"]:
+            return self._send(200, json.dumps({"nextBuildNumber": self.server.next_build}).encode())
+        if len(path) >= 4 and path[:2] == ["job", "app"]:
+            build = self.server.builds.get(int(path[2]))
+            if build is None:
+                return self._send(404)
+            if build.queued_polls:
+                build.queued_polls -= 1
+                return self._send(404)
+            if path[3:] == ["logText", "progressiveText"]:
+                start = int(urllib.parse.parse_qs(parts.query).get("start", ["0"])[0])
+                if build.building:
+                    build.emitted += 1
+                text = build.log.encode()
+                headers = {"X-Text-Size": str(len(text))}
+                if build.building:
+                    headers["X-More-Data"] = "true"
+                return self._send(200, text[start:], headers, "text/plain")
+            if path[3:] == ["api", "json"]:
+                payload = {"building": build.building, "result": None if build.building else build.result}
+                return self._send(200, json.dumps(payload).encode())
+        self._send(404)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def jenkins(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JenkinsStandIn)
+    server.next_build = 5
+    server.builds = {}
+    server.pending_builds = []
+    server.clients = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(jenkins_integration, "_BUILD_POLL_MIN_INTERVAL", 0.01)
+    monkeypatch.setattr(jenkins_integration, "_BUILD_POLL_INTERVAL", 0.05)
+    server.url = "http://127.0.0.1:%d" % server.server_address[1]
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _integration(server, **extra):
+    config = {"enabled": True, "jenkins_url": server.url, "jenkins_job_name": "app"}
+    config.update(extra)
+    return JenkinsIntegration(config)
+
+
+class TestBackoff:
+    def test_delay_grows_to_cap_and_resets_on_progress(self):
+        watcher = BuildWatcher(lambda path: (404, {}, b""), min_interval=1, max_interval=8, jitter=0)
+        watch = BuildWatch("app", "/job/app", 1, time.monotonic() + 60, 1)
+        assert [watcher.next_delay(watch, False) for _ in range(5)] == [2, 4, 8, 8, 8]
+        assert watcher.next_delay(watch, True) == 1
+
+    def test_jitter_stays_within_bounds(self):
+        watcher = BuildWatcher(lambda path: (404, {}, b""), min_interval=4, jitter=0.25, rng=random.Random(1))
+        watch = BuildWatch("app", "/job/app", 1, time.monotonic() + 60, 4)
+        delays = {watcher.next_delay(watch, True) for _ in range(50)}
+        assert len(delays) > 1
+        assert all(3 <= d <= 5 for d in delays)
+
+
+class TestIntegration:
+    def test_update_returns_immediately_and_review_gets_result(self, jenkins):
+        jenkins.pending_builds.append(_Build(["step %d\n" % i for i in range(4)], "SUCCESS"))
+        gh = _integration(jenkins, jenkins_wait=False)
+
+        started = time.monotonic()
+        updated = gh.update({"branch_name": "feat"})
+        assert time.monotonic() - started < 1.0
+        assert updated["pending"] is True and updated["build_number"] == 5
+        assert updated["success"] is False and updated["result"] == "BUILDING"
+
+        review = gh.on_review({"pr_number": 1}, {})
+        assert review["passed"] is True and review["result"] == "SUCCESS"
+        watch = gh.watch_build("app", 5)
+        assert watch.console == "".join("step %d\n" % i for i in range(4))
+        assert gh.pending_builds() == []
+        # All requests went over one keep-alive connection.
+        assert len(jenkins.clients) == 1
+        assert gh._get_connection().connects == 1
+
+    def test_update_blocks_by_default(self, jenkins):
+        jenkins.pending_builds.append(_Build(["boom\n"], "FAILURE", queued_polls=2))
+        jenkins.pending_builds.append(_Build(["ok\n"], "SUCCESS"))
+        gh = _integration(jenkins)
+        failed = gh.update({})
+        assert failed["success"] is False and failed["result"] == "FAILURE"
+        assert "pending" not in failed
+        assert gh.update({})["success"] is True
+
+    def test_pipeline_update_returns_before_the_build_finishes(self, jenkins):
+        jenkins.pending_builds.append(_Build(["step %d\n" % i for i in range(6)], "SUCCESS"))
+        registry = IntegrationRegistry(
+            extra_config={"enabled": True, "jenkins_url": jenkins.url, "jenkins_job_name": "app"}
+        )
+        gh = registry.get("jenkins")
+
+        updated = gh.update({"branch_name": "feat"})
+        assert updated["pending"] is True and updated["result"] == "BUILDING"
+        assert jenkins.builds[5].building  # Step 10 did not wait for Jenkins
+
+        assert gh.on_review({"pr_number": 1}, {})["result"] == "SUCCESS"
+        assert not jenkins.builds[5].building
+
+    def test_several_builds_are_watched_concurrently(self, jenkins):
+        jenkins.builds[7] = _Build(["a\n"] * 3, "SUCCESS", queued_polls=3)
+        jenkins.builds[8] = _Build(["b\n"] * 2, "UNSTABLE")
+        gh = _integration(jenkins)
+        streamed = []
+        watches = [gh.watch_build("app", 7), gh.watch_build("app", 8, on_log=streamed.append)]
+        assert [w.wait(5)["result"] for w in watches] == ["SUCCESS", "UNSTABLE"]
+        assert "".join(streamed) == "b\nb\n"
+        assert gh._watcher._thread is not None
+
+    def test_finished_watches_are_pruned(self, jenkins):
+        for number in range(10, 14):
+            jenkins.builds[number] = _Build(["x\n"], "SUCCESS")
+        gh = _integration(jenkins)
+        watcher = gh._get_watcher()
+        watcher.keep_finished = 2
+        watches = [gh.watch_build("app", n) for n in range(10, 14)]
+        assert [w.wait(5)["result"] for w in watches] == ["SUCCESS"] * 4
+        deadline = time.monotonic() + 5
+        while len(watcher._watches) > 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(watcher._watches) == 2
+        assert set(watcher._watches.values()) <= set(watches)
+
+    def test_watch_times_out(self, jenkins, monkeypatch):
+        monkeypatch.setattr(jenkins_integration, "_BUILD_POLL_MAX_WAIT", 0.2)
+        jenkins.builds[9] = _Build([], "SUCCESS", queued_polls=10**6)
+        result = _integration(jenkins)._wait_for_build("app", 9)
+        assert result["timed_out"] is True and result["result"] == "TIMED_OUT"
+
+
+class TestConnection:
+    def test_reconnects_after_server_closes(self, jenkins):
+        conn = JenkinsConnection(jenkins.url)
+        assert conn.request("GET", "/job/app/api/json")[0] == 200
+        conn._conn.sock.close()
+        assert conn.request("GET", "/job/app/api/json")[0] == 200
+        assert conn.connects == 2
@@ -0,0 +1,129 @@
+"""
+Tests for the render cache, batch rendering and self-hosted endpoint
+support in langgraph_engine/diagrams/kroki_renderer.py.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from langgraph_engine.diagrams.kroki_renderer import KrokiRenderer, render_key
+
+
+class _CountingRenderer(KrokiRenderer):
+    """Renderer whose network call is replaced by a deterministic echo."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.posts = []
+        self._lock = threading.Lock()
+
+    def _post(self, diagram_text, diagram_type, output_format):
+        with self._lock:
+            self.posts.append((diagram_type, output_format))
+        if "bad" in diagram_text:
+            return None
+        return ("<svg>%s:%s</svg>" % (diagram_type, diagram_text)).encode("utf-8")
+
+
+class TestRenderCache:
+    def test_second_render_is_served_from_disk(self, tmp_path):
+        first = _CountingRenderer(cache_dir=str(tmp_path))
+        assert first.render("A -> B", "plantuml") == b"<svg>plantuml:A -> B</svg>"
+
+        second = _CountingRenderer(cache_dir=str(tmp_path))
+        assert second.render("A -> B", "plantuml") == b"<svg>plantuml:A -> B</svg>"
+        assert second.posts == []
+        assert second.hits == 1
+
+    def test_key_covers_type_and_format(self, tmp_path):
+        keys = {render_key("x", t, f) for t in ("plantuml", "mermaid") for f in ("svg", "png")}
+        assert len(keys) == 4
+
+    def test_failures_are_not_cached(self, tmp_path):
+        renderer = _CountingRenderer(cache_dir=str(tmp_path))
+        assert renderer.render("bad") is None
+        assert renderer.render("bad") is None
+        assert len(renderer.posts) == 2
+
+    def test_cache_can_be_disabled(self, tmp_path):
+        renderer = _CountingRenderer(cache_dir=str(tmp_path), use_cache=False)
+        renderer.render("A")
+        renderer.render("A")
+        assert len(renderer.posts) == 2
+        assert not any(tmp_path.iterdir())
+
+
+class TestBatch:
+    def test_batch_keeps_order_and_dedupes(self, tmp_path):
+        renderer = _CountingRenderer(cache_dir=str(tmp_path), max_workers=4)
+        jobs = [("d%d" % (i % 5), "mermaid", "svg") for i in range(20)]
+        results = renderer.render_batch(jobs)
+        assert results == [("<svg>mermaid:%s</svg>" % job[0]).encode("utf-8") for job in jobs]
+        assert len(renderer.posts) == 5
+
+    def test_render_all_to_dir_detects_type(self, tmp_path):
+        renderer = _CountingRenderer(cache_dir=str(tmp_path / "cache"))
+        paths = renderer.render_all_to_dir(
+            {"class-diagram": "@startuml\nA\n@enduml", "flow": "flowchart LR", "broken": "bad", "empty": ""},
+            tmp_path / "out",
+        )
+        assert sorted(paths) == ["broken", "class-diagram", "flow"]
+        assert paths["broken"] is None
+        assert (tmp_path / "out" / "flow.svg").read_bytes() == b"<svg>mermaid:flowchart LR</svg>"
+        assert sorted(renderer.posts) == [("mermaid", "svg"), ("mermaid", "svg"), ("plantuml", "svg")]
+
+    def test_uml_generator_renders_saved_diagrams_as_one_batch(self, tmp_path):
+        from langgraph_engine.diagrams.legacy_generator import UMLDiagramGenerator
+
+        renderer = _CountingRenderer(cache_dir=str(tmp_path / "cache"))
+        gen = UMLDiagramGenerator(str(tmp_path), use_cache=False)
+        paths = gen.render_diagrams(
+            {"class-diagram": "@startuml\nA\n@enduml", "flow": "flowchart LR"}, renderer=renderer
+        )
+        assert paths == {
+            "class-diagram": str(tmp_path / "uml" / "class-diagram.svg"),
+            "flow": str(tmp_path / "uml" / "flow.svg"),
+        }
+        assert sorted(renderer.posts) == [("mermaid", "svg"), ("plantuml", "svg")]
+
+
+class _KrokiStandIn(BaseHTTPRequestHandler):
+    """Minimal local Kroki: POST /<type>/<format> echoes the body as SVG."""
+
+    protocol_version = "HTTP/1.1"
+    requests_seen = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.requests_seen.append(self.path)
+        payload = b"<svg>" + body + b"</svg>"
+        self.send_response(200)
+        self.send_header("Content-Type", "image/svg+xml")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSelfHostedEndpoint:
+    def test_renders_against_local_server(self, tmp_path):
+        pytest.importorskip("requests")
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KrokiStandIn)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = "http://127.0.0.1:%d" % server.server_address[1]
+            renderer = KrokiRenderer(server_url=url, cache_dir=str(tmp_path))
+            results = renderer.render_batch([("A", "plantuml", "svg"), ("B", "mermaid", "svg")])
+            assert results == [b"<svg>A</svg>", b"<svg>B</svg>"]
+            assert renderer.render("A", "plantuml", "svg") == b"<svg>A</svg>"
+            assert sorted(_KrokiStandIn.requests_seen) == ["/mermaid/svg", "/plantuml/svg"]
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -199,6 +199,80 @@ class TestComplexityCalculator:
         assert count == 3
 
 
+class TestComplexityIndex:
+    """Per-file metrics are cached by mtime/size/hash and updated incrementally."""
+
+    def _index(self, root, tmp_path):
+        from langgraph_engine.complexity_calculator import ComplexityIndex
+
+        return ComplexityIndex(root, cache_dir=str(tmp_path / "cache"))
+
+    @staticmethod
+    def _settle(root):
+        """Backdate every file past the racy-clean window so its stat is trusted."""
+        import os
+
+        old = time.time() - 60
+        for path in root.glob("*.py"):
+            os.utime(str(path), (old, old))
+
+    def test_only_changed_files_are_reread(self, tmp_project, tmp_path):
+        index = self._index(tmp_project, tmp_path)
+        assert index.refresh() == 5
+        assert index.totals() == (5, 250)
+
+        (tmp_project / "module_0.py").write_text("a = 1\n# note\n\nb = 2\n", encoding="utf-8")
+        (tmp_project / "module_4.py").unlink()
+        assert index.refresh() == 2
+        assert index.totals() == (4, 152)
+        assert index.stats["rescored"] == 6
+        assert index.stats["removed"] == 1
+
+    def test_touched_file_keeps_cached_metrics(self, tmp_project, tmp_path):
+        import os
+
+        self._settle(tmp_project)
+        index = self._index(tmp_project, tmp_path)
+        index.refresh()
+        target = tmp_project / "module_1.py"
+        st = target.stat()
+        os.utime(str(target), ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert index.refresh() == 0
+        assert index.stats["rehashed"] == 1
+        assert index.file_metrics("module_1.py")["m"] == st.st_mtime_ns + 10**9
+
+    def test_excluded_dirs_are_not_walked(self, tmp_project, tmp_path):
+        for name in (".git", "node_modules", ".venv", "pkg.egg-info"):
+            (tmp_project / name).mkdir()
+            (tmp_project / name / "junk.py").write_text("x = 1\n" * 1000, encoding="utf-8")
+        index = self._index(tmp_project, tmp_path)
+        index.refresh()
+        assert index.totals() == (5, 250)
+
+    def test_persisted_index_is_reused(self, tmp_project, tmp_path):
+        self._settle(tmp_project)
+        self._index(tmp_project, tmp_path).refresh()
+        warm = self._index(tmp_project, tmp_path)
+        assert warm.refresh() == 0
+        assert warm.stats["reused"] == 5
+        assert warm.totals() == (5, 250)
+
+    def test_edit_within_racy_window_is_detected(self, tmp_project, tmp_path):
+        import os
+
+        index = self._index(tmp_project, tmp_path)
+        index.refresh()
+        target = tmp_project / "module_2.py"
+        st = target.stat()
+        # Same size, and the mtime tick did not advance
+        target.write_text("# Module 2\n" + "y = 2\n" * 49 + "\n\n\n\n\n\n", encoding="utf-8")
+        assert target.stat().st_size == st.st_size
+        os.utime(str(target), ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert index.refresh() == 1
+        assert index.totals() == (5, 250 - 1)
+
+
 # ============================================================================
 # 3. Timeouts Prevent File Hangs
 # ============================================================================
@@ -335,6 +409,49 @@ class TestContextDeduplication:
         assert "_dedup_original_bytes" in result
         assert "_dedup_new_bytes" in result
 
+    def test_reflowed_paragraph_dropped_as_near_duplicate(self):
+        """A paraphrase-free reflow of an SRS paragraph is dropped from README."""
+        from langgraph_engine.level1_sync.context_deduplicator import deduplicate_context
+
+        para = (
+            "The orchestrator loads the project context, scores task complexity and selects "
+            "coding standards before any execution step runs, caching every result per session."
+        )
+        reflowed = para.replace(" and selects", "\nand selects").replace(", caching", ",\n   caching")
+        context = {
+            "srs": para + "\n\nSRS keeps its own unique requirements section here.\n",
+            "readme": "# Overview\n\n" + reflowed + "\n\nInstall with pip and run the hooks.\n",
+        }
+        result = deduplicate_context(context)
+        report = result["_dedup_report"]
+        assert [(d["doc"], d["reason"], d["duplicate_of"]) for d in report["dropped"]] == [
+            ("readme", "near_duplicate", "srs#0")
+        ]
+        assert result["_dedup_applied"] is True
+        assert "orchestrator" not in result["readme"]
+        assert "Install with pip" in result["readme"]
+        assert "SRS keeps its own" in result["srs"]
+
+    def test_token_budget_keeps_task_relevant_chunks(self):
+        """Budget packing keeps the chunks that match the task and reports the rest."""
+        from langgraph_engine.level1_sync.context_deduplicator import deduplicate_context
+
+        topics = ["database migrations", "logging setup", "jenkins pipeline", "release notes"]
+        srs = "\n\n".join(
+            "Section {}: details about {} and nothing else of note {}.".format(i, t, "x" * 40)
+            for i, t in enumerate(topics)
+        )
+        context = {"srs": srs + "\n", "readme": "Short readme.\n"}
+        result = deduplicate_context(context, task="fix the jenkins pipeline", token_budget=40)
+
+        assert result["_dedup_applied"] is True
+        assert "jenkins pipeline" in result["srs"]
+        report = result["_dedup_report"]
+        assert report["tokens_after"] <= 40 < report["tokens_before"]
+        assert all(d["reason"] == "budget" for d in report["dropped"])
+        again = deduplicate_context(context, task="fix the jenkins pipeline", token_budget=40)
+        assert again["_dedup_report"] == report  # Deterministic
+
 
 # ============================================================================
 # 7. Partial Context Works When Individual Files Fail
@@ -32,72 +32,72 @@ for _p in [_REPO_ROOT, _SCRIPTS]:
 
 
 # ---------------------------------------------------------------------------
-# Pre-import stubs (must be registered BEFORE importing level1_sync modules)
+# Pre-import stubs (registered only while the level1_sync modules import)
 # ---------------------------------------------------------------------------
 
 
-def _stub(name):
-    if name not in sys.modules:
-        m = types.ModuleType(name)
-        sys.modules[name] = m
-    return sys.modules[name]
-
-
-# LangGraph
-_lg = _stub("langgraph")
-_lg_graph = _stub("langgraph.graph")
-_lg_graph.START = "START"
-_lg_graph.END = "END"
-_lg_graph.StateGraph = MagicMock()
-
-# loguru (used by some modules)
-_loguru = _stub("loguru")
-
-
 def _noop(*a, **kw):
     pass
 
 
-_loguru.logger = type(
-    "_L",
-    (),
-    {
-        "info": _noop,
-        "debug": _noop,
-        "warning": _noop,
-        "error": _noop,
-        "critical": _noop,
-    },
-)()
+def _stubs():
+    """Fresh stub modules, keyed by the sys.modules name they stand in for."""
+    stubs = {name: types.ModuleType(name) for name in ("langgraph", "langgraph.graph", "loguru", "toons")}
+
+    # LangGraph
+    stubs["langgraph.graph"].START = "START"
+    stubs["langgraph.graph"].END = "END"
+    stubs["langgraph.graph"].StateGraph = MagicMock()
+
+    # loguru (used by some modules)
+    stubs["loguru"].logger = type(
+        "_L",
+        (),
+        {
+            "info": _noop,
+            "debug": _noop,
+            "warning": _noop,
+            "error": _noop,
+            "critical": _noop,
+        },
+    )()
 
-# toons library stub
-_toons = _stub("toons")
-_toons.dumps = json.dumps
+    # toons library stub
+    stubs["toons"].dumps = json.dumps
 
-# langgraph_engine package stub WITH __path__ so sub-package imports resolve
-_le_pkg = _stub("langgraph_engine")
-_le_pkg.__path__ = [str(Path(_REPO_ROOT) / "langgraph_engine")]
-_le_pkg.__package__ = "langgraph_engine"
+    # langgraph_engine package stub WITH __path__ so sub-package imports resolve
+    pkg = stubs["langgraph_engine"] = types.ModuleType("langgraph_engine")
+    pkg.__path__ = [str(Path(_REPO_ROOT) / "langgraph_engine")]
+    pkg.__package__ = "langgraph_engine"
 
-# flow_state stub
-_flow_state = _stub("langgraph_engine.flow_state")
-_flow_state.FlowState = dict
+    # flow_state stub
+    stubs["langgraph_engine.flow_state"] = types.ModuleType("langgraph_engine.flow_state")
+    stubs["langgraph_engine.flow_state"].FlowState = dict
 
-# step_logger stub (helpers.py falls back to no-op when attribute missing)
-_stub("langgraph_engine.step_logger")
+    # step_logger stub (helpers.py falls back to no-op when attribute missing)
+    stubs["langgraph_engine.step_logger"] = types.ModuleType("langgraph_engine.step_logger")
 
-# Top-level complexity_calculator stub (empty -> ImportError in helpers -> flag=False)
-_stub("langgraph_engine.complexity_calculator")
+    # Top-level complexity_calculator stub (empty -> ImportError in helpers -> flag=False)
+    stubs["langgraph_engine.complexity_calculator"] = types.ModuleType("langgraph_engine.complexity_calculator")
+    return stubs
 
 
 # ---------------------------------------------------------------------------
 # Import each level1_sync submodule now that stubs are in place
 # ---------------------------------------------------------------------------
 
-_l1_session = _importlib.import_module("langgraph_engine.level1_sync.session_loader")
-_l1_complexity = _importlib.import_module("langgraph_engine.level1_sync.complexity_calculator")
-_l1_context = _importlib.import_module("langgraph_engine.level1_sync.context_loader")
-_l1_routing = _importlib.import_module("langgraph_engine.level1_sync.routing")
+# patch.dict restores sys.modules on exit: the stubs (and the copies of the
+# engine modules imported against them) never leak into later test modules,
+# whatever order the suite runs in.
+with patch.dict(sys.modules):
+    for _name in [n for n in sys.modules if n == "langgraph_engine" or n.startswith("langgraph_engine.")]:
+        del sys.modules[_name]
+    sys.modules.update(_stubs())
+
+    _l1_session = _importlib.import_module("langgraph_engine.level1_sync.session_loader")
+    _l1_complexity = _importlib.import_module("langgraph_engine.level1_sync.complexity_calculator")
+    _l1_context = _importlib.import_module("langgraph_engine.level1_sync.context_loader")
+    _l1_routing = _importlib.import_module("langgraph_engine.level1_sync.routing")
 
 # Public function aliases
 node_session_loader = _l1_session.node_session_loader
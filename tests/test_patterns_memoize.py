@@ -0,0 +1,154 @@
+"""
+Tests for langgraph_engine.patterns.memoize - key derivation, single-flight
+loads, stale-while-revalidate and cache statistics.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import threading
+import time
+
+import pytest
+
+from langgraph_engine.patterns import _make_cache_key, memoize
+
+
+class TestCacheKey:
+    def test_scalar_arguments_use_tuple_fast_path(self):
+        key = _make_cache_key(("a", 1), {"flag": True})
+        assert isinstance(key, tuple)
+        assert key == _make_cache_key(("a", 1), {"flag": True})
+
+    def test_equal_but_differently_typed_scalars_stay_distinct(self):
+        keys = {_make_cache_key((v,), {}) for v in (1, 1.0, True)}
+        assert len(keys) == 3
+
+    def test_unhashable_arguments_fall_back_to_digest(self):
+        key = _make_cache_key(({"b": 2, "a": 1},), {})
+        assert isinstance(key, str) and len(key) == 32
+        assert key == _make_cache_key(({"a": 1, "b": 2},), {})
+
+
+class TestMemoize:
+    def test_hits_misses_and_lru_eviction(self):
+        calls = []
+
+        @memoize(ttl_seconds=0, max_size=2)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        assert [square(2), square(2), square(3), square(4), square(2)] == [4, 4, 9, 16, 4]
+        assert calls == [2, 3, 4, 2]
+        info = square.cache_info()
+        assert (info["hits"], info["misses"], info["evictions"], info["size"]) == (1, 4, 2, 2)
+
+        square.cache_clear()
+        assert square.cache_info()["size"] == 0 and square.cache_info()["misses"] == 0
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+        gate = threading.Event()
+
+        @memoize(ttl_seconds=60)
+        def detect(path):
+            calls.append(path)
+            gate.wait(5)
+            return "python"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(detect("/proj"))) for _ in range(8)]
+        for t in threads:
+            t.start()
+        deadline = time.time() + 5
+        while detect.cache_info()["coalesced"] < 7 and time.time() < deadline:
+            time.sleep(0.01)
+        gate.set()
+        for t in threads:
+            t.join(5)
+
+        assert calls == ["/proj"] and results == ["python"] * 8
+        info = detect.cache_info()
+        assert info["misses"] == 1 and info["coalesced"] == 7 and info["loads"] == 1
+
+    def test_errors_are_shared_but_not_cached(self):
+        attempts = []
+
+        @memoize(ttl_seconds=60)
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            flaky()
+        assert flaky() == "ok"
+        assert flaky.cache_info()["load_errors"] == 1
+
+    def test_concurrent_waiters_get_their_own_error(self):
+        gate = threading.Event()
+
+        @memoize(ttl_seconds=60)
+        def failing():
+            gate.wait(5)
+            raise RuntimeError("boom")
+
+        caught = []
+
+        def call():
+            try:
+                failing()
+            except RuntimeError as exc:
+                caught.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for t in threads:
+            t.start()
+        deadline = time.time() + 5
+        while failing.cache_info()["coalesced"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        gate.set()
+        for t in threads:
+            t.join(5)
+
+        assert len(caught) == 3 and len({id(exc) for exc in caught}) == 3
+        assert all(str(exc) == "boom" for exc in caught)
+        # All copies chain to the one error the load raised
+        assert len({id(exc.__cause__) for exc in caught}) == 1
+
+    def test_stale_value_served_while_refreshing(self):
+        version = [1]
+        refreshed = threading.Event()
+
+        @memoize(ttl_seconds=0.05, stale_while_revalidate=10)
+        def config():
+            value = version[0]
+            if value > 1:
+                refreshed.set()
+            return value
+
+        assert config() == 1
+        time.sleep(0.06)
+        version[0] = 2
+        assert config() == 1  # stale, refresh started in the background
+        assert refreshed.wait(5)
+        deadline = time.time() + 5
+        while config.cache_info()["in_flight"] and time.time() < deadline:
+            time.sleep(0.01)
+        assert config() == 2
+        info = config.cache_info()
+        assert info["stale_hits"] == 1 and info["refreshes"] == 1
+
+    def test_expired_beyond_window_recomputes_synchronously(self):
+        calls = []
+
+        @memoize(ttl_seconds=0.02)
+        def now():
+            calls.append(1)
+            return len(calls)
+
+        assert now() == 1
+        time.sleep(0.03)
+        assert now() == 2
+        assert now.cache_info()["stale_hits"] == 0
@@ -0,0 +1,143 @@
+"""
+Tests for langgraph_engine/project_fingerprint.py and the fingerprint-backed
+detection and team-standards caching in standard_selector.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import json
+import os
+
+import pytest
+
+from langgraph_engine import project_fingerprint, standard_selector
+from langgraph_engine.project_fingerprint import FingerprintCache, build_fingerprint
+
+
+@pytest.fixture
+def cache(tmp_path_factory, monkeypatch):
+    # Outside the project tree: saving must not touch the walked directories.
+    fresh = FingerprintCache(cache_dir=str(tmp_path_factory.mktemp("fingerprint-cache")))
+    monkeypatch.setattr(project_fingerprint, "_cache", fresh)
+    return fresh
+
+
+def _bump(path):
+    st = path.stat()
+    os.utime(str(path), ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+class TestFingerprint:
+    def test_single_walk_records_histogram_and_markers(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("x = 1\n")
+        (tmp_path / "src" / "App.CSPROJ").write_text("<Project/>")
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib" / "x.py").write_text("")
+        (tmp_path / "requirements.txt").write_text("Flask==3.0\ncelery\n")
+        (tmp_path / "app.py").write_text("from fastapi import FastAPI\n")
+
+        fp = build_fingerprint(tmp_path)
+        assert fp.count(".py") == 2
+        assert fp.count(".csproj") == 1
+        assert fp.has_manifest("requirements.txt") and not fp.has_manifest("pom.xml")
+        assert fp.keywords["python"] == ["flask", "celery"]
+        assert fp.app_imports == {"fastapi"}
+
+    def test_cache_revalidates_on_manifest_change(self, tmp_path, cache):
+        (tmp_path / "package.json").write_text(json.dumps({"dependencies": {"express": "4"}}))
+        assert standard_selector.detect_framework(str(tmp_path), "javascript") == "express"
+        for _ in range(3):
+            standard_selector.detect_project_type(str(tmp_path))
+        assert cache.stats == {"hits": 3, "disk_hits": 0, "builds": 1}
+
+        (tmp_path / "package.json").write_text(json.dumps({"dependencies": {"react": "18"}}))
+        _bump(tmp_path / "package.json")
+        assert standard_selector.detect_framework(str(tmp_path), "javascript") == "react"
+        assert cache.stats["builds"] == 2
+
+    def test_clear_detection_cache_drops_memory_only(self, tmp_path, cache):
+        (tmp_path / "go.mod").write_text("module x\n")
+        assert standard_selector.detect_project_type(str(tmp_path)) == "go"
+        standard_selector.clear_detection_cache()
+        assert standard_selector.detect_project_type(str(tmp_path)) == "go"
+        assert cache.stats == {"hits": 0, "disk_hits": 1, "builds": 1}
+
+    def test_cache_revalidates_when_source_files_change(self, tmp_path, cache):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("x = 1\n")
+        assert standard_selector.detect_project_type(str(tmp_path)) == "python"
+
+        (tmp_path / "src" / "a.py").unlink()
+        (tmp_path / "src" / "App.sln").write_text("")
+        _bump(tmp_path / "src")
+        assert standard_selector.detect_project_type(str(tmp_path)) == "csharp"
+        assert cache.stats["builds"] == 2
+
+        (tmp_path / "src" / "App.sln").write_text("edited")  # Content-only edit
+        standard_selector.detect_project_type(str(tmp_path))
+        assert cache.stats["builds"] == 2
+
+    def test_persisted_fingerprint_is_reused(self, tmp_path, tmp_path_factory):
+        (tmp_path / "go.mod").write_text("module x\n")
+        cache_dir = str(tmp_path_factory.mktemp("fingerprint-cache"))
+        FingerprintCache(cache_dir=cache_dir).get(tmp_path)
+        warm = FingerprintCache(cache_dir=cache_dir)
+        assert warm.get(tmp_path).has_manifest("go.mod")
+        assert warm.stats == {"hits": 0, "disk_hits": 1, "builds": 0}
+
+
+class TestDetection:
+    @pytest.mark.parametrize(
+        "files,expected",
+        [
+            ({"pyproject.toml": "[project]\ndependencies = ['django']\n"}, ("python", "django")),
+            ({"manage.py": ""}, ("python", "django")),
+            ({"pom.xml": "<artifactId>quarkus-core</artifactId>", "build.gradle": "spring"}, ("java", "quarkus")),
+            ({"build.gradle.kts": "org.springframework.boot:spring-boot"}, ("java", "spring-boot")),
+            (
+                {"tsconfig.json": "{}", "package.json": '{"devDependencies": {"@angular/core": "17"}}'},
+                ("typescript", "angular"),
+            ),
+            ({"Cargo.toml": ""}, ("rust", "unknown")),
+            ({"sub/App.sln": ""}, ("csharp", "unknown")),
+            ({"README.md": ""}, ("unknown", "unknown")),
+        ],
+    )
+    def test_matches_marker_rules(self, tmp_path, cache, files, expected):
+        for rel, text in files.items():
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text(text)
+        project_type = standard_selector.detect_project_type(str(tmp_path))
+        assert (project_type, standard_selector.detect_framework(str(tmp_path), project_type)) == expected
+
+
+class TestTeamStandards:
+    def test_rescans_only_when_tree_changes(self, tmp_path, monkeypatch):
+        policies = tmp_path / "policies"
+        nested = policies / "02-standards-system" / "nested"
+        nested.mkdir(parents=True)
+        (nested / "naming.md").write_text("names")
+        (nested / "README.md").write_text("skip")
+        monkeypatch.setattr(standard_selector, "_STANDARD_SELECTOR_POLICIES_DIR", policies)
+        monkeypatch.setattr(standard_selector, "_STANDARD_SELECTOR_CLAUDE_HOME", tmp_path / "home")
+        monkeypatch.setattr(standard_selector, "_team_standards_cache", {})
+
+        first = standard_selector.load_team_standards("")
+        assert [s["id"] for s in first] == ["team_naming"]
+
+        reads = []
+        real_read_text = standard_selector.Path.read_text
+        monkeypatch.setattr(
+            standard_selector.Path,
+            "read_text",
+            lambda self, *a, **k: reads.append(self) or real_read_text(self, *a, **k),
+        )
+        assert standard_selector.load_team_standards("") == first
+        assert reads == []
+
+        (nested / "naming.md").write_text("names v2")
+        _bump(nested / "naming.md")
+        (nested / "errors.md").write_text("errors")
+        loaded = {s["id"]: s["content"] for s in standard_selector.load_team_standards("")}
+        assert loaded == {"team_naming": "names v2", "team_errors": "errors"}
@@ -0,0 +1,130 @@
+"""
+Tests for concurrent gate evaluation in
+langgraph_engine/level3_execution/quality_gate.py.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import os
+import sys
+import threading
+import time
+
+from langgraph_engine.cancellation import run_subprocess
+from langgraph_engine.level3_execution import quality_gate as qg
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+_STATE_WITH_COVERAGE = {"step10_coverage_results": {"coverage_before": 80.0, "coverage_after_estimate": 82.0}}
+
+
+class TestRunGateGraph:
+    def test_dependencies_run_before_dependents(self):
+        order = []
+        nodes = {
+            "prep": ((), lambda: order.append("prep") or 1),
+            "gate": (("prep",), lambda: order.append("gate") or 2),
+            "other": ((), lambda: 3),
+        }
+        outcomes = qg._run_gate_graph(nodes, max_workers=2, timeout_s=5.0)
+        assert order == ["prep", "gate"]
+        assert {name: o[0] for name, o in outcomes.items()} == {"prep": 1, "gate": 2, "other": 3}
+        assert all(o[2] == "ok" and o[1] >= 0.0 for o in outcomes.values())
+
+    def test_slow_node_times_out_and_dependents_still_run(self):
+        nodes = {
+            "slow": ((), lambda: time.sleep(1.0)),
+            "after": (("slow",), lambda: "ran"),
+        }
+        start = time.monotonic()
+        outcomes = qg._run_gate_graph(nodes, max_workers=2, timeout_s=0.1)
+        assert time.monotonic() - start < 0.8
+        assert outcomes["slow"][2] == "timeout"
+        assert outcomes["after"] == ("ran", outcomes["after"][1], "ok")
+
+    def test_queued_nodes_clock_starts_when_they_start(self):
+        nodes = {"n%d" % i: ((), lambda: time.sleep(0.15) or "ok") for i in range(4)}
+        outcomes = qg._run_gate_graph(nodes, max_workers=2, timeout_s=0.25)
+        assert [o[2] for o in outcomes.values()] == ["ok"] * 4
+        assert all(o[1] < 250 for o in outcomes.values())
+
+    def test_timed_out_node_releases_its_slot(self):
+        release = threading.Event()
+        nodes = {
+            "stuck": ((), lambda: release.wait(5)),
+            "queued": ((), lambda: "ran"),
+        }
+        outcomes = qg._run_gate_graph(nodes, max_workers=1, timeout_s=0.1)
+        release.set()
+        assert outcomes["stuck"][2] == "timeout"
+        assert outcomes["queued"][0] == "ran"
+
+    def test_timed_out_node_subprocess_is_killed(self, tmp_path):
+        pid_file = tmp_path / "scanner.pid"
+        script = "import os, time; open(%r, 'w').write(str(os.getpid())); time.sleep(30)" % str(pid_file)
+        nodes = {"sonar": ((), lambda: run_subprocess([sys.executable, "-c", script], timeout=30))}
+
+        start = time.monotonic()
+        outcomes = qg._run_gate_graph(nodes, max_workers=1, timeout_s=1.0)
+        assert outcomes["sonar"][2] == "timeout"
+        assert time.monotonic() - start < 5
+
+        pid = int(pid_file.read_text())
+        deadline = time.monotonic() + 5
+        while _alive(pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not _alive(pid)
+
+    def test_raising_node_is_reported_as_error(self):
+        outcomes = qg._run_gate_graph({"bad": ((), lambda: 1 / 0)}, max_workers=1, timeout_s=5.0)
+        assert outcomes["bad"][0] is None
+        assert outcomes["bad"][2] == "error"
+
+
+class TestEvaluateQualityGate:
+    def test_gates_run_concurrently(self, tmp_path, monkeypatch):
+        def slow_gate(*args, **kwargs):
+            time.sleep(0.3)
+            return {"passed": True, "reason": "slow"}
+
+        monkeypatch.setattr(qg, "_evaluate_sonar_gate", slow_gate)
+        monkeypatch.setattr(qg, "_evaluate_breaking_changes_gate", slow_gate)
+        monkeypatch.setattr(qg, "_evaluate_tests_exist_gate", slow_gate)
+
+        start = time.monotonic()
+        result = qg.evaluate_quality_gate(str(tmp_path), dict(_STATE_WITH_COVERAGE))
+        assert time.monotonic() - start < 0.8
+        assert result["gate_passed"] is True
+        assert result["gates"]["sonar"]["elapsed_ms"] >= 250
+        assert set(result["timings_ms"]) >= {"sonar", "coverage", "breaking_changes", "tests_exist", "verification"}
+
+    def test_timed_out_gate_needs_manual_review(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(qg, "_evaluate_sonar_gate", lambda *a, **k: time.sleep(1.0))
+        result = qg.evaluate_quality_gate(
+            str(tmp_path), dict(_STATE_WITH_COVERAGE, step10_findings=[]), {"gate_timeout_seconds": 0.1}
+        )
+        assert result["gates"]["sonar"]["timed_out"] is True
+        assert result["gates"]["sonar"]["passed"] is False
+        assert result["gate_passed"] is False
+        assert result["blocking_gates"] == ["sonar"]
+        assert result["recommendation"] == "MANUAL_REVIEW"
+
+    def test_tests_exist_uses_shared_test_file_walk(self, tmp_path):
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_auth.py").write_text("def test_login():\n    pass\n", encoding="utf-8")
+        state = dict(_STATE_WITH_COVERAGE, step10_modified_files=["auth.py", "billing.py"], step10_findings=[])
+
+        result = qg.evaluate_quality_gate(str(tmp_path), state)
+        tests_gate = result["gates"]["tests_exist"]
+        assert tests_gate["modified_with_tests"] == ["auth.py"]
+        assert tests_gate["modified_without_tests"] == ["billing.py"]
+        assert "test_files" in result["timings_ms"]
+        # Coverage came from state, so no reference index / call graph work.
+        assert "call_graph" not in result["timings_ms"]
@@ -559,6 +559,48 @@ class TestPipelineBenchmark:
         history = self.pb.PipelineBenchmark.load_history(benchmark_dir=missing)
         assert history == []
 
+    def test_percentile_interpolates(self):
+        """percentile() interpolates between ranks and handles edge cases."""
+        assert self.pb.percentile([], 95) == 0.0
+        assert self.pb.percentile([10, 20, 30, 40], 50) == pytest.approx(25.0)
+        assert self.pb.percentile([10, 20, 30, 40], 100) == 40.0
+
+    def test_compare_to_baseline_flags_regressions(self):
+        """compare_to_baseline reports only metrics beyond their thresholds."""
+
+        def report(p95, step_p95, throughput, rss, fd_leaked):
+            return {
+                "pipeline_latency": {"p95_ms": p95},
+                "steps": {"level1_context": {"p95_ms": step_p95}, "tiny": {"p95_ms": 1.0}},
+                "throughput_per_s": throughput,
+                "resources": {"peak_rss_mb": rss, "fd_leaked": fd_leaked},
+                "locks": {"total_wait_ms": 10.0},
+            }
+
+        baseline = report(100.0, 40.0, 10.0, 200.0, 0)
+        assert self.pb.compare_to_baseline(report(110.0, 45.0, 9.0, 210.0, 2), baseline) == []
+        regressions = self.pb.compare_to_baseline(report(150.0, 60.0, 7.0, 300.0, 9), baseline)
+        assert [r.split(":")[0] for r in regressions] == [
+            "pipeline p95 ms",
+            "step level1_context p95 ms",
+            "throughput/s",
+            "peak RSS MB",
+            "fd leaked",
+        ]
+
+    @pytest.mark.skipif(os.name != "posix", reason="claude shim is POSIX-only")
+    def test_fake_llm_serves_cli_subprocesses(self, tmp_path):
+        """Inside fake_llm(), a `claude` subprocess is answered by the shim."""
+        import subprocess
+
+        prompt = tmp_path / "prompt.txt"
+        prompt.write_text("hello")
+        provider = self.pb.FakeLLMProvider(latency_ms=1)
+        with self.pb.fake_llm(provider):
+            out = subprocess.run(["claude", "--json", "@" + str(prompt)], capture_output=True, text=True, timeout=30)
+        assert json.loads(out.stdout)["result"].startswith("FAKE_LLM_RESPONSE")
+        assert provider.stats["subprocess_calls"] == 1
+
 
 # ===========================================================================
 # MetricsDashboard tests
@@ -0,0 +1,152 @@
+"""
+Tests for level3_execution/search_index.py - BM25 + trigram project index.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import os
+
+from langgraph_engine.level3_execution.search_index import (
+    SearchIndex,
+    glob_matches,
+    required_literals,
+    tokenize,
+)
+
+
+def _write(root, rel, text):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _make_project(tmp_path):
+    root = tmp_path / "proj"
+    _write(root, "app/checkpoint.py", "def save_checkpoint():\n    checkpoint = 1\n    return checkpoint\n")
+    _write(root, "app/recovery.py", "def resume_from_checkpoint():\n    pass\n")
+    _write(root, "app/unrelated.py", "def helper():\n    return 42\n")
+    _write(root, "node_modules/lib/checkpoint.py", "checkpoint checkpoint checkpoint\n")
+    _write(root, ".venv/site.py", "checkpoint\n")
+    return root
+
+
+class TestTokenizer:
+    def test_splits_snake_and_camel_case(self):
+        terms = tokenize("getUserName user_id")
+        assert "getusername" in terms
+        assert "user" in terms
+        assert "name" in terms
+        assert "user_id" in terms
+        assert "id" in terms
+
+
+class TestRequiredLiterals:
+    def test_plain_substring(self):
+        assert required_literals("Resume") == ["resume"]
+
+    def test_short_pattern_has_no_literals(self):
+        assert required_literals("ab") == []
+
+    def test_regex_drops_optional_characters(self):
+        assert required_literals(r"abcd?ef", is_regex=True) == ["abc"]
+
+    def test_regex_escapes_are_literal(self):
+        assert required_literals(r"def\s+foo_bar\(", is_regex=True) == ["def", "foo_bar("]
+
+    def test_regex_alternation_disables_filtering(self):
+        assert required_literals(r"foo|bar", is_regex=True) == []
+
+
+class TestGlobMatches:
+    def test_double_star_matches_root_files(self):
+        assert glob_matches("setup.py", "**/*.py")
+        assert glob_matches("pkg/mod.py", "**/*.py")
+        assert not glob_matches("pkg/mod.js", "**/*.py")
+
+    def test_single_star_stays_within_one_segment(self):
+        assert glob_matches("setup.py", "*.py")
+        assert not glob_matches("pkg/mod.py", "*.py")
+        assert glob_matches("src/mod.py", "src/*.py")
+        assert not glob_matches("src/pkg/mod.py", "src/*.py")
+        assert not glob_matches("a/b", "a?b")
+
+    def test_double_star_segment_spans_directories(self):
+        assert glob_matches("src/mod.py", "src/**/*.py")
+        assert glob_matches("src/a/b/mod.py", "src/**/*.py")
+        assert not glob_matches("lib/a/mod.py", "src/**/*.py")
+
+
+class TestSearchIndex:
+    def test_excluded_dirs_are_not_indexed(self, tmp_path):
+        idx = SearchIndex(_make_project(tmp_path), cache_dir=str(tmp_path / "cache"), persist=False)
+        paths = idx.file_paths()
+        assert "app/checkpoint.py" in paths
+        assert not any(p.startswith(("node_modules/", ".venv/")) for p in paths)
+
+    def test_bm25_ranks_most_relevant_file_first(self, tmp_path):
+        idx = SearchIndex(_make_project(tmp_path), persist=False)
+        ranked = idx.search("checkpoint")
+        assert ranked[0][0] == "app/checkpoint.py"
+        assert {r[0] for r in ranked} == {"app/checkpoint.py", "app/recovery.py"}
+
+    def test_grep_candidates_filter_by_trigrams(self, tmp_path):
+        idx = SearchIndex(_make_project(tmp_path), persist=False)
+        assert idx.grep_candidates("resume_from") == ["app/recovery.py"]
+        assert idx.grep_candidates("no_such_symbol") == []
+
+    def test_incremental_refresh_reindexes_only_changed_files(self, tmp_path):
+        root = _make_project(tmp_path)
+        idx = SearchIndex(root, persist=False)
+        idx.refresh(force=True)
+        assert idx.stats["indexed"] == 3
+
+        path = root / "app" / "unrelated.py"
+        path.write_text("def brand_new_symbol():\n    pass\n", encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        (root / "app" / "recovery.py").unlink()
+        idx.refresh(force=True)
+
+        assert idx.stats["indexed"] == 4
+        assert idx.stats["removed"] == 1
+        assert idx.grep_candidates("brand_new_symbol") == ["app/unrelated.py"]
+        assert idx.search("resume") == []
+
+    def test_invalidate_makes_the_next_query_see_a_fresh_write(self, tmp_path, monkeypatch):
+        from langgraph_engine.level3_execution import search_index
+
+        root = _make_project(tmp_path)
+        idx = SearchIndex(root, persist=False)
+        monkeypatch.setitem(search_index._indexes, str(root.resolve()), idx)
+        assert idx.grep_candidates("written_just_now") == []
+
+        _write(root, "app/fresh.py", "def written_just_now():\n    pass\n")
+        assert idx.grep_candidates("written_just_now") == []  # Inside the refresh interval
+
+        search_index.invalidate_search_indexes(root)
+        assert idx.grep_candidates("written_just_now") == ["app/fresh.py"]
+
+    def test_index_is_persisted_between_instances(self, tmp_path):
+        root = _make_project(tmp_path)
+        cache = str(tmp_path / "cache")
+        SearchIndex(root, cache_dir=cache).refresh(force=True)
+
+        warm = SearchIndex(root, cache_dir=cache)
+        warm.refresh(force=True)
+        assert warm.stats["indexed"] == 0
+        assert warm.stats["reused"] == 3
+        assert warm.search("helper")[0][0] == "app/unrelated.py"
+
+    def test_oversized_files_are_left_to_a_direct_scan(self, tmp_path, monkeypatch):
+        from langgraph_engine.level3_execution import search_index
+
+        monkeypatch.setattr(search_index, "_MAX_INDEXED_FILE_BYTES", 64)
+        root = _make_project(tmp_path)
+        _write(root, "app/generated.py", "x = 0\n" * 20 + "def resume_from_big():\n    pass\n")
+        idx = SearchIndex(root, persist=False)
+
+        assert idx.grep_candidates("resume_from") == ["app/generated.py", "app/recovery.py"]
+        assert idx.grep_candidates("no_such_symbol") == ["app/generated.py"]
+        assert "app/generated.py" in idx.file_paths()
+        assert idx.stats["indexed"] == 3
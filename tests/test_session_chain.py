@@ -0,0 +1,178 @@
+"""
+Tests for src/mcp/session_chain.py - the memory-resident session chain graph
+behind the session MCP server's chain tools.
+
+Covers adjacency / tag-index semantics of the old .chain-index.json code,
+the append log, compaction, reload from the legacy snapshot format, pick-up
+of writes from another instance, and top-k related ranking.
+
+ASCII-only: cp1252 safe for Windows.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src" / "mcp"))
+
+from session_chain import SessionChainGraph, new_record  # noqa: E402
+
+
+def _graph(tmp_path, **kwargs):
+    return SessionChainGraph(tmp_path / ".chain-index.json", **kwargs)
+
+
+class TestMutations:
+    def test_link_builds_adjacency_and_ancestors(self, tmp_path):
+        graph = _graph(tmp_path)
+        graph.link("S2", "S1")
+        graph.link("S3", "S2")
+        graph.link("S3", "S2")  # Idempotent
+
+        assert graph.get("S1")["children"] == ["S2"]
+        assert graph.get("S3")["parent"] == "S2"
+        assert [sid for sid, _ in graph.ancestors("S3", 5)] == ["S2", "S1"]
+        assert [sid for sid, _ in graph.ancestors("S3", 1)] == ["S2"]
+
+        graph.link("S1", "S3")  # Cycle: the walk still terminates
+        assert [sid for sid, _ in graph.ancestors("S3", 10)] == ["S2", "S1"]
+
+    def test_tag_updates_postings_and_auto_relates(self, tmp_path):
+        graph = _graph(tmp_path)
+        graph.create("A", new_record(tags=["docker", "python"]))
+        graph.create("B", new_record(tags=["docker"]))
+
+        assert graph.tag("C", ["python", "docker", "redis"], summary="cache work") == ["A"]
+        assert graph.get("C")["tags"] == ["docker", "python", "redis"]
+        assert graph.get("C")["summary"] == "cache work"
+        assert graph.get("A")["related"] == ["C"]
+        assert graph.search_tags(["docker", "redis"]) == {"A": ["docker"], "B": ["docker"], "C": ["docker", "redis"]}
+
+        assert graph.tag("B", ["redis"]) == ["C"]
+        assert graph.get("C")["related"] == ["A", "B"]
+
+    def test_update_only_touches_known_sessions(self, tmp_path):
+        graph = _graph(tmp_path)
+        graph.create("A", new_record())
+        assert graph.update("A", summary="done")
+        assert not graph.update("missing", summary="x")
+        assert graph.get("A")["summary"] == "done"
+
+    def test_retagging_drops_stale_postings(self, tmp_path):
+        graph = _graph(tmp_path)
+        graph.create("A", new_record(tags=["docker", "python"]))
+        graph.create("A", new_record(tags=["python", "redis"]))
+        assert graph.search_tags(["docker"]) == {}
+        assert graph.update("A", tags=["redis"])
+        assert graph.search_tags(["docker", "python", "redis"]) == {"A": ["redis"]}
+        assert "python" not in graph.to_dict()["tag_index"]
+
+        replayed = _graph(tmp_path)
+        assert replayed.search_tags(["docker", "python", "redis"]) == {"A": ["redis"]}
+
+    def test_modify_is_atomic_across_threads(self, tmp_path):
+        graph = _graph(tmp_path)
+        graph.create("A", new_record())
+
+        def append(n):
+            graph.modify("A", lambda session: {"items": session.get("items", []) + [n]})
+
+        threads = [threading.Thread(target=append, args=(n,)) for n in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(graph.get("A")["items"]) == list(range(20))
+        assert sorted(_graph(tmp_path).get("A")["items"]) == list(range(20))
+        assert graph.modify("A", lambda session: None) == {}
+        assert graph.modify("missing", lambda session: {"x": 1}) is None
+
+
+class TestPersistence:
+    def _populate(self, graph):
+        graph.create("A", new_record(tags=["docker", "python"], project="p"))
+        graph.link("B", "A")
+        graph.tag("B", ["docker", "python"])
+        graph.update("B", work_items=[{"work_id": "TASK-1"}])
+
+    def test_log_replays_into_a_new_instance(self, tmp_path):
+        graph = _graph(tmp_path)
+        self._populate(graph)
+        assert not graph.index_path.exists()
+        assert len(graph.log_path.read_text().splitlines()) == 4
+
+        reopened = _graph(tmp_path)
+        assert reopened.to_dict() == graph.to_dict()
+
+    def test_compaction_writes_legacy_snapshot(self, tmp_path):
+        graph = _graph(tmp_path, compact_every=4)
+        self._populate(graph)
+
+        assert graph.log_path.read_text() == ""
+        snapshot = json.loads(graph.index_path.read_text())
+        assert snapshot["sessions"]["B"]["parent"] == "A"
+        assert snapshot["sessions"]["A"]["related"] == ["B"]
+        assert snapshot["tag_index"] == {"docker": ["A", "B"], "python": ["A", "B"]}
+        assert _graph(tmp_path).to_dict() == graph.to_dict()
+
+    def test_legacy_index_and_torn_log_line(self, tmp_path):
+        legacy = {
+            "version": "1.0.0",
+            "sessions": {"OLD": new_record(tags=["java"], created_at="2024-01-01T00:00:00")},
+            "tag_index": {"java": ["OLD"]},
+        }
+        (tmp_path / ".chain-index.json").write_text(json.dumps(legacy))
+        graph = _graph(tmp_path)
+        graph.link("NEW", "OLD")
+        with open(graph.log_path, "a") as f:
+            f.write('{"op": "link", "child": "X"')  # Crash mid-append
+
+        reopened = _graph(tmp_path)
+        assert reopened.get("OLD")["children"] == ["NEW"]
+        assert "X" not in reopened
+        assert reopened.search_tags(["java"]) == {"OLD": ["java"]}
+
+    def test_writes_from_another_instance_are_picked_up(self, tmp_path):
+        first = _graph(tmp_path)
+        second = _graph(tmp_path)
+        first.create("A", new_record(tags=["go"]))
+        assert "A" in second
+
+        second.tag("A", ["rust"])
+        assert first.get("A")["tags"] == ["go", "rust"]
+
+        second.compact()
+        first.create("B", new_record())
+        assert sorted(_graph(tmp_path).to_dict()["sessions"]) == ["A", "B"]
+
+
+class TestQueries:
+    def test_top_related_prefers_rare_shared_tags(self, tmp_path):
+        graph = _graph(tmp_path)
+        for i in range(6):
+            graph.create("common-%d" % i, new_record(tags=["python"], created_at="2024-01-0%d" % (i + 1)))
+        graph.create("rare", new_record(tags=["kafka"], created_at="2023-01-01"))
+        graph.create("both", new_record(tags=["python", "kafka"], created_at="2023-01-01"))
+        graph.create("me", new_record(tags=["python", "kafka"]))
+
+        ranked = graph.top_related("me", k=3)
+        assert [sid for sid, _, _ in ranked] == ["both", "rare", "common-5"]
+        assert ranked[0][2] == ["kafka", "python"]
+        assert ranked[0][1] > ranked[1][1] > ranked[2][1]
+        assert graph.top_related("unknown") == []
+
+    def test_queries_do_not_touch_disk_per_call(self, tmp_path):
+        graph = _graph(tmp_path, compact_every=10**6)
+        for i in range(3000):
+            graph.create("S%d" % i, new_record(parent="S%d" % (i - 1) if i else None, tags=["t%d" % (i % 50)]))
+        graph.compact()
+
+        started = time.perf_counter()
+        for _ in range(200):
+            graph.ancestors("S2999", 5)
+            graph.search_tags(["t7"])
+        per_call = (time.perf_counter() - started) / 400
+        assert per_call < 0.002
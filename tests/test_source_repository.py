@@ -0,0 +1,83 @@
+"""
+Tests for langgraph_engine/core/source_repository.py - shared parsed-source memo.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import os
+
+import pytest
+
+from langgraph_engine.core.source_repository import SourceRepository
+
+
+def _write(path, text, age_s=10):
+    path.write_text(text, encoding="utf-8")
+    # Backdate so the racy-clean window does not force a re-read.
+    past = path.stat().st_mtime_ns - age_s * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+class TestSourceRepository:
+    def test_file_is_read_and_parsed_once(self, tmp_path):
+        repo = SourceRepository()
+        f = tmp_path / "m.py"
+        _write(f, "def a():\n    return 1\n")
+
+        first = repo.get_ast(f)
+        assert repo.get_ast(f) is first
+        assert repo.get_text(f).startswith("def a")
+        stats = repo.stats()
+        assert stats["reads"] == 1
+        assert stats["parses"] == 1
+        assert stats["hits"] == 2
+
+    def test_parse_source_shares_tree_with_path_lookup(self, tmp_path):
+        repo = SourceRepository()
+        f = tmp_path / "m.py"
+        _write(f, "x = 1\n")
+        assert repo.parse_source("x = 1\n", "m.py") is repo.get_ast(f)
+        assert repo.stats()["parses"] == 1
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        repo = SourceRepository()
+        f = tmp_path / "m.py"
+        _write(f, "x = 1\n", age_s=20)
+        old = repo.get_ast(f)
+        _write(f, "y = 22\n")
+        new = repo.get_ast(f)
+        assert new is not old
+        assert new.body[0].targets[0].id == "y"
+
+    def test_syntax_error_is_cached(self, tmp_path):
+        repo = SourceRepository()
+        f = tmp_path / "bad.py"
+        _write(f, "def broken(:\n")
+        raised = []
+        for _ in range(2):
+            with pytest.raises(SyntaxError) as info:
+                repo.get_ast(f)
+            raised.append(info.value)
+        assert repo.stats()["parses"] == 1
+        assert raised[0] is not raised[1]
+        assert raised[0].lineno == raised[1].lineno == 1
+        assert raised[0].__cause__ is raised[1].__cause__
+
+    def test_line_offsets(self, tmp_path):
+        repo = SourceRepository()
+        f = tmp_path / "m.txt"
+        _write(f, "ab\ncd\nef")
+        assert repo.get_line_offsets(f) == [0, 3, 6]
+        assert repo.line_of_offset(f, 4) == 2
+
+    def test_budget_evicts_least_recently_used(self, tmp_path):
+        repo = SourceRepository(max_bytes=64)
+        for i in range(5):
+            repo.parse_source("value_%d = %d\n" % (i, i))
+        stats = repo.stats()
+        assert stats["evictions"] > 0
+        assert stats["bytes"] <= 64 or stats["entries"] == 1
+
+    def test_missing_file_raises_oserror(self, tmp_path):
+        with pytest.raises(OSError):
+            SourceRepository().get_ast(tmp_path / "nope.py")
@@ -0,0 +1,237 @@
+"""
+Tests for hooks/stop_notifier/tasks.py - the Stop hook's concurrent task
+runner: dependency ordering, time budget, deferral, retries, the shared git
+snapshot and script subprocesses.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "hooks"))
+
+from stop_notifier import tasks  # noqa: E402
+from stop_notifier.tasks import GitSnapshot, StopContext, StopTask, StopTaskRunner  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def logged(monkeypatch):
+    lines = []
+    monkeypatch.setattr(tasks, "log_s", lines.append)
+    return lines
+
+
+@pytest.fixture
+def ctx(tmp_path):
+    return StopContext(project_name="proj", session_id="SESSION-1", git=GitSnapshot(cwd=str(tmp_path)))
+
+
+def _sleeper(seconds, log=None, name=None):
+    def run(ctx):
+        time.sleep(seconds)
+        if log is not None:
+            log.append(name)
+        return True
+
+    return run
+
+
+class TestRunner:
+    def test_independent_tasks_run_concurrently(self, ctx):
+        runner = StopTaskRunner([StopTask("t%d" % i, _sleeper(0.3)) for i in range(4)], budget_s=10)
+        started = time.monotonic()
+        results = runner.run(ctx)
+        assert time.monotonic() - started < 0.9
+        assert all(r["status"] == "ok" for r in results.values())
+
+    def test_dependencies_finish_first(self, ctx):
+        order = []
+        runner = StopTaskRunner(
+            [
+                StopTask("archive", _sleeper(0, order, "archive"), deps=("save",)),
+                StopTask("save", _sleeper(0.1, order, "save")),
+                StopTask("unscheduled-dep", _sleeper(0, order, "other"), deps=("missing",)),
+            ],
+            budget_s=10,
+        )
+        runner.run(ctx)
+        assert order.index("save") < order.index("archive")
+        assert "other" in order
+
+    def test_cycle_and_duplicates_are_rejected(self):
+        with pytest.raises(ValueError):
+            StopTaskRunner([StopTask("a", bool, deps=("b",)), StopTask("b", bool, deps=("a",))])
+        with pytest.raises(ValueError):
+            StopTaskRunner([StopTask("a", bool), StopTask("a", bool)])
+
+    def test_budget_abandons_slow_tasks(self, ctx, logged):
+        release = threading.Event()
+        runner = StopTaskRunner(
+            [StopTask("fast", lambda c: True), StopTask("stuck", lambda c: release.wait(5))],
+            budget_s=0.2,
+        )
+        started = time.monotonic()
+        results = runner.run(ctx)
+        release.set()
+        assert time.monotonic() - started < 2
+        assert results["fast"]["status"] == "ok"
+        assert results["stuck"]["status"] == "timeout"
+        assert any("Budget" in line for line in logged)
+
+    def test_must_finish_task_outlives_the_budget(self, ctx):
+        ran = []
+        runner = StopTaskRunner(
+            [
+                StopTask("commit", _sleeper(0.5, ran, "commit"), must_finish=True, timeout=5),
+                StopTask("after-commit", _sleeper(0, ran, "after-commit"), deps=("commit",)),
+                StopTask("stuck", _sleeper(5)),
+            ],
+            budget_s=0.1,
+        )
+        started = time.monotonic()
+        results = runner.run(ctx)
+        assert 0.5 <= time.monotonic() - started < 2
+        assert results["commit"]["status"] == "ok"
+        assert results["stuck"]["status"] == "timeout"
+        assert results["after-commit"]["status"] == "timeout"  # Not started once over budget
+        assert ran == ["commit"]
+
+    def test_must_finish_task_is_abandoned_past_its_own_bound(self, ctx, monkeypatch, logged):
+        monkeypatch.setattr(tasks, "MUST_FINISH_GRACE_S", 0.1)
+        release = threading.Event()
+        runner = StopTaskRunner(
+            [StopTask("commit", lambda c: release.wait(5), must_finish=True, timeout=0.2, retries=2)],
+            budget_s=0.1,
+        )
+        started = time.monotonic()
+        results = runner.run(ctx)
+        release.set()
+        assert 0.5 <= time.monotonic() - started < 2  # 2 x 0.2s + 0.1s grace
+        assert results["commit"]["status"] == "timeout"
+        assert any("Budget" in line for line in logged)
+
+    def test_must_finish_requires_a_timeout(self):
+        with pytest.raises(ValueError):
+            StopTask("commit", lambda c: True, must_finish=True)
+
+    def test_deferrable_tasks_go_to_worker(self, ctx):
+        spawned = []
+        ran = []
+        runner = StopTaskRunner(
+            [StopTask("now", _sleeper(0, ran, "now")), StopTask("later", _sleeper(0, ran, "later"), deferrable=True)],
+            budget_s=10,
+        )
+        results = runner.run(ctx, spawn=lambda names, c: spawned.append(names) or 4242)
+        assert ran == ["now"] and spawned == [["later"]]
+        assert results["later"] == {"status": "deferred", "attempts": 0, "error": "", "worker_pid": 4242}
+
+        ran.clear()
+        assert runner.run(ctx, defer=False)["later"]["status"] == "ok"
+        assert sorted(ran) == ["later", "now"]
+
+
+class TestStopTask:
+    def test_retries_then_reports(self, ctx, logged):
+        attempts = []
+
+        def flaky(c):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return len(attempts) == 3
+
+        result = StopTask("flaky", flaky, ok_msg="[OK] saved {project}").execute(ctx)
+        assert result["status"] == "ok" and result["attempts"] == 3
+        assert logged == [
+            "[RETRY 1/3] flaky error, retrying...",
+            "[RETRY 2/3] flaky failed, retrying...",
+            "[OK] saved proj",
+        ]
+
+        logged.clear()
+        assert StopTask("never", lambda c: False, retries=2).execute(ctx)["status"] == "failed"
+        assert logged[-1] == "[POLICY-WARN] never failed after 2 retries"
+
+    def test_missing_script_is_skipped(self, ctx, monkeypatch, tmp_path):
+        monkeypatch.setattr(tasks, "ARCH_DIR", tmp_path)
+        task = tasks.script_task("absent", "nope/absent.py", ["--x"])
+        assert task.execute(ctx)["status"] == "skipped"
+
+    def test_default_tasks_form_a_valid_graph(self, ctx, monkeypatch, tmp_path):
+        monkeypatch.setattr(tasks, "ARCH_DIR", tmp_path)
+        default = tasks.default_tasks()
+        runner = StopTaskRunner(default, budget_s=10)
+        results = runner.run(ctx, spawn=lambda names, c: None)
+        deferred = {n for n, r in results.items() if r["status"] == "deferred"}
+        assert deferred == {t.name for t in default if t.deferrable}
+        assert results["git-snapshot"]["status"] == "ok"
+        assert [t.name for t in default if t.must_finish] == ["auto-commit"]
+        commit = next(t for t in default if t.must_finish)
+        assert commit.retries * commit.timeout < tasks.STOP_HOOK_BUDGET_S
+
+
+class TestRunScript:
+    SCRIPT = (
+        "import sys\n"
+        "def main():\n"
+        "    print('noise')\n"
+        "    sys.exit(0 if sys.argv[1:] == ['--project', 'proj'] else 3)\n"
+        "if __name__ == '__main__':\n"
+        "    main()\n"
+    )
+
+    def test_exit_status_and_quiet_output(self, tmp_path, capfd):
+        script = tmp_path / "auto-save.py"
+        script.write_text(self.SCRIPT)
+        argv = list(sys.argv)
+
+        assert tasks.run_script(script, ["--project", "proj"])
+        assert not tasks.run_script(script, ["--project", "other"])
+        assert sys.argv == argv
+        assert "noise" not in capfd.readouterr().out
+
+    def test_timeout_kills_the_script(self, tmp_path):
+        script = tmp_path / "slow.py"
+        script.write_text("import time\ntime.sleep(30)\n")
+        started = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            tasks.run_script(script, timeout=0.5)
+        assert time.monotonic() - started < 5
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitSnapshot:
+    def _repo(self, path):
+        def git(*args):
+            subprocess.run(["git", *args], cwd=str(path), check=True, capture_output=True)
+
+        git("init", "-q", "-b", "main")
+        git("-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-q", "--allow-empty", "-m", "base")
+        git("checkout", "-q", "-b", "feature")
+        git("-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-q", "--allow-empty", "-m", "work")
+        return git
+
+    def test_values_are_read_once_and_shared(self, tmp_path):
+        self._repo(tmp_path)
+        snap = GitSnapshot(cwd=str(tmp_path))
+        threads = [threading.Thread(target=snap.prefetch) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+
+        assert (snap.branch, snap.commits_ahead, snap.is_clean) == ("feature", 1, True)
+        assert snap.git_calls == 3
+
+        (tmp_path / "dirty.txt").write_text("x")
+        assert snap.is_clean is True  # Still the snapshot
+        snap.invalidate()
+        assert snap.is_clean is False
+        assert snap.git_calls == 4
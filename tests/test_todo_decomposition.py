@@ -9,6 +9,8 @@ Covers:
 
 import json
 import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -33,7 +35,6 @@ from langgraph_engine.level3_execution.architecture.todo_executor import (
     execute_todo_list,
 )
 
-
 # ===========================================================================
 # Group 1: todo_decomposer._parse_args
 # ===========================================================================
@@ -230,7 +231,7 @@ class TestSaveCheckpoint:
 
 
 class TestExecuteTodoList:
-    """Integration-style tests for execute_todo_list with mocked subprocess."""
+    """Integration-style tests for execute_todo_list with mocked claude CLI subprocess."""
 
     _FAKE_SUCCESS_STDOUT = json.dumps({"llm_response": "agent output here"})
 
@@ -260,7 +261,9 @@ class TestExecuteTodoList:
         state = self._make_state(tmp_path)
         todo_list = [{"id": "todo_001", "prompt": "do something"}]
 
-        with patch("langgraph_engine.level3_execution.architecture.todo_executor.subprocess.run") as mock_run:
+        with patch(
+            "langgraph_engine.level3_execution.architecture.orchestrator_agent_caller.subprocess.run"
+        ) as mock_run:
             results = execute_todo_list(state, todo_list)
 
         mock_run.assert_not_called()
@@ -275,7 +278,7 @@ class TestExecuteTodoList:
         fake_proc = self._make_proc(returncode=0, stdout=self._FAKE_SUCCESS_STDOUT)
 
         with patch(
-            "langgraph_engine.level3_execution.architecture.todo_executor.subprocess.run",
+            "langgraph_engine.level3_execution.architecture.orchestrator_agent_caller.subprocess.run",
             return_value=fake_proc,
         ):
             results = execute_todo_list(state, todo_list)
@@ -291,7 +294,7 @@ class TestExecuteTodoList:
         fake_proc = self._make_proc(returncode=1, stdout="", stderr="some error message")
 
         with patch(
-            "langgraph_engine.level3_execution.architecture.todo_executor.subprocess.run",
+            "langgraph_engine.level3_execution.architecture.orchestrator_agent_caller.subprocess.run",
             return_value=fake_proc,
         ):
             results = execute_todo_list(state, todo_list)
@@ -305,7 +308,7 @@ class TestExecuteTodoList:
         todo_list = [{"id": "todo_004", "prompt": "do something dangerous"}]
 
         with patch(
-            "langgraph_engine.level3_execution.architecture.todo_executor.subprocess.run",
+            "langgraph_engine.level3_execution.architecture.orchestrator_agent_caller.subprocess.run",
             side_effect=RuntimeError("unexpected subprocess failure"),
         ):
             results = execute_todo_list(state, todo_list)
@@ -321,7 +324,7 @@ class TestExecuteTodoList:
         fake_proc = self._make_proc(returncode=0, stdout=self._FAKE_SUCCESS_STDOUT)
 
         with patch(
-            "langgraph_engine.level3_execution.architecture.todo_executor.subprocess.run",
+            "langgraph_engine.level3_execution.architecture.orchestrator_agent_caller.subprocess.run",
             return_value=fake_proc,
         ):
             execute_todo_list(state, todo_list)
@@ -332,6 +335,147 @@ class TestExecuteTodoList:
         assert "todo_005" in data["completed_ids"]
 
 
+# ===========================================================================
+# Group 7b: todo_executor DAG scheduling
+# ===========================================================================
+
+
+class TestTodoDagScheduling:
+    """Dependency-aware parallel execution with a fake in-process claude call."""
+
+    _DELAY = 0.2
+
+    def _run(self, tmp_path, todo_list, max_parallel=4, on_call=None, fail=()):
+        from langgraph_engine.level3_execution.architecture import todo_executor
+
+        calls = []
+        lock = threading.Lock()
+        active = [0, 0]  # running now, most seen at once
+
+        def fake_cli(prompt, timeout=None, token=None):
+            started = time.monotonic()
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            if on_call:
+                on_call(prompt)
+            time.sleep(self._DELAY)
+            with lock:
+                active[0] -= 1
+                calls.append((prompt, started, time.monotonic()))
+            if prompt in fail:
+                return None, "boom"
+            return "done: " + prompt, None
+
+        state = {"session_dir": str(tmp_path)}
+        with patch.object(todo_executor._agent_caller, "_call_claude_cli", side_effect=fake_cli):
+            results = execute_todo_list(state, todo_list, max_parallel=max_parallel)
+        self.max_concurrent = active[1]
+        return results, {c[0]: c[1:] for c in calls}
+
+    def test_diamond_runs_at_critical_path_length(self, tmp_path):
+        todo_list = [
+            {"id": "d", "prompt": "d", "depends_on": ["b", "c"]},
+            {"id": "a", "prompt": "a", "depends_on": []},
+            {"id": "b", "prompt": "b", "depends_on": ["a"]},
+            {"id": "c", "prompt": "c", "depends_on": ["a"]},
+            {"id": "e", "prompt": "e"},
+        ]
+        results, spans = self._run(tmp_path, todo_list)
+
+        assert [r["todo_id"] for r in results] == ["d", "a", "b", "c", "e"]
+        assert all(r["status"] == "SUCCESS" for r in results)
+        assert results[0]["result"]["llm_response"] == "done: d"
+        for child, parents in (("b", "a"), ("c", "a"), ("d", "bc")):
+            for parent in parents:
+                assert spans[child][0] >= spans[parent][1]
+        # a and e are independent, as are b and c: both pairs run side by side
+        assert 2 <= self.max_concurrent <= 4
+
+    def test_width_one_is_sequential(self, tmp_path):
+        todo_list = [{"id": "t%d" % i, "prompt": "t%d" % i} for i in range(3)]
+        _, spans = self._run(tmp_path, todo_list, max_parallel=1)
+        assert self.max_concurrent == 1
+        ordered = sorted(spans.values())
+        assert all(later[0] >= earlier[1] for earlier, later in zip(ordered, ordered[1:]))
+
+    def test_checkpoint_written_as_each_todo_finishes(self, tmp_path):
+        seen = {}
+
+        def on_call(prompt):
+            data = json.loads((tmp_path / "todo_checkpoint.json").read_text(encoding="utf-8"))
+            seen[prompt] = data["completed_ids"]
+
+        todo_list = [
+            {"id": "a", "prompt": "a"},
+            {"id": "b", "prompt": "b", "depends_on": ["a"]},
+        ]
+        self._run(tmp_path, todo_list, on_call=lambda p: on_call(p) if p == "b" else None)
+        assert seen["b"] == ["a"]
+
+    def test_resume_partial_wavefront(self, tmp_path):
+        checkpoint = {"completed_ids": ["a", "b"], "results": {"a": {"llm_response": "old a"}}}
+        (tmp_path / "todo_checkpoint.json").write_text(json.dumps(checkpoint), encoding="utf-8")
+        todo_list = [
+            {"id": "a", "prompt": "a"},
+            {"id": "b", "prompt": "b", "depends_on": ["a"]},
+            {"id": "c", "prompt": "c", "depends_on": ["a"]},
+            {"id": "d", "prompt": "d", "depends_on": ["b", "c"]},
+        ]
+        results, spans = self._run(tmp_path, todo_list)
+
+        assert [r["status"] for r in results] == ["SKIPPED", "SKIPPED", "SUCCESS", "SUCCESS"]
+        assert results[0]["result"] == {"llm_response": "old a"}
+        assert set(spans) == {"c", "d"}
+        assert spans["d"][0] >= spans["c"][1]
+        data = json.loads((tmp_path / "todo_checkpoint.json").read_text(encoding="utf-8"))
+        assert data["completed_ids"] == ["a", "b", "c", "d"]
+
+    def test_dependents_of_a_failed_todo_are_skipped(self, tmp_path):
+        todo_list = [
+            {"id": "a", "prompt": "a"},
+            {"id": "b", "prompt": "b", "depends_on": ["a"]},
+            {"id": "c", "prompt": "c", "depends_on": ["b"]},
+            {"id": "e", "prompt": "e"},
+        ]
+        results, spans = self._run(tmp_path, todo_list, fail=("a",))
+
+        assert [r["status"] for r in results] == ["FAILED", "SKIPPED", "SKIPPED", "SUCCESS"]
+        assert set(spans) == {"a", "e"}
+        assert "a" in results[1]["error"] and "b" in results[2]["error"]
+        # Skipped TODOs are not checkpointed, so a resume retries them
+        data = json.loads((tmp_path / "todo_checkpoint.json").read_text(encoding="utf-8"))
+        assert data["completed_ids"] == ["a", "e"]
+
+    def test_cli_runs_under_the_step_token(self, tmp_path):
+        from langgraph_engine.cancellation import CancellationToken, use_token
+        from langgraph_engine.level3_execution.architecture import todo_executor
+
+        seen = []
+
+        def fake_cli(prompt, timeout=None, token=None):
+            seen.append(token)
+            return "ok", None
+
+        step_token = CancellationToken("step0")
+        with patch.object(todo_executor._agent_caller, "_call_claude_cli", side_effect=fake_cli):
+            with use_token(step_token):
+                execute_todo_list({"session_dir": str(tmp_path)}, [{"id": "a", "prompt": "a"}])
+        assert seen == [step_token]
+
+    def test_cycle_and_unknown_dependency_do_not_hang(self, tmp_path):
+        todo_list = [
+            {"id": "x", "prompt": "x", "depends_on": ["y"]},
+            {"id": "y", "prompt": "y", "depends_on": ["x", "missing"]},
+            {"prompt": "no id"},
+        ]
+        results, spans = self._run(tmp_path, todo_list)
+        assert [r["status"] for r in results] == ["SUCCESS"] * 3
+        assert spans["y"][0] >= spans["x"][1]
+        data = json.loads((tmp_path / "todo_checkpoint.json").read_text(encoding="utf-8"))
+        assert data["completed_ids"] == ["x", "y"]
+
+
 # ===========================================================================
 # Group 8: state_definition regression
 # ===========================================================================
@@ -0,0 +1,93 @@
+"""
+Tests for scripts/helpers/tool_tracker_log.py (per-session tool-tracker
+segments with an offset index) and the indexed activity lookup in
+github_operations.issue_manager.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from github_operations import issue_manager  # noqa: E402
+from helpers import tool_tracker_log as ttl  # noqa: E402
+
+
+def _write_session(segment, tasks=3, noise=5):
+    """Create all tasks up front, then task N does N Reads and completes."""
+    for n in range(1, tasks + 1):
+        ttl.append_entry(segment, {"tool": "TaskCreate", "task_subject": "t%d" % n})
+        for _ in range(noise):
+            ttl.append_entry(segment, {"tool": "Bash", "command": "echo idle"})
+    for n in range(1, tasks + 1):
+        for i in range(n):
+            ttl.append_entry(segment, {"tool": "Read", "file": "task%d/f%d.py" % (n, i)})
+        ttl.append_entry(segment, {"tool": "TaskUpdate", "task_id": str(n), "task_status": "completed"})
+
+
+class TestIndex:
+    def test_index_records_only_task_events(self, tmp_path):
+        segment = ttl.segment_path(tmp_path / "tool-tracker.jsonl", "SESSION-1")
+        _write_session(segment)
+        records = ttl.load_index(segment)
+        assert [r["tool"] for r in records] == ["TaskCreate"] * 3 + ["TaskUpdate"] * 3
+        raw = segment.read_bytes()
+        for rec in records:
+            assert json.loads(raw[rec["off"] : rec["off"] + rec["len"]])["tool"] == rec["tool"]
+
+    def test_missing_or_stale_index_is_rebuilt(self, tmp_path):
+        segment = tmp_path / "seg.jsonl"
+        _write_session(segment)
+        expected = ttl.load_index(segment)
+        ttl.index_path(segment).unlink()
+        assert ttl.load_index(segment) == expected
+        ttl.index_path(segment).write_text(json.dumps({"off": 10**9, "len": 1, "tool": "TaskCreate"}) + "\n")
+        assert ttl.load_index(segment) == expected
+
+    def test_window_is_read_without_scanning_history(self, tmp_path):
+        segment = tmp_path / "seg.jsonl"
+        _write_session(segment, tasks=3)
+        start, end = ttl.find_task_window(segment, "2")
+        entries = list(ttl.iter_window(segment, start, end))
+        # From just after the 2nd TaskCreate up to (not including) TaskUpdate(2).
+        assert entries[0] == {"tool": "Bash", "command": "echo idle"}
+        assert {"tool": "TaskUpdate", "task_id": "1", "task_status": "completed"} in entries
+        assert entries[-2:] == [{"tool": "Read", "file": "task2/f%d.py" % i} for i in range(2)]
+        assert ttl.find_task_window(segment, "9") is None
+        assert ttl.find_task_window(segment, "x") is None
+
+
+class TestIssueManagerLookup:
+    def test_activity_from_segment(self, tmp_path):
+        segment = tmp_path / "seg.jsonl"
+        _write_session(segment, tasks=3)
+        activity = issue_manager._get_tool_activity_for_task("3", segment=segment)
+        assert activity["files_read"][-3:] == ["task3/f0.py", "task3/f1.py", "task3/f2.py"]
+        assert "_tc_count" not in activity
+
+    def test_open_task_reads_to_end_of_segment(self, tmp_path):
+        segment = tmp_path / "seg.jsonl"
+        ttl.append_entry(segment, {"tool": "TaskCreate"})
+        ttl.append_entry(segment, {"tool": "Edit", "file": "a.py", "old_hint": "x", "new_hint": "yy", "edit_size": 1})
+        activity = issue_manager._get_tool_activity_for_task(1, segment=segment)
+        assert activity["files_edited"] == ["a.py"]
+        assert activity["edits"] == ["a.py (+1 chars)"]
+        assert activity["total_tools"] == 1
+
+    def test_legacy_global_log_is_still_supported(self, tmp_path, monkeypatch):
+        log = tmp_path / "tool-tracker.jsonl"
+        lines = [
+            {"tool": "TaskCreate"},
+            {"tool": "Grep", "pattern": "foo"},
+            {"tool": "TaskUpdate", "task_id": "1", "task_status": "completed"},
+            {"tool": "Read", "file": "late.py"},
+        ]
+        log.write_text("".join(json.dumps(e) + "\n" for e in lines))
+        monkeypatch.setattr(issue_manager, "TRACKER_LOG", log)
+        monkeypatch.setattr(issue_manager, "_tool_tracker_segment", lambda: None)
+        activity = issue_manager._get_tool_activity_for_task("1")
+        assert activity["searches"] == ["Grep: foo"]
+        assert activity["total_tools"] == 1
@@ -0,0 +1,124 @@
+"""
+Tests for parallel, fingerprint-cached generation in
+langgraph_engine/diagrams/legacy_generator.py (UMLDiagramGenerator.generate_all)
+and langgraph_engine/diagrams/diagram_cache.py.
+
+ASCII-safe, UTF-8 encoded - Windows cp1252 compatible.
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from langgraph_engine import llm_call as llm_call_module
+from langgraph_engine.diagrams import legacy_generator
+from langgraph_engine.diagrams.diagram_cache import DiagramCache, fingerprint
+from langgraph_engine.diagrams.legacy_generator import UMLDiagramGenerator
+
+
+class _FakeLLM:
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt, model="fast", timeout=60):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return '@startuml\nnote "%d" as N\n@enduml' % len(prompt)
+
+
+@pytest.fixture
+def project(tmp_path):
+    src = tmp_path / "proj" / "src"
+    src.mkdir(parents=True)
+    (src / "models.py").write_text(
+        "class Animal:\n    def speak(self):\n        return self.sound()\n\n"
+        "    def sound(self):\n        return ''\n",
+        encoding="utf-8",
+    )
+    (src / "main.py").write_text("from models import Animal\n\ndef main():\n    Animal().speak()\n", encoding="utf-8")
+    (tmp_path / "proj" / "README.md").write_text("# Zoo\n\nUsers feed animals.\n", encoding="utf-8")
+    return tmp_path / "proj"
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    fake = _FakeLLM()
+    monkeypatch.setattr(llm_call_module, "llm_call", fake)
+    return fake
+
+
+class TestGenerateAll:
+    def test_llm_diagrams_run_concurrently_under_cap(self, project, tmp_path, fake_llm):
+        gen = UMLDiagramGenerator(str(project), cache_dir=str(tmp_path / "cache"))
+        results = gen.generate_all()
+
+        assert list(results) == list(legacy_generator._DIAGRAM_ORDER)
+        assert fake_llm.calls >= 6
+        assert 2 <= fake_llm.max_active <= legacy_generator._LLM_CONCURRENCY
+
+    def test_unchanged_inputs_are_served_from_disk(self, project, tmp_path, fake_llm):
+        cache_dir = str(tmp_path / "cache")
+        first = UMLDiagramGenerator(str(project), cache_dir=cache_dir).generate_all()
+        calls_after_first = fake_llm.calls
+
+        second_gen = UMLDiagramGenerator(str(project), cache_dir=cache_dir)
+        second = second_gen.generate_all()
+
+        assert fake_llm.calls == calls_after_first
+        assert second == first
+        assert second_gen._cache.hits >= 10
+
+    def test_cache_can_be_disabled(self, project, fake_llm):
+        gen = UMLDiagramGenerator(str(project), use_cache=False)
+        gen.generate_all()
+        gen.generate_all()
+        assert gen._cache is None
+        assert fake_llm.calls >= 12
+
+
+class TestDiagramCache:
+    def test_fingerprint_ignores_set_order(self):
+        assert fingerprint({"a": {"x", "y", "z"}}) == fingerprint({"a": {"z", "y", "x"}})
+        assert fingerprint("p", 1) != fingerprint("p", 2)
+
+    def test_entries_survive_reload_and_are_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(DiagramCache, "MAX_ENTRIES", 3)
+        cache = DiagramCache(tmp_path, cache_dir=str(tmp_path / "c"))
+        for i in range(5):
+            cache.put("k%d" % i, "v%d" % i)
+        cache.put("empty", "")
+        cache.flush()
+
+        reloaded = DiagramCache(tmp_path, cache_dir=str(tmp_path / "c"))
+        assert reloaded.get("k4") == "v4"
+        assert reloaded.get("k0") is None
+        assert reloaded.get("empty") is None
+
+    def test_concurrent_flushes_do_not_collide(self, tmp_path, caplog):
+        caplog.set_level(logging.DEBUG, logger="langgraph_engine.diagrams.diagram_cache")
+        caches = [DiagramCache(tmp_path, cache_dir=str(tmp_path / "c")) for _ in range(8)]
+
+        def churn(n, cache):
+            for i in range(20):
+                cache.put("k%d-%d" % (n, i), "v")
+                cache.flush()
+
+        threads = [threading.Thread(target=churn, args=(n, c)) for n, c in enumerate(caches)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert "write failed" not in caplog.text
+        assert [p.name for p in (tmp_path / "c").iterdir()] == [caches[0].path.name]